@@ -8,14 +8,29 @@ __version__ = "0.1.0"
 __author__ = "SAI Team"
 __email__ = "team@sai.software"
 
-from .core.saidata_loader import SaidataLoader, SaidataNotFoundError, ValidationResult
-from .models.config import SaiConfig
-from .models.provider_data import ProviderData
-from .models.saidata import SaiData
-from .utils.config import get_config, get_config_manager
-from .utils.errors import SaiError, format_error_for_cli, get_error_suggestions
-from .utils.execution_tracker import ExecutionResult, get_execution_tracker
-from .utils.logging import get_logger, setup_root_logging
+from .utils.lazy import make_lazy_getattr
+
+# Public names are imported on first use so that light entry points, such as
+# forwarding a command to a running agent, do not load the whole package
+_LAZY_EXPORTS = {
+    "SaidataLoader": ".core.saidata_loader",
+    "SaidataNotFoundError": ".core.saidata_loader",
+    "ValidationResult": ".core.saidata_loader",
+    "SaiConfig": ".models.config",
+    "ProviderData": ".models.provider_data",
+    "SaiData": ".models.saidata",
+    "get_config": ".utils.config",
+    "get_config_manager": ".utils.config",
+    "SaiError": ".utils.errors",
+    "format_error_for_cli": ".utils.errors",
+    "get_error_suggestions": ".utils.errors",
+    "ExecutionResult": ".utils.execution_tracker",
+    "get_execution_tracker": ".utils.execution_tracker",
+    "get_logger": ".utils.logging",
+    "setup_root_logging": ".utils.logging",
+}
+
+__getattr__ = make_lazy_getattr(__name__, _LAZY_EXPORTS, globals())
 
 __all__ = [
     "ProviderData",
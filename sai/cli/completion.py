@@ -5,9 +5,13 @@ from typing import List
 
 import click
 
-from ..core.saidata_loader import SaidataLoader
-from ..providers.loader import ProviderLoader
-from ..utils.config import get_config
+from ..utils.lazy import lazy_import
+
+# Completion runs on every key press, so only load what the completer needs
+SaidataLoader = lazy_import("sai.core.saidata_loader", "SaidataLoader")
+ProviderLoader = lazy_import("sai.providers.loader", "ProviderLoader")
+get_config = lazy_import("sai.utils.config", "get_config")
+load_catalog = lazy_import("sai.core.saidata_catalog", "load_catalog")
 
 
 def complete_software_names(
@@ -22,9 +26,14 @@ def complete_software_names(
         software_names = set()
         for path in search_paths:
             if path.exists() and path.is_dir():
+                # Repositories come with a catalog of their software
+                catalog = load_catalog(path)
+                if catalog is not None:
+                    software_names.update(catalog.names(incomplete))
+
                 # Check for hierarchical structure: software/{prefix}/{name}/default.yaml
                 software_dir = path / "software"
-                if software_dir.exists() and software_dir.is_dir():
+                if catalog is None and software_dir.exists() and software_dir.is_dir():
                     for prefix_dir in software_dir.iterdir():
                         if prefix_dir.is_dir():
                             for name_dir in prefix_dir.iterdir():
@@ -73,13 +82,16 @@ def complete_action_names(ctx: click.Context, param: click.Parameter, incomplete
         provider_loader = ProviderLoader()
         providers = provider_loader.load_all_providers()
 
-        actions = set()
-        for provider_data in providers.values():
-            from ..providers.base import BaseProvider
+        from ..providers.base import create_provider
+        from ..providers.detection import ProviderDetector
 
-            provider_instance = BaseProvider(provider_data)
-            if provider_instance.is_available():
-                actions.update(provider_instance.get_supported_actions())
+        provider_instances = [create_provider(data) for data in providers.values()]
+
+        actions = set()
+        for provider_instance in ProviderDetector.from_config().filter_available(
+            provider_instances
+        ):
+            actions.update(provider_instance.get_supported_actions())
 
         return sorted([action for action in actions if action.startswith(incomplete)])
     except Exception:
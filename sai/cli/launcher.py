@@ -0,0 +1,19 @@
+"""Console entry point that hands commands to a running sai agent."""
+
+import sys
+
+
+def main():
+    """Run a command in the sai agent if one is running, otherwise in-process."""
+    from ..utils.agent_client import forward_to_agent
+
+    try:
+        exit_code = forward_to_agent(sys.argv[1:])
+    except KeyboardInterrupt:
+        sys.exit(130)
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from .main import main as cli_main
+
+    cli_main()
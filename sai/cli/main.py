@@ -7,11 +7,6 @@ from typing import List, Optional
 
 import click
 
-from ..core.execution_engine import ExecutionContext, ExecutionEngine
-from ..core.saidata_loader import SaidataLoader, SaidataNotFoundError
-from ..core.saidata_repository_manager import SaidataRepositoryManager
-from ..providers.loader import ProviderLoader
-from ..utils.config import get_config
 from ..utils.errors import (
     SaiError,
     format_error_for_cli,
@@ -19,12 +14,24 @@ from ..utils.errors import (
     is_system_error,
     is_user_error,
 )
+from ..utils.lazy import lazy_import
 from ..version import get_version
 from .completion import (
     complete_config_keys,
     complete_saidata_files,
 )
 
+# Heavy modules are imported when a command first needs them, so that --help,
+# --version and shell completion do not pay for loading the whole tool
+ExecutionContext = lazy_import("sai.core.execution_engine", "ExecutionContext")
+ExecutionEngine = lazy_import("sai.core.execution_engine", "ExecutionEngine")
+SaidataLoader = lazy_import("sai.core.saidata_loader", "SaidataLoader")
+SaidataRepositoryManager = lazy_import(
+    "sai.core.saidata_repository_manager", "SaidataRepositoryManager"
+)
+ProviderLoader = lazy_import("sai.providers.loader", "ProviderLoader")
+get_config = lazy_import("sai.utils.config", "get_config")
+
 
 def format_command_execution(provider_name: str, command: str, verbose: bool = False) -> str:
     """Format command execution message with highlighting."""
@@ -372,22 +379,16 @@ def apply(
             click.echo(f"Error loading action file: {e}", err=True)
             ctx.exit(1)
 
-        # Load providers
+        # Load providers, skipping those that cannot run on this platform
         provider_loader = ProviderLoader()
-        providers = provider_loader.load_all_providers()
+        providers = provider_loader.load_all_providers(current_platform_only=True)
 
         if not providers:
             click.echo("No providers found. Please install a package manager.", err=True)
             ctx.exit(1)
 
-        # Create provider instances
-        provider_instances = []
-        for name, provider_data in providers.items():
-            from ..providers.base import BaseProvider
-
-            provider_instance = BaseProvider(provider_data)
-            if provider_instance.is_available():
-                provider_instances.append(provider_instance)
+        # Create provider instances and detect availability concurrently
+        provider_instances = _create_available_providers(providers, ctx.obj["sai_config"])
 
         if not provider_instances:
             click.echo("No available providers found.", err=True)
@@ -730,6 +731,28 @@ def _get_available_version_from_provider(provider, package_name):
         return None
 
 
+def _create_available_providers(providers, config, use_cache: bool = True):
+    """Create provider instances and keep those available on this system.
+
+    Availability probes run concurrently, bounded by the provider detection
+    settings in the configuration.
+
+    Args:
+        providers: Dictionary mapping provider names to ProviderData
+        config: SAI configuration object
+        use_cache: Whether to use cached availability results
+
+    Returns:
+        List of available provider instances in loader order
+    """
+    from ..providers.base import create_provider
+    from ..providers.detection import ProviderDetector
+
+    provider_instances = [create_provider(provider_data) for provider_data in providers.values()]
+    detector = ProviderDetector.from_config(config)
+    return detector.filter_available(provider_instances, use_cache=use_cache)
+
+
 def _execute_software_action(
     ctx: click.Context,
     action: str,
@@ -740,22 +763,30 @@ def _execute_software_action(
 ):
     """Execute a software management action."""
     try:
-        # Load providers
+        # Load only the providers that can take part in this action
         provider_loader = ProviderLoader()
-        providers = provider_loader.load_all_providers()
-
-        if not providers:
-            click.echo("No providers found. Please install a package manager.", err=True)
-            ctx.exit(1)
-
-        # Create provider instances
-        provider_instances = []
-        for name, provider_data in providers.items():
-            from ..providers.base import BaseProvider
+        requested_provider = ctx.obj.get("provider")
+        if requested_provider:
+            providers = provider_loader.load_all_providers(names=[requested_provider])
+            if not providers:
+                click.echo(f"Requested provider '{requested_provider}' not available", err=True)
+                ctx.exit(1)
+        else:
+            providers = provider_loader.load_all_providers(
+                action=action, current_platform_only=True
+            )
+            if not providers:
+                click.echo(
+                    f"No providers found that support '{action}' on this platform. "
+                    "Please install a package manager.",
+                    err=True,
+                )
+                ctx.exit(1)
 
-            provider_instance = BaseProvider(provider_data)
-            if provider_instance.is_available(use_cache=use_cache):
-                provider_instances.append(provider_instance)
+        # Create provider instances and detect availability concurrently
+        provider_instances = _create_available_providers(
+            providers, ctx.obj["sai_config"], use_cache=use_cache
+        )
 
         # Sort provider instances by priority (highest first)
         provider_instances.sort(key=lambda p: p.get_priority(), reverse=True)
@@ -767,6 +798,8 @@ def _execute_software_action(
         # Load saidata if software name is provided, or create minimal saidata
         saidata = None
         if software:
+            from ..core.saidata_loader import SaidataNotFoundError
+
             try:
                 # Use repository manager for saidata loading
                 repo_manager = SaidataRepositoryManager(ctx.obj["sai_config"])
@@ -1473,15 +1506,21 @@ def providers_list(ctx: click.Context, available_only: bool, detailed: bool, no_
             click.echo("No providers found.")
             return
 
-        # Create provider instances to check availability
+        # Create provider instances and check availability concurrently
+        from ..providers.base import create_provider
+        from ..providers.detection import ProviderDetector
+
         provider_info = []
         use_cache = not no_cache
 
-        for name, provider_data in providers.items():
-            from ..providers.base import BaseProvider
+        instances = {name: create_provider(data) for name, data in providers.items()}
+        availability = ProviderDetector.from_config(ctx.obj["sai_config"]).detect_availability(
+            [*instances.values()], use_cache=use_cache
+        )
 
-            provider_instance = BaseProvider(provider_data)
-            is_available = provider_instance.is_available(use_cache=use_cache)
+        for name, provider_data in providers.items():
+            provider_instance = instances[name]
+            is_available = availability.get(provider_instance.name, False)
 
             if available_only and not is_available:
                 continue
@@ -1550,14 +1589,19 @@ def providers_detect(ctx: click.Context, no_cache: bool):
         if not ctx.obj["quiet"]:
             click.echo("Detecting provider availability...")
 
+        from ..providers.base import create_provider
+        from ..providers.detection import ProviderDetector
+
         results = []
         use_cache = not no_cache
 
-        for name, provider_data in providers.items():
-            from ..providers.base import BaseProvider
+        instances = {name: create_provider(data) for name, data in providers.items()}
+        availability = ProviderDetector.from_config(ctx.obj["sai_config"]).detect_availability(
+            [*instances.values()], use_cache=use_cache
+        )
 
-            provider_instance = BaseProvider(provider_data)
-            is_available = provider_instance.is_available(use_cache=use_cache)
+        for name, provider_data in providers.items():
+            is_available = availability.get(instances[name].name, False)
 
             if is_available:
                 available_count += 1
@@ -1610,9 +1654,9 @@ def providers_info(ctx: click.Context, provider_name: str, no_cache: bool):
             ctx.exit(1)
 
         provider_data = providers[provider_name]
-        from ..providers.base import BaseProvider
+        from ..providers.base import create_provider
 
-        provider_instance = BaseProvider(provider_data)
+        provider_instance = create_provider(provider_data)
 
         use_cache = not no_cache
         is_available = provider_instance.is_available(use_cache=use_cache)
@@ -1798,29 +1842,36 @@ def providers_refresh_cache(ctx: click.Context, provider: Optional[str]):
             click.echo("No providers found to cache.", err=True)
             ctx.exit(1)
 
+        from ..providers.base import create_provider
+        from ..providers.detection import ProviderDetector
+
         refreshed_count = 0
         results = []
 
-        for name, provider_data in providers.items():
-            if provider and name != provider:
-                continue
-
-            from ..providers.base import BaseProvider
+        instances = {
+            name: create_provider(provider_data)
+            for name, provider_data in providers.items()
+            if not provider or name == provider
+        }
+        detection = ProviderDetector.from_config(ctx.obj["sai_config"]).detect(
+            [*instances.values()], use_cache=False
+        )
 
-            provider_instance = BaseProvider(provider_data)
-            is_available = provider_instance.is_available()
+        for name, provider_instance in instances.items():
+            info = detection.get(provider_instance.name, {})
+            is_available = info.get("available", False)
 
             # Update cache
             cache.update_provider_cache(
                 name,
                 {
                     "available": is_available,
-                    "executable_path": provider_instance.get_executable_path(),
-                    "version": provider_instance.get_version() if is_available else None,
+                    "executable_path": info.get("executable_path"),
+                    "version": info.get("version"),
                     "priority": provider_instance.get_priority(),
                     "actions": provider_instance.get_supported_actions(),
-                    "platforms": provider_data.provider.platforms or [],
-                    "type": provider_data.provider.type.value,
+                    "platforms": provider_instance.platforms,
+                    "type": provider_instance.type.value,
                 },
             )
 
@@ -1831,6 +1882,8 @@ def providers_refresh_cache(ctx: click.Context, provider: Optional[str]):
                 status = "✓" if is_available else "✗"
                 click.echo(f"  {status} {name}")
 
+        cache.flush()
+
         if ctx.obj["output_json"]:
             import json
 
@@ -1859,6 +1912,42 @@ def providers_refresh_cache(ctx: click.Context, provider: Optional[str]):
         ctx.exit(1)
 
 
+@providers.command("compile")
+@click.pass_context
+def providers_compile(ctx: click.Context):
+    """Precompile provider definitions into a bundle for faster startup."""
+    try:
+        provider_loader = ProviderLoader()
+        provider_count, bundle_path = provider_loader.compile_bundle()
+
+        if ctx.obj["output_json"]:
+            import json
+
+            output = {
+                "success": True,
+                "provider_count": provider_count,
+                "bundle_path": str(bundle_path),
+            }
+            click.echo(json.dumps(output, indent=2))
+        elif not ctx.obj["quiet"]:
+            click.echo(f"✓ Compiled {provider_count} provider(s) into {bundle_path}")
+
+    except Exception as e:
+        if ctx.obj["output_json"]:
+            import json
+
+            error_output = {"success": False, "error": str(e)}
+            click.echo(json.dumps(error_output, indent=2))
+        else:
+            click.echo(f"Error compiling providers: {e}", err=True)
+
+        if ctx.obj["verbose"]:
+            import traceback
+
+            traceback.print_exc()
+        ctx.exit(1)
+
+
 # Configuration management commands
 @cli.group()
 def config():
@@ -2145,10 +2234,10 @@ def validate(ctx: click.Context, saidata_files: tuple, strict: bool):
             file_path = Path(file_path_str)
             try:
                 # Load and validate the file
-                import yaml
+                from ..utils.yaml_loader import safe_load
 
                 with open(file_path, "r") as f:
-                    data = yaml.safe_load(f)
+                    data = safe_load(f)
 
                 validation_result = saidata_loader.validate_saidata(data)
 
@@ -3515,6 +3604,123 @@ def repository_clear(ctx: click.Context, all: bool, url: Optional[str], branch:
         ctx.exit(1)
 
 
+# Agent commands
+@cli.group()
+def agent():
+    """Run a background agent that keeps providers and caches warm.
+
+    While the agent is running, every sai invocation by the same user is
+    forwarded to it over a Unix domain socket (~/.sai/agent.sock, or
+    SAI_AGENT_SOCKET) instead of loading providers and saidata again. Set
+    SAI_NO_AGENT=1 to run a command in-process anyway.
+    """
+
+
+@agent.command("start")
+@click.option("--detach", is_flag=True, help="Run the agent in the background")
+@click.option(
+    "--idle-timeout",
+    type=int,
+    help="Exit after this many seconds without requests (default: run until stopped)",
+)
+@click.pass_context
+def agent_start(ctx: click.Context, detach: bool, idle_timeout: Optional[int]):
+    """Start the sai agent."""
+    import os
+
+    from ..core.agent import AgentError, AgentServer
+    from ..utils.agent_client import get_agent_socket_path
+
+    server = AgentServer(get_agent_socket_path(), cli, idle_timeout=idle_timeout)
+    try:
+        server.bind()
+    except AgentError as e:
+        click.echo(f"Error starting agent: {e}", err=True)
+        ctx.exit(1)
+
+    if detach:
+        pid = os.fork()
+        if pid:
+            if not ctx.obj["quiet"]:
+                click.echo(f"✓ sai agent started (pid {pid}) on {server.socket_path}")
+            return
+
+        # Detach from the terminal and serve in the child
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os._exit(0)
+
+    if not ctx.obj["quiet"]:
+        click.echo(f"sai agent listening on {server.socket_path} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+@agent.command("stop")
+@click.pass_context
+def agent_stop(ctx: click.Context):
+    """Stop the running sai agent."""
+    from ..utils.agent_client import stop_agent
+
+    if not stop_agent():
+        click.echo("No sai agent is running", err=True)
+        ctx.exit(1)
+
+    if not ctx.obj["quiet"]:
+        click.echo("✓ sai agent stopped")
+
+
+@agent.command("status")
+@click.pass_context
+def agent_status(ctx: click.Context):
+    """Show whether the sai agent is running."""
+    import json
+    from datetime import datetime
+
+    from ..utils.agent_client import get_agent_socket_path, ping_agent
+
+    socket_path = get_agent_socket_path()
+    status = ping_agent(socket_path)
+
+    if ctx.obj["output_json"]:
+        output = {"running": status is not None, "socket": str(socket_path)}
+        if status is not None:
+            output.update(
+                {
+                    "pid": status.get("pid"),
+                    "version": status.get("version"),
+                    "started_at": status.get("started_at"),
+                    "requests_served": status.get("requests_served"),
+                }
+            )
+        click.echo(json.dumps(output, indent=2))
+    elif status is None:
+        click.echo(f"sai agent is not running ({socket_path})")
+    else:
+        started_at = datetime.fromtimestamp(status.get("started_at", 0)).isoformat()
+        click.echo(f"sai agent is running on {socket_path}")
+        click.echo(f"  PID: {status.get('pid')}")
+        click.echo(f"  Version: {status.get('version')}")
+        click.echo(f"  Started: {started_at}")
+        click.echo(f"  Requests served: {status.get('requests_served')}")
+
+    if status is None:
+        ctx.exit(1)
+
+
 def main():
     """Main entry point."""
     cli()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,41 @@
 """Core sai functionality."""
 
-from .execution_engine import (
-    ExecutionContext,
-    ExecutionEngine,
-    ExecutionError,
-    ExecutionResult,
-    ExecutionStatus,
-    ProviderSelectionError,
-)
-from .git_repository_handler import GitOperationResult, GitRepositoryHandler, RepositoryInfo
-from .saidata_loader import SaidataLoader, SaidataNotFoundError, ValidationResult
-from .saidata_repository_manager import (
-    RepositoryHealthCheck,
-    RepositoryStatus,
-    SaidataRepositoryManager,
-)
-from .tarball_repository_handler import (
-    ReleaseInfo,
-    TarballOperationResult,
-    TarballRepositoryHandler,
-)
+from ..utils.lazy import make_lazy_getattr
+
+# Imported on first use; the repository handlers and the execution engine are
+# expensive and most commands need only one of them
+_LAZY_EXPORTS = {
+    "ExecutionContext": ".execution_engine",
+    "ExecutionEngine": ".execution_engine",
+    "ExecutionError": ".execution_engine",
+    "ExecutionResult": ".execution_engine",
+    "ExecutionStatus": ".execution_engine",
+    "ProviderSelectionError": ".execution_engine",
+    "GitOperationResult": ".git_repository_handler",
+    "GitRepositoryHandler": ".git_repository_handler",
+    "RepositoryInfo": ".git_repository_handler",
+    "CatalogEntry": ".saidata_catalog",
+    "SaidataCatalog": ".saidata_catalog",
+    "BulkLoadResult": ".saidata_loader",
+    "SaidataLoader": ".saidata_loader",
+    "SaidataNotFoundError": ".saidata_loader",
+    "ValidationResult": ".saidata_loader",
+    "SaidataMirror": ".saidata_mirror",
+    "RepositoryHealthCheck": ".saidata_repository_manager",
+    "RepositoryStatus": ".saidata_repository_manager",
+    "SaidataRepositoryManager": ".saidata_repository_manager",
+    "ReleaseInfo": ".tarball_repository_handler",
+    "TarballOperationResult": ".tarball_repository_handler",
+    "TarballRepositoryHandler": ".tarball_repository_handler",
+}
+
+__getattr__ = make_lazy_getattr(__name__, _LAZY_EXPORTS, globals())
 
 __all__ = [
     "SaidataLoader",
     "ValidationResult",
     "SaidataNotFoundError",
+    "BulkLoadResult",
     "ExecutionEngine",
     "ExecutionResult",
     "ExecutionContext",
@@ -40,4 +51,7 @@ __all__ = [
     "SaidataRepositoryManager",
     "RepositoryStatus",
     "RepositoryHealthCheck",
+    "SaidataCatalog",
+    "CatalogEntry",
+    "SaidataMirror",
 ]
@@ -55,6 +55,10 @@ class ActionExecutor:
         self.saidata_loader = saidata_loader
         self.logger = get_logger(__name__)
 
+        # Saidata loaded up front for the actions of the current action file
+        self._preloaded_saidata: Dict[str, SaiData] = {}
+        self._preload_errors: Dict[str, Exception] = {}
+
     def execute_action_file(
         self, action_file: ActionFile, global_config: Optional[Dict[str, Any]] = None
     ) -> ActionFileExecutionResult:
@@ -89,6 +93,9 @@ class ActionExecutor:
 
         self.logger.info(f"Executing {len(all_actions)} actions")
 
+        # Load saidata for all actions at once instead of once per action
+        self._preload_saidata(all_actions)
+
         # Execute actions
         if config.parallel:
             results = self._execute_actions_parallel(all_actions, config)
@@ -185,13 +192,7 @@ class ActionExecutor:
             ActionExecutionResult: Result of the action
         """
         # Normalize item to ActionItem
-        if isinstance(item, str):
-            action_item = ActionItem(name=item)
-        elif isinstance(item, dict):
-            action_item = ActionItem(**item)
-        else:
-            action_item = item
-
+        action_item = self._get_action_item(item)
         software = action_item.name
 
         try:
@@ -231,6 +232,41 @@ class ActionExecutor:
                 action_type=action_type, software=software, success=False, error=error_msg
             )
 
+    @staticmethod
+    def _get_action_item(item: Union[str, ActionItem, Dict[str, Any]]) -> ActionItem:
+        """Normalize an action item given as a string, dictionary or ActionItem.
+
+        Args:
+            item: Action item as found in the action file
+
+        Returns:
+            ActionItem: Normalized action item
+        """
+        if isinstance(item, str):
+            return ActionItem(name=item)
+        if isinstance(item, dict):
+            return ActionItem(**item)
+        return item
+
+    def _preload_saidata(self, actions: List[tuple[str, Union[str, ActionItem]]]) -> None:
+        """Load saidata for the software of all actions in one bulk load.
+
+        Args:
+            actions: Actions of the action file as (action type, item) pairs
+        """
+        self._preloaded_saidata = {}
+        self._preload_errors = {}
+        try:
+            software_names = [self._get_action_item(item).name for _, item in actions]
+            result = self.saidata_loader.load_many(software_names)
+        except Exception as e:
+            # Fall back to loading saidata action by action
+            self.logger.warning(f"Bulk saidata loading failed: {e}")
+            return
+
+        self._preloaded_saidata = result.saidata
+        self._preload_errors = result.errors
+
     def _load_saidata_for_software(self, software: str) -> SaiData:
         """Load saidata for software, creating minimal saidata if not found.
 
@@ -241,6 +277,10 @@ class ActionExecutor:
             SaiData: Loaded or minimal saidata
         """
         try:
+            if software in self._preloaded_saidata:
+                return self._preloaded_saidata[software]
+            if software in self._preload_errors:
+                raise self._preload_errors[software]
             return self.saidata_loader.load_saidata(software)
         except SaidataNotFoundError:
             # Create minimal saidata
@@ -0,0 +1,565 @@
+"""Long-running sai agent serving CLI invocations over a Unix domain socket.
+
+Starting ``sai`` pays for Python startup, importing the CLI, loading providers,
+detecting available providers and checking the saidata repository. The agent
+keeps all of that warm in one process: the CLI forwards its arguments,
+environment and working directory over a socket, the agent runs the command
+and streams output, prompts and the exit code back. The client side lives in
+:mod:`sai.utils.agent_client`.
+
+Commands take over the process environment, working directory and standard
+streams, so the agent runs one at a time. A listener thread keeps accepting
+connections meanwhile: it answers pings and interrupts, and turns other
+commands away as busy so their clients run them in-process instead of
+waiting behind a long one.
+"""
+
+import ctypes
+import io
+import logging
+import os
+import queue
+import signal
+import socket
+import struct
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.agent_client import AGENT_PROTOCOL_VERSION, ping_agent, receive_message, send_message
+from ..utils.errors import SaiError
+from ..version import get_version
+
+logger = logging.getLogger(__name__)
+
+# Seconds a client may take to send its request after connecting
+REQUEST_TIMEOUT = 5.0
+
+# Seconds the serving loop waits for commands between checks for a shutdown
+_POLL_INTERVAL = 0.5
+
+
+class AgentError(SaiError):
+    """Raised when the agent cannot be started."""
+
+
+class _AgentOutput(io.TextIOBase):
+    """Text stream sending everything written to it to the client."""
+
+    def __init__(self, stream, name: str, tty: bool):
+        self._stream = stream
+        self._name = name
+        self._tty = tty
+        self._closed = False
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: str) -> int:
+        # Click probes streams with b"" to tell text and binary streams apart
+        if not isinstance(data, str):
+            raise TypeError(f"write() argument must be str, not {type(data).__name__}")
+        if data and not self._closed:
+            try:
+                send_message(self._stream, {"type": self._name, "data": data})
+            except OSError:
+                # Client went away; keep running the command and drop its output
+                self._closed = True
+        return len(data)
+
+    def detach_client(self) -> None:
+        """Stop forwarding output, e.g. for handlers created during the request."""
+        self._closed = True
+
+
+class _AgentInput(io.TextIOBase):
+    """Text stream reading lines from the client on demand."""
+
+    def __init__(self, stream, tty: bool):
+        self._stream = stream
+        self._tty = tty
+        self._eof = False
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def readable(self) -> bool:
+        return True
+
+    def readline(self, size: int = -1) -> str:
+        if self._eof:
+            return ""
+        try:
+            send_message(self._stream, {"type": "input"})
+            message = receive_message(self._stream)
+        except (OSError, ValueError):
+            message = None
+
+        data = message.get("data") if message and message.get("type") == "input" else None
+        if not data:
+            self._eof = True
+            return ""
+        return data
+
+    def read(self, size: int = -1) -> str:
+        lines = []
+        while True:
+            line = self.readline()
+            if not line:
+                return "".join(lines)
+            lines.append(line)
+
+
+class AgentServer:
+    """Serves forwarded CLI invocations from a warm process.
+
+    Commands run one at a time on the thread calling serve_forever, because
+    each one temporarily takes over the process environment, working directory
+    and standard streams. Commands arriving while one runs are rejected as
+    busy. Provider data, provider instances with their template engines,
+    provider availability and the PATH index stay cached between commands;
+    the cached state is dropped when provider directories, the configuration
+    or the saidata repository metadata change.
+    """
+
+    def __init__(self, socket_path: Path, cli, idle_timeout: Optional[float] = None):
+        """Initialize the agent.
+
+        Args:
+            socket_path: Path of the Unix domain socket to listen on
+            cli: Click command that runs forwarded invocations
+            idle_timeout: Exit after this many seconds without requests, None to run forever
+        """
+        self.socket_path = socket_path
+        self.cli = cli
+        self.idle_timeout = idle_timeout
+        self.started_at = time.time()
+        self.requests_served = 0
+        self._socket: Optional[socket.socket] = None
+        self._state_token: Optional[Tuple[Any, ...]] = None
+        self._running = False
+        self._commands: "queue.Queue[Tuple[socket.socket, Any, Dict[str, Any]]]" = queue.Queue()
+        self._busy = False
+        self._current_request: Optional[int] = None
+        self._in_command = False
+        self._interrupt_pending = False
+        self._command_lock = threading.RLock()
+        self._serving_thread: Optional[threading.Thread] = None
+
+    def bind(self) -> None:
+        """Create and bind the agent socket.
+
+        Raises:
+            AgentError: If another agent is running or the socket cannot be created
+        """
+        if ping_agent(self.socket_path) is not None:
+            raise AgentError(f"An agent is already running on {self.socket_path}")
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            sock.bind(str(self.socket_path))
+        except OSError as e:
+            sock.close()
+            raise AgentError(f"Cannot create agent socket {self.socket_path}: {e}") from e
+        finally:
+            os.umask(old_umask)
+
+        sock.listen(64)
+        self._socket = sock
+
+        # Keep provider data loaded between requests
+        from ..providers.loader import ProviderLoader
+
+        ProviderLoader.enable_shared_state()
+        logger.info(f"sai agent listening on {self.socket_path}")
+
+    def serve_forever(self) -> None:
+        """Serve requests until shut down, interrupted or idle for too long."""
+        if self._socket is None:
+            self.bind()
+
+        self._running = True
+        self._serving_thread = threading.current_thread()
+        listener = threading.Thread(target=self._listen, name="sai-agent-listener", daemon=True)
+
+        previous_handlers = {}
+        if self._serving_thread is threading.main_thread():
+            previous_handlers[signal.SIGTERM] = signal.signal(signal.SIGTERM, self._handle_sigterm)
+            previous_handlers[signal.SIGINT] = signal.signal(signal.SIGINT, self._handle_sigint)
+        try:
+            listener.start()
+            idle_since = time.monotonic()
+            while self._running:
+                if (
+                    self.idle_timeout is not None
+                    and time.monotonic() - idle_since >= self.idle_timeout
+                ):
+                    logger.info("sai agent idle timeout reached, exiting")
+                    break
+
+                try:
+                    conn, stream, request = self._commands.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+
+                with conn, stream:
+                    try:
+                        exit_code = self._handle_run(stream, request)
+                    except (OSError, ValueError) as e:
+                        logger.debug(f"Agent connection failed: {e}")
+                        exit_code = None
+                    finally:
+                        # Free the agent before the client learns the command is done
+                        with self._command_lock:
+                            self._busy = False
+                            self._current_request = None
+
+                    if exit_code is not None:
+                        try:
+                            send_message(stream, {"type": "exit", "code": exit_code})
+                        except OSError as e:
+                            logger.debug(f"Agent connection failed: {e}")
+                idle_since = time.monotonic()
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            self.close()
+            listener.join(timeout=5)
+
+            # Clients of commands that never started run them in-process
+            while not self._commands.empty():
+                conn, stream, _ = self._commands.get_nowait()
+                stream.close()
+                conn.close()
+
+    def close(self) -> None:
+        """Close the socket, remove the socket file and stop sharing provider data."""
+        from ..providers.loader import ProviderLoader
+
+        self._running = False
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+            ProviderLoader.disable_shared_state()
+
+    def _handle_sigterm(self, signum, frame) -> None:
+        """Stop serving after the current request on SIGTERM."""
+        raise KeyboardInterrupt
+
+    def _handle_sigint(self, signum, frame) -> None:
+        """Interrupt the running command for its client, or stop the agent on Ctrl+C."""
+        if self._interrupt_pending:
+            self._interrupt_pending = False
+            if self._in_command:
+                raise KeyboardInterrupt
+            return
+        raise KeyboardInterrupt
+
+    def _interrupt(self, request_id: Any) -> bool:
+        """Interrupt the running command on behalf of its client.
+
+        Args:
+            request_id: Request ID the agent sent the client when the command started
+
+        Returns:
+            True if the command was interrupted
+        """
+        with self._command_lock:
+            if not self._in_command or request_id != self._current_request:
+                return False
+
+            thread = self._serving_thread
+            if thread is threading.main_thread() and hasattr(signal, "pthread_kill"):
+                # A signal also wakes the command from blocking system calls
+                self._interrupt_pending = True
+                signal.pthread_kill(thread.ident, signal.SIGINT)
+            else:
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                    ctypes.c_ulong(thread.ident), ctypes.py_object(KeyboardInterrupt)
+                )
+        logger.info(f"Interrupted request {request_id} on behalf of its client")
+        return True
+
+    def _listen(self) -> None:
+        """Accept connections until the agent stops."""
+        while self._running:
+            sock = self._socket
+            if sock is None:
+                break
+            try:
+                sock.settimeout(_POLL_INTERVAL)
+                conn, _ = sock.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            self._handle_connection(conn)
+
+    def _is_peer_allowed(self, conn: socket.socket) -> bool:
+        """Check that the client runs as the same user as the agent.
+
+        Args:
+            conn: Accepted client connection
+
+        Returns:
+            True if the client may use the agent
+        """
+        if not hasattr(socket, "SO_PEERCRED"):
+            # The socket is only reachable by its owner thanks to its permissions
+            return True
+
+        credentials = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        _, uid, _ = struct.unpack("3i", credentials)
+        return uid == os.getuid()
+
+    def _handle_connection(self, conn: socket.socket) -> None:
+        """Handle one client connection on the listener thread.
+
+        Commands are handed to the serving thread, everything else is answered
+        right away.
+
+        Args:
+            conn: Accepted client connection
+        """
+        stream = conn.makefile("rwb")
+        handed_over = False
+        try:
+            if not self._is_peer_allowed(conn):
+                logger.warning("Rejected agent connection from another user")
+                send_message(stream, {"type": "rejected", "reason": "permission denied"})
+                return
+
+            conn.settimeout(REQUEST_TIMEOUT)
+            message = receive_message(stream)
+            if message is None:
+                return
+            conn.settimeout(None)
+
+            message_type = message.get("type")
+            if message_type == "ping":
+                send_message(
+                    stream,
+                    {
+                        "type": "pong",
+                        "pid": os.getpid(),
+                        "version": get_version(),
+                        "started_at": self.started_at,
+                        "requests_served": self.requests_served,
+                        "busy": self._busy,
+                    },
+                )
+            elif message_type == "shutdown":
+                self._running = False
+                send_message(stream, {"type": "bye"})
+            elif message_type == "interrupt":
+                interrupted = self._interrupt(message.get("request"))
+                send_message(stream, {"type": "interrupted" if interrupted else "finished"})
+            elif message_type == "run":
+                with self._command_lock:
+                    if not self._busy:
+                        self._busy = True
+                        self._commands.put((conn, stream, message))
+                        handed_over = True
+                if not handed_over:
+                    send_message(stream, {"type": "rejected", "reason": "busy"})
+            else:
+                send_message(stream, {"type": "rejected", "reason": "unknown request"})
+
+        except (OSError, ValueError) as e:
+            logger.debug(f"Agent connection failed: {e}")
+        finally:
+            if not handed_over:
+                stream.close()
+                conn.close()
+
+    def _handle_run(self, stream, request: Dict[str, Any]) -> Optional[int]:
+        """Run a forwarded CLI invocation.
+
+        Args:
+            stream: Binary socket file of the client connection
+            request: Run request from the client
+
+        Returns:
+            Exit code of the command, or None if the request was rejected
+        """
+        if (
+            request.get("protocol") != AGENT_PROTOCOL_VERSION
+            or request.get("version") != get_version()
+        ):
+            send_message(stream, {"type": "rejected", "reason": "version mismatch"})
+            return None
+
+        argv = request.get("argv")
+        cwd = request.get("cwd")
+        env = request.get("env")
+        if not isinstance(argv, list) or not isinstance(cwd, str) or not isinstance(env, dict):
+            send_message(stream, {"type": "rejected", "reason": "malformed request"})
+            return None
+
+        try:
+            saved_cwd = os.getcwd()
+            os.chdir(cwd)
+        except OSError:
+            send_message(stream, {"type": "rejected", "reason": "working directory not accessible"})
+            return None
+
+        stdout = _AgentOutput(stream, "stdout", bool(request.get("stdout_tty")))
+        stderr = _AgentOutput(stream, "stderr", bool(request.get("stderr_tty")))
+        stdin = _AgentInput(stream, bool(request.get("stdin_tty")))
+
+        saved_streams = (sys.stdin, sys.stdout, sys.stderr)
+        saved_environ = dict(os.environ)
+        self.requests_served += 1
+        with self._command_lock:
+            self._current_request = self.requests_served
+        send_message(stream, {"type": "started", "request": self.requests_served})
+
+        try:
+            os.environ.clear()
+            os.environ.update({str(k): str(v) for k, v in env.items()})
+            sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+
+            try:
+                exit_code = self._run_cli(argv, Path(cwd), bool(request.get("stdout_tty")))
+            except KeyboardInterrupt:
+                # An interrupt that arrived just as the command finished
+                exit_code = 1
+
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = saved_streams
+            os.environ.clear()
+            os.environ.update(saved_environ)
+            try:
+                os.chdir(saved_cwd)
+            except OSError:
+                pass
+            stdout.detach_client()
+            stderr.detach_client()
+
+        return exit_code
+
+    def _run_cli(self, argv: List[str], cwd: Path, color: bool) -> int:
+        """Run the CLI with the client's arguments.
+
+        Args:
+            argv: Command line arguments
+            cwd: Client working directory
+            color: Whether the client's output supports colors
+
+        Returns:
+            Exit code of the command
+        """
+        try:
+            self._refresh_state(cwd)
+            with self._command_lock:
+                self._in_command = True
+            self.cli.main(args=argv, prog_name="sai", standalone_mode=True, color=color)
+            return 0
+        except SystemExit as e:
+            if e.code is None:
+                return 0
+            if isinstance(e.code, int):
+                return e.code
+            sys.stderr.write(f"{e.code}\n")
+            return 1
+        except KeyboardInterrupt:
+            sys.stderr.write("Aborted!\n")
+            return 1
+        except Exception:
+            sys.stderr.write(traceback.format_exc())
+            return 1
+        finally:
+            with self._command_lock:
+                self._in_command = False
+                self._interrupt_pending = False
+            self._flush_caches()
+
+    def _refresh_state(self, cwd: Path) -> None:
+        """Reload configuration and drop cached state that may be outdated.
+
+        Args:
+            cwd: Client working directory, used to find project configuration
+        """
+        from ..utils.config import get_config, reset_config_manager
+
+        # Configuration is cheap to read and commands may modify the loaded object
+        reset_config_manager(working_directory=cwd)
+
+        token = self._compute_state_token(get_config())
+        if self._state_token is not None and token != self._state_token:
+            logger.info("Providers, configuration or saidata repository changed")
+            self.invalidate()
+        self._state_token = token
+
+    def _compute_state_token(self, config) -> Tuple[Any, ...]:
+        """Fingerprint the files and directories the cached state depends on.
+
+        Args:
+            config: Current SAI configuration
+
+        Returns:
+            Tuple of modification times, changing when any of them changes
+        """
+        from ..providers.loader import ProviderLoader
+        from ..utils.config import ConfigManager
+
+        paths: List[Path] = []
+        for directory in ProviderLoader(enable_caching=False).get_default_provider_directories():
+            paths.extend([directory, directory / "specialized"])
+        paths.extend(ConfigManager.DEFAULT_CONFIG_PATHS[:2])
+
+        repository_cache_dir = config.saidata_repository_cache_dir or (
+            config.cache_directory / "repositories"
+        )
+        paths.append(repository_cache_dir / ".repository_metadata")
+
+        token = []
+        for path in paths:
+            try:
+                token.append((str(path), path.stat().st_mtime_ns))
+            except OSError:
+                token.append((str(path), None))
+        return tuple(token)
+
+    def invalidate(self) -> None:
+        """Drop cached provider data and PATH lookups."""
+        from ..providers.loader import ProviderLoader
+        from ..utils.path_index import get_path_index
+
+        ProviderLoader.clear_shared_state()
+        get_path_index().invalidate()
+
+    @staticmethod
+    def _flush_caches() -> None:
+        """Write cached provider availability updates after each request."""
+        try:
+            from ..utils.cache import flush_provider_caches
+
+            flush_provider_caches()
+        except Exception as e:
+            logger.debug(f"Failed to flush provider caches: {e}")
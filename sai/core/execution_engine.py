@@ -7,18 +7,21 @@ import subprocess
 import tempfile
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from ..models.provider_data import Action
 from ..models.saidata import SaiData
 from ..providers.base import BaseProvider
+from ..providers.detection import ProviderDetector
 from ..utils.errors import (
     ExecutionError,
     ProviderSelectionError,
 )
 from ..utils.execution_tracker import ExecutionStatus, get_execution_tracker
 from ..utils.logging import get_logger
-from ..utils.system import get_system_info
+from ..utils.path_index import get_path_index
+from ..utils.system import get_platform, get_system_info
 
 logger = get_logger(__name__)
 
@@ -80,9 +83,19 @@ class ExecutionEngine:
             config: SAI configuration object
         """
         self.providers = providers
-        self.available_providers = [p for p in providers if p.is_available()]
         self.config = config
+        self.available_providers = ProviderDetector.from_config(config).filter_available(
+            providers
+        )
         self.execution_tracker = get_execution_tracker(config)
+        self._secure_path_cache: Optional[tuple] = None
+
+        # Route actions to providers once instead of scanning and sorting per call
+        self._providers_by_name: Dict[str, BaseProvider] = {}
+        for provider in self.available_providers:
+            self._providers_by_name.setdefault(provider.name, provider)
+        self._provider_priorities: Dict[str, int] = {}
+        self._routing_table = self._build_routing_table(self.available_providers)
 
         logger.info(
             f"ExecutionEngine initialized with {len(self.providers)} providers "
@@ -212,43 +225,73 @@ class ExecutionEngine:
         """
         # If specific provider is requested, use it
         if context.provider:
-            for provider in self.available_providers:
-                if provider.name == context.provider:
-                    if provider.has_action(context.action):
-                        logger.debug(f"Using requested provider '{context.provider}'")
-                        return provider
-                    else:
-                        raise ProviderSelectionError(
-                            f"Provider '{
-                                context.provider}' does not support action '{
-                                context.action}'")
-
-            raise ProviderSelectionError(f"Requested provider '{context.provider}' not available")
-
-        # Find providers that support the action
-        suitable_providers = [p for p in self.available_providers if p.has_action(context.action)]
+            provider = self._providers_by_name.get(context.provider)
+            if provider is None:
+                raise ProviderSelectionError(
+                    f"Requested provider '{context.provider}' not available"
+                )
 
-        if not suitable_providers:
-            available_actions = set()
-            for p in self.available_providers:
-                available_actions.update(p.get_supported_actions())
+            if provider.has_action(context.action):
+                logger.debug(f"Using requested provider '{context.provider}'")
+                return provider
 
             raise ProviderSelectionError(
-                f"No available provider supports action '{context.action}'. "
-                f"Available actions: {sorted(available_actions)}"
+                f"Provider '{context.provider}' does not support action '{context.action}'"
             )
 
-        # Sort by priority (higher priority first)
-        suitable_providers.sort(key=lambda p: p.get_priority(), reverse=True)
+        # Providers supporting the action, already sorted by priority (highest first)
+        suitable_providers = self._routing_table.get(context.action)
+
+        if not suitable_providers:
+            raise ProviderSelectionError(
+                f"No available provider supports action '{context.action}'. "
+                f"Available actions: {sorted(self._routing_table)}"
+            )
 
         selected = suitable_providers[0]
         logger.debug(
-            f"Selected provider '{selected.name}' (priority: {selected.get_priority()}) "
+            f"Selected provider '{selected.name}' "
+            f"(priority: {self._provider_priorities[selected.name]}) "
             f"from {len(suitable_providers)} suitable providers"
         )
 
         return selected
 
+    def _build_routing_table(
+        self, providers: List[BaseProvider]
+    ) -> Mapping[str, Tuple[BaseProvider, ...]]:
+        """Build the action to provider routing table.
+
+        Args:
+            providers: Available providers in preference order
+
+        Returns:
+            Read-only mapping of action names to providers sorted by priority (highest first)
+        """
+        current_platform = get_platform()
+
+        routes: Dict[str, List[BaseProvider]] = {}
+        for provider in providers:
+            self._provider_priorities.setdefault(
+                provider.name, provider.get_priority(current_platform)
+            )
+            for action_name in provider.get_supported_actions():
+                routes.setdefault(action_name, []).append(provider)
+
+        # Stable sort keeps the given order among providers with equal priority
+        return MappingProxyType(
+            {
+                action_name: tuple(
+                    sorted(
+                        action_providers,
+                        key=lambda p: self._provider_priorities[p.name],
+                        reverse=True,
+                    )
+                )
+                for action_name, action_providers in routes.items()
+            }
+        )
+
     def _dry_run_action(
         self,
         provider: BaseProvider,
@@ -702,7 +745,11 @@ class ExecutionEngine:
                 start_new_session=True if os.name != "nt" else False,
             )
 
-            return self._handle_process_execution(process, timeout, verbose)
+            try:
+                return self._handle_process_execution(process, timeout, verbose)
+            finally:
+                # The command may have installed or removed executables
+                get_path_index().invalidate()
 
         except Exception as e:
             logger.error(f"Command execution error: {e}")
@@ -1195,17 +1242,25 @@ class ExecutionEngine:
                 "/usr/local/sbin",
             ]
 
+        # Reuse the last result while PATH and the indexed directories are unchanged
+        path_index = get_path_index()
+        current_path = os.environ.get("PATH", "")
+        cache_key = (system_info["platform"], current_path, path_index.generation)
+        if self._secure_path_cache is not None and self._secure_path_cache[0] == cache_key:
+            return self._secure_path_cache[1]
+
         # Filter existing paths
-        existing_paths = [path for path in safe_paths if os.path.isdir(path)]
+        existing_paths = [path for path in safe_paths if path_index.get_directory(path).exists]
 
         # Add current PATH entries that are safe
-        current_path = os.environ.get("PATH", "")
         if current_path:
             for path in current_path.split(os.pathsep):
                 if path and self._is_safe_path_entry(path) and path not in existing_paths:
                     existing_paths.append(path)
 
-        return os.pathsep.join(existing_paths)
+        secure_path = os.pathsep.join(existing_paths)
+        self._secure_path_cache = (cache_key, secure_path)
+        return secure_path
 
     def _is_safe_env_value(self, value: str) -> bool:
         """Check if an environment variable value is safe.
@@ -1255,16 +1310,13 @@ class ExecutionEngine:
             return False
 
         # Block paths that don't exist or aren't directories
-        if not os.path.isdir(path):
+        directory = get_path_index().get_directory(path)
+        if not directory.exists:
             return False
 
         # Block world-writable directories (security risk)
-        try:
-            stat_info = os.stat(path)
-            if stat_info.st_mode & 0o002:  # World writable
-                logger.warning(f"Blocking world-writable path: {path}")
-                return False
-        except OSError:
+        if directory.world_writable:
+            logger.warning(f"Blocking world-writable path: {path}")
             return False
 
         return True
@@ -1339,12 +1391,22 @@ class ExecutionEngine:
                 return provider
         return None
 
-    def get_supported_actions(self) -> Dict[str, List[str]]:
+    def get_supported_actions(self, by_action: bool = False) -> Dict[str, List[str]]:
         """Get all supported actions by provider.
 
+        Args:
+            by_action: Return the routing table instead, mapping each action name
+                to the names of the providers supporting it (highest priority first)
+
         Returns:
             Dictionary mapping provider names to their supported actions
         """
+        if by_action:
+            return {
+                action_name: [provider.name for provider in action_providers]
+                for action_name, action_providers in self._routing_table.items()
+            }
+
         result = {}
         for provider in self.available_providers:
             result[provider.name] = provider.get_supported_actions()
@@ -3,10 +3,10 @@
 import logging
 import subprocess
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from ..models.config import RepositoryAuthType
 from ..utils.credentials import CredentialManager
@@ -43,6 +43,48 @@ class GitOperationResult:
     return_code: int = 0
 
 
+@dataclass
+class SparseCheckoutProfile:
+    """Parts of a saidata repository to materialize in a sparse checkout.
+
+    Files at the repository root are always checked out. Within ``software/``
+    only the selected prefix directories are checked out, and of those only
+    the default files and the override directories of the selected operating
+    systems. Everything else stays in the repository and can be hydrated later.
+    """
+
+    prefixes: List[str] = field(default_factory=list)  # software/{prefix} dirs, empty for all
+    os_ids: Optional[List[str]] = None  # OS override directories, None for all
+
+    def get_patterns(self) -> List[str]:
+        """Get the non-cone sparse-checkout patterns of the profile.
+
+        Returns:
+            Sparse-checkout patterns
+        """
+        patterns = ["/*", "!/*/"]
+        for prefix in self.prefixes or ["*"]:
+            patterns.extend(self.get_directory_patterns(f"software/{prefix}/*"))
+        return patterns
+
+    def get_directory_patterns(self, directory: str) -> List[str]:
+        """Get the patterns checking out software directories under the profile.
+
+        Args:
+            directory: Software directory relative to the repository root, may
+                       contain glob characters
+
+        Returns:
+            Sparse-checkout patterns
+        """
+        directory = directory.strip("/")
+        patterns = [f"/{directory}/"]
+        if self.os_ids is not None:
+            patterns.append(f"!/{directory}/*/")
+            patterns.extend(f"/{directory}/{os_id}/" for os_id in self.os_ids)
+        return patterns
+
+
 class GitRepositoryHandler:
     """Handles git-based repository operations for SAI saidata management."""
 
@@ -103,6 +145,8 @@ class GitRepositoryHandler:
         auth_type: Optional[RepositoryAuthType] = None,
         auth_data: Optional[Dict[str, str]] = None,
         verify_signatures: bool = True,
+        partial_clone: bool = False,
+        sparse_profile: Optional[SparseCheckoutProfile] = None,
     ) -> GitOperationResult:
         """Clone a git repository with security validation.
 
@@ -114,6 +158,9 @@ class GitRepositoryHandler:
             auth_type: Authentication type (ssh, token, basic)
             auth_data: Authentication data (keys, tokens, credentials)
             verify_signatures: Whether to verify git signatures after clone
+            partial_clone: Whether to clone without file contents (``--filter=blob:none``),
+                           fetching them when they are checked out
+            sparse_profile: Only check out the parts of the repository in the profile
 
         Returns:
             GitOperationResult with operation status and details
@@ -122,6 +169,7 @@ class GitRepositoryHandler:
         logger.debug(
             f"Clone parameters: branch={branch}, shallow={shallow}, auth_type={auth_type}, verify_signatures={verify_signatures}"
         )
+        logger.debug(f"Partial clone: {partial_clone}, sparse profile: {sparse_profile}")
 
         # Security validation of repository URL
         url_validation = self.security_validator.validate_repository_url(url)
@@ -162,6 +210,13 @@ class GitRepositoryHandler:
         if shallow:
             cmd.extend(["--depth", "1"])
 
+        if partial_clone:
+            cmd.append("--filter=blob:none")
+
+        # Sparse clones are checked out once the sparse-checkout patterns are set
+        if sparse_profile:
+            cmd.append("--no-checkout")
+
         cmd.extend(["--branch", branch, url, str(target_dir)])
 
         # Setup environment for authentication (with credential manager integration)
@@ -170,6 +225,9 @@ class GitRepositoryHandler:
         # Execute clone with retries and enhanced error handling
         result = self._execute_git_command_with_retry(cmd, env=env)
 
+        if result.success and sparse_profile:
+            result = self._checkout_sparse(target_dir, branch, sparse_profile, env)
+
         if result.success:
             logger.info(f"Git clone completed successfully: {url}")
 
@@ -292,6 +350,158 @@ class GitRepositoryHandler:
             self._log_git_error_details(reset_result, str(repo_dir), "reset")
             return reset_result
 
+    def _checkout_sparse(
+        self,
+        repo_dir: Path,
+        branch: str,
+        sparse_profile: SparseCheckoutProfile,
+        env: Optional[Dict[str, str]] = None,
+    ) -> GitOperationResult:
+        """Set the sparse-checkout patterns of a fresh clone and check it out.
+
+        Args:
+            repo_dir: Path to the cloned repository
+            branch: Branch to check out
+            sparse_profile: Parts of the repository to check out
+            env: Environment variables for authentication
+
+        Returns:
+            GitOperationResult of the checkout
+        """
+        patterns = sparse_profile.get_patterns()
+        logger.debug(f"Setting sparse-checkout patterns: {patterns}")
+        set_cmd = ["git", "-C", str(repo_dir), "sparse-checkout", "set", "--no-cone", *patterns]
+        set_result = self._execute_git_command(set_cmd)
+        if not set_result.success:
+            logger.error(f"Failed to set sparse-checkout patterns: {set_result.stderr}")
+            return set_result
+
+        # With a partial clone the checkout fetches the contents of the selected files
+        checkout_cmd = ["git", "-C", str(repo_dir), "checkout", branch]
+        checkout_result = self._execute_git_command_with_retry(checkout_cmd, env=env)
+        if checkout_result.success:
+            checkout_result.message = "Repository cloned with sparse checkout"
+        return checkout_result
+
+    def is_sparse_checkout(self, repo_dir: Path) -> bool:
+        """Check whether a repository only checks out part of its files.
+
+        Args:
+            repo_dir: Path to the repository directory
+
+        Returns:
+            True if sparse checkout is enabled, False otherwise
+        """
+        if not (repo_dir / ".git").exists():
+            return False
+
+        cmd = ["git", "-C", str(repo_dir), "config", "--bool", "core.sparseCheckout"]
+        result = self._execute_git_command(cmd)
+        return result.success and result.stdout.strip() == "true"
+
+    def hydrate_paths(
+        self,
+        repo_dir: Path,
+        paths: List[str],
+        sparse_profile: Optional[SparseCheckoutProfile] = None,
+        auth_type: Optional[RepositoryAuthType] = None,
+        auth_data: Optional[Dict[str, str]] = None,
+    ) -> GitOperationResult:
+        """Add directories to the checkout of a sparse repository.
+
+        Directories that do not exist in the checked out commit are skipped,
+        so asking for unknown software costs no network request.
+
+        Args:
+            repo_dir: Path to the repository directory
+            paths: Directories relative to the repository root
+            sparse_profile: Profile limiting which OS override directories are added
+            auth_type: Authentication type (ssh, token, basic)
+            auth_data: Authentication data (keys, tokens, credentials)
+
+        Returns:
+            GitOperationResult, successful if at least one directory was added
+        """
+        if not self.is_sparse_checkout(repo_dir):
+            return GitOperationResult(success=False, message="Repository is not a sparse checkout")
+
+        # Trees are always available locally, even in a partial clone
+        ls_cmd = ["git", "-C", str(repo_dir), "ls-tree", "-d", "--name-only", "HEAD", "--"]
+        ls_result = self._execute_git_command([*ls_cmd, *paths])
+        existing = set(ls_result.stdout.splitlines()) if ls_result.success else set()
+        paths = [path for path in paths if path.strip("/") in existing]
+        if not paths:
+            return GitOperationResult(success=False, message="Paths do not exist in repository")
+
+        patterns = []
+        for path in paths:
+            if sparse_profile:
+                patterns.extend(sparse_profile.get_directory_patterns(path))
+            else:
+                patterns.append(f"/{path.strip('/')}/")
+
+        logger.info(f"Hydrating sparse repository paths: {', '.join(paths)}")
+        env = self._setup_git_environment(auth_type, auth_data)
+        add_cmd = ["git", "-C", str(repo_dir), "sparse-checkout", "add", *patterns]
+        result = self._execute_git_command_with_retry(add_cmd, env=env)
+        if not result.success:
+            self._log_git_error_details(result, str(repo_dir), "sparse-checkout")
+        return result
+
+    def get_head_commit(self, repo_dir: Path) -> Optional[str]:
+        """Get the commit a repository is checked out at.
+
+        Args:
+            repo_dir: Path to the repository directory
+
+        Returns:
+            Commit hash, or None if not a valid repository
+        """
+        if not (repo_dir / ".git").exists():
+            return None
+
+        result = self._execute_git_command(["git", "-C", str(repo_dir), "rev-parse", "HEAD"])
+        if not result.success:
+            return None
+        return result.stdout.strip() or None
+
+    def get_changed_paths(
+        self, repo_dir: Path, from_commit: str, to_commit: str
+    ) -> Optional[List[str]]:
+        """List the files that differ between two commits.
+
+        Only trees are compared, so this works in partial clones without
+        fetching file contents.
+
+        Args:
+            repo_dir: Path to the repository directory
+            from_commit: Commit the repository was at
+            to_commit: Commit the repository is at now
+
+        Returns:
+            Paths relative to the repository root, or None if the commits cannot be compared
+        """
+        if from_commit == to_commit:
+            return []
+
+        cmd = [
+            "git",
+            "-C",
+            str(repo_dir),
+            "diff",
+            "--name-only",
+            "--no-renames",
+            "-z",
+            from_commit,
+            to_commit,
+            "--",
+        ]
+        result = self._execute_git_command(cmd)
+        if not result.success:
+            logger.debug(f"Cannot list changes {from_commit}..{to_commit}: {result.stderr}")
+            return None
+        return [path for path in result.stdout.split("\0") if path]
+
     def get_repository_info(self, repo_dir: Path) -> Optional[RepositoryInfo]:
         """Get information about a git repository.
 
@@ -2,17 +2,24 @@
 
 import json
 import logging
+import os
 import shutil
+import threading
 import time
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from ..models.config import SaiConfig
+from .repository_stats import FileManifest
 
 logger = logging.getLogger(__name__)
 
+# Serializes metadata updates of caches used from several threads, such as
+# layered repositories that are updated concurrently
+_metadata_lock = threading.RLock()
+
 
 @dataclass
 class RepositoryMetadata:
@@ -26,6 +33,9 @@ class RepositoryMetadata:
     auth_type: Optional[str] = None
     size_bytes: int = 0
     file_count: int = 0
+    health: Optional[Dict[str, Any]] = None
+    release: Optional[Dict[str, Any]] = None
+    revision: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -150,7 +160,9 @@ class RepositoryCache:
             }
 
             # Write atomically by writing to temp file first
-            temp_file = self.metadata_file.with_suffix(".tmp")
+            temp_file = self.metadata_file.with_name(
+                f"{self.metadata_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
             with open(temp_file, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2)
 
@@ -203,7 +215,7 @@ class RepositoryCache:
         return self.cache_dir / repo_key
 
     def _calculate_directory_stats(self, directory: Path) -> tuple[int, int]:
-        """Calculate size and file count for a directory.
+        """Calculate size and file count for a directory by walking all of it.
 
         Args:
             directory: Directory to analyze
@@ -211,26 +223,51 @@ class RepositoryCache:
         Returns:
             Tuple of (size_bytes, file_count)
         """
-        if not directory.exists():
-            return 0, 0
+        manifest = FileManifest.scan(directory)
+        return manifest.size_bytes, manifest.file_count
 
-        total_size = 0
-        file_count = 0
+    def _update_file_manifest(
+        self,
+        local_path: Path,
+        previous_revision: Optional[str],
+        revision: Optional[str],
+        changed_paths: Optional[Iterable[str]],
+        files: Optional[Dict[str, int]],
+    ) -> FileManifest:
+        """Bring the file manifest of a repository up to date after an update.
+
+        Args:
+            local_path: Repository directory
+            previous_revision: Revision recorded at the previous update
+            revision: Revision the repository is now at
+            changed_paths: Paths changed since the previous revision, None if unknown
+            files: Sizes of all files by relative path, if known without a walk
+
+        Returns:
+            The updated manifest
+        """
+        if files is not None:
+            manifest = FileManifest(local_path, dict(files), revision)
+        else:
+            manifest = None
+            if changed_paths is not None:
+                manifest = FileManifest.load(local_path)
+                if manifest is not None and manifest.revision != previous_revision:
+                    manifest = None
+
+            if manifest is None:
+                logger.debug(f"Scanning all files of repository {local_path}")
+                manifest = FileManifest.scan(local_path, revision)
+            else:
+                applied = manifest.apply_changes(changed_paths)
+                manifest.revision = revision
+                logger.debug(f"Applied {applied} changed paths to file manifest of {local_path}")
 
         try:
-            for item in directory.rglob("*"):
-                if item.is_file():
-                    try:
-                        total_size += item.stat().st_size
-                        file_count += 1
-                    except (OSError, IOError):
-                        # Skip files we can't read
-                        pass
-        except (OSError, IOError):
-            # Skip directories we can't read
-            pass
-
-        return total_size, file_count
+            manifest.save()
+        except OSError as e:
+            logger.warning(f"Failed to save file manifest of {local_path}: {e}")
+        return manifest
 
     def is_repository_valid(self, url: str, branch: str = "main") -> bool:
         """Check if a cached repository is valid and not expired.
@@ -289,40 +326,150 @@ class RepositoryCache:
         branch: str = "main",
         is_git_repo: bool = True,
         auth_type: Optional[str] = None,
+        release: Optional[Dict[str, Any]] = None,
+        revision: Optional[str] = None,
+        changed_paths: Optional[Iterable[str]] = None,
+        files: Optional[Dict[str, int]] = None,
     ) -> None:
         """Mark a repository as updated in the cache.
 
+        File statistics are carried over from the previous update with only the
+        changed paths re-examined when those are known, and are taken from
+        ``files`` when given. Otherwise the whole repository is walked.
+
         Args:
             url: Repository URL
             branch: Repository branch
             is_git_repo: Whether this is a git repository or tarball
             auth_type: Authentication type used
+            release: Release a tarball repository was extracted from
+            revision: Commit the repository is checked out at
+            changed_paths: Paths changed since the revision recorded at the previous update
+            files: Sizes of all files by path relative to the repository directory
         """
         if not self.cache_enabled:
             return
 
-        repositories = self._load_metadata()
         repo_key = self._get_repository_key(url, branch)
         local_path = self._get_repository_path(url, branch)
 
-        # Calculate directory statistics
-        size_bytes, file_count = self._calculate_directory_stats(local_path)
+        previous = self._load_metadata().get(repo_key)
+        manifest = self._update_file_manifest(
+            local_path,
+            previous.revision if previous else None,
+            revision,
+            changed_paths,
+            files,
+        )
 
         # Create or update metadata
-        repositories[repo_key] = RepositoryMetadata(
-            url=url,
-            branch=branch,
-            local_path=local_path,
-            last_updated=time.time(),
-            is_git_repo=is_git_repo,
-            auth_type=auth_type,
-            size_bytes=size_bytes,
-            file_count=file_count,
-        )
+        with _metadata_lock:
+            repositories = self._load_metadata()
+            repositories[repo_key] = RepositoryMetadata(
+                url=url,
+                branch=branch,
+                local_path=local_path,
+                last_updated=time.time(),
+                is_git_repo=is_git_repo,
+                auth_type=auth_type,
+                size_bytes=manifest.size_bytes,
+                file_count=manifest.file_count,
+                release=release,
+                revision=revision,
+            )
+            self._save_metadata(repositories)
 
-        self._save_metadata(repositories)
         logger.debug(f"Marked repository '{url}#{branch}' as updated")
 
+    def update_repository_stats(
+        self, url: str, branch: str = "main", changed_paths: Iterable[str] = ()
+    ) -> None:
+        """Update the file statistics of a repository after files changed outside an update.
+
+        Args:
+            url: Repository URL
+            branch: Repository branch
+            changed_paths: Changed files or directories relative to the repository directory
+        """
+        if not self.cache_enabled:
+            return
+
+        with _metadata_lock:
+            repositories = self._load_metadata()
+            repo_meta = repositories.get(self._get_repository_key(url, branch))
+            if repo_meta is None:
+                return
+
+            manifest = self._update_file_manifest(
+                repo_meta.local_path, repo_meta.revision, repo_meta.revision, changed_paths, None
+            )
+            repo_meta.size_bytes = manifest.size_bytes
+            repo_meta.file_count = manifest.file_count
+            self._save_metadata(repositories)
+
+    def get_repository_revision(self, url: str, branch: str = "main") -> Optional[str]:
+        """Get the commit a git repository was at when it was last updated.
+
+        Args:
+            url: Repository URL
+            branch: Repository branch
+
+        Returns:
+            Commit hash, or None if unknown
+        """
+        repo_meta = self._load_metadata().get(self._get_repository_key(url, branch))
+        return repo_meta.revision if repo_meta else None
+
+    def get_repository_release(self, url: str, branch: str = "main") -> Optional[Dict[str, Any]]:
+        """Get the release a tarball repository was extracted from.
+
+        Args:
+            url: Repository URL
+            branch: Repository branch
+
+        Returns:
+            Release information, or None if the repository was not updated from a release
+        """
+        repo_meta = self._load_metadata().get(self._get_repository_key(url, branch))
+        return repo_meta.release if repo_meta else None
+
+    def get_repository_health(self, url: str, branch: str = "main") -> Optional[Dict[str, Any]]:
+        """Get the last recorded health check of a repository.
+
+        Args:
+            url: Repository URL
+            branch: Repository branch
+
+        Returns:
+            Health check snapshot, or None if none was recorded since the last update
+        """
+        repo_meta = self._load_metadata().get(self._get_repository_key(url, branch))
+        return repo_meta.health if repo_meta else None
+
+    def set_repository_health(
+        self, url: str, branch: str = "main", health: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Record the health check of a repository.
+
+        The snapshot is dropped when the repository is marked as updated.
+
+        Args:
+            url: Repository URL
+            branch: Repository branch
+            health: Health check snapshot, None to forget the recorded one
+        """
+        if not self.cache_enabled:
+            return
+
+        with _metadata_lock:
+            repositories = self._load_metadata()
+            repo_meta = repositories.get(self._get_repository_key(url, branch))
+            if repo_meta is None or repo_meta.health == health:
+                return
+
+            repo_meta.health = health
+            self._save_metadata(repositories)
+
     def get_repository_status(self, url: str, branch: str = "main") -> RepositoryStatus:
         """Get detailed status information for a repository.
 
@@ -354,8 +501,9 @@ class RepositoryCache:
             size_bytes = repo_meta.size_bytes
             file_count = repo_meta.file_count
         elif exists:
-            # Repository exists but no metadata - calculate stats
-            size_bytes, file_count = self._calculate_directory_stats(local_path)
+            # Repository exists but no metadata - use recorded file statistics if any
+            manifest = FileManifest.load(local_path) or FileManifest.scan(local_path)
+            size_bytes, file_count = manifest.size_bytes, manifest.file_count
             error_message = "Repository exists but no metadata found"
 
         age_hours = age_seconds / 3600
@@ -0,0 +1,192 @@
+"""Detached background updates of the saidata repository.
+
+With ``saidata_background_update`` enabled, lookups serve an expired but
+present repository as is and start ``python -m sai.core.repository_refresh``
+to update it. Every update, detached or in the foreground, holds an exclusive
+lock on a file next to the repository it writes, and each layered repository
+has its own lock, so at most one update of a directory runs at a time. Later
+invocations pick up the new snapshot once it is in place.
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+from ..models.config import SaiConfig
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between starting background updates of the same repository
+BACKGROUND_UPDATE_INTERVAL = 300
+
+
+def get_lock_path(repository_path: Path) -> Path:
+    """Get the lock file guarding updates of a repository directory.
+
+    Args:
+        repository_path: Cached repository directory
+
+    Returns:
+        Path of the lock file
+    """
+    return repository_path.parent / f".{repository_path.name}.update.lock"
+
+
+def _lock_file(f: IO[bytes], wait: bool = False) -> None:
+    """Lock an open file exclusively.
+
+    Args:
+        f: File opened for writing
+        wait: Whether to wait for the lock instead of failing
+
+    Raises:
+        OSError: If another process holds the lock
+    """
+    if os.name == "nt":
+        import msvcrt
+
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if wait else msvcrt.LK_NBLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX if wait else fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+@contextmanager
+def hold_update_lock(lock_path: Path, wait: bool = False) -> Iterator[bool]:
+    """Hold the update lock of a repository if nobody else does.
+
+    The lock is released when the context exits or the process dies.
+
+    Args:
+        lock_path: Lock file from get_lock_path
+        wait: Whether to wait until another process releases the lock
+
+    Yields:
+        True if the lock is held, False if another process holds it
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "ab") as f:
+        try:
+            _lock_file(f, wait)
+        except OSError:
+            yield False
+        else:
+            yield True
+
+
+def is_update_running(repository_path: Path) -> bool:
+    """Check whether a process is updating a repository.
+
+    Args:
+        repository_path: Cached repository directory
+
+    Returns:
+        True if another process holds the update lock
+    """
+    with hold_update_lock(get_lock_path(repository_path)) as locked:
+        return not locked
+
+
+def start_background_update(config: SaiConfig, repository_path: Path) -> bool:
+    """Start a detached process updating the repository.
+
+    Nothing is started while an update runs or if one was started within
+    BACKGROUND_UPDATE_INTERVAL, so repeated lookups while the network is down
+    do not start an update each.
+
+    Args:
+        config: Configuration of the repository to update
+        repository_path: Cached repository directory
+
+    Returns:
+        True if an update process was started
+    """
+    lock_path = get_lock_path(repository_path)
+    try:
+        if time.time() - lock_path.stat().st_mtime < BACKGROUND_UPDATE_INTERVAL:
+            logger.debug("Background repository update started recently, not starting another")
+            return False
+    except OSError:
+        pass
+
+    try:
+        if is_update_running(repository_path):
+            logger.debug("Background repository update already running")
+            return False
+        lock_path.touch()
+    except OSError as e:
+        logger.warning(f"Cannot use repository update lock {lock_path}: {e}")
+        return False
+
+    # The child must import this copy of sai even if it is not installed
+    env = os.environ.copy()
+    package_root = str(Path(__file__).resolve().parent.parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+
+    try:
+        process = subprocess.Popen(
+            [sys.executable, "-m", __name__],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            close_fds=True,
+            **kwargs,
+        )
+        # Credentials in the configuration travel over the pipe, not the command line
+        with process.stdin:
+            process.stdin.write(config.model_dump_json().encode("utf-8"))
+    except OSError as e:
+        logger.warning(f"Failed to start background repository update: {e}")
+        return False
+
+    logger.info(f"Started background repository update (pid {process.pid})")
+    return True
+
+
+def run_update(config: SaiConfig) -> bool:
+    """Update the repository unless another process already does.
+
+    Args:
+        config: Configuration of the repository to update
+
+    Returns:
+        True if the repository is up to date or another process updates it
+    """
+    from .saidata_repository_manager import SaidataRepositoryManager
+
+    config.saidata_background_update = False
+    manager = SaidataRepositoryManager(config)
+
+    with manager.hold_update_lock() as locked:
+        if not locked:
+            logger.info("Another process is updating the repository")
+            return True
+        return manager.update_repository()
+
+
+def main() -> int:
+    """Run a background update with the configuration read from stdin."""
+    config = SaiConfig.model_validate_json(sys.stdin.buffer.read())
+
+    from ..utils.logging import setup_root_logging
+
+    setup_root_logging(config)
+    return 0 if run_update(config) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
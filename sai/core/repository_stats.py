@@ -0,0 +1,190 @@
+"""Incrementally maintained file statistics of cached repositories.
+
+Counting the files of a repository and summing their sizes walks and stats
+the whole tree. The file manifest records the size of every checked-out file
+once, next to the repository directory, and later updates only re-stat what
+changed: the paths a git update touched, or nothing at all for a release
+archive whose member sizes were recorded while it was extracted. The totals
+are kept in the repository cache metadata, so status checks never touch the
+tree.
+
+Git's own ``.git`` directory is not part of the statistics.
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = "1.0"
+
+# Directories at the repository root that are not repository content
+EXCLUDED_DIRECTORIES = {".git"}
+
+
+def get_manifest_path(base_path: Path) -> Path:
+    """Get the file manifest location for a repository directory.
+
+    Args:
+        base_path: Repository directory
+
+    Returns:
+        Path of the manifest file
+    """
+    return base_path.parent / f".{base_path.name}.files.json"
+
+
+def _scan_directory(base_path: Path, directory: Path, sizes: Dict[str, int]) -> None:
+    """Record the sizes of all files below a directory.
+
+    Args:
+        base_path: Repository directory the recorded paths are relative to
+        directory: Directory to walk
+        sizes: File sizes by relative path, updated in place
+    """
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if directory == base_path and entry.name in EXCLUDED_DIRECTORIES:
+                    continue
+                _scan_directory(base_path, Path(entry.path), sizes)
+            elif entry.is_file():
+                relative_path = Path(entry.path).relative_to(base_path).as_posix()
+                sizes[relative_path] = entry.stat().st_size
+        except OSError:
+            # Skip files we can't read
+            continue
+
+
+@dataclass
+class FileManifest:
+    """Sizes of the files of a repository directory.
+
+    Paths are relative to the repository directory.
+    """
+
+    base_path: Path
+    sizes: Dict[str, int] = field(default_factory=dict)
+    revision: Optional[str] = None
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the files in bytes."""
+        return sum(self.sizes.values())
+
+    @property
+    def file_count(self) -> int:
+        """Number of files."""
+        return len(self.sizes)
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path of the manifest file."""
+        return get_manifest_path(self.base_path)
+
+    @classmethod
+    def scan(cls, base_path: Path, revision: Optional[str] = None) -> "FileManifest":
+        """Build the manifest of a repository directory by walking all of it.
+
+        Args:
+            base_path: Repository directory
+            revision: Revision the directory is checked out at
+
+        Returns:
+            FileManifest of the directory, empty if it does not exist
+        """
+        manifest = cls(base_path, revision=revision)
+        _scan_directory(base_path, base_path, manifest.sizes)
+        return manifest
+
+    def apply_changes(self, paths: Iterable[str]) -> int:
+        """Re-stat changed paths, leaving the rest of the manifest as is.
+
+        Files that no longer exist are dropped. A directory is walked, and
+        files recorded below it that are gone are dropped.
+
+        Args:
+            paths: Changed files or directories relative to the repository directory
+
+        Returns:
+            Number of paths applied
+        """
+        applied = 0
+        for path in paths:
+            path = path.strip("/")
+            if not path:
+                continue
+            applied += 1
+
+            full_path = self.base_path / path
+            if full_path.is_dir() and not full_path.is_symlink():
+                prefix = f"{path}/"
+                for recorded in [p for p in self.sizes if p.startswith(prefix)]:
+                    del self.sizes[recorded]
+                _scan_directory(self.base_path, full_path, self.sizes)
+                continue
+
+            try:
+                if full_path.is_file():
+                    self.sizes[path] = full_path.stat().st_size
+                    continue
+            except OSError:
+                pass
+            self.sizes.pop(path, None)
+
+        return applied
+
+    def save(self) -> None:
+        """Write the manifest file atomically."""
+        data = {
+            "manifest_version": MANIFEST_VERSION,
+            "revision": self.revision,
+            "files": self.sizes,
+        }
+
+        manifest_path = self.manifest_path
+        temp_file = manifest_path.with_name(
+            f"{manifest_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            temp_file.replace(manifest_path)
+        except OSError:
+            temp_file.unlink(missing_ok=True)
+            raise
+
+        logger.debug(f"Saved file manifest to {manifest_path}")
+
+    @classmethod
+    def load(cls, base_path: Path) -> Optional["FileManifest"]:
+        """Load the manifest of a repository directory.
+
+        Args:
+            base_path: Repository directory
+
+        Returns:
+            FileManifest, or None if there is no readable manifest
+        """
+        manifest_path = get_manifest_path(base_path)
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("manifest_version") != MANIFEST_VERSION:
+                logger.debug(f"Ignoring file manifest with other version: {manifest_path}")
+                return None
+            sizes = {str(path): int(size) for path, size in data["files"].items()}
+            return cls(base_path, sizes, data.get("revision"))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Failed to read file manifest {manifest_path}: {e}")
+            return None
@@ -0,0 +1,735 @@
+"""Precomputed catalog of the software available in a saidata repository.
+
+Resolving a software name in the hierarchical layout stats up to six
+candidate files, and listing software for completion or suggestions walks
+every ``software/{prefix}/{name}`` directory. The catalog records the result
+of that walk once, when the repository is updated, so lookups become a single
+dictionary access. It also carries a trigram index of the software names for
+ranked "did you mean" suggestions.
+
+The catalog is stored next to the repository directory rather than inside it
+so that git checkouts stay clean and tarball updates, which replace the
+directory, cannot leave an outdated catalog behind unnoticed. It also records
+the modification times of the prefix and software directories, so software
+added or changed after the catalog was built, e.g. by a manual ``git pull``,
+is found on the filesystem instead of being reported missing.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import yaml
+
+from ..utils.yaml_loader import safe_load
+from .saidata_path import SAIDATA_FILE_NAMES
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = "1.2"
+
+# Number of names sharing the most trigrams with a query that are compared by edit distance
+SUGGESTION_CANDIDATES = 100
+
+# Loaded catalogs by catalog path, with the catalog file fingerprint they were read from
+_loaded_catalogs: Dict[str, Tuple[Tuple[int, int, int], "SaidataCatalog"]] = {}
+_loaded_catalogs_lock = threading.Lock()
+
+
+@dataclass
+class CatalogEntry:
+    """Files and aliases of one software in the catalog.
+
+    Paths are relative to the repository directory.
+    """
+
+    name: str
+    default: str
+    overrides: Dict[str, str] = field(default_factory=dict)
+    aliases: List[str] = field(default_factory=list)
+    fingerprints: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        data = asdict(self)
+        del data["name"]
+        return data
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> "CatalogEntry":
+        """Create from dictionary loaded from JSON."""
+        return cls(name=name, **data)
+
+
+def get_catalog_path(base_path: Path) -> Path:
+    """Get the catalog file location for a repository directory.
+
+    Args:
+        base_path: Repository directory containing the ``software`` tree
+
+    Returns:
+        Path of the catalog file
+    """
+    return base_path.parent / f".{base_path.name}.catalog.json"
+
+
+def _get_tree_fingerprint(base_path: Path) -> Optional[List[int]]:
+    """Fingerprint the ``software`` directory of a repository.
+
+    Replacing the directory, or adding or removing prefix directories, changes
+    the fingerprint.
+
+    Args:
+        base_path: Repository directory
+
+    Returns:
+        List of inode and modification time, or None if there is no software directory
+    """
+    try:
+        stat = (base_path / "software").stat()
+    except OSError:
+        return None
+    return [stat.st_ino, stat.st_mtime_ns]
+
+
+def _get_mtime(path: Path) -> Optional[int]:
+    """Get the modification time of a path in nanoseconds, None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _get_trigrams(name: str) -> Set[str]:
+    """Split a name into trigrams, padded so that short names have some.
+
+    Args:
+        name: Lowercase software name
+
+    Returns:
+        Set of three-character substrings of the padded name
+    """
+    padded = f"  {name} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(first: str, second: str) -> int:
+    """Compute the optimal string alignment distance between two strings.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters count as one edit each, so ``ngnix`` is one edit from ``nginx``.
+
+    Args:
+        first: First string
+        second: Second string
+
+    Returns:
+        Number of edits turning the first string into the second
+    """
+    # Rows of the distance matrix for the current and the two previous characters
+    older_row: List[int] = []
+    previous_row: List[int] = []
+    row = list(range(len(second) + 1))
+    for i in range(1, len(first) + 1):
+        older_row, previous_row, row = previous_row, row, [i] + [0] * len(second)
+        for j in range(1, len(second) + 1):
+            cost = 0 if first[i - 1] == second[j - 1] else 1
+            row[j] = min(row[j - 1] + 1, previous_row[j] + 1, previous_row[j - 1] + cost)
+            if i > 1 and j > 1 and first[i - 1] == second[j - 2] and first[i - 2] == second[j - 1]:
+                row[j] = min(row[j], older_row[j - 2] + 1)
+    return row[-1]
+
+
+def _get_max_distance(name: str) -> int:
+    """Get the number of edits a suggestion may differ by for a name of this length."""
+    if len(name) <= 4:
+        return 1
+    if len(name) <= 8:
+        return 2
+    return 3
+
+
+class SaidataCatalog:
+    """Index of software names, saidata files and aliases of a repository."""
+
+    def __init__(
+        self,
+        base_path: Path,
+        entries: Dict[str, CatalogEntry],
+        tree_fingerprint: Optional[List[int]] = None,
+        trigram_index: Optional[Dict[str, List[int]]] = None,
+        directory_mtimes: Optional[Dict[str, int]] = None,
+    ):
+        """Initialize the catalog.
+
+        Args:
+            base_path: Repository directory the catalog describes
+            entries: Catalog entries by software name
+            tree_fingerprint: Fingerprint of the software directory when the catalog was built
+            trigram_index: Positions in the sorted software names by trigram, built if None
+            directory_mtimes: Modification times of the ``{prefix}`` and
+                              ``{prefix}/{name}`` directories below ``software``
+        """
+        self.base_path = base_path
+        self.entries = entries
+        self.tree_fingerprint = tree_fingerprint
+        self.directory_mtimes = directory_mtimes or {}
+        self._alias_index: Optional[Dict[str, List[str]]] = None
+        self._sorted_names = sorted(entries)
+        self._trigram_index = trigram_index
+
+    def __contains__(self, software_name: str) -> bool:
+        return software_name in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def catalog_path(self) -> Path:
+        """Get the path of the catalog file."""
+        return get_catalog_path(self.base_path)
+
+    def is_current(self, software_name: Optional[str] = None) -> bool:
+        """Check that the software directories did not change since the catalog was built.
+
+        Checking one software only looks at its prefix and software
+        directories, which is enough to trust lookups of that name.
+
+        Args:
+            software_name: Software to check, None to check the whole tree
+
+        Returns:
+            True if the catalog describes the directories as they are
+        """
+        if software_name is None:
+            directories = list(self.directory_mtimes)
+        else:
+            name = software_name.strip().lower()
+            prefix = name[:2]
+            directories = [prefix, f"{prefix}/{name}"]
+
+        software_dir = self.base_path / "software"
+        for directory in directories:
+            if _get_mtime(software_dir / directory) != self.directory_mtimes.get(directory):
+                logger.debug(f"Saidata catalog of {self.base_path} is outdated for {directory}")
+                return False
+        return True
+
+    def get(self, software_name: str) -> Optional[CatalogEntry]:
+        """Get the catalog entry of a software.
+
+        Args:
+            software_name: Normalized software name
+
+        Returns:
+            CatalogEntry if the repository has saidata for the software, None otherwise
+        """
+        return self.entries.get(software_name)
+
+    def resolve_default(self, software_name: str) -> Optional[Path]:
+        """Get the default saidata file of a software.
+
+        Args:
+            software_name: Normalized software name
+
+        Returns:
+            Absolute path of the default saidata file, or None if not in the catalog
+        """
+        entry = self.entries.get(software_name)
+        return self.base_path / entry.default if entry else None
+
+    def names(self, prefix: str = "") -> List[str]:
+        """List software names.
+
+        Args:
+            prefix: Only return names starting with this prefix
+
+        Returns:
+            Sorted list of software names
+        """
+        return sorted(name for name in self.entries if name.startswith(prefix))
+
+    def find_by_alias(self, alias: str) -> List[str]:
+        """Find software providing a package or command name.
+
+        Args:
+            alias: Package or command name, e.g. ``httpd``
+
+        Returns:
+            Sorted list of software names listing the alias
+        """
+        if self._alias_index is None:
+            index: Dict[str, List[str]] = {}
+            for entry in self.entries.values():
+                for entry_alias in entry.aliases:
+                    index.setdefault(entry_alias, []).append(entry.name)
+            self._alias_index = index
+        return sorted(self._alias_index.get(alias.lower(), []))
+
+    @property
+    def trigram_index(self) -> Dict[str, List[int]]:
+        """Get the positions in the sorted software names containing each trigram."""
+        if self._trigram_index is None:
+            index: Dict[str, List[int]] = {}
+            for position, name in enumerate(self._sorted_names):
+                for trigram in _get_trigrams(name.lower()):
+                    index.setdefault(trigram, []).append(position)
+            self._trigram_index = index
+        return self._trigram_index
+
+    def suggest(self, software_name: str, limit: int = 5) -> List[str]:
+        """Suggest cataloged software names for a name that was not found.
+
+        Names sharing the most trigrams with the requested name are ranked by
+        edit distance. Names containing the requested name, or contained in it,
+        are suggested after close matches.
+
+        Args:
+            software_name: Requested software name
+            limit: Maximum number of suggestions
+
+        Returns:
+            Software names, closest first
+        """
+        query = software_name.strip().lower()
+        if not query:
+            return []
+
+        shared = Counter()
+        trigram_index = self.trigram_index
+        for trigram in _get_trigrams(query):
+            shared.update(trigram_index.get(trigram, ()))
+
+        max_distance = _get_max_distance(query)
+        ranked = []
+        for position, shared_count in shared.most_common(SUGGESTION_CANDIDATES):
+            name = self._sorted_names[position]
+            name_lower = name.lower()
+            if name_lower == query:
+                continue
+            if abs(len(name_lower) - len(query)) <= max_distance:
+                distance = _edit_distance(query, name_lower)
+            else:
+                distance = max_distance + 1
+            if distance <= max_distance:
+                ranked.append((0, distance, -shared_count, name))
+            elif query in name_lower or name_lower in query:
+                ranked.append((1, len(name_lower), -shared_count, name))
+
+        ranked.sort()
+        return [name for *_, name in ranked[:limit]]
+
+    @classmethod
+    def build(
+        cls, base_path: Path, documents: Optional[Dict[str, Any]] = None
+    ) -> Optional["SaidataCatalog"]:
+        """Build the catalog by scanning a repository directory.
+
+        Args:
+            base_path: Repository directory containing the ``software`` tree
+            documents: Optional dictionary that receives the parsed default saidata
+                       files by relative path, so callers need not parse them again
+
+        Returns:
+            SaidataCatalog, or None if the directory has no software tree
+        """
+        tree_fingerprint = _get_tree_fingerprint(base_path)
+        if tree_fingerprint is None:
+            return None
+
+        entries = {}
+        directory_mtimes = {}
+        with os.scandir(base_path / "software") as prefix_dirs:
+            for prefix_dir in prefix_dirs:
+                if not prefix_dir.is_dir():
+                    continue
+                # Times are taken before scanning, so changes made meanwhile are noticed
+                directory_mtimes[prefix_dir.name] = prefix_dir.stat().st_mtime_ns
+                with os.scandir(prefix_dir.path) as software_dirs:
+                    for software_dir in software_dirs:
+                        if software_dir.is_dir():
+                            directory_mtimes[f"{prefix_dir.name}/{software_dir.name}"] = (
+                                software_dir.stat().st_mtime_ns
+                            )
+                            entry = _build_entry(
+                                base_path, Path(software_dir.path), documents
+                            )
+                            if entry:
+                                entries[entry.name] = entry
+
+        logger.debug(f"Built saidata catalog for {base_path} with {len(entries)} entries")
+        return cls(base_path, entries, tree_fingerprint, directory_mtimes=directory_mtimes)
+
+    def save(self) -> None:
+        """Write the catalog file atomically."""
+        data = {
+            "catalog_version": CATALOG_VERSION,
+            "tree_fingerprint": self.tree_fingerprint,
+            "directories": self.directory_mtimes,
+            "software": {name: entry.to_dict() for name, entry in sorted(self.entries.items())},
+            "trigrams": self.trigram_index,
+        }
+
+        catalog_path = self.catalog_path
+        temp_file = catalog_path.with_name(
+            f"{catalog_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            temp_file.replace(catalog_path)
+        except OSError:
+            temp_file.unlink(missing_ok=True)
+            raise
+
+        logger.debug(f"Saved saidata catalog to {catalog_path}")
+
+    @classmethod
+    def load(cls, base_path: Path) -> Optional["SaidataCatalog"]:
+        """Load the catalog of a repository directory.
+
+        Catalogs are kept in memory as long as the catalog file does not change.
+        Only the ``software`` directory itself is checked; use is_current before
+        trusting the catalog for a lookup.
+
+        Args:
+            base_path: Repository directory containing the ``software`` tree
+
+        Returns:
+            SaidataCatalog, or None if there is no catalog or the software directory changed
+        """
+        catalog_path = get_catalog_path(base_path)
+        try:
+            stat = catalog_path.stat()
+        except OSError:
+            return None
+        file_fingerprint = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+        key = str(catalog_path)
+        with _loaded_catalogs_lock:
+            loaded = _loaded_catalogs.get(key)
+        if loaded and loaded[0] == file_fingerprint:
+            catalog = loaded[1]
+        else:
+            catalog = cls._read(base_path, catalog_path)
+            if catalog is None:
+                return None
+            with _loaded_catalogs_lock:
+                _loaded_catalogs[key] = (file_fingerprint, catalog)
+
+        if catalog.tree_fingerprint != _get_tree_fingerprint(base_path):
+            logger.debug(f"Saidata catalog {catalog_path} is outdated")
+            return None
+        return catalog
+
+    @classmethod
+    def _read(cls, base_path: Path, catalog_path: Path) -> Optional["SaidataCatalog"]:
+        """Read a catalog file.
+
+        Args:
+            base_path: Repository directory the catalog describes
+            catalog_path: Path of the catalog file
+
+        Returns:
+            SaidataCatalog, or None if the file is unreadable or has another version
+        """
+        try:
+            with open(catalog_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("catalog_version") != CATALOG_VERSION:
+                logger.debug(f"Ignoring saidata catalog with other version: {catalog_path}")
+                return None
+            entries = {
+                name: CatalogEntry.from_dict(name, entry)
+                for name, entry in data["software"].items()
+            }
+            return cls(
+                base_path,
+                entries,
+                data.get("tree_fingerprint"),
+                data.get("trigrams"),
+                data["directories"],
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Failed to read saidata catalog {catalog_path}: {e}")
+            return None
+
+
+def _hash_file(file_path: Path) -> str:
+    """Get the SHA-256 digest of a file's content."""
+    with open(file_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def read_saidata_file(file_path: Path) -> Any:
+    """Parse a saidata file.
+
+    Args:
+        file_path: JSON or YAML saidata file
+
+    Returns:
+        The parsed document
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        if file_path.suffix == ".json":
+            return json.load(f)
+        return safe_load(f)
+
+
+def _extract_aliases(data: Any, software_name: str) -> List[str]:
+    """Collect package and command names from a saidata document.
+
+    Args:
+        data: Parsed default saidata file
+        software_name: Software name, left out of the aliases
+
+    Returns:
+        Sorted list of lowercase aliases
+    """
+    if not isinstance(data, dict):
+        return []
+
+    aliases = set()
+    for package in data.get("packages") or []:
+        if isinstance(package, dict) and isinstance(package.get("package_name"), str):
+            aliases.add(package["package_name"].lower())
+    for command in data.get("commands") or []:
+        if not isinstance(command, dict):
+            continue
+        if isinstance(command.get("name"), str):
+            aliases.add(command["name"].lower())
+        aliases.update(
+            alias.lower() for alias in command.get("aliases") or [] if isinstance(alias, str)
+        )
+
+    aliases.discard(software_name)
+    return sorted(aliases)
+
+
+def _build_entry(
+    base_path: Path, software_dir: Path, documents: Optional[Dict[str, Any]] = None
+) -> Optional[CatalogEntry]:
+    """Build the catalog entry for one software directory.
+
+    Args:
+        base_path: Repository directory
+        software_dir: ``software/{prefix}/{name}`` directory
+        documents: Optional dictionary that receives the parsed default file
+
+    Returns:
+        CatalogEntry, or None if the directory has no default saidata file
+    """
+    name = software_dir.name
+    default_file = None
+    for file_name in SAIDATA_FILE_NAMES:
+        candidate = software_dir / file_name
+        if candidate.is_file():
+            default_file = candidate
+            break
+    if default_file is None:
+        return None
+
+    overrides = {}
+    for os_dir in sorted(software_dir.iterdir()):
+        if not os_dir.is_dir():
+            continue
+        for override_file in sorted(os_dir.iterdir()):
+            if override_file.suffix in (".yaml", ".yml") and override_file.is_file():
+                overrides[f"{os_dir.name}/{override_file.stem}"] = override_file.relative_to(
+                    base_path
+                ).as_posix()
+
+    default = default_file.relative_to(base_path).as_posix()
+    fingerprints = {}
+    for relative_path in [default, *overrides.values()]:
+        try:
+            fingerprints[relative_path] = _hash_file(base_path / relative_path)
+        except OSError as e:
+            logger.debug(f"Cannot read saidata file {relative_path}: {e}")
+
+    try:
+        data = read_saidata_file(default_file)
+        aliases = _extract_aliases(data, name)
+        if documents is not None:
+            documents[default] = data
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        logger.debug(f"Cannot read aliases from {default_file}: {e}")
+        aliases = []
+
+    return CatalogEntry(
+        name=name,
+        default=default,
+        overrides=overrides,
+        aliases=aliases,
+        fingerprints=fingerprints,
+    )
+
+
+def build_catalog(
+    base_path: Path, documents: Optional[Dict[str, Any]] = None
+) -> Optional[SaidataCatalog]:
+    """Build and save the catalog of a repository directory.
+
+    Args:
+        base_path: Repository directory containing the ``software`` tree
+        documents: Optional dictionary that receives the parsed default saidata
+                   files by relative path
+
+    Returns:
+        The new catalog, or None if it could not be built
+    """
+    try:
+        catalog = SaidataCatalog.build(base_path, documents)
+        if catalog is not None:
+            catalog.save()
+        return catalog
+    except OSError as e:
+        logger.warning(f"Failed to build saidata catalog for {base_path}: {e}")
+        return None
+
+
+def load_catalog(
+    base_path: Path, software_name: Optional[str] = None
+) -> Optional[SaidataCatalog]:
+    """Load the up-to-date catalog of a repository directory.
+
+    Args:
+        base_path: Repository directory containing the ``software`` tree
+        software_name: Only require the catalog to be up to date for this
+                       software, which takes a few stats instead of one per
+                       software directory
+
+    Returns:
+        SaidataCatalog, or None if the directory has no catalog or it is outdated
+    """
+    catalog = SaidataCatalog.load(base_path)
+    if catalog is None or not catalog.is_current(software_name):
+        return None
+    return catalog
+
+
+class MergedCatalog:
+    """Catalogs of layered repositories merged into one index.
+
+    Every software name maps to its default saidata files in all layers that
+    have it, highest precedence first, so finding the winning layer or the
+    whole merge order is a single dictionary access instead of a probe of
+    every layer.
+    """
+
+    def __init__(self, catalogs: List[SaidataCatalog]):
+        """Initialize the merged catalog.
+
+        Args:
+            catalogs: Catalogs of the layers, highest precedence first
+        """
+        self.catalogs = catalogs
+        self.files: Dict[str, Tuple[Path, ...]] = {}
+        self._winners: Dict[str, Path] = {}
+        for catalog in catalogs:
+            for name, entry in catalog.entries.items():
+                self.files[name] = self.files.get(name, ()) + (catalog.base_path / entry.default,)
+                self._winners.setdefault(name, catalog.base_path)
+
+    def __contains__(self, software_name: str) -> bool:
+        return software_name in self.files
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    @property
+    def base_paths(self) -> List[Path]:
+        """Get the repository directories of the layers, highest precedence first."""
+        return [catalog.base_path for catalog in self.catalogs]
+
+    def is_current(self, software_name: Optional[str] = None) -> bool:
+        """Check that the catalogs of all layers are up to date.
+
+        Args:
+            software_name: Software to check, None to check the whole trees
+
+        Returns:
+            True if every layer catalog describes its directories as they are
+        """
+        return all(catalog.is_current(software_name) for catalog in self.catalogs)
+
+    def resolve(self, software_name: str) -> List[Path]:
+        """Get the default saidata files of a software in all layers.
+
+        Args:
+            software_name: Normalized software name
+
+        Returns:
+            Absolute paths of the default saidata files, highest precedence first
+        """
+        return list(self.files.get(software_name, ()))
+
+    def get_layer(self, software_name: str) -> Optional[Path]:
+        """Get the layer whose saidata of a software takes precedence.
+
+        Args:
+            software_name: Normalized software name
+
+        Returns:
+            Repository directory of the winning layer, or None if no layer has the software
+        """
+        return self._winners.get(software_name)
+
+    def names(self, prefix: str = "") -> List[str]:
+        """List software names of all layers.
+
+        Args:
+            prefix: Only return names starting with this prefix
+
+        Returns:
+            Sorted list of software names
+        """
+        return sorted(name for name in self.files if name.startswith(prefix))
+
+
+# Merged catalogs by layer directories
+_merged_catalogs: Dict[Tuple[Path, ...], MergedCatalog] = {}
+
+
+def load_merged_catalog(base_paths: List[Path]) -> Optional[MergedCatalog]:
+    """Load the merged catalog of layered repository directories.
+
+    Layers that do not exist are skipped. The merged catalog is rebuilt in
+    memory only when the catalog of a layer changed. Like SaidataCatalog.load,
+    only the software directories of the layers are checked; use is_current
+    before trusting it for a lookup.
+
+    Args:
+        base_paths: Repository directories, highest precedence first
+
+    Returns:
+        MergedCatalog, or None if an existing layer has no catalog
+    """
+    catalogs = []
+    for base_path in base_paths:
+        if not base_path.is_dir():
+            continue
+        catalog = SaidataCatalog.load(base_path)
+        if catalog is None:
+            return None
+        catalogs.append(catalog)
+
+    key = tuple(base_paths)
+    with _loaded_catalogs_lock:
+        merged = _merged_catalogs.get(key)
+        if merged is not None and len(merged.catalogs) == len(catalogs) and all(
+            current is loaded for current, loaded in zip(catalogs, merged.catalogs)
+        ):
+            return merged
+
+    merged = MergedCatalog(catalogs)
+    logger.debug(f"Merged saidata catalogs of {len(catalogs)} layers")
+    with _loaded_catalogs_lock:
+        _merged_catalogs[key] = merged
+    return merged
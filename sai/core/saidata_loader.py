@@ -2,24 +2,49 @@
 
 import json
 import logging
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 import jsonschema
 import yaml
+from jsonschema.protocols import Validator
 from pydantic import ValidationError as PydanticValidationError
 
 from ..models.config import SaiConfig
 from ..models.saidata import SaiData
+from ..utils.cache import get_file_fingerprint
+from ..utils.schema_registry import compile_schema, get_schema_path, get_schema_validator, validate
+from ..utils.yaml_loader import safe_load
+from ..version import get_version
+from .saidata_mirror import get_mirrored_saidata
 from .saidata_path import HierarchicalPathResolver, SaidataPath
 
 if TYPE_CHECKING:
+    from .saidata_catalog import MergedCatalog
     from .saidata_repository_manager import SaidataRepositoryManager
 
 
 logger = logging.getLogger(__name__)
 
+SAIDATA_SCHEMA = "saidata-0.3"
+SAIDATA_SCHEMA_PATH = get_schema_path(SAIDATA_SCHEMA)
+
+# Validated SaiData objects shared by all loaders in the process, keyed by
+# software name and the fingerprints of its source files
+_VALIDATED_SAIDATA_LIMIT = 256
+_validated_saidata: "OrderedDict[Tuple[Any, ...], SaiData]" = OrderedDict()
+_validated_saidata_lock = threading.Lock()
+
+
+def clear_validated_saidata_cache() -> None:
+    """Forget all validated SaiData objects kept in memory."""
+    with _validated_saidata_lock:
+        _validated_saidata.clear()
+
 
 class SaidataNotFoundError(Exception):
     """Raised when saidata file is not found."""
@@ -58,6 +83,19 @@ class ValidationResult:
         return len(self.warnings) > 0
 
 
+@dataclass
+class BulkLoadResult:
+    """Result of loading saidata for several software."""
+
+    saidata: Dict[str, SaiData] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def has_errors(self) -> bool:
+        """Check if any software failed to load."""
+        return len(self.errors) > 0
+
+
 class SaidataLoader:
     """Loads and validates saidata files using repository-based hierarchical structure exclusively."""
 
@@ -75,6 +113,7 @@ class SaidataLoader:
         self.config = config or SaiConfig()
         self._repository_manager = repository_manager
         self._schema_cache: Optional[Dict[str, Any]] = None
+        self._schema_validator: Optional[Validator] = None
 
         # Initialize hierarchical path resolver
         search_paths = self.get_search_paths()
@@ -112,20 +151,7 @@ class SaidataLoader:
             )
 
         # Ensure repository is available if repository manager is configured
-        if self._repository_manager:
-            try:
-                # This will update repository if needed and ensure it's available
-                repo_status = self._repository_manager.get_repository_status()
-                if (
-                    not repo_status.is_healthy
-                    and not self._repository_manager.repository_path.exists()
-                ):
-                    logger.warning(
-                        f"Repository not available, attempting update for {software_name}"
-                    )
-                    self._repository_manager.update_repository(force=False)
-            except Exception as e:
-                logger.warning(f"Repository check failed for {software_name}: {e}")
+        self._ensure_repository_available(software_name)
 
         # Find all hierarchical saidata files for the software (hierarchical structure only)
         saidata_files = self._find_hierarchical_saidata_files(software_name)
@@ -137,44 +163,219 @@ class SaidataLoader:
             error_msg = self._build_saidata_not_found_error(software_name, expected_paths)
             raise SaidataNotFoundError(error_msg, software_name, expected_paths)
 
+        return self._load_resolved_saidata(software_name, saidata_files, use_cache)
+
+    def load_many(
+        self,
+        software_names: Iterable[str],
+        use_cache: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> BulkLoadResult:
+        """Load and validate saidata for several software at once.
+
+        The repository is checked once, saidata files of all software are
+        resolved in one pass over the search paths, and the files are read,
+        merged and validated concurrently. Names given more than once are
+        loaded once.
+
+        Args:
+            software_names: Names of the software to load saidata for
+            use_cache: Whether to use cached data if available
+            max_workers: Maximum number of threads, defaults to one per software up to 8
+
+        Returns:
+            BulkLoadResult with the saidata or the error of every requested name
+        """
+        unique_names = list(dict.fromkeys(software_names))
+        result = BulkLoadResult()
+        if not unique_names:
+            return result
+
+        logger.debug(f"Loading saidata for {len(unique_names)} software")
+        self._ensure_repository_available(f"{len(unique_names)} software")
+
+        # Resolve the files of every software against the same search paths
+        search_paths = self.get_search_paths()
+        merged_catalog = self._get_merged_catalog()
+        resolved: Dict[str, List[Path]] = {}
+        for software_name in unique_names:
+            validation_errors = self._path_resolver.validate_software_name(software_name)
+            if validation_errors:
+                result.errors[software_name] = ValueError(
+                    f"Invalid software name '{software_name}': {'; '.join(validation_errors)}"
+                )
+                continue
+
+            saidata_files = self._find_hierarchical_saidata_files(
+                software_name, search_paths, merged_catalog
+            )
+            if not saidata_files:
+                expected_paths = self._generate_expected_hierarchical_paths(software_name)
+                error_msg = self._build_saidata_not_found_error(software_name, expected_paths)
+                result.errors[software_name] = SaidataNotFoundError(
+                    error_msg, software_name, expected_paths
+                )
+                continue
+
+            resolved[software_name] = saidata_files
+
+        def load(software_name: str) -> SaiData:
+            return self._load_resolved_saidata(software_name, resolved[software_name], use_cache)
+
+        workers = min(max_workers or 8, len(resolved))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {name: executor.submit(load, name) for name in resolved}
+                outcomes = {name: future.exception() for name, future in futures.items()}
+                for software_name, future in futures.items():
+                    if outcomes[software_name] is None:
+                        result.saidata[software_name] = future.result()
+                    else:
+                        result.errors[software_name] = outcomes[software_name]
+        else:
+            for software_name in resolved:
+                try:
+                    result.saidata[software_name] = load(software_name)
+                except Exception as e:
+                    result.errors[software_name] = e
+
+        logger.info(f"Loaded saidata for {len(result.saidata)} of {len(unique_names)} software")
+        return result
+
+    def _ensure_repository_available(self, software_name: str) -> None:
+        """Update the saidata repository if it is unhealthy and missing.
+
+        Args:
+            software_name: Software being loaded, for log messages
+        """
+        if not self._repository_manager:
+            return
+
+        try:
+            # This will update repository if needed and ensure it's available
+            repo_status = self._repository_manager.get_repository_status()
+            if not repo_status.is_healthy and not self._repository_manager.repository_path.exists():
+                logger.warning(f"Repository not available, attempting update for {software_name}")
+                self._repository_manager.update_repository(force=False)
+        except Exception as e:
+            logger.warning(f"Repository check failed for {software_name}: {e}")
+
+    def _load_resolved_saidata(
+        self, software_name: str, saidata_files: List[Path], use_cache: bool
+    ) -> SaiData:
+        """Load, validate and cache saidata from resolved files.
+
+        Args:
+            software_name: Name of the software
+            saidata_files: Hierarchical saidata files in precedence order
+            use_cache: Whether to use cached data if available
+
+        Returns:
+            Validated SaiData object
+
+        Raises:
+            ValidationError: If saidata validation fails
+        """
+        # Fingerprint the files before reading them, so edits made while loading
+        # cannot end up cached under the new fingerprints
+        memo_key = self._get_memo_key(software_name, saidata_files)
+        if use_cache and memo_key is not None:
+            with _validated_saidata_lock:
+                saidata = _validated_saidata.get(memo_key)
+                if saidata is not None:
+                    _validated_saidata.move_to_end(memo_key)
+            if saidata is not None:
+                logger.debug(f"Using validated saidata for {software_name} from memory")
+                return saidata
+
+        validation_signature = self._get_validation_signature()
+
         # Check cache first if enabled and requested
         merged_data = None
+        validated = False
         if use_cache and self._saidata_cache:
-            merged_data = self._saidata_cache.get_cached_saidata(software_name, saidata_files)
-            if merged_data:
+            cached_entry = self._saidata_cache.get_cached_entry(software_name, saidata_files)
+            if cached_entry and cached_entry.get("data"):
+                merged_data = cached_entry["data"]
+                validated = cached_entry.get("validated_with") == validation_signature
                 logger.debug(f"Using cached saidata for {software_name}")
 
         # Load and merge saidata files if not cached
         if merged_data is None:
             merged_data = self._merge_hierarchical_saidata_files(saidata_files)
 
-            # Cache the merged data if caching is enabled
-            if self._saidata_cache:
-                self._saidata_cache.update_saidata_cache(software_name, saidata_files, merged_data)
-
-        # Validate the merged data
-        validation_result = self.validate_saidata(merged_data)
-        if validation_result.has_errors:
-            error_msg = f"Saidata validation failed for {software_name}: {
-                '; '.join(
-                    validation_result.errors)}"
-            logger.error(error_msg)
-            raise ValidationError(error_msg)
+        # Validate the merged data unless the cached copy already passed the same checks
+        if not validated:
+            validation_result = self.validate_saidata(merged_data)
+            if validation_result.has_errors:
+                error_msg = (
+                    f"Saidata validation failed for {software_name}: "
+                    f"{'; '.join(validation_result.errors)}"
+                )
+                logger.error(error_msg)
+                raise ValidationError(error_msg)
 
-        if validation_result.has_warnings:
-            for warning in validation_result.warnings:
-                logger.warning(f"Saidata validation warning for {software_name}: {warning}")
+            if validation_result.has_warnings:
+                for warning in validation_result.warnings:
+                    logger.warning(f"Saidata validation warning for {software_name}: {warning}")
 
         # Create SaiData object
         try:
             saidata = SaiData(**merged_data)
-            logger.info(f"Successfully loaded hierarchical saidata for {software_name}")
-            return saidata
         except PydanticValidationError as e:
             error_msg = f"Failed to create SaiData object for {software_name}: {e}"
             logger.error(error_msg)
             raise ValidationError(error_msg) from e
 
+        # Cache the validated data if caching is enabled
+        if not validated and self._saidata_cache:
+            self._saidata_cache.update_saidata_cache(
+                software_name, saidata_files, merged_data, validated_with=validation_signature
+            )
+
+        if memo_key is not None:
+            with _validated_saidata_lock:
+                _validated_saidata[memo_key] = saidata
+                _validated_saidata.move_to_end(memo_key)
+                while len(_validated_saidata) > _VALIDATED_SAIDATA_LIMIT:
+                    _validated_saidata.popitem(last=False)
+
+        logger.info(f"Successfully loaded hierarchical saidata for {software_name}")
+        return saidata
+
+    def _get_memo_key(
+        self, software_name: str, saidata_files: List[Path]
+    ) -> Optional[Tuple[Any, ...]]:
+        """Build the key identifying validated saidata in memory.
+
+        Args:
+            software_name: Name of the software
+            saidata_files: Saidata files the software is merged from
+
+        Returns:
+            Key changing whenever a source file changes, None if caching is
+            disabled or a file cannot be fingerprinted
+        """
+        if not self.config.cache_enabled:
+            return None
+
+        fingerprints = []
+        for saidata_file in saidata_files:
+            fingerprint = get_file_fingerprint(saidata_file)
+            if fingerprint is None:
+                return None
+            fingerprints.append((str(saidata_file), *fingerprint))
+
+        return (software_name, *fingerprints)
+
+    def _get_validation_signature(self) -> List[Any]:
+        """Identify the validation rules applied by this version of SAI.
+
+        Returns:
+            SAI version and schema path and fingerprint
+        """
+        return [get_version(), str(SAIDATA_SCHEMA_PATH), get_file_fingerprint(SAIDATA_SCHEMA_PATH)]
+
     def get_search_paths(self) -> List[Path]:
         """Return ordered list of saidata search paths.
 
@@ -205,11 +406,11 @@ class SaidataLoader:
 
         try:
             # Load JSON schema if not cached
-            if self._schema_cache is None:
+            if self._schema_validator is None:
                 self._load_schema()
 
             # Validate against JSON schema
-            jsonschema.validate(data, self._schema_cache)
+            validate(self._schema_validator, data)
 
             # Additional validation checks
             self._validate_metadata(data, errors, warnings)
@@ -299,6 +500,12 @@ class SaidataLoader:
         Returns:
             List of software names found in the hierarchical structure
         """
+        from .saidata_catalog import load_catalog
+
+        catalog = load_catalog(base_path)
+        if catalog is not None:
+            return catalog.names()
+
         software_names = []
         software_dir = base_path / "software"
 
@@ -328,19 +535,66 @@ class SaidataLoader:
 
         return sorted(software_names)
 
-    def _find_hierarchical_saidata_files(self, software_name: str) -> List[Path]:
+    def _get_merged_catalog(self) -> Optional["MergedCatalog"]:
+        """Get the merged catalog of the repository layers.
+
+        Returns:
+            MergedCatalog, or None without a repository manager or if a layer has no catalog
+        """
+        if not self._repository_manager:
+            return None
+
+        from .saidata_catalog import load_merged_catalog
+
+        try:
+            layer_paths = [path.resolve() for path in self._repository_manager.get_layer_paths()]
+            return load_merged_catalog(layer_paths)
+        except Exception as e:
+            logger.debug(f"Repository layers not available for catalog lookups: {e}")
+            return None
+
+    def _find_hierarchical_saidata_files(
+        self,
+        software_name: str,
+        search_paths: Optional[List[Path]] = None,
+        merged_catalog: Optional["MergedCatalog"] = None,
+    ) -> List[Path]:
         """Find saidata files using hierarchical structure exclusively.
 
+        Repository layers covered by the merged catalog are resolved with one
+        catalog lookup, other search paths are probed one by one.
+
         Args:
             software_name: Name of the software to find saidata for
+            search_paths: Search paths to use, defaults to the configured ones
+            merged_catalog: Merged catalog of the repository layers, looked up
+                            when search_paths is not given
 
         Returns:
             List of hierarchical saidata file paths in precedence order
         """
+        if search_paths is None:
+            search_paths = self.get_search_paths()
+            merged_catalog = self._get_merged_catalog()
+
+        if merged_catalog is not None and not merged_catalog.is_current(software_name):
+            logger.debug("Repository layer catalogs are outdated, searching the layers")
+            merged_catalog = None
+
         saidata_files = []
+        layer_paths = set(merged_catalog.base_paths) if merged_catalog else set()
+        layers_resolved = False
 
         # Search only in hierarchical structure across all search paths
-        for search_path in self.get_search_paths():
+        for search_path in search_paths:
+            if search_path in layer_paths:
+                if not layers_resolved:
+                    layers_resolved = True
+                    layer_files = merged_catalog.resolve(software_name.strip().lower())
+                    saidata_files.extend(layer_files)
+                    logger.debug(f"Found {len(layer_files)} saidata files in repository layers")
+                continue
+
             try:
                 saidata_path = SaidataPath.from_software_name(software_name, search_path)
                 existing_file = saidata_path.find_existing_file()
@@ -506,12 +760,18 @@ class SaidataLoader:
         if not self._is_hierarchical_path(file_path):
             logger.warning(f"File not in hierarchical structure: {file_path}")
 
+        # Use the compiled repository mirror while the file is unchanged
+        data = get_mirrored_saidata(file_path)
+        if isinstance(data, dict):
+            logger.debug(f"Loaded hierarchical saidata from compiled mirror: {file_path}")
+            return data
+
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 if file_path.suffix.lower() == ".json":
                     data = json.load(f)
                 elif file_path.suffix.lower() in [".yaml", ".yml"]:
-                    data = yaml.safe_load(f) or {}
+                    data = safe_load(f) or {}
                 else:
                     raise ValueError(f"Unsupported file format: {file_path.suffix}")
 
@@ -689,13 +949,11 @@ class SaidataLoader:
         return result
 
     def _load_schema(self) -> None:
-        """Load the JSON schema for saidata validation."""
-        schema_path = Path(__file__).parent.parent.parent / "schemas" / "saidata-0.3-schema.json"
-
+        """Load the compiled JSON schema validator for saidata validation."""
         try:
-            with open(schema_path, "r", encoding="utf-8") as f:
-                self._schema_cache = json.load(f)
-            logger.info(f"Loaded saidata schema version 0.3 from: {schema_path}")
+            self._schema_validator = get_schema_validator(SAIDATA_SCHEMA)
+            self._schema_cache = self._schema_validator.schema
+            logger.info(f"Loaded saidata schema version 0.3 from: {SAIDATA_SCHEMA_PATH}")
         except Exception as e:
             logger.error(f"Failed to load saidata schema: {e}")
             # Use minimal schema as fallback for 0.3 format
@@ -711,6 +969,7 @@ class SaidataLoader:
                 },
                 "required": ["version", "metadata"],
             }
+            self._schema_validator = compile_schema(self._schema_cache)
 
     def _validate_metadata(
         self, data: Dict[str, Any], errors: List[str], warnings: List[str]
@@ -0,0 +1,331 @@
+"""Compiled mirror of the parsed saidata files of a repository.
+
+Parsing YAML is the bulk of the work when saidata is not cached yet. The
+mirror holds every saidata file of a repository already parsed, stored with
+``marshal`` and grouped by software name so that a lookup only decodes the
+files of one software. It is compiled together with the catalog when the
+repository is updated and is used for a file only while the file's stat
+fingerprint matches the one recorded at compile time.
+
+The mirror is stored next to the repository directory, like the catalog, and
+is only trusted together with a catalog describing the same software tree.
+"""
+
+import logging
+import marshal
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from ..utils.cache import get_file_fingerprint
+from .saidata_catalog import SaidataCatalog, read_saidata_file
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the layout of the mirror file changes
+MIRROR_VERSION = 1
+
+# Loaded mirrors by mirror path, with the mirror file fingerprint they were read from
+_loaded_mirrors: Dict[str, Tuple[Tuple[int, int, int], "SaidataMirror"]] = {}
+_loaded_mirrors_lock = threading.Lock()
+
+
+def get_mirror_path(base_path: Path) -> Path:
+    """Get the mirror file location for a repository directory.
+
+    Args:
+        base_path: Repository directory containing the ``software`` tree
+
+    Returns:
+        Path of the mirror file
+    """
+    return base_path.parent / f".{base_path.name}.saidata.marshal"
+
+
+def _get_header(tree_fingerprint: Optional[List[int]]) -> Dict[str, Any]:
+    """Build the header identifying what a mirror file depends on.
+
+    The marshal format is only guaranteed to be readable by the Python
+    version that wrote it.
+    """
+    return {
+        "mirror_version": MIRROR_VERSION,
+        "python_version": list(sys.version_info[:2]),
+        "marshal_version": marshal.version,
+        "tree_fingerprint": tree_fingerprint,
+    }
+
+
+def _is_trusted_file(mirror_path: Path, stat_result: os.stat_result) -> bool:
+    """Check that the mirror file is owned by us and not writable by others.
+
+    Unmarshalling maliciously constructed data can crash the interpreter, so
+    the mirror must only be read when nobody else could have written it.
+    """
+    if os.name == "nt":
+        return True
+
+    if stat_result.st_uid != os.getuid():
+        logger.warning(f"Ignoring saidata mirror not owned by current user: {mirror_path}")
+        return False
+
+    if stat_result.st_mode & 0o022:
+        logger.warning(f"Ignoring group/world-writable saidata mirror: {mirror_path}")
+        return False
+
+    return True
+
+
+class SaidataMirror:
+    """Parsed saidata files of a repository, grouped by software name."""
+
+    def __init__(
+        self,
+        base_path: Path,
+        software: Dict[str, bytes],
+        tree_fingerprint: Optional[List[int]] = None,
+    ):
+        """Initialize the mirror.
+
+        Args:
+            base_path: Repository directory the mirror describes
+            software: Marshalled ``{relative path: {"fingerprint", "data"}}``
+                      dictionaries by software name
+            tree_fingerprint: Fingerprint of the software directory of the catalog
+                              the mirror was compiled from
+        """
+        self.base_path = base_path
+        self.software = software
+        self.tree_fingerprint = tree_fingerprint
+
+    def __contains__(self, software_name: str) -> bool:
+        return software_name in self.software
+
+    def __len__(self) -> int:
+        return len(self.software)
+
+    @property
+    def mirror_path(self) -> Path:
+        """Path of the mirror file."""
+        return get_mirror_path(self.base_path)
+
+    def get(self, file_path: Path) -> Optional[Any]:
+        """Get the parsed content of a saidata file if it is unchanged.
+
+        Every call decodes a fresh copy, so callers may modify the result.
+
+        Args:
+            file_path: Saidata file inside the repository directory
+
+        Returns:
+            The parsed document, or None if the file is not mirrored or has changed
+        """
+        try:
+            relative_path = file_path.relative_to(self.base_path)
+        except ValueError:
+            return None
+
+        parts = relative_path.parts
+        if len(parts) < 4 or parts[0] != "software" or parts[2] not in self.software:
+            return None
+
+        document = marshal.loads(self.software[parts[2]]).get(relative_path.as_posix())
+        if document is None:
+            return None
+
+        if document["fingerprint"] != get_file_fingerprint(file_path):
+            logger.debug(f"Saidata mirror entry for {file_path} is stale")
+            return None
+        return document["data"]
+
+    @classmethod
+    def compile(
+        cls,
+        base_path: Path,
+        catalog: SaidataCatalog,
+        documents: Optional[Dict[str, Any]] = None,
+    ) -> "SaidataMirror":
+        """Parse every saidata file listed in a catalog.
+
+        Args:
+            base_path: Repository directory containing the ``software`` tree
+            catalog: Catalog of the repository
+            documents: Already parsed files by relative path, as collected while
+                       building the catalog
+
+        Returns:
+            The compiled mirror
+        """
+        documents = documents or {}
+        software = {}
+        for name, entry in catalog.entries.items():
+            files = {}
+            for relative_path in [entry.default, *entry.overrides.values()]:
+                file_path = base_path / relative_path
+                fingerprint = get_file_fingerprint(file_path)
+                if fingerprint is None:
+                    continue
+
+                try:
+                    if relative_path in documents:
+                        data = documents[relative_path]
+                    else:
+                        data = read_saidata_file(file_path)
+                    # Values YAML can produce but marshal cannot store, such as
+                    # dates, leave the file to be parsed when it is loaded
+                    marshal.dumps(data)
+                except (OSError, ValueError, yaml.YAMLError) as e:
+                    logger.debug(f"Not mirroring saidata file {relative_path}: {e}")
+                    continue
+
+                files[relative_path] = {"fingerprint": fingerprint, "data": data}
+
+            if files:
+                software[name] = marshal.dumps(files)
+
+        logger.debug(f"Compiled saidata mirror for {base_path} with {len(software)} software")
+        return cls(base_path, software, catalog.tree_fingerprint)
+
+    def save(self) -> None:
+        """Write the mirror file atomically."""
+        mirror_path = self.mirror_path
+        temp_file = mirror_path.with_name(
+            f"{mirror_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump(
+                    {"header": _get_header(self.tree_fingerprint), "software": self.software}, f
+                )
+            temp_file.replace(mirror_path)
+        except OSError:
+            temp_file.unlink(missing_ok=True)
+            raise
+
+        logger.debug(f"Saved saidata mirror to {mirror_path}")
+
+    @classmethod
+    def load(cls, base_path: Path) -> Optional["SaidataMirror"]:
+        """Load the mirror of a repository directory.
+
+        Mirrors are kept in memory as long as the mirror file does not change.
+
+        Args:
+            base_path: Repository directory containing the ``software`` tree
+
+        Returns:
+            SaidataMirror, or None if there is no mirror or it is outdated
+        """
+        mirror_path = get_mirror_path(base_path)
+        try:
+            stat = mirror_path.stat()
+        except OSError:
+            return None
+        file_fingerprint = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+        key = str(mirror_path)
+        with _loaded_mirrors_lock:
+            loaded = _loaded_mirrors.get(key)
+        if loaded and loaded[0] == file_fingerprint:
+            mirror = loaded[1]
+        else:
+            if not _is_trusted_file(mirror_path, stat):
+                return None
+            mirror = cls._read(base_path, mirror_path)
+            if mirror is None:
+                return None
+            with _loaded_mirrors_lock:
+                _loaded_mirrors[key] = (file_fingerprint, mirror)
+
+        # Mirrored files are checked one by one when they are read
+        catalog = SaidataCatalog.load(base_path)
+        if catalog is None or catalog.tree_fingerprint != mirror.tree_fingerprint:
+            logger.debug(f"Saidata mirror {mirror_path} is outdated")
+            return None
+        return mirror
+
+    @classmethod
+    def _read(cls, base_path: Path, mirror_path: Path) -> Optional["SaidataMirror"]:
+        """Read a mirror file.
+
+        Args:
+            base_path: Repository directory the mirror describes
+            mirror_path: Path of the mirror file
+
+        Returns:
+            SaidataMirror, or None if the file is unreadable or was written differently
+        """
+        try:
+            with open(mirror_path, "rb") as f:
+                data = marshal.load(f)
+            header = data["header"]
+            if header != _get_header(header.get("tree_fingerprint")):
+                logger.debug(f"Ignoring saidata mirror written differently: {mirror_path}")
+                return None
+            return cls(base_path, data["software"], header["tree_fingerprint"])
+        except (OSError, EOFError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Failed to read saidata mirror {mirror_path}: {e}")
+            return None
+
+
+def compile_mirror(
+    base_path: Path, catalog: SaidataCatalog, documents: Optional[Dict[str, Any]] = None
+) -> Optional[SaidataMirror]:
+    """Compile and save the mirror of a repository directory.
+
+    Args:
+        base_path: Repository directory containing the ``software`` tree
+        catalog: Catalog of the repository
+        documents: Already parsed files by relative path
+
+    Returns:
+        The new mirror, or None if it could not be saved
+    """
+    try:
+        mirror = SaidataMirror.compile(base_path, catalog, documents)
+        mirror.save()
+        return mirror
+    except OSError as e:
+        logger.warning(f"Failed to compile saidata mirror for {base_path}: {e}")
+        return None
+
+
+def load_mirror(base_path: Path) -> Optional[SaidataMirror]:
+    """Load the up-to-date mirror of a repository directory.
+
+    Args:
+        base_path: Repository directory containing the ``software`` tree
+
+    Returns:
+        SaidataMirror, or None if there is none or it is outdated
+    """
+    return SaidataMirror.load(base_path)
+
+
+def get_mirrored_saidata(file_path: Path) -> Optional[Any]:
+    """Get the parsed content of a saidata file from its repository's mirror.
+
+    Args:
+        file_path: ``software/{prefix}/{name}/...`` saidata file
+
+    Returns:
+        The parsed document, or None if no up-to-date mirror holds the file
+    """
+    parts = file_path.parts
+    # default.yaml is three levels below "software", OS overrides four
+    for depth in (4, 5):
+        if len(parts) > depth and parts[-depth] == "software":
+            base_path = Path(*parts[:-depth])
+            break
+    else:
+        return None
+
+    mirror = load_mirror(base_path)
+    if mirror is None:
+        return None
+    return mirror.get(file_path)
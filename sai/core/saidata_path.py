@@ -7,6 +7,16 @@ from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Saidata file names in a software directory, in lookup order
+SAIDATA_FILE_NAMES = [
+    "default.yaml",
+    "default.yml",
+    "default.json",
+    "saidata.yaml",
+    "saidata.yml",
+    "saidata.json",
+]
+
 
 @dataclass
 class SaidataPath:
@@ -79,6 +89,17 @@ class SaidataPath:
         """
         return self.hierarchical_path.parent
 
+    def get_base_path(self) -> Optional[Path]:
+        """Get the base directory containing the ``software`` tree.
+
+        Returns:
+            Base directory, or None if the path does not follow the hierarchical layout
+        """
+        parents = self.hierarchical_path.parents
+        if len(parents) < 4 or parents[2].name != "software":
+            return None
+        return parents[3]
+
     def get_alternative_files(self) -> List[Path]:
         """Get alternative saidata files in the same directory.
 
@@ -96,16 +117,8 @@ class SaidataPath:
         if not directory.exists():
             return []
 
-        alternative_names = [
-            "default.yml",
-            "default.json",
-            "saidata.yaml",
-            "saidata.yml",
-            "saidata.json",
-        ]
-
         alternatives = []
-        for name in alternative_names:
+        for name in SAIDATA_FILE_NAMES[1:]:
             alt_path = directory / name
             if alt_path.exists() and alt_path.is_file():
                 alternatives.append(alt_path)
@@ -124,9 +137,20 @@ class SaidataPath:
         5. saidata.yml
         6. saidata.json
 
+        If the base directory has a catalog that is up to date for this
+        software, the file is looked up in the catalog instead of the filesystem.
+
         Returns:
             Path to the first existing file, or None if no file exists
         """
+        base_path = self.get_base_path()
+        if base_path is not None:
+            from .saidata_catalog import load_catalog
+
+            catalog = load_catalog(base_path, self.software_name)
+            if catalog is not None:
+                return catalog.resolve_default(self.software_name)
+
         # Check primary file first
         if self.exists():
             return self.hierarchical_path
@@ -2,13 +2,15 @@
 
 import logging
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from ..models.config import RepositoryAuthType, SaiConfig
+from ..models.config import RepositoryAuthType, RepositoryMethod, SaiConfig, SaidataRepositorySource
 from ..models.saidata import SaiData
 from ..utils.errors import (
     RepositoryError,
@@ -17,11 +19,25 @@ from ..utils.system import (
     NetworkConnectivityTracker,
     check_url_accessibility,
     detect_offline_mode,
+    get_os_id,
+)
+from .git_repository_handler import (
+    GitOperationResult,
+    GitRepositoryHandler,
+    RepositoryInfo,
+    SparseCheckoutProfile,
 )
-from .git_repository_handler import GitOperationResult, GitRepositoryHandler, RepositoryInfo
 from .repository_cache import RepositoryCache
-from .saidata_loader import SaidataLoader, SaidataNotFoundError
-from .tarball_repository_handler import TarballOperationResult, TarballRepositoryHandler
+from .repository_refresh import get_lock_path, hold_update_lock, start_background_update
+from .saidata_catalog import SaidataCatalog, build_catalog
+from .saidata_loader import BulkLoadResult, SaidataLoader, SaidataNotFoundError
+from .saidata_mirror import compile_mirror, get_mirror_path
+from .saidata_path import SaidataPath
+from .tarball_repository_handler import (
+    ReleaseInfo,
+    TarballOperationResult,
+    TarballRepositoryHandler,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +74,34 @@ class RepositoryHealthCheck:
         """Check if repository needs an update."""
         return self.update_available or self.status == RepositoryStatus.ERROR
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        data = asdict(self)
+        data["status"] = self.status.value
+        for key in ("last_updated", "last_check"):
+            if data[key]:
+                data[key] = data[key].isoformat()
+        if data["repository_info"] and data["repository_info"]["last_updated"]:
+            data["repository_info"]["last_updated"] = data["repository_info"][
+                "last_updated"
+            ].isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RepositoryHealthCheck":
+        """Create from dictionary loaded from JSON."""
+        data = data.copy()
+        data["status"] = RepositoryStatus(data["status"])
+        for key in ("last_updated", "last_check"):
+            if data.get(key):
+                data[key] = datetime.fromisoformat(data[key])
+        if data.get("repository_info"):
+            info = data["repository_info"].copy()
+            if info.get("last_updated"):
+                info["last_updated"] = datetime.fromisoformat(info["last_updated"])
+            data["repository_info"] = RepositoryInfo(**info)
+        return cls(**data)
+
 
 class SaidataRepositoryManager:
     """Central coordinator for saidata repository operations and lifecycle management."""
@@ -89,6 +133,12 @@ class SaidataRepositoryManager:
             security_level=security_level,
         )
 
+        # Managers of the repositories layered on top of this one, highest precedence first
+        self.layers: List[SaidataRepositoryManager] = [
+            SaidataRepositoryManager(self._get_layer_config(source))
+            for source in self.config.saidata_repositories
+        ]
+
         # Initialize saidata loader with repository-aware configuration
         self._setup_repository_paths()
         self.saidata_loader = SaidataLoader(self.config, repository_manager=self)
@@ -97,6 +147,14 @@ class SaidataRepositoryManager:
         self._last_update_check: Optional[datetime] = None
         self._repository_status: RepositoryStatus = RepositoryStatus.UNKNOWN
         self._last_error: Optional[str] = None
+        self._status_snapshot: Optional[Dict[str, Any]] = None
+        # Result of the last successful tarball update
+        self._tarball_result: Optional[TarballOperationResult] = None
+        # Commit and changed paths of the last successful git update
+        self._git_revision: Optional[str] = None
+        self._git_changed_paths: Optional[List[str]] = None
+        # Whether this manager holds the update lock of its repository
+        self._holds_update_lock = False
 
         # Offline mode and network tracking
         self._network_tracker = NetworkConnectivityTracker()
@@ -126,6 +184,30 @@ class SaidataRepositoryManager:
         repo_name = self._get_repository_name()
         return self.repository_cache_dir / repo_name
 
+    @contextmanager
+    def hold_update_lock(self, wait: bool = False) -> Iterator[bool]:
+        """Hold the update lock of this repository if no other process does.
+
+        Holding the lock again while this manager holds it succeeds, so the
+        background update process can update the repository it locked.
+
+        Args:
+            wait: Whether to wait until another process releases the lock
+
+        Yields:
+            True if the lock is held, False if another process holds it
+        """
+        if self._holds_update_lock:
+            yield True
+            return
+
+        with hold_update_lock(get_lock_path(self.repository_path), wait) as locked:
+            self._holds_update_lock = locked
+            try:
+                yield locked
+            finally:
+                self._holds_update_lock = False
+
     def get_saidata(self, software_name: str, force_update: bool = False) -> Optional[SaiData]:
         """Get saidata for the specified software.
 
@@ -156,7 +238,9 @@ class SaidataRepositoryManager:
                 self.warn_about_stale_cache(cache_age)
 
         # Update repository if needed (unless in offline mode)
-        if (force_update or self._should_update_repository()) and not self.is_offline_mode():
+        if self._update_in_background(force_update):
+            logger.debug(f"Serving cached repository for {software_name}")
+        elif (force_update or self._should_update_repository()) and not self.is_offline_mode():
             logger.info(f"Repository update required for {software_name}")
             try:
                 update_result = self.update_repository(force=force_update)
@@ -177,6 +261,9 @@ class SaidataRepositoryManager:
         elif self.is_offline_mode():
             logger.debug(f"Offline mode active, skipping repository update for {software_name}")
 
+        # Catalogs are built on update; repositories fetched before that get one now
+        self._ensure_repository_catalogs()
+
         # Load saidata using the repository-aware loader
         try:
             logger.debug(f"Loading saidata for {software_name} from repository")
@@ -185,6 +272,13 @@ class SaidataRepositoryManager:
             return saidata
 
         except SaidataNotFoundError:
+            # Sparse checkouts may have the software in the repository without checking it out
+            if not self.is_offline_mode() and self._hydrate_software([software_name]):
+                try:
+                    return self.saidata_loader.load_saidata(software_name)
+                except SaidataNotFoundError:
+                    logger.debug(f"Saidata for {software_name} still missing after hydration")
+
             # If not found and we haven't updated recently, try updating once (unless offline)
             if not force_update and self._should_retry_with_update() and not self.is_offline_mode():
                 logger.info(
@@ -209,8 +303,130 @@ class SaidataRepositoryManager:
             self._log_saidata_search_failure(software_name)
             raise
 
+    def load_many(self, software_names: Iterable[str], force_update: bool = False) -> BulkLoadResult:
+        """Get saidata for several software, checking the repository once.
+
+        Args:
+            software_names: Names of the software to get saidata for
+            force_update: Whether to force a repository update before loading
+
+        Returns:
+            BulkLoadResult with the saidata or the error of every requested name
+        """
+        software_names = list(dict.fromkeys(software_names))
+        logger.info(f"Getting saidata for {len(software_names)} software")
+
+        if self._update_in_background(force_update):
+            logger.debug("Serving cached repository")
+        elif (force_update or self._should_update_repository()) and not self.is_offline_mode():
+            try:
+                self.update_repository(force=force_update)
+            except Exception as e:
+                logger.warning(f"Repository update failed, using cached data: {e}")
+
+        self._ensure_repository_catalogs()
+        result = self.saidata_loader.load_many(software_names)
+
+        # Saidata missing from the cached repository may have been added upstream
+        missing = [
+            name
+            for name, error in result.errors.items()
+            if isinstance(error, SaidataNotFoundError)
+        ]
+        if missing and not self.is_offline_mode() and self._hydrate_software(missing):
+            retry = self.saidata_loader.load_many(missing)
+            for name, saidata in retry.saidata.items():
+                result.saidata[name] = saidata
+                del result.errors[name]
+            missing = [name for name in missing if name not in retry.saidata]
+
+        if (
+            missing
+            and not force_update
+            and self._should_retry_with_update()
+            and not self.is_offline_mode()
+        ):
+            logger.info(f"Saidata not found for {len(missing)} software, updating repository")
+            try:
+                if self.update_repository(force=True):
+                    retry = self.saidata_loader.load_many(missing)
+                    for name in missing:
+                        if name in retry.saidata:
+                            result.saidata[name] = retry.saidata[name]
+                            del result.errors[name]
+                        else:
+                            result.errors[name] = retry.errors[name]
+            except Exception as e:
+                logger.warning(f"Repository update failed during retry: {e}")
+
+        return result
+
     def update_repository(self, force: bool = False) -> bool:
-        """Update the saidata repository.
+        """Update the saidata repository and the repositories layered on top of it.
+
+        Layers are updated concurrently, each by its own git or tarball
+        handler, so the slowest repository bounds the update time.
+
+        Args:
+            force: Whether to force update regardless of cache validity
+
+        Returns:
+            True if every repository was updated or has a usable cached copy, False otherwise
+        """
+        if not self.layers:
+            return self._update_repository(force)
+
+        managers = [*self.layers, self]
+        logger.info(f"Updating {len(managers)} layered saidata repositories")
+        with ThreadPoolExecutor(max_workers=len(managers)) as executor:
+            futures = [
+                executor.submit(
+                    manager._update_repository if manager is self else manager.update_repository,
+                    force,
+                )
+                for manager in managers
+            ]
+            results = []
+            for manager, future in zip(managers, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error(f"Update of {manager.config.saidata_repository_url} failed: {e}")
+                    results.append(False)
+        return all(results)
+
+    def get_layer_paths(self) -> List[Path]:
+        """Get the directories of the layered repositories.
+
+        Returns:
+            Repository directories, highest precedence first and this repository last
+        """
+        return [layer.repository_path for layer in self.layers] + [self.repository_path]
+
+    def _get_layer_config(self, source: SaidataRepositorySource) -> SaiConfig:
+        """Derive the configuration of a repository layered on top of this one.
+
+        Args:
+            source: Layered repository
+
+        Returns:
+            Copy of this configuration pointing at the layer
+        """
+        return self.config.model_copy(
+            update={
+                "saidata_repository_url": source.url,
+                "saidata_repository_branch": source.branch,
+                "saidata_repository_method": source.method,
+                "saidata_repository_auth_type": source.auth_type,
+                "saidata_repository_auth_data": dict(source.auth_data or {}),
+                "saidata_repositories": [],
+                "saidata_paths": [],
+            },
+            deep=True,
+        )
+
+    def _update_repository(self, force: bool = False) -> bool:
+        """Update this saidata repository alone.
 
         Args:
             force: Whether to force update regardless of cache validity
@@ -260,6 +476,27 @@ class SaidataRepositoryManager:
             logger.debug("Repository cache is valid, no update needed")
             return True
 
+        # Background refreshers write the same directory, so updates take turns
+        with self.hold_update_lock() as locked:
+            if locked:
+                return self._fetch_repository()
+
+        if self.repository_path.exists():
+            logger.info("Another process is updating the repository, using the cached copy")
+            return True
+
+        logger.info("Waiting for another process fetching the repository")
+        with self.hold_update_lock(wait=True):
+            return self.repository_path.exists()
+
+    def _fetch_repository(self) -> bool:
+        """Fetch this repository with git or as a release tarball.
+
+        The caller holds the update lock of the repository.
+
+        Returns:
+            True if the repository was updated or has a usable cached copy, False otherwise
+        """
         # Log current repository status
         current_status = self.get_repository_status()
         logger.debug(f"Current repository status: {current_status.status}")
@@ -271,10 +508,11 @@ class SaidataRepositoryManager:
         self._repository_status = RepositoryStatus.UPDATING
 
         update_start_time = datetime.now()
+        method = self.config.saidata_repository_method
 
         try:
             # Try git first if available
-            if self.git_handler.is_git_available():
+            if method != RepositoryMethod.TARBALL and self.git_handler.is_git_available():
                 logger.info("Attempting git-based repository update")
                 result = self._update_with_git()
                 if result:
@@ -282,28 +520,52 @@ class SaidataRepositoryManager:
                     logger.info(
                         f"Git repository update completed successfully in {update_duration:.2f}s"
                     )
-                    self._mark_update_successful(is_git_repo=True)
+                    self._mark_update_successful(
+                        is_git_repo=True,
+                        revision=self._git_revision,
+                        changed_paths=self._git_changed_paths,
+                    )
                     self._validate_repository_structure()
+                    self._build_repository_catalog()
                     return True
 
-                logger.warning("Git update failed, falling back to tarball download")
-            else:
+                if method == RepositoryMethod.AUTO:
+                    logger.warning("Git update failed, falling back to tarball download")
+            elif method == RepositoryMethod.GIT:
+                logger.error("Git not available, cannot update git repository")
+            elif method == RepositoryMethod.AUTO:
                 logger.info("Git not available, using tarball download method")
 
             # Fall back to tarball download
-            logger.info("Attempting tarball-based repository update")
-            result = self._update_with_tarball()
+            if method == RepositoryMethod.GIT:
+                result = False
+            else:
+                logger.info("Attempting tarball-based repository update")
+                result = self._update_with_tarball()
             if result:
                 update_duration = (datetime.now() - update_start_time).total_seconds()
                 logger.info(
                     f"Tarball repository update completed successfully in {update_duration:.2f}s"
                 )
-                self._mark_update_successful(is_git_repo=False)
+                tarball_result = self._tarball_result
+                self._mark_update_successful(
+                    is_git_repo=False,
+                    release_info=tarball_result.release_info if tarball_result else None,
+                    changed_paths=[] if tarball_result and tarball_result.not_modified else None,
+                    files=tarball_result.files if tarball_result else None,
+                )
                 self._validate_repository_structure()
+                if tarball_result and tarball_result.not_modified:
+                    self._ensure_repository_catalog()
+                else:
+                    self._build_repository_catalog()
                 return True
 
             # Both methods failed - record network failure and check for cached fallback
-            error_msg = "Both git and tarball update methods failed"
+            if method == RepositoryMethod.AUTO:
+                error_msg = "Both git and tarball update methods failed"
+            else:
+                error_msg = f"Repository update with {method.value} failed"
             logger.error(error_msg)
             self._network_tracker.record_failure()
             self._mark_update_failed(error_msg)
@@ -355,6 +617,25 @@ class SaidataRepositoryManager:
     def get_repository_status(self) -> RepositoryHealthCheck:
         """Get comprehensive repository status and health information.
 
+        Checking the repository runs git and may probe the network, so results
+        are reused for ``saidata_repository_status_ttl`` seconds, also by later
+        processes. Updating or reconfiguring the repository, or changes to the
+        repository directory, discard the reused result.
+
+        Returns:
+            RepositoryHealthCheck with current repository status
+        """
+        health_check = self._get_memoized_status()
+        if health_check is not None:
+            return health_check
+
+        health_check = self._check_repository_status()
+        self._memoize_status(health_check)
+        return health_check
+
+    def _check_repository_status(self) -> RepositoryHealthCheck:
+        """Check repository status and health.
+
         Returns:
             RepositoryHealthCheck with current repository status
         """
@@ -416,6 +697,101 @@ class SaidataRepositoryManager:
 
         return health_check
 
+    def _get_repository_fingerprint(self) -> List[Optional[int]]:
+        """Fingerprint the repository directory for reusing health checks.
+
+        Git updates the ``.git`` directory on fetches, checkouts and resets, and
+        tarball updates replace the repository directory.
+
+        Returns:
+            Modification times of the repository and its ``.git`` directory
+        """
+        fingerprint = []
+        for path in (self.repository_path, self.repository_path / ".git"):
+            try:
+                fingerprint.append(path.stat().st_mtime_ns)
+            except OSError:
+                fingerprint.append(None)
+        return fingerprint
+
+    def _get_memoized_status(self) -> Optional[RepositoryHealthCheck]:
+        """Get the recorded health check if it is still valid.
+
+        Returns:
+            RepositoryHealthCheck, or None if the repository has to be checked
+        """
+        ttl = self.config.saidata_repository_status_ttl
+        if ttl <= 0:
+            return None
+
+        snapshot = self._status_snapshot
+        if snapshot is None:
+            snapshot = self.repository_cache.get_repository_health(
+                self.config.saidata_repository_url, self.config.saidata_repository_branch
+            )
+
+        try:
+            if (
+                not snapshot
+                or time.time() - snapshot["checked_at"] > ttl
+                or snapshot["offline_mode"] != self.config.saidata_offline_mode
+                or snapshot["repository_fingerprint"] != self._get_repository_fingerprint()
+            ):
+                self._status_snapshot = None
+                return None
+            health_check = RepositoryHealthCheck.from_dict(snapshot["health"])
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Ignoring invalid repository health snapshot: {e}")
+            self._status_snapshot = None
+            return None
+
+        # Status changes made by this process are not in the snapshot
+        if self._repository_status not in (RepositoryStatus.UNKNOWN, health_check.status):
+            return None
+
+        self._status_snapshot = snapshot
+        if self._last_network_check is None and snapshot.get("offline_mode_detected") is not None:
+            self._offline_mode_detected = snapshot["offline_mode_detected"]
+            self._last_network_check = datetime.fromtimestamp(snapshot["checked_at"])
+
+        logger.debug(f"Reusing repository health check: {health_check.status}")
+        return health_check
+
+    def _memoize_status(self, health_check: RepositoryHealthCheck) -> None:
+        """Record a health check for reuse.
+
+        Args:
+            health_check: Result of checking the repository
+        """
+        if self.config.saidata_repository_status_ttl <= 0:
+            return
+
+        try:
+            health = health_check.to_dict()
+        except (TypeError, ValueError, AttributeError) as e:
+            logger.debug(f"Cannot record repository health check: {e}")
+            return
+
+        self._status_snapshot = {
+            "checked_at": time.time(),
+            "offline_mode": self.config.saidata_offline_mode,
+            "offline_mode_detected": self._offline_mode_detected,
+            "repository_fingerprint": self._get_repository_fingerprint(),
+            "health": health,
+        }
+        self.repository_cache.set_repository_health(
+            self.config.saidata_repository_url,
+            self.config.saidata_repository_branch,
+            self._status_snapshot,
+        )
+
+    def _invalidate_status(self) -> None:
+        """Discard the recorded health check."""
+        self._status_snapshot = None
+        self.repository_cache.set_repository_health(
+            self.config.saidata_repository_url, self.config.saidata_repository_branch, None
+        )
+
     def configure_repository(
         self,
         url: str,
@@ -466,6 +842,7 @@ class SaidataRepositoryManager:
             # Reset status to trigger fresh update
             self._repository_status = RepositoryStatus.UNKNOWN
             self._last_update_check = None
+            self._status_snapshot = None
 
             logger.info(f"Repository configured: {url} (branch: {branch})")
             return True
@@ -595,15 +972,14 @@ class SaidataRepositoryManager:
 
     def _setup_repository_paths(self) -> None:
         """Setup saidata paths to prioritize repository cache."""
-        repo_path = str(self.repository_path)
+        repo_paths = [str(path) for path in self.get_layer_paths()]
 
-        # Ensure repository path is first in saidata_paths
-        if repo_path not in self.config.saidata_paths:
-            self.config.saidata_paths.insert(0, repo_path)
-        elif self.config.saidata_paths[0] != repo_path:
-            # Move to front if not already there
-            self.config.saidata_paths.remove(repo_path)
-            self.config.saidata_paths.insert(0, repo_path)
+        # Ensure the layered repositories come first in saidata_paths, in layer order
+        if self.config.saidata_paths[: len(repo_paths)] != repo_paths:
+            for repo_path in repo_paths:
+                if repo_path in self.config.saidata_paths:
+                    self.config.saidata_paths.remove(repo_path)
+            self.config.saidata_paths[:0] = repo_paths
 
         # Update the saidata loader if it exists
         if hasattr(self, "saidata_loader") and self.saidata_loader:
@@ -688,13 +1064,19 @@ class SaidataRepositoryManager:
     def get_cached_repository_age(self) -> Optional[timedelta]:
         """Get the age of the cached repository.
 
+        Uses the recorded health check when there is one, otherwise the update time
+        of the repository on disk, so the network is never probed.
+
         Returns:
             Age of cached repository, or None if no cache exists
         """
         if not self.repository_path.exists():
             return None
 
-        last_updated = self._get_last_update_time()
+        health_check = self._get_memoized_status()
+        last_updated = health_check.last_updated if health_check else None
+        if last_updated is None:
+            last_updated = self._get_last_update_time()
         if last_updated:
             return datetime.now() - last_updated
 
@@ -773,12 +1155,40 @@ class SaidataRepositoryManager:
             return False
 
         # Use repository cache to check validity
-        return not self.repository_cache.is_repository_valid(
-            self.config.saidata_repository_url, self.config.saidata_repository_branch
-        )
+        return not self._is_cache_valid()
+
+    def _update_in_background(self, force_update: bool = False) -> bool:
+        """Serve the cached repository and update it in a detached process if expired.
+
+        Repositories without a local copy, including layers, are fetched by the
+        caller. The detached process updates every layer, each under its own lock.
+
+        Args:
+            force_update: Whether the caller asked for an update before loading
+
+        Returns:
+            True if lookups should use the cached repository as is, False if the
+            caller should decide on a synchronous update
+        """
+        if (
+            force_update
+            or not self.config.saidata_background_update
+            or not self.config.saidata_auto_update
+            or not all(path.exists() for path in self.get_layer_paths())
+            or self.is_offline_mode()
+        ):
+            return False
+
+        if not self._is_cache_valid():
+            start_background_update(self.config, self.repository_path)
+        return True
 
     def _should_retry_with_update(self) -> bool:
         """Check if we should retry with a repository update when saidata is not found."""
+        # Background updates keep repository fetches out of lookups
+        if self.config.saidata_background_update and self.repository_path.exists():
+            return False
+
         # Only retry if we haven't updated recently
         if self._last_update_check:
             time_since_check = datetime.now() - self._last_update_check
@@ -788,10 +1198,10 @@ class SaidataRepositoryManager:
         return True
 
     def _is_cache_valid(self) -> bool:
-        """Check if the repository cache is valid based on update interval."""
+        """Check if the repository and layer caches are valid based on update interval."""
         return self.repository_cache.is_repository_valid(
             self.config.saidata_repository_url, self.config.saidata_repository_branch
-        )
+        ) and all(layer._is_cache_valid() for layer in self.layers)
 
     def _get_last_update_time(self) -> Optional[datetime]:
         """Get the last update time of the repository."""
@@ -825,6 +1235,8 @@ class SaidataRepositoryManager:
             logger.debug(
                 f"Git update parameters: auth_type={auth_type}, shallow={
                     self.config.saidata_shallow_clone}")
+            self._git_revision = None
+            self._git_changed_paths = None
 
             if self.repository_path.exists():
                 # Update existing repository
@@ -844,6 +1256,8 @@ class SaidataRepositoryManager:
                     self.config.saidata_shallow_clone,
                     auth_type,
                     auth_data,
+                    partial_clone=self.config.saidata_partial_clone,
+                    sparse_profile=self._get_sparse_profile(),
                 )
 
             duration = (datetime.now() - operation_start).total_seconds()
@@ -851,11 +1265,12 @@ class SaidataRepositoryManager:
             if result.success:
                 logger.info(f"Git repository {operation} successful")
                 self._network_tracker.record_success()
+                self._record_git_changes(operation)
                 self._log_repository_operation_summary(
                     operation,
                     True,
                     duration,
-                    {"method": "git", "repository_size_mb": self._get_repository_size_mb()},
+                    {"method": "git", "revision": self._git_revision},
                 )
                 return True
             else:
@@ -894,18 +1309,11 @@ class SaidataRepositoryManager:
             auth_data = self.config.saidata_repository_auth_data
 
             logger.debug(f"Tarball update parameters: auth_type={auth_type}")
+            self._tarball_result = None
 
-            # Remove existing repository if it exists
-            if self.repository_path.exists():
-                logger.debug("Removing existing repository for tarball update")
-                import shutil
-
-                try:
-                    shutil.rmtree(self.repository_path)
-                    logger.debug("Existing repository removed successfully")
-                except Exception as e:
-                    logger.warning(f"Failed to remove existing repository: {e}")
-                    # Continue anyway, tarball extraction might overwrite
+            # The existing repository is replaced when the new release is extracted,
+            # and kept if the release did not change
+            previous_release = self._get_previous_release()
 
             # Download and extract tarball
             logger.debug("Downloading repository tarball")
@@ -927,13 +1335,19 @@ class SaidataRepositoryManager:
                 auth_type,
                 auth_data,
                 progress_callback,
+                previous_release=previous_release,
             )
 
             duration = (datetime.now() - operation_start).total_seconds()
 
             if result.success:
-                logger.info("Tarball repository update successful")
+                self._tarball_result = result
                 self._network_tracker.record_success()
+                if result.not_modified:
+                    logger.info("Repository release not modified, keeping cached repository")
+                    return True
+
+                logger.info("Tarball repository update successful")
 
                 # Log release information if available
                 if result.release_info:
@@ -951,7 +1365,7 @@ class SaidataRepositoryManager:
                         "release_tag": result.release_info.tag_name
                         if result.release_info
                         else None,
-                        "repository_size_mb": self._get_repository_size_mb(),
+                        "file_count": len(result.files) if result.files is not None else None,
                     },
                 )
                 return True
@@ -985,11 +1399,63 @@ class SaidataRepositoryManager:
             )
             return False
 
-    def _mark_update_successful(self, is_git_repo: bool = True) -> None:
+    def _record_git_changes(self, operation: str) -> None:
+        """Record the commit of the repository and the paths the update changed.
+
+        Args:
+            operation: ``git_clone`` or ``git_update``
+        """
+        self._git_revision = self.git_handler.get_head_commit(self.repository_path)
+        if operation != "git_update" or not self._git_revision:
+            return
+
+        previous_revision = self.repository_cache.get_repository_revision(
+            self.config.saidata_repository_url, self.config.saidata_repository_branch
+        )
+        if previous_revision:
+            self._git_changed_paths = self.git_handler.get_changed_paths(
+                self.repository_path, previous_revision, self._git_revision
+            )
+            if self._git_changed_paths is not None:
+                logger.debug(f"Git update changed {len(self._git_changed_paths)} files")
+
+    def _get_previous_release(self) -> Optional[ReleaseInfo]:
+        """Get the release the cached tarball repository was extracted from.
+
+        Returns:
+            ReleaseInfo, or None if the repository is missing or not from a release
+        """
+        if not self.repository_path.exists():
+            return None
+
+        release = self.repository_cache.get_repository_release(
+            self.config.saidata_repository_url, self.config.saidata_repository_branch
+        )
+        if not release:
+            return None
+
+        try:
+            return ReleaseInfo.from_dict(release)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cached release information: {e}")
+            return None
+
+    def _mark_update_successful(
+        self,
+        is_git_repo: bool = True,
+        release_info: Optional[ReleaseInfo] = None,
+        revision: Optional[str] = None,
+        changed_paths: Optional[List[str]] = None,
+        files: Optional[Dict[str, int]] = None,
+    ) -> None:
         """Mark repository update as successful.
 
         Args:
             is_git_repo: Whether this is a git repository or tarball
+            release_info: Release a tarball repository was extracted from
+            revision: Commit a git repository is checked out at
+            changed_paths: Paths the update changed, None if unknown
+            files: Sizes of all files of an extracted release
         """
         self._repository_status = RepositoryStatus.AVAILABLE
         self._last_update_check = datetime.now()
@@ -1005,9 +1471,18 @@ class SaidataRepositoryManager:
             self.config.saidata_repository_branch,
             is_git_repo,
             auth_type,
+            release=release_info.to_dict() if release_info else None,
+            revision=revision,
+            changed_paths=changed_paths,
+            files=files,
         )
+        self._status_snapshot = None
 
-        logger.debug("Repository update marked as successful")
+        size_mb = self._get_repository_size_mb()
+        if size_mb is not None:
+            logger.debug(f"Repository update marked as successful ({size_mb:.1f}MB)")
+        else:
+            logger.debug("Repository update marked as successful")
 
     def _mark_update_failed(self, error_message: str) -> None:
         """Mark repository update as failed.
@@ -1018,6 +1493,7 @@ class SaidataRepositoryManager:
         self._repository_status = RepositoryStatus.ERROR
         self._last_update_check = datetime.now()
         self._last_error = error_message
+        self._invalidate_status()
         logger.error(f"Repository update marked as failed: {error_message}")
 
     def _validate_repository_structure(self) -> bool:
@@ -1085,6 +1561,93 @@ class SaidataRepositoryManager:
             logger.error(f"Repository structure validation failed: {e}")
             return False
 
+    def _build_repository_catalog(self) -> Optional[SaidataCatalog]:
+        """Build the software catalog and compiled saidata mirror of the cached repository.
+
+        Returns:
+            The new catalog, or None if the repository has no software tree
+        """
+        documents: Dict[str, Any] = {}
+        catalog = build_catalog(self.repository_path, documents)
+        if catalog is not None:
+            logger.info(f"Repository catalog lists {len(catalog)} software")
+            compile_mirror(self.repository_path, catalog, documents)
+        return catalog
+
+    def _get_sparse_profile(self) -> Optional[SparseCheckoutProfile]:
+        """Get the sparse checkout profile for new clones of the repository.
+
+        Returns:
+            SparseCheckoutProfile limited to the host OS, or None for full checkouts
+        """
+        if not self.config.saidata_sparse_checkout:
+            return None
+        return SparseCheckoutProfile(
+            prefixes=list(self.config.saidata_sparse_prefixes), os_ids=[get_os_id()]
+        )
+
+    def _hydrate_software(self, software_names: List[str]) -> bool:
+        """Check out software that a sparse repository has but did not materialize.
+
+        Args:
+            software_names: Names of the software missing from the checkout
+
+        Returns:
+            True if any software directory was added to the checkout
+        """
+        directories = []
+        for software_name in software_names:
+            try:
+                saidata_path = SaidataPath.from_software_name(software_name, self.repository_path)
+            except ValueError:
+                continue
+            directory = saidata_path.get_directory()
+            if not directory.exists():
+                directories.append(directory.relative_to(self.repository_path).as_posix())
+
+        if not directories or not self.git_handler.is_sparse_checkout(self.repository_path):
+            return False
+
+        sparse_profile = self._get_sparse_profile() or SparseCheckoutProfile(os_ids=[get_os_id()])
+        result = self.git_handler.hydrate_paths(
+            self.repository_path,
+            directories,
+            sparse_profile,
+            self.config.saidata_repository_auth_type,
+            self.config.saidata_repository_auth_data,
+        )
+        if not result.success:
+            logger.debug(f"No software hydrated: {result.message}")
+            return False
+
+        self.repository_cache.update_repository_stats(
+            self.config.saidata_repository_url, self.config.saidata_repository_branch, directories
+        )
+        self._build_repository_catalog()
+        return True
+
+    def _ensure_repository_catalogs(self) -> None:
+        """Make sure this repository and every layer have an up-to-date catalog."""
+        for layer in self.layers:
+            layer._ensure_repository_catalog()
+        self._ensure_repository_catalog()
+
+    def _ensure_repository_catalog(self) -> Optional[SaidataCatalog]:
+        """Get the catalog of the cached repository, building it if missing or outdated.
+
+        Returns:
+            SaidataCatalog, or None if there is no cached repository
+        """
+        if not self.repository_path.exists():
+            return None
+
+        # Lookups check the parts of the tree they use, see SaidataCatalog.is_current
+        catalog = SaidataCatalog.load(self.repository_path)
+        if catalog is None or not get_mirror_path(self.repository_path).exists():
+            logger.debug("Repository catalog missing or outdated, rebuilding")
+            catalog = self._build_repository_catalog()
+        return catalog
+
     def _log_saidata_search_failure(self, software_name: str) -> None:
         """Log detailed information about saidata search failure.
 
@@ -1144,68 +1707,42 @@ class SaidataRepositoryManager:
         # Suggest similar software names
         self._suggest_similar_software(software_name)
 
-    def _suggest_similar_software(self, software_name: str) -> None:
+    def _suggest_similar_software(self, software_name: str) -> List[str]:
         """Suggest similar software names based on available saidata.
 
         Args:
             software_name: Name of software that was not found
+
+        Returns:
+            Suggested software names, closest first
         """
         try:
             if not self.repository_path.exists():
-                return
+                return []
 
-            software_dir = self.repository_path / "software"
-            if not software_dir.exists():
-                return
-
-            # Collect available software names
-            available_software = []
-            for prefix_dir in software_dir.iterdir():
-                if prefix_dir.is_dir():
-                    for software_specific_dir in prefix_dir.iterdir():
-                        if (
-                            software_specific_dir.is_dir()
-                            and (software_specific_dir / "default.yaml").exists()
-                        ):
-                            available_software.append(software_specific_dir.name)
-
-            if not available_software:
-                return
-
-            # Find similar names using simple string matching
-            software_lower = software_name.lower()
-            suggestions = []
-
-            # Exact substring matches
-            for name in available_software:
-                if software_lower in name.lower() or name.lower() in software_lower:
-                    suggestions.append(name)
-
-            # If no substring matches, try prefix/suffix matches
-            if not suggestions:
-                for name in available_software:
-                    name_lower = name.lower()
-                    if (
-                        software_lower.startswith(name_lower[:3])
-                        or name_lower.startswith(software_lower[:3])
-                        or software_lower.endswith(name_lower[-3:])
-                        or name_lower.endswith(software_lower[-3:])
-                    ):
-                        suggestions.append(name)
-
-            # Limit suggestions
-            suggestions = list(set(suggestions))[:5]
+            catalog = self._ensure_repository_catalog()
+            if catalog is None:
+                return []
 
+            # Software shipping a package or command of that name
+            providers = catalog.find_by_alias(software_name)
+            if providers:
+                logger.info(f"'{software_name}' is provided by: {', '.join(providers[:5])}")
+
+            suggestions = catalog.suggest(software_name)
             if suggestions:
                 logger.info(f"Similar software names found: {', '.join(suggestions)}")
             else:
                 logger.debug(f"No similar software names found for '{software_name}'")
                 # Log a few random examples
-                examples = available_software[:5]
-                logger.debug(f"Available software examples: {', '.join(examples)}")
+                examples = catalog.names()[:5]
+                if examples:
+                    logger.debug(f"Available software examples: {', '.join(examples)}")
+            return suggestions
 
         except Exception as e:
             logger.debug(f"Failed to suggest similar software names: {e}")
+            return []
 
     def _log_repository_operation_summary(
         self,
@@ -1287,24 +1824,21 @@ class SaidataRepositoryManager:
         logger.info("  Use 'sai repository status' to check repository configuration")
 
     def _get_repository_size_mb(self) -> Optional[float]:
-        """Get repository size in megabytes.
+        """Get repository size in megabytes as recorded at the last update.
 
         Returns:
             Repository size in MB, or None if cannot be determined
         """
-        try:
-            if not self.repository_path.exists():
-                return None
-
-            total_size = 0
-            for file_path in self.repository_path.rglob("*"):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
-
-            return total_size / (1024 * 1024)  # Convert to MB
+        if not self.repository_cache.cache_enabled:
+            return None
 
+        try:
+            status = self.repository_cache.get_repository_status(
+                self.config.saidata_repository_url, self.config.saidata_repository_branch
+            )
         except Exception:
             return None
+        return status.size_mb if status.exists and status.last_updated else None
 
     def _analyze_git_operation_failure(self, result: GitOperationResult, operation: str) -> None:
         """Analyze git operation failure and provide specific guidance.
@@ -3,17 +3,20 @@
 import hashlib
 import json
 import logging
+import posixpath
 import shutil
 import tarfile
 import tempfile
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
 import zipfile
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
+from email.message import Message
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..models.config import RepositoryAuthType
 from ..utils.credentials import CredentialManager
@@ -41,6 +44,26 @@ class ReleaseInfo:
     checksum: Optional[str] = None
     checksum_algorithm: str = "sha256"
     size: Optional[int] = None
+    # HTTP cache validators of the release metadata and of the downloaded asset
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    asset_etag: Optional[str] = None
+    asset_last_modified: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        data = asdict(self)
+        if self.published_at:
+            data["published_at"] = self.published_at.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReleaseInfo":
+        """Create from dictionary loaded from JSON."""
+        data = data.copy()
+        if data.get("published_at"):
+            data["published_at"] = datetime.fromisoformat(data["published_at"])
+        return cls(**data)
 
 
 @dataclass
@@ -52,6 +75,89 @@ class TarballOperationResult:
     release_info: Optional[ReleaseInfo] = None
     extracted_path: Optional[Path] = None
     error_details: Optional[str] = None
+    # The server confirmed that the local copy of the release is current
+    not_modified: bool = False
+    # Sizes of the extracted files by path relative to extracted_path
+    files: Optional[Dict[str, int]] = None
+
+
+def _get_cache_validators(headers: Optional[Message]) -> Tuple[Optional[str], Optional[str]]:
+    """Get the ETag and Last-Modified values of an HTTP response.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Tuple of (etag, last_modified), each None if the server did not send it
+    """
+    if headers is None:
+        return None, None
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    return (
+        etag if isinstance(etag, str) else None,
+        last_modified if isinstance(last_modified, str) else None,
+    )
+
+
+def _add_conditional_headers(
+    request: urllib.request.Request, etag: Optional[str], last_modified: Optional[str]
+) -> None:
+    """Make a request conditional on the resource having changed.
+
+    Args:
+        request: urllib Request object
+        etag: ETag of the copy we have
+        last_modified: Last-Modified value of the copy we have
+    """
+    if etag:
+        request.add_header("If-None-Match", etag)
+    if last_modified:
+        request.add_header("If-Modified-Since", last_modified)
+
+
+# Bytes read from a release download at a time
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class _HashingReader:
+    """Read-only stream wrapper hashing and counting the bytes read through it."""
+
+    def __init__(
+        self,
+        stream: Any,
+        hasher: Optional[Any] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        total_size: int = 0,
+    ):
+        """Initialize the reader.
+
+        Args:
+            stream: Binary stream to read from
+            hasher: Optional hashlib object updated with every chunk
+            progress_callback: Optional callback receiving (downloaded_bytes, total_bytes)
+            total_size: Expected stream size, 0 if unknown
+        """
+        self.stream = stream
+        self.hasher = hasher
+        self.progress_callback = progress_callback
+        self.total_size = total_size
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        if data:
+            self.bytes_read += len(data)
+            if self.hasher:
+                self.hasher.update(data)
+            if self.progress_callback:
+                self.progress_callback(self.bytes_read, self.total_size)
+        return data
+
+    def drain(self) -> None:
+        """Read the rest of the stream, such as the padding after the end of a tar archive."""
+        while self.read(DOWNLOAD_CHUNK_SIZE):
+            pass
 
 
 class ProgressReporter:
@@ -92,11 +198,14 @@ class ProgressReporter:
 class TarballRepositoryHandler:
     """Handles tarball-based repository downloads for SAI saidata management."""
 
+    GITHUB_API_URL = "https://api.github.com"
+
     def __init__(
         self,
         timeout: int = 300,
         max_retries: int = 3,
         security_level: SecurityLevel = SecurityLevel.MODERATE,
+        api_url: str = GITHUB_API_URL,
     ):
         """Initialize the tarball repository handler.
 
@@ -104,9 +213,11 @@ class TarballRepositoryHandler:
             timeout: Timeout for download operations in seconds
             max_retries: Maximum number of retries for failed operations
             security_level: Security validation level
+            api_url: Base URL of the GitHub API
         """
         self.timeout = timeout
         self.max_retries = max_retries
+        self.api_url = api_url.rstrip("/")
 
         # Initialize security components
         self.security_validator = RepositorySecurityValidator(security_level)
@@ -122,6 +233,7 @@ class TarballRepositoryHandler:
         repo_url: str,
         auth_type: Optional[RepositoryAuthType] = None,
         auth_data: Optional[Dict[str, str]] = None,
+        previous_release: Optional[ReleaseInfo] = None,
     ) -> TarballOperationResult:
         """Get information about the latest release from a GitHub repository.
 
@@ -129,9 +241,12 @@ class TarballRepositoryHandler:
             repo_url: Repository URL (e.g., https://github.com/owner/repo)
             auth_type: Authentication type (token, basic)
             auth_data: Authentication data
+            previous_release: Release the local copy was downloaded from. The
+                              request is made conditional on its cache validators.
 
         Returns:
-            TarballOperationResult with release information
+            TarballOperationResult with release information, with ``not_modified``
+            set and the previous release if the release metadata did not change
         """
         logger.info(f"Fetching latest release info for repository: {repo_url}")
         logger.debug(f"Release info parameters: auth_type={auth_type}")
@@ -167,12 +282,16 @@ class TarballRepositoryHandler:
             logger.debug(f"Parsed repository: {owner}/{repo}")
 
             # Build GitHub API URL
-            api_url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
+            api_url = f"{self.api_url}/repos/{owner}/{repo}/releases/latest"
 
             # Create request with authentication
             request = urllib.request.Request(api_url)
             request.add_header("Accept", "application/vnd.github.v3+json")
             request.add_header("User-Agent", "SAI-Tool/1.0")
+            if previous_release:
+                _add_conditional_headers(
+                    request, previous_release.etag, previous_release.last_modified
+                )
 
             # Add authentication headers (with credential manager integration)
             if auth_type and auth_data:
@@ -214,6 +333,7 @@ class TarballRepositoryHandler:
                     )
 
                 data = json.loads(response.read().decode())
+                etag, last_modified = _get_cache_validators(response.headers)
                 logger.debug(f"API response received, parsing release data")
 
             # Parse release information
@@ -230,6 +350,17 @@ class TarballRepositoryHandler:
                     error_details="Release must contain tarball or zipball assets",
                 )
 
+            release_info.etag = etag
+            release_info.last_modified = last_modified
+            if (
+                previous_release
+                and previous_release.tag_name == release_info.tag_name
+                and previous_release.download_url == release_info.download_url
+            ):
+                # Same release asset, its validators still describe our copy
+                release_info.asset_etag = previous_release.asset_etag
+                release_info.asset_last_modified = previous_release.asset_last_modified
+
             logger.info(f"Found latest release: {release_info.tag_name} ({release_info.name})")
             logger.debug(
                 f"Release details: download_url={
@@ -243,6 +374,15 @@ class TarballRepositoryHandler:
             )
 
         except urllib.error.HTTPError as e:
+            if e.code == 304 and previous_release:
+                logger.info(f"Latest release is still {previous_release.tag_name}")
+                return TarballOperationResult(
+                    success=True,
+                    message=f"Release {previous_release.tag_name} not modified",
+                    release_info=previous_release,
+                    not_modified=True,
+                )
+
             error_msg = f"HTTP error while fetching release info: {e.code} {e.reason}"
             logger.error(error_msg)
 
@@ -318,6 +458,12 @@ class TarballRepositoryHandler:
         Returns:
             TarballOperationResult with extraction details
         """
+        # Zip archives keep their index at the end and are downloaded before extraction
+        if self._get_file_extension(release_info.download_url) != "zip":
+            return self._stream_and_extract_release(
+                release_info, target_dir, auth_type, auth_data, progress_callback
+            )
+
         temp_dir = None
         temp_file = None
 
@@ -332,11 +478,17 @@ class TarballRepositoryHandler:
 
             # Download the release file
             download_result = self._download_file_with_retry(
-                release_info.download_url, temp_file, auth_type, auth_data, progress_callback
+                release_info.download_url,
+                temp_file,
+                auth_type,
+                auth_data,
+                progress_callback,
+                release_info,
             )
 
             if not download_result.success:
                 return download_result
+            release_info = download_result.release_info or release_info
 
             # Verify checksum if available (using enhanced validator)
             if release_info.checksum:
@@ -353,6 +505,7 @@ class TarballRepositoryHandler:
 
             if extraction_result.success:
                 logger.info(f"Successfully extracted release to {target_dir}")
+                extraction_result.release_info = release_info
 
             return extraction_result
 
@@ -371,6 +524,166 @@ class TarballRepositoryHandler:
                 except Exception as e:
                     logger.warning(f"Failed to cleanup temporary directory {temp_dir}: {e}")
 
+    def _stream_and_extract_release(
+        self,
+        release_info: ReleaseInfo,
+        target_dir: Path,
+        auth_type: Optional[RepositoryAuthType] = None,
+        auth_data: Optional[Dict[str, str]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> TarballOperationResult:
+        """Download a release tarball and extract it in a single pass.
+
+        The archive is never written to disk. Its bytes are hashed as they
+        arrive while each member is checked and extracted into a staging
+        directory next to the target, which replaces the target only once the
+        whole archive was read and its digest matches the release checksum.
+
+        Args:
+            release_info: Release information from get_latest_release_info
+            target_dir: Target directory for extraction
+            auth_type: Authentication type (token, basic)
+            auth_data: Authentication data
+            progress_callback: Optional progress callback function
+
+        Returns:
+            TarballOperationResult with extraction details
+        """
+        algorithm = release_info.checksum_algorithm.lower()
+        if release_info.checksum and algorithm not in ChecksumValidator.SUPPORTED_ALGORITHMS:
+            error_msg = f"Unsupported algorithm: {algorithm}"
+            return TarballOperationResult(
+                success=False,
+                message=f"Checksum verification error: {error_msg}",
+                error_details=error_msg,
+            )
+
+        logger.info(
+            f"Downloading release {release_info.tag_name} from {release_info.download_url}"
+        )
+        last_error = None
+
+        for attempt in range(self.max_retries):
+            staging_dir = None
+            try:
+                # Staging next to the target keeps the final rename on one filesystem
+                target_dir.parent.mkdir(parents=True, exist_ok=True)
+                staging_dir = Path(
+                    tempfile.mkdtemp(prefix=f".{target_dir.name}.", dir=target_dir.parent)
+                )
+                return self._stream_and_extract_once(
+                    release_info, staging_dir, target_dir, auth_type, auth_data, progress_callback
+                )
+
+            except SecurityError as e:
+                error_msg = f"Archive extraction failed: {e}"
+                logger.error(error_msg)
+                return TarballOperationResult(
+                    success=False, message=error_msg, error_details=str(e)
+                )
+
+            except Exception as e:
+                last_error = e
+
+                if attempt < self.max_retries - 1:
+                    # Exponential backoff: 1s, 2s, 4s, etc.
+                    delay = 2**attempt
+                    logger.warning(
+                        f"Download failed (attempt {attempt + 1}/{self.max_retries}), "
+                        f"retrying in {delay}s: {e}"
+                    )
+                    time.sleep(delay)
+
+            finally:
+                if staging_dir and staging_dir.exists():
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+
+        return TarballOperationResult(
+            success=False,
+            message=f"Download failed after {self.max_retries} attempts",
+            error_details=str(last_error),
+        )
+
+    def _stream_and_extract_once(
+        self,
+        release_info: ReleaseInfo,
+        staging_dir: Path,
+        target_dir: Path,
+        auth_type: Optional[RepositoryAuthType],
+        auth_data: Optional[Dict[str, str]],
+        progress_callback: Optional[Callable[[int, int], None]],
+    ) -> TarballOperationResult:
+        """Make one attempt at streaming a release into the staging directory.
+
+        Args:
+            release_info: Release to download
+            staging_dir: Empty directory to extract into
+            target_dir: Directory replaced by the extracted release
+            auth_type: Authentication type
+            auth_data: Authentication data
+            progress_callback: Optional progress callback function
+
+        Returns:
+            TarballOperationResult with extraction details
+
+        Raises:
+            SecurityError: If the archive contains too many unsafe members
+            Exception: If the download or the archive is broken
+        """
+        request = urllib.request.Request(release_info.download_url)
+        request.add_header("User-Agent", "SAI-Tool/1.0")
+        if auth_type and auth_data:
+            self._add_auth_headers(request, auth_type, auth_data)
+
+        algorithm = release_info.checksum_algorithm.lower()
+        hasher = None
+        if release_info.checksum:
+            hasher = ChecksumValidator.SUPPORTED_ALGORITHMS[algorithm]()
+
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            reader = _HashingReader(
+                response,
+                hasher,
+                progress_callback,
+                int(response.headers.get("Content-Length") or 0),
+            )
+            with tarfile.open(fileobj=reader, mode="r|*") as tar:
+                files = self._extract_tar_members(
+                    tar, staging_dir, PathTraversalProtector(staging_dir)
+                )
+            reader.drain()
+            asset_etag, asset_last_modified = _get_cache_validators(response.headers)
+
+        logger.info(f"Downloaded and extracted {reader.bytes_read} bytes")
+        release_info = replace(
+            release_info, asset_etag=asset_etag, asset_last_modified=asset_last_modified
+        )
+
+        if hasher:
+            calculated_checksum = hasher.hexdigest().lower()
+            if calculated_checksum != release_info.checksum.lower():
+                error_msg = (
+                    f"Checksum verification failed: expected {release_info.checksum}, "
+                    f"got {calculated_checksum}"
+                )
+                logger.error(error_msg)
+                return TarballOperationResult(
+                    success=False, message="Checksum verification failed", error_details=error_msg
+                )
+            logger.info(f"Checksum verification passed ({algorithm}: {calculated_checksum})")
+
+        extracted_root = self._get_extracted_root(staging_dir)
+        self._replace_directory(extracted_root, target_dir)
+        logger.info(f"Successfully extracted release to {target_dir}")
+
+        return TarballOperationResult(
+            success=True,
+            message=f"Successfully extracted archive to {target_dir}",
+            extracted_path=target_dir,
+            release_info=release_info,
+            files=self._relative_file_sizes(files, extracted_root.relative_to(staging_dir)),
+        )
+
     def download_latest_release(
         self,
         repo_url: str,
@@ -378,24 +691,49 @@ class TarballRepositoryHandler:
         auth_type: Optional[RepositoryAuthType] = None,
         auth_data: Optional[Dict[str, str]] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        previous_release: Optional[ReleaseInfo] = None,
     ) -> TarballOperationResult:
         """Download and extract the latest release from a repository.
 
+        With a previous release, the release metadata and asset are requested
+        conditionally and nothing is downloaded if the server reports them as
+        not modified.
+
         Args:
             repo_url: Repository URL (e.g., https://github.com/owner/repo)
             target_dir: Target directory for extraction
             auth_type: Authentication type (token, basic)
             auth_data: Authentication data
             progress_callback: Optional progress callback function
+            previous_release: Release currently extracted in target_dir
 
         Returns:
-            TarballOperationResult with operation details
+            TarballOperationResult with operation details, with ``not_modified``
+            set if target_dir already holds the latest release
         """
+        if not target_dir.exists():
+            previous_release = None
+
         # First, get the latest release info
-        release_result = self.get_latest_release_info(repo_url, auth_type, auth_data)
-        if not release_result.success:
+        release_result = self.get_latest_release_info(
+            repo_url, auth_type, auth_data, previous_release
+        )
+        if not release_result.success or release_result.not_modified:
             return release_result
 
+        release_info = release_result.release_info
+        if (release_info.asset_etag or release_info.asset_last_modified) and (
+            not self._is_asset_modified(release_info, auth_type, auth_data)
+        ):
+            logger.info(f"Release asset of {release_info.tag_name} not modified")
+            return TarballOperationResult(
+                success=True,
+                message=f"Release {release_info.tag_name} not modified",
+                release_info=release_info,
+                extracted_path=target_dir,
+                not_modified=True,
+            )
+
         # Then download and extract it
         return self.download_and_extract_release(
             release_result.release_info, target_dir, auth_type, auth_data, progress_callback
@@ -437,6 +775,9 @@ class TarballRepositoryHandler:
     ):
         """Add authentication headers to the request.
 
+        The headers are not sent again when the request is redirected, as release
+        assets are served from a different host than the repository.
+
         Args:
             request: urllib Request object
             auth_type: Authentication type
@@ -445,7 +786,7 @@ class TarballRepositoryHandler:
         if auth_type == RepositoryAuthType.TOKEN:
             token = auth_data.get("token")
             if token:
-                request.add_header("Authorization", f"token {token}")
+                request.add_unredirected_header("Authorization", f"token {token}")
 
         elif auth_type == RepositoryAuthType.BASIC:
             username = auth_data.get("username")
@@ -454,7 +795,7 @@ class TarballRepositoryHandler:
                 import base64
 
                 credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
-                request.add_header("Authorization", f"Basic {credentials}")
+                request.add_unredirected_header("Authorization", f"Basic {credentials}")
 
     def _parse_release_data(self, data: Dict[str, Any]) -> Optional[ReleaseInfo]:
         """Parse GitHub release API response data.
@@ -549,6 +890,42 @@ class TarballRepositoryHandler:
             # Default to tar.gz for GitHub releases
             return "tar.gz"
 
+    def _is_asset_modified(
+        self,
+        release_info: ReleaseInfo,
+        auth_type: Optional[RepositoryAuthType],
+        auth_data: Optional[Dict[str, str]],
+    ) -> bool:
+        """Ask the server whether a release asset changed since we downloaded it.
+
+        Args:
+            release_info: Release with the validators of the downloaded asset
+            auth_type: Authentication type
+            auth_data: Authentication data
+
+        Returns:
+            False only if the server answered 304 Not Modified
+        """
+        request = urllib.request.Request(release_info.download_url, method="HEAD")
+        request.add_header("User-Agent", "SAI-Tool/1.0")
+        if auth_type and auth_data:
+            self._add_auth_headers(request, auth_type, auth_data)
+        _add_conditional_headers(
+            request, release_info.asset_etag, release_info.asset_last_modified
+        )
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                return True
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return False
+            logger.debug(f"Conditional asset request failed, downloading: {e}")
+            return True
+        except (urllib.error.URLError, OSError) as e:
+            logger.debug(f"Conditional asset request failed, downloading: {e}")
+            return True
+
     def _download_file_with_retry(
         self,
         url: str,
@@ -556,6 +933,7 @@ class TarballRepositoryHandler:
         auth_type: Optional[RepositoryAuthType],
         auth_data: Optional[Dict[str, str]],
         progress_callback: Optional[Callable[[int, int], None]],
+        release_info: Optional[ReleaseInfo] = None,
     ) -> TarballOperationResult:
         """Download a file with retry logic.
 
@@ -565,9 +943,11 @@ class TarballRepositoryHandler:
             auth_type: Authentication type
             auth_data: Authentication data
             progress_callback: Progress callback function
+            release_info: Release the file belongs to
 
         Returns:
-            TarballOperationResult with download status
+            TarballOperationResult with download status, and with a copy of
+            release_info carrying the cache validators of the downloaded file
         """
         last_error = None
 
@@ -584,7 +964,7 @@ class TarballRepositoryHandler:
                 progress_reporter = ProgressReporter(progress_callback)
 
                 # Download the file
-                urllib.request.urlretrieve(url, target_file, progress_reporter)
+                download = urllib.request.urlretrieve(url, target_file, progress_reporter)
 
                 # Verify the file was downloaded
                 if not target_file.exists() or target_file.stat().st_size == 0:
@@ -592,9 +972,21 @@ class TarballRepositoryHandler:
 
                 logger.info(f"Successfully downloaded {target_file.stat().st_size} bytes")
 
+                downloaded_release = None
+                if release_info:
+                    asset_etag, asset_last_modified = _get_cache_validators(
+                        download[1] if download else None
+                    )
+                    downloaded_release = replace(
+                        release_info,
+                        asset_etag=asset_etag,
+                        asset_last_modified=asset_last_modified,
+                    )
+
                 return TarballOperationResult(
                     success=True,
                     message=f"Successfully downloaded file ({target_file.stat().st_size} bytes)",
+                    release_info=downloaded_release,
                 )
 
             except Exception as e:
@@ -966,30 +1358,7 @@ class TarballRepositoryHandler:
             else:
                 self._extract_tar_secure(archive_path, temp_extract_dir, path_protector)
 
-            # Find the extracted content (handle single directory case)
-            extracted_items = list(temp_extract_dir.iterdir())
-
-            if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                # Single directory case - move its contents
-                source_dir = extracted_items[0]
-            else:
-                # Multiple items case - move the temp directory itself
-                source_dir = temp_extract_dir
-
-            # Ensure target directory exists
-            target_dir.parent.mkdir(parents=True, exist_ok=True)
-
-            # Atomic move: first remove target if it exists, then move
-            if target_dir.exists():
-                shutil.rmtree(target_dir)
-
-            if source_dir == temp_extract_dir:
-                # Move the entire temp directory
-                shutil.move(str(temp_extract_dir), str(target_dir))
-                temp_extract_dir = None  # Prevent cleanup since it was moved
-            else:
-                # Move contents of the single subdirectory
-                shutil.move(str(source_dir), str(target_dir))
+            self._replace_directory(self._get_extracted_root(temp_extract_dir), target_dir)
 
             logger.info(f"Successfully extracted {archive_path.name} to {target_dir}")
 
@@ -1012,6 +1381,68 @@ class TarballRepositoryHandler:
                 except Exception as e:
                     logger.warning(f"Failed to cleanup temporary extraction directory: {e}")
 
+    def _get_extracted_root(self, extract_dir: Path) -> Path:
+        """Get the directory holding the extracted release content.
+
+        Args:
+            extract_dir: Directory an archive was extracted into
+
+        Returns:
+            The single top-level directory of the archive, or extract_dir itself
+        """
+        extracted_items = list(extract_dir.iterdir())
+        if len(extracted_items) == 1 and extracted_items[0].is_dir():
+            return extracted_items[0]
+        return extract_dir
+
+    def _relative_file_sizes(self, files: Dict[str, int], root: Path) -> Dict[str, int]:
+        """Make extracted file paths relative to the extracted root directory.
+
+        Args:
+            files: File sizes by archive member path
+            root: Extracted root relative to the extraction directory
+
+        Returns:
+            File sizes by path relative to the root
+        """
+        if root == Path("."):
+            return files
+
+        prefix = f"{root.as_posix()}/"
+        return {
+            path[len(prefix) :]: size for path, size in files.items() if path.startswith(prefix)
+        }
+
+    def _replace_directory(self, source_dir: Path, target_dir: Path) -> None:
+        """Move a directory into place, replacing the previous target.
+
+        The previous target is renamed aside rather than deleted first, so it is
+        restored if the move fails.
+
+        Args:
+            source_dir: Directory to move
+            target_dir: Directory to replace
+        """
+        target_dir.parent.mkdir(parents=True, exist_ok=True)
+
+        backup_dir = None
+        if target_dir.exists():
+            backup_dir = Path(
+                tempfile.mkdtemp(prefix=f".{target_dir.name}.old.", dir=target_dir.parent)
+            )
+            backup_dir.rmdir()
+            target_dir.rename(backup_dir)
+
+        try:
+            shutil.move(str(source_dir), str(target_dir))
+        except Exception:
+            if backup_dir:
+                backup_dir.rename(target_dir)
+            raise
+
+        if backup_dir:
+            shutil.rmtree(backup_dir, ignore_errors=True)
+
     def _extract_tar_secure(
         self, archive_path: Path, target_dir: Path, path_protector: PathTraversalProtector
     ):
@@ -1023,41 +1454,71 @@ class TarballRepositoryHandler:
             path_protector: Path traversal protector
         """
         with tarfile.open(archive_path, "r:*") as tar:
-            # Security check: validate all member paths
-            blocked_members = []
-            safe_members = []
-
-            for member in tar.getmembers():
-                # Check for path traversal
-                is_safe, error_msg = path_protector.validate_extraction_path(member.name)
-                if not is_safe:
-                    blocked_members.append(f"{member.name}: {error_msg}")
-                    logger.warning(f"Blocked unsafe archive member: {member.name} ({error_msg})")
-                    continue
+            self._extract_tar_members(tar, target_dir, path_protector)
 
-                # Prevent extraction of device files, etc.
-                if not (member.isfile() or member.isdir() or member.issym() or member.islnk()):
-                    blocked_members.append(f"{member.name}: special file type not allowed")
-                    logger.warning(f"Blocked special file: {member.name}")
-                    continue
+    def _extract_tar_members(
+        self, tar: tarfile.TarFile, target_dir: Path, path_protector: PathTraversalProtector
+    ) -> Dict[str, int]:
+        """Extract the safe members of an open tar archive in archive order.
 
-                # Check for suspicious file sizes (prevent zip bombs)
-                if member.isfile() and member.size > 100 * 1024 * 1024:  # 100MB limit
-                    logger.warning(f"Large file in archive: {member.name} ({member.size} bytes)")
+        Members are checked as they are read, so this also works on archives
+        opened in stream mode. Each path is validated against what is already
+        extracted, which catches members written through earlier symlinks.
 
-                safe_members.append(member)
+        Args:
+            tar: Open tar archive
+            target_dir: Target directory for extraction
+            path_protector: Path traversal protector
 
-            if blocked_members:
-                logger.warning(f"Blocked {len(blocked_members)} unsafe archive members")
-                if len(blocked_members) > len(safe_members):
-                    raise SecurityError("Archive contains too many unsafe members")
+        Returns:
+            Sizes of the extracted files by normalized member path
 
-            # Extract only safe members
-            for member in safe_members:
-                try:
-                    tar.extract(member, target_dir)
-                except Exception as e:
-                    logger.warning(f"Failed to extract member {member.name}: {e}")
+        Raises:
+            SecurityError: If the archive contains more unsafe than safe members
+        """
+        blocked_members = []
+        safe_count = 0
+        files: Dict[str, int] = {}
+
+        for member in tar:
+            # Check for path traversal
+            is_safe, error_msg = path_protector.validate_extraction_path(member.name)
+            if not is_safe:
+                blocked_members.append(f"{member.name}: {error_msg}")
+                logger.warning(f"Blocked unsafe archive member: {member.name} ({error_msg})")
+                continue
+
+            # Prevent extraction of device files, etc.
+            if not (member.isfile() or member.isdir() or member.issym() or member.islnk()):
+                blocked_members.append(f"{member.name}: special file type not allowed")
+                logger.warning(f"Blocked special file: {member.name}")
+                continue
+
+            # Check for suspicious file sizes (prevent zip bombs)
+            if member.isfile() and member.size > 100 * 1024 * 1024:  # 100MB limit
+                logger.warning(f"Large file in archive: {member.name} ({member.size} bytes)")
+
+            safe_count += 1
+            try:
+                tar.extract(member, target_dir)
+            except Exception as e:
+                logger.warning(f"Failed to extract member {member.name}: {e}")
+                continue
+
+            member_path = posixpath.normpath(member.name)
+            if member.isfile():
+                files[member_path] = member.size
+            elif member.islnk():
+                linked_path = posixpath.normpath(member.linkname)
+                if linked_path in files:
+                    files[member_path] = files[linked_path]
+
+        if blocked_members:
+            logger.warning(f"Blocked {len(blocked_members)} unsafe archive members")
+            if len(blocked_members) > safe_count:
+                raise SecurityError("Archive contains too many unsafe members")
+
+        return files
 
     def _extract_zip_secure(
         self, archive_path: Path, target_dir: Path, path_protector: PathTraversalProtector
@@ -1,21 +1,33 @@
 """Data models and schemas for sai CLI tool."""
 
-from .actions import ActionConfig, ActionFile, ActionItem, Actions
-from .config import SaiConfig
-from .provider_data import Action, Mappings, Provider, ProviderData
-from .saidata import (
-    Command,
-    Compatibility,
-    Container,
-    Directory,
-    File,
-    Metadata,
-    Package,
-    Port,
-    ProviderConfig,
-    SaiData,
-    Service,
-)
+from ..utils.lazy import make_lazy_getattr
+
+# Each model module builds its pydantic models at import time; only pay for
+# the ones that are actually used
+_LAZY_EXPORTS = {
+    "ActionConfig": ".actions",
+    "ActionFile": ".actions",
+    "ActionItem": ".actions",
+    "Actions": ".actions",
+    "SaiConfig": ".config",
+    "Action": ".provider_data",
+    "Mappings": ".provider_data",
+    "Provider": ".provider_data",
+    "ProviderData": ".provider_data",
+    "Command": ".saidata",
+    "Compatibility": ".saidata",
+    "Container": ".saidata",
+    "Directory": ".saidata",
+    "File": ".saidata",
+    "Metadata": ".saidata",
+    "Package": ".saidata",
+    "Port": ".saidata",
+    "ProviderConfig": ".saidata",
+    "SaiData": ".saidata",
+    "Service": ".saidata",
+}
+
+__getattr__ = make_lazy_getattr(__name__, _LAZY_EXPORTS, globals())
 
 __all__ = [
     # ProviderData models
@@ -1,5 +1,6 @@
 """Configuration models for sai CLI tool."""
 
+import re
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -24,6 +25,33 @@ class RepositoryAuthType(str, Enum):
     BASIC = "basic"
 
 
+class RepositoryMethod(str, Enum):
+    """Ways of fetching a saidata repository."""
+
+    AUTO = "auto"  # git if available, release tarball otherwise
+    GIT = "git"
+    TARBALL = "tarball"
+
+
+class SaidataRepositorySource(BaseModel):
+    """A saidata repository layered on top of the primary repository."""
+
+    url: str
+    branch: str = "main"
+    method: RepositoryMethod = RepositoryMethod.AUTO
+    auth_type: Optional[RepositoryAuthType] = None
+    auth_data: Optional[Dict[str, str]] = Field(default_factory=dict)
+
+    @field_validator("url")
+    @classmethod
+    def validate_url(cls, v):
+        """Validate repository URL format, allowing local file:// remotes."""
+        valid_prefixes = ("http://", "https://", "git://", "ssh://", "git@", "file://")
+        if not any(v.startswith(prefix) for prefix in valid_prefixes):
+            raise ValueError(f"Invalid repository URL format: {v}")
+        return v
+
+
 class SaiConfig(BaseModel):
     """Main sai CLI configuration."""
 
@@ -55,6 +83,8 @@ class SaiConfig(BaseModel):
     cache_enabled: bool = True
     cache_directory: Path = Path.home() / ".sai" / "cache"
     cache_ttl: int = 3600  # seconds
+    provider_availability_ttl: int = 604800  # seconds, for fingerprinted availability entries
+    saidata_cache_verify_content: bool = False  # Also compare content hashes of saidata files
     default_provider: Optional[str] = None
 
     # Repository settings
@@ -62,12 +92,20 @@ class SaiConfig(BaseModel):
     saidata_repository_branch: str = "main"
     saidata_repository_auth_type: Optional[RepositoryAuthType] = None
     saidata_repository_auth_data: Optional[Dict[str, str]] = Field(default_factory=dict)
+    saidata_repository_method: RepositoryMethod = RepositoryMethod.AUTO
+    # Repositories layered on top of the primary one, highest precedence first
+    saidata_repositories: List[SaidataRepositorySource] = Field(default_factory=list)
     saidata_auto_update: bool = True
     saidata_update_interval: int = 86400  # 24 hours in seconds
+    saidata_background_update: bool = False  # Serve expired cache, update in a detached process
     saidata_offline_mode: bool = False
     saidata_repository_cache_dir: Optional[Path] = None  # Defaults to cache_directory/repositories
     saidata_shallow_clone: bool = True
+    saidata_partial_clone: bool = False  # Clone without file contents (--filter=blob:none)
+    saidata_sparse_checkout: bool = False  # Only check out host OS overrides, hydrate the rest
+    saidata_sparse_prefixes: List[str] = Field(default_factory=list)  # Empty checks out all
     saidata_repository_timeout: int = 300  # seconds
+    saidata_repository_status_ttl: int = 300  # seconds to reuse health checks, 0 disables
 
     # Security settings
     saidata_verify_signatures: bool = True
@@ -77,6 +115,9 @@ class SaiConfig(BaseModel):
 
     # Advanced settings
     max_concurrent_actions: int = 3
+    provider_detection_workers: int = 8  # Concurrent provider availability probes
+    provider_detection_timeout: int = 30  # seconds per provider probe
+    provider_detection_deadline: int = 60  # seconds for a whole detection run
     action_timeout: int = 300  # seconds
     require_confirmation: bool = True
     dry_run_default: bool = False
@@ -124,6 +165,44 @@ class SaiConfig(BaseModel):
             raise ValueError("Repository timeout cannot exceed 3600 seconds (1 hour)")
         return v
 
+    @field_validator("saidata_sparse_prefixes")
+    @classmethod
+    def validate_sparse_prefixes(cls, v):
+        """Validate sparse checkout prefixes are software prefix directory names."""
+        for prefix in v:
+            if not re.fullmatch(r"[a-z0-9._-]{1,2}", prefix):
+                raise ValueError(
+                    f"Invalid sparse checkout prefix '{prefix}': must be the first two "
+                    "characters of software names"
+                )
+        return v
+
+    @field_validator("provider_availability_ttl")
+    @classmethod
+    def validate_provider_availability_ttl(cls, v):
+        """Validate provider availability TTL is not negative."""
+        if v < 0:
+            raise ValueError("Provider availability TTL cannot be negative")
+        return v
+
+    @field_validator("provider_detection_workers")
+    @classmethod
+    def validate_provider_detection_workers(cls, v):
+        """Validate provider detection worker count is reasonable."""
+        if v < 1:
+            raise ValueError("Provider detection workers must be at least 1")
+        if v > 64:
+            raise ValueError("Provider detection workers cannot exceed 64")
+        return v
+
+    @field_validator("provider_detection_timeout", "provider_detection_deadline")
+    @classmethod
+    def validate_provider_detection_limits(cls, v):
+        """Validate provider detection time limits are positive."""
+        if v <= 0:
+            raise ValueError("Provider detection time limits must be positive")
+        return v
+
     @field_validator("saidata_security_level")
     @classmethod
     def validate_security_level(cls, v):
@@ -1,6 +1,16 @@
 """Provider system for SAI CLI tool."""
 
-from .base import BaseProvider, ProviderFactory
-from .loader import ProviderLoader
+from ..utils.lazy import make_lazy_getattr
 
-__all__ = ["ProviderLoader", "BaseProvider", "ProviderFactory"]
+# Imported on first use so that light modules of this package, such as the
+# manifest, can be used without loading provider models and templates
+_LAZY_EXPORTS = {
+    "BaseProvider": ".base",
+    "ProviderFactory": ".base",
+    "ProviderDetector": ".detection",
+    "ProviderLoader": ".loader",
+}
+
+__getattr__ = make_lazy_getattr(__name__, _LAZY_EXPORTS, globals())
+
+__all__ = ["ProviderLoader", "BaseProvider", "ProviderFactory", "ProviderDetector"]
@@ -1,18 +1,23 @@
 """Base provider class and factory for SAI CLI tool."""
 
 import logging
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 from saigen.models.saidata import SaiData
 
 from ..models.provider_data import Action, ProviderData
 from ..utils.system import (
     check_executable_functionality,
+    get_cached_executable_version,
+    get_executable_fingerprint,
     get_executable_path,
     get_executable_version,
     is_executable_available,
     is_platform_supported,
 )
+from .bundle import file_fingerprint
+from .detection import ProviderDetector
 from .loader import ProviderLoader
 from .template_engine import TemplateEngine, TemplateResolutionError
 
@@ -158,9 +163,12 @@ class BaseProvider:
         logger.debug(f"Provider '{self.name}' has no package data for '{saidata.metadata.name}'")
         return False
 
-    def get_priority(self) -> int:
+    def get_priority(self, current_platform: Optional[str] = None) -> int:
         """Return provider priority.
 
+        Args:
+            current_platform: Platform to rank for, detected if None
+
         Returns:
             Provider priority (higher = more preferred), defaults to 50
         """
@@ -172,9 +180,10 @@ class BaseProvider:
             return self.provider_data.provider.priority
 
         # Platform-specific priority logic
-        from ..utils.system import get_platform
+        if current_platform is None:
+            from ..utils.system import get_platform
 
-        current_platform = get_platform()
+            current_platform = get_platform()
 
         # Give higher priority to platform-specific providers
         if self.platforms and len(self.platforms) == 1:
@@ -200,16 +209,18 @@ class BaseProvider:
         Returns:
             True if provider is available and functional
         """
+        fingerprint = None
+
         # Try to use cache first if enabled
         if use_cache:
             try:
-                from ..utils.cache import ProviderCache
-                from ..utils.config import get_config
+                from ..utils.cache import get_provider_cache
 
-                config = get_config()
-                cache = ProviderCache(config)
+                cache = get_provider_cache()
 
-                cached_info = cache.get_cached_provider_info(self.name)
+                # Cached results stay valid while the executable and provider file are unchanged
+                fingerprint = self.get_availability_fingerprint()
+                cached_info = cache.get_cached_provider_info(self.name, fingerprint=fingerprint)
                 if cached_info is not None:
                     logger.debug(
                         f"Using cached availability for provider '{
@@ -245,11 +256,9 @@ class BaseProvider:
             # Update cache with result if caching is enabled
             if use_cache:
                 try:
-                    from ..utils.cache import ProviderCache
-                    from ..utils.config import get_config
+                    from ..utils.cache import get_provider_cache
 
-                    config = get_config()
-                    cache = ProviderCache(config)
+                    cache = get_provider_cache()
 
                     cache_info = {
                         "available": availability,
@@ -260,6 +269,8 @@ class BaseProvider:
                         "platforms": self.platforms,
                         "type": self.type.value,
                     }
+                    if fingerprint is not None:
+                        cache_info["fingerprint"] = fingerprint
 
                     cache.update_provider_cache(self.name, cache_info)
 
@@ -272,6 +283,28 @@ class BaseProvider:
             logger.warning(f"Error checking availability for provider '{self.name}': {e}")
             return False
 
+    def get_availability_fingerprint(self) -> Dict[str, Any]:
+        """Get a fingerprint of everything the availability check depends on.
+
+        Computing it only needs a PATH lookup and a couple of ``stat`` calls, so a
+        cached availability result can be revalidated without running any command.
+
+        Returns:
+            Dictionary with the main executable and provider file fingerprints
+        """
+        main_executable = self._get_main_executable()
+        source_file = getattr(self.provider_data, "_source_file", None)
+        provider_fingerprint = file_fingerprint(Path(source_file)) if source_file else None
+
+        return {
+            "executable": (
+                get_executable_fingerprint(main_executable) if main_executable else [None]
+            ),
+            "provider_file": (
+                [source_file, *provider_fingerprint] if provider_fingerprint else None
+            ),
+        }
+
     def get_executable_path(self) -> Optional[str]:
         """Get the full path to the provider's main executable.
 
@@ -283,16 +316,38 @@ class BaseProvider:
             return get_executable_path(main_executable)
         return None
 
-    def get_version(self) -> Optional[str]:
+    def get_version(self, use_cache: bool = True) -> Optional[str]:
         """Get version information for the provider.
 
+        With caching, the version command runs at most once per executable
+        fingerprint: results are reused from the provider cache across runs
+        and shared in-process between providers using the same binary.
+
+        Args:
+            use_cache: Whether to use cached version information
+
         Returns:
             Version string if available, None otherwise
         """
         main_executable = self._get_main_executable()
-        if main_executable:
+        if not main_executable:
+            return None
+
+        if not use_cache:
             return get_executable_version(main_executable)
-        return None
+
+        try:
+            from ..utils.cache import get_provider_cache
+
+            version = get_provider_cache().get_cached_version(
+                self.name, get_executable_fingerprint(main_executable)
+            )
+            if version is not None:
+                return version
+        except Exception as e:
+            logger.debug(f"Failed to check version cache for provider '{self.name}': {e}")
+
+        return get_cached_executable_version(main_executable)
 
     def _get_main_executable(self) -> Optional[str]:
         """Get the main executable name for this provider.
@@ -508,16 +563,43 @@ class BaseProvider:
         )
 
 
+def create_provider(provider_data: ProviderData) -> BaseProvider:
+    """Create a provider, reusing the instance made for the same data if possible.
+
+    While ProviderLoader shares state (``sai agent``), unchanged provider data
+    yields the same instance, so its template engine keeps its compiled
+    templates between commands.
+
+    Args:
+        provider_data: Validated provider data from YAML
+
+    Returns:
+        BaseProvider instance
+    """
+    instances = ProviderLoader.get_shared_instances()
+    if instances is None:
+        return BaseProvider(provider_data)
+
+    provider = instances.get(id(provider_data))
+    if provider is None or provider.provider_data is not provider_data:
+        provider = BaseProvider(provider_data)
+        instances[id(provider_data)] = provider
+    return provider
+
+
 class ProviderFactory:
     """Factory for creating provider instances."""
 
-    def __init__(self, loader: ProviderLoader):
+    def __init__(self, loader: ProviderLoader, detector: Optional[ProviderDetector] = None):
         """Initialize the factory with a provider loader.
 
         Args:
             loader: ProviderLoader instance for loading provider data
+            detector: ProviderDetector used for availability checks.
+                     If None, one is created from the current configuration.
         """
         self.loader = loader
+        self.detector = detector or ProviderDetector.from_config()
 
     def create_providers(self, additional_directories: List = None) -> List[BaseProvider]:
         """Dynamically create providers from YAML files.
@@ -535,7 +617,7 @@ class ProviderFactory:
 
         for name, provider_data in provider_data_dict.items():
             try:
-                provider = BaseProvider(provider_data)
+                provider = create_provider(provider_data)
                 providers.append(provider)
                 logger.debug(f"Created provider: {provider}")
 
@@ -558,19 +640,15 @@ class ProviderFactory:
         logger.info("Creating and detecting available providers")
 
         all_providers = self.create_providers(additional_directories)
+        availability = self.detector.detect_availability(all_providers)
         available_providers = []
 
         for provider in all_providers:
-            try:
-                if provider.is_available():
-                    available_providers.append(provider)
-                    logger.info(f"Provider '{provider.name}' is available")
-                else:
-                    logger.debug(f"Provider '{provider.name}' is not available")
-
-            except Exception as e:
-                logger.error(f"Error checking availability for provider '{provider.name}': {e}")
-                # Continue with other providers
+            if availability.get(provider.name, False):
+                available_providers.append(provider)
+                logger.info(f"Provider '{provider.name}' is available")
+            else:
+                logger.debug(f"Provider '{provider.name}' is not available")
 
         logger.info(
             f"Found {
@@ -593,40 +671,16 @@ class ProviderFactory:
         logger.info("Detecting providers and gathering information")
 
         all_providers = self.create_providers(additional_directories)
-        provider_info = {}
-
-        for provider in all_providers:
-            try:
-                is_available = provider.is_available(use_cache=use_cache)
-
-                info = {
-                    "name": provider.name,
-                    "display_name": provider.display_name,
-                    "description": provider.description,
-                    "type": provider.type,
-                    "platforms": provider.platforms,
-                    "capabilities": provider.capabilities,
-                    "supported_actions": provider.get_supported_actions(),
-                    "priority": provider.get_priority(),
-                    "available": is_available,
-                    "executable_path": provider.get_executable_path() if is_available else None,
-                    "version": provider.get_version() if is_available else None,
-                }
-
-                provider_info[provider.name] = info
-
-                if info["available"]:
-                    logger.info(f"✓ Provider '{provider.name}' is available")
-                else:
-                    logger.debug(f"✗ Provider '{provider.name}' is not available")
-
-            except Exception as e:
-                logger.error(f"Error detecting provider '{provider.name}': {e}")
-                provider_info[provider.name] = {
-                    "name": provider.name,
-                    "available": False,
-                    "error": str(e),
-                }
+        provider_info = self.detector.detect(all_providers, use_cache=use_cache)
+
+        # Failed, timed out and skipped probes are logged by the detector
+        for name, info in provider_info.items():
+            if info.get("error"):
+                continue
+            if info["available"]:
+                logger.info(f"✓ Provider '{name}' is available")
+            else:
+                logger.debug(f"✗ Provider '{name}' is not available")
 
         available_count = sum(1 for info in provider_info.values() if info.get("available", False))
         logger.info(
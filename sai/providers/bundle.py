@@ -0,0 +1,231 @@
+"""Persisted bundle of precompiled provider data."""
+
+import logging
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from ..models.provider_data import ProviderData
+from ..version import get_version
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the bundle layout or the ProviderData model changes incompatibly
+BUNDLE_FORMAT_VERSION = 1
+
+FileFingerprint = Tuple[int, int]
+
+
+def file_fingerprint(path: Path) -> Optional[FileFingerprint]:
+    """Get the (mtime_ns, size) fingerprint of a file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Fingerprint tuple, or None if the file cannot be stat'ed
+    """
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+class ProviderBundle:
+    """Stores validated ProviderData objects for every provider file in one file.
+
+    Entries are keyed by provider file path and carry the file's (mtime, size)
+    fingerprint, so a warm start can reuse the already-validated models and skip
+    YAML parsing, JSON schema validation and Pydantic model construction. The
+    whole bundle is discarded when the bundle format, the SAI version or the
+    provider schema changes.
+    """
+
+    def __init__(self, bundle_path: Path, schema_path: Optional[Path] = None):
+        """Initialize the bundle.
+
+        Args:
+            bundle_path: Path of the bundle file
+            schema_path: Path of the provider JSON schema the entries were validated against
+        """
+        self.bundle_path = bundle_path
+        self.schema_path = schema_path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def _header(self) -> Dict[str, Any]:
+        """Build the header identifying what the bundle entries depend on."""
+        schema_fingerprint = file_fingerprint(self.schema_path) if self.schema_path else None
+        return {
+            "format_version": BUNDLE_FORMAT_VERSION,
+            "sai_version": get_version(),
+            "schema_path": str(self.schema_path) if self.schema_path else None,
+            "schema_fingerprint": schema_fingerprint,
+        }
+
+    def _is_trusted_file(self) -> bool:
+        """Check that the bundle file is owned by us and not writable by others.
+
+        The bundle is unpickled, so it must only be loaded when nobody else
+        could have written it.
+        """
+        if os.name == "nt":
+            return True
+
+        try:
+            stat_result = self.bundle_path.stat()
+        except OSError:
+            return False
+
+        if stat_result.st_uid != os.getuid():
+            logger.warning(
+                f"Ignoring provider bundle not owned by current user: {self.bundle_path}"
+            )
+            return False
+
+        if stat_result.st_mode & 0o022:
+            logger.warning(f"Ignoring group/world-writable provider bundle: {self.bundle_path}")
+            return False
+
+        return True
+
+    def load(self) -> None:
+        """Load the bundle from disk, discarding it if stale or unreadable."""
+        self._loaded = True
+        self._entries = {}
+
+        if not self.bundle_path.exists() or not self._is_trusted_file():
+            return
+
+        try:
+            with open(self.bundle_path, "rb") as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load provider bundle {self.bundle_path}: {e}")
+            self._dirty = True
+            return
+
+        if not isinstance(data, dict) or data.get("header") != self._header():
+            logger.debug(f"Provider bundle {self.bundle_path} is outdated, it will be rebuilt")
+            self._dirty = True
+            return
+
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+            logger.debug(f"Loaded provider bundle with {len(entries)} entries")
+
+    def _ensure_loaded(self) -> None:
+        """Load the bundle on first use."""
+        if not self._loaded:
+            self.load()
+
+    def get(self, provider_file: Path) -> Optional[ProviderData]:
+        """Get precompiled provider data if the file is unchanged.
+
+        Args:
+            provider_file: Path to the provider YAML file
+
+        Returns:
+            ProviderData if the bundle holds an entry with a matching fingerprint
+        """
+        self._ensure_loaded()
+
+        entry = self._entries.get(str(provider_file))
+        if entry is None:
+            return None
+
+        if entry.get("fingerprint") != file_fingerprint(provider_file):
+            logger.debug(f"Provider bundle entry for {provider_file} is stale")
+            return None
+
+        return entry.get("data")
+
+    def put(self, provider_file: Path, provider_data: ProviderData) -> None:
+        """Store validated provider data for a file.
+
+        Args:
+            provider_file: Path to the provider YAML file
+            provider_data: Validated provider data loaded from the file
+        """
+        self._ensure_loaded()
+
+        fingerprint = file_fingerprint(provider_file)
+        if fingerprint is None:
+            return
+
+        self._entries[str(provider_file)] = {"fingerprint": fingerprint, "data": provider_data}
+        self._dirty = True
+
+    def prune(self) -> int:
+        """Remove entries for provider files that no longer exist.
+
+        Returns:
+            Number of entries removed
+        """
+        self._ensure_loaded()
+
+        missing = [path for path in self._entries if not Path(path).exists()]
+        for path in missing:
+            del self._entries[path]
+
+        if missing:
+            self._dirty = True
+        return len(missing)
+
+    def clear(self) -> None:
+        """Drop all entries so the bundle is rebuilt from scratch."""
+        self._loaded = True
+        self._entries = {}
+        self._dirty = True
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether the bundle has changes that are not yet saved."""
+        return self._dirty
+
+    def __len__(self) -> int:
+        """Number of provider files in the bundle."""
+        self._ensure_loaded()
+        return len(self._entries)
+
+    def save(self) -> bool:
+        """Write the bundle atomically if it changed.
+
+        Returns:
+            True if the bundle was written
+        """
+        if not self._dirty:
+            return False
+
+        try:
+            self.bundle_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write atomically by writing to temp file first
+            temp_file = self.bundle_path.with_name(f".{self.bundle_path.name}.{os.getpid()}.tmp")
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {
+                        "header": self._header(),
+                        "created_at": time.time(),
+                        "entries": self._entries,
+                    },
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+
+            # Atomic move
+            temp_file.replace(self.bundle_path)
+            self._dirty = False
+
+            logger.debug(f"Saved provider bundle with {len(self._entries)} entries")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to save provider bundle {self.bundle_path}: {e}")
+            return False
@@ -0,0 +1,301 @@
+"""Concurrent provider availability detection for SAI CLI tool."""
+
+import logging
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .base import BaseProvider
+
+logger = logging.getLogger(__name__)
+
+# Interval used to re-check running probes against their individual timeout
+_POLL_INTERVAL = 0.05
+
+
+def _numeric_setting(config: Any, name: str, default: int) -> int:
+    """Read a numeric setting from a configuration object, falling back to a default."""
+    value = getattr(config, name, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return default
+    return value
+
+
+class ProviderDetector:
+    """Runs provider availability probes on a bounded set of daemon threads.
+
+    Each probe (``is_available`` plus optional version lookup) mostly waits on
+    subprocesses, so running them concurrently makes cold-cache detection cost
+    roughly as much as the slowest probe instead of the sum of all probes.
+    Probes exceeding ``probe_timeout`` or still pending when the global
+    ``deadline`` expires are reported as unavailable and abandoned; they run
+    on daemon threads, so they never keep the process alive.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        probe_timeout: Optional[float] = 30.0,
+        deadline: Optional[float] = 60.0,
+    ):
+        """Initialize the detector.
+
+        Args:
+            max_workers: Maximum number of concurrent probes (1 disables threading)
+            probe_timeout: Maximum seconds a single probe may run, None for no limit
+            deadline: Maximum seconds for the whole detection run, None for no limit
+        """
+        self.max_workers = max(1, max_workers)
+        self.probe_timeout = probe_timeout
+        self.deadline = deadline
+
+    @classmethod
+    def from_config(cls, config: Optional[Any] = None) -> "ProviderDetector":
+        """Create a detector using the detection settings from the SAI configuration.
+
+        Args:
+            config: SAI configuration object, loaded from disk if None
+
+        Returns:
+            ProviderDetector instance
+        """
+        if config is None:
+            try:
+                from ..utils.config import get_config
+
+                config = get_config()
+            except Exception as e:
+                logger.debug(f"Failed to load configuration for provider detection: {e}")
+                return cls()
+
+        return cls(
+            max_workers=_numeric_setting(config, "provider_detection_workers", 8),
+            probe_timeout=_numeric_setting(config, "provider_detection_timeout", 30),
+            deadline=_numeric_setting(config, "provider_detection_deadline", 60),
+        )
+
+    def detect_availability(
+        self, providers: List["BaseProvider"], use_cache: bool = True
+    ) -> Dict[str, bool]:
+        """Check availability of all providers concurrently.
+
+        Args:
+            providers: Providers to check
+            use_cache: Whether providers may use cached availability results
+
+        Returns:
+            Dictionary mapping provider names to availability, in input order
+        """
+        results = self._run(
+            providers,
+            lambda provider: provider.is_available(use_cache=use_cache),
+            lambda provider, reason: False,
+        )
+        self._flush_cache()
+        return {name: bool(available) for name, available in results.items()}
+
+    def filter_available(
+        self, providers: List["BaseProvider"], use_cache: bool = True
+    ) -> List["BaseProvider"]:
+        """Return the subset of providers that are available, preserving order.
+
+        Args:
+            providers: Providers to check
+            use_cache: Whether providers may use cached availability results
+
+        Returns:
+            List of available providers
+        """
+        availability = self.detect_availability(providers, use_cache=use_cache)
+        return [p for p in providers if availability.get(p.name, False)]
+
+    def detect(
+        self, providers: List["BaseProvider"], use_cache: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """Gather detailed detection information for all providers concurrently.
+
+        Args:
+            providers: Providers to inspect
+            use_cache: Whether providers may use cached availability results
+
+        Returns:
+            Dictionary mapping provider names to their detection information
+        """
+
+        def probe(provider: "BaseProvider") -> Dict[str, Any]:
+            is_available = provider.is_available(use_cache=use_cache)
+            return {
+                "name": provider.name,
+                "display_name": provider.display_name,
+                "description": provider.description,
+                "type": provider.type,
+                "platforms": provider.platforms,
+                "capabilities": provider.capabilities,
+                "supported_actions": provider.get_supported_actions(),
+                "priority": provider.get_priority(),
+                "available": is_available,
+                "executable_path": provider.get_executable_path() if is_available else None,
+                "version": provider.get_version(use_cache=use_cache) if is_available else None,
+            }
+
+        def on_failure(provider: "BaseProvider", reason: str) -> Dict[str, Any]:
+            return {"name": provider.name, "available": False, "error": reason}
+
+        results = self._run(providers, probe, on_failure)
+        self._flush_cache()
+        return results
+
+    @staticmethod
+    def _flush_cache() -> None:
+        """Write availability results cached during detection in one batch."""
+        try:
+            from ..utils.cache import flush_provider_caches
+
+            flush_provider_caches()
+        except Exception as e:
+            logger.debug(f"Failed to flush provider cache after detection: {e}")
+
+    def _run(
+        self,
+        providers: List["BaseProvider"],
+        probe: Callable[["BaseProvider"], Any],
+        on_failure: Callable[["BaseProvider", str], Any],
+    ) -> Dict[str, Any]:
+        """Run a probe for every provider and collect results in input order.
+
+        Args:
+            providers: Providers to probe
+            probe: Callable producing the result for one provider
+            on_failure: Callable producing the result for a failed or timed out probe
+
+        Returns:
+            Dictionary mapping provider names to probe results
+        """
+        if not providers:
+            return {}
+
+        if self.max_workers == 1:
+            return self._run_serial(providers, probe, on_failure)
+
+        results: Dict[str, Any] = {}
+        started_at: Dict[str, float] = {}
+        start = time.monotonic()
+        deadline_at = start + self.deadline if self.deadline else None
+
+        work: "queue.Queue[BaseProvider]" = queue.Queue()
+        for provider in providers:
+            work.put(provider)
+        finished: "queue.Queue[Tuple[BaseProvider, Any, Optional[Exception]]]" = queue.Queue()
+        stopped = threading.Event()
+
+        def worker() -> None:
+            while not stopped.is_set():
+                try:
+                    provider = work.get_nowait()
+                except queue.Empty:
+                    return
+                started_at[provider.name] = time.monotonic()
+                try:
+                    finished.put((provider, probe(provider), None))
+                except Exception as e:
+                    finished.put((provider, None, e))
+
+        # Daemon threads, so a hung probe abandoned after its timeout never blocks exit
+        workers = min(self.max_workers, len(providers))
+        for index in range(workers):
+            threading.Thread(
+                target=worker, name=f"sai-provider-detect-{index}", daemon=True
+            ).start()
+
+        pending = {provider.name: provider for provider in providers}
+        try:
+            while pending:
+                now = time.monotonic()
+                if deadline_at is not None and now >= deadline_at:
+                    break
+
+                wait_timeout = _POLL_INTERVAL if self.probe_timeout else None
+                if deadline_at is not None:
+                    remaining = deadline_at - now
+                    wait_timeout = (
+                        remaining if wait_timeout is None else min(wait_timeout, remaining)
+                    )
+
+                try:
+                    provider, result, error = finished.get(timeout=wait_timeout)
+                except queue.Empty:
+                    pass
+                else:
+                    if pending.pop(provider.name, None) is not None:
+                        if error is None:
+                            results[provider.name] = result
+                        else:
+                            logger.error(f"Error detecting provider '{provider.name}': {error}")
+                            results[provider.name] = on_failure(provider, str(error))
+
+                if self.probe_timeout:
+                    now = time.monotonic()
+                    for name, provider in list(pending.items()):
+                        provider_start = started_at.get(name)
+                        if provider_start is not None and now - provider_start > self.probe_timeout:
+                            del pending[name]
+                            logger.warning(
+                                f"Availability probe for provider '{name}' timed out "
+                                f"after {self.probe_timeout}s"
+                            )
+                            results[name] = on_failure(
+                                provider, f"Detection timed out after {self.probe_timeout}s"
+                            )
+
+            for name, provider in pending.items():
+                logger.warning(
+                    f"Provider detection deadline of {self.deadline}s reached before "
+                    f"provider '{name}' finished"
+                )
+                results[name] = on_failure(
+                    provider, f"Detection deadline of {self.deadline}s exceeded"
+                )
+        finally:
+            # Probes not started yet are dropped, abandoned ones finish in the background
+            stopped.set()
+
+        logger.debug(
+            f"Probed {len(providers)} providers with {workers} workers "
+            f"in {time.monotonic() - start:.2f}s"
+        )
+        return {p.name: results[p.name] for p in providers if p.name in results}
+
+    def _run_serial(
+        self,
+        providers: List["BaseProvider"],
+        probe: Callable[["BaseProvider"], Any],
+        on_failure: Callable[["BaseProvider", str], Any],
+    ) -> Dict[str, Any]:
+        """Run probes one at a time, honouring the global deadline.
+
+        Args:
+            providers: Providers to probe
+            probe: Callable producing the result for one provider
+            on_failure: Callable producing the result for a failed or skipped probe
+
+        Returns:
+            Dictionary mapping provider names to probe results
+        """
+        results: Dict[str, Any] = {}
+        deadline_at = time.monotonic() + self.deadline if self.deadline else None
+
+        for provider in providers:
+            if deadline_at is not None and time.monotonic() >= deadline_at:
+                results[provider.name] = on_failure(
+                    provider, f"Detection deadline of {self.deadline}s exceeded"
+                )
+                continue
+            try:
+                results[provider.name] = probe(provider)
+            except Exception as e:
+                logger.error(f"Error detecting provider '{provider.name}': {e}")
+                results[provider.name] = on_failure(provider, str(e))
+
+        return results
@@ -3,17 +3,24 @@
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
-from jsonschema import Draft7Validator
+from jsonschema import SchemaError
 from jsonschema import ValidationError as JsonSchemaValidationError
+from jsonschema.protocols import Validator
 from pydantic import ValidationError as PydanticValidationError
 
 from ..models.provider_data import ProviderData
+from ..utils.schema_registry import get_schema_path, get_schema_validator, get_validator
+from ..utils.yaml_loader import safe_load
+from .bundle import ProviderBundle
+from .manifest import ProviderManifest
 
 logger = logging.getLogger(__name__)
 
+PROVIDER_SCHEMA = "providerdata-0.1"
+
 
 class ProviderValidationError(Exception):
     """Raised when provider YAML validation fails."""
@@ -40,25 +47,149 @@ class ProviderLoadError(Exception):
 class ProviderLoader:
     """Loads and validates provider YAML files."""
 
-    def __init__(self, schema_path: Optional[Path] = None, enable_caching: bool = True):
+    # Caches shared by all loaders once enable_shared_state() is called, keyed
+    # by schema and bundle path, so long-running processes load providers once
+    _shared_states: Optional[Dict[Tuple[Path, Optional[Path]], Dict[str, Any]]] = None
+
+    # Provider instances reused while state is shared, keyed by provider data identity
+    _shared_instances: Optional[Dict[int, Any]] = None
+
+    def __init__(
+        self,
+        schema_path: Optional[Path] = None,
+        enable_caching: bool = True,
+        bundle_path: Optional[Path] = None,
+    ):
         """Initialize the provider loader.
 
         Args:
             schema_path: Path to the provider data JSON schema file.
                         If None, uses the default schema location.
             enable_caching: Whether to enable provider data caching for performance
+            bundle_path: Path to the precompiled provider bundle.
+                        If None, uses providers.bundle in the configured cache directory.
         """
-        self.schema_path = (
-            schema_path
-            or Path(__file__).parent.parent.parent / "schemas" / "providerdata-0.1-schema.json"
-        )
-        self._schema_validator: Optional[Draft7Validator] = None
+        self._schema_name = None if schema_path else PROVIDER_SCHEMA
+        self.schema_path = schema_path or get_schema_path(PROVIDER_SCHEMA)
+        self._schema_validator: Optional[Validator] = None
         self.enable_caching = enable_caching
+        self.bundle_path = bundle_path
+        self._bundle: Optional[ProviderBundle] = None
+        self._manifest: Optional[ProviderManifest] = None
         self._provider_cache: Dict[Path, ProviderData] = {}
+        self._shared_state: Optional[Dict[str, Any]] = None
+
+        if ProviderLoader._shared_states is not None:
+            self._shared_state = ProviderLoader._shared_states.setdefault(
+                (self.schema_path, bundle_path), {}
+            )
+            self._provider_cache = self._shared_state.setdefault("provider_cache", {})
+            self._bundle = self._shared_state.get("bundle")
+            self._manifest = self._shared_state.get("manifest")
+
         self._load_schema()
 
+    @classmethod
+    def enable_shared_state(cls) -> None:
+        """Share loaded providers, bundles and manifests between loader instances.
+
+        Meant for long-running processes such as ``sai agent``. Cached provider
+        data is still revalidated against the provider files on every load.
+        """
+        if cls._shared_states is None:
+            cls._shared_states = {}
+            cls._shared_instances = {}
+
+    @classmethod
+    def clear_shared_state(cls) -> None:
+        """Drop the state shared between loader instances, if sharing is enabled."""
+        if cls._shared_states is not None:
+            cls._shared_states.clear()
+            cls._shared_instances.clear()
+
+    @classmethod
+    def disable_shared_state(cls) -> None:
+        """Stop sharing state between loader instances."""
+        cls._shared_states = None
+        cls._shared_instances = None
+
+    @classmethod
+    def get_shared_instances(cls) -> Optional[Dict[int, Any]]:
+        """Get the provider instances kept while state is shared.
+
+        Returns:
+            Provider instances by ``id()`` of their provider data, or None if
+            state is not shared
+        """
+        return cls._shared_instances
+
+    def _get_cache_directory(self) -> Optional[Path]:
+        """Get the directory holding the provider bundle and manifest.
+
+        Returns:
+            Cache directory, or None if provider caching is disabled
+        """
+        if not self.enable_caching:
+            return None
+
+        if self.bundle_path is not None:
+            return self.bundle_path.parent
+
+        try:
+            from ..utils.config import get_config
+
+            config = get_config()
+            if not config.cache_enabled:
+                return None
+            return config.cache_directory
+        except Exception as e:
+            logger.debug(f"Provider caches disabled, failed to load configuration: {e}")
+            return None
+
+    def _get_bundle(self) -> Optional[ProviderBundle]:
+        """Get the precompiled provider bundle, if caching is enabled.
+
+        Returns:
+            ProviderBundle instance or None if bundles are disabled
+        """
+        if self._bundle is None:
+            cache_directory = self._get_cache_directory()
+            if cache_directory is None:
+                return None
+
+            bundle_path = self.bundle_path or cache_directory / "providers.bundle"
+            self._bundle = ProviderBundle(bundle_path, self.schema_path)
+            if self._shared_state is not None:
+                self._shared_state["bundle"] = self._bundle
+
+        return self._bundle
+
+    def _get_manifest(self) -> Optional[ProviderManifest]:
+        """Get the provider manifest index, if caching is enabled.
+
+        Returns:
+            ProviderManifest instance or None if caching is disabled
+        """
+        if self._manifest is None:
+            cache_directory = self._get_cache_directory()
+            if cache_directory is None:
+                return None
+
+            self._manifest = ProviderManifest(cache_directory / "provider-manifest.json")
+            if self._shared_state is not None:
+                self._shared_state["manifest"] = self._manifest
+
+        return self._manifest
+
+    def _save_bundle(self) -> None:
+        """Persist the provider bundle and manifest if any entry changed."""
+        for cache in (self._get_bundle(), self._get_manifest()):
+            if cache is not None:
+                cache.prune()
+                cache.save()
+
     def _load_schema(self) -> None:
-        """Load and compile the JSON schema for validation."""
+        """Get the compiled JSON schema validator, shared by all loaders in the process."""
         try:
             if not self.schema_path.exists():
                 logger.warning(
@@ -66,13 +197,13 @@ class ProviderLoader:
                 )
                 return
 
-            with open(self.schema_path, "r", encoding="utf-8") as f:
-                schema_data = json.load(f)
-
-            self._schema_validator = Draft7Validator(schema_data)
+            if self._schema_name:
+                self._schema_validator = get_schema_validator(self._schema_name)
+            else:
+                self._schema_validator = get_validator(self.schema_path)
             logger.debug(f"Loaded provider schema from {self.schema_path}")
 
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+        except (json.JSONDecodeError, FileNotFoundError, SchemaError) as e:
             logger.warning(f"Failed to load provider schema from {self.schema_path}: {e}")
             self._schema_validator = None
 
@@ -195,6 +326,15 @@ class ProviderLoader:
                 # File might have been deleted or cache corrupted, continue with fresh load
                 pass
 
+        # Reuse precompiled data from the persisted bundle if the file is unchanged
+        bundle = self._get_bundle()
+        if bundle is not None:
+            provider_data = bundle.get(provider_file)
+            if provider_data is not None:
+                logger.debug(f"Using precompiled provider data for {provider_file}")
+                self._remember(provider_file, provider_data)
+                return provider_data
+
         try:
             # Security check: limit file size to prevent DoS attacks
             file_size = provider_file.stat().st_size
@@ -206,7 +346,7 @@ class ProviderLoader:
 
             # Load YAML file
             with open(provider_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = safe_load(f)
 
             if not isinstance(data, dict):
                 raise ProviderLoadError(
@@ -221,9 +361,9 @@ class ProviderLoader:
 
             # Cache the result if caching is enabled
             if self.enable_caching:
-                # Store modification time for cache invalidation
-                setattr(provider_data, "_cached_mtime", provider_file.stat().st_mtime)
-                self._provider_cache[provider_file] = provider_data
+                self._remember(provider_file, provider_data)
+                if bundle is not None:
+                    bundle.put(provider_file, provider_data)
 
             logger.info(
                 f"Successfully loaded provider: {provider_data.provider.name} from {provider_file}"
@@ -237,6 +377,39 @@ class ProviderLoader:
         except PermissionError as e:
             raise ProviderLoadError(provider_file, "Permission denied", e) from e
 
+    def _remember(self, provider_file: Path, provider_data: ProviderData) -> None:
+        """Keep provider data in the in-memory cache and the manifest index.
+
+        Args:
+            provider_file: Path to the provider YAML file
+            provider_data: Validated provider data
+        """
+        manifest = self._get_manifest()
+        if manifest is not None:
+            entry = manifest.get(provider_file)
+            if entry is None or entry.error:
+                manifest.put(provider_file, provider_data)
+
+        try:
+            # Store modification time for cache invalidation
+            setattr(provider_data, "_cached_mtime", provider_file.stat().st_mtime)
+            # Remember where the provider came from for availability fingerprints
+            setattr(provider_data, "_source_file", str(provider_file))
+        except OSError:
+            return
+        self._provider_cache[provider_file] = provider_data
+
+    def _remember_error(self, provider_file: Path, error: Exception) -> None:
+        """Record a provider file that failed to load in the manifest index.
+
+        Args:
+            provider_file: Path to the provider YAML file
+            error: Error raised while loading the file
+        """
+        manifest = self._get_manifest()
+        if manifest is not None:
+            manifest.put_error(provider_file, str(error))
+
     def load_providers_from_directory(self, directory: Path) -> Dict[str, ProviderData]:
         """Load all provider YAML files from a directory.
 
@@ -271,6 +444,7 @@ class ProviderLoader:
 
             except (ProviderLoadError, ProviderValidationError) as e:
                 logger.error(f"Failed to load provider from {provider_file}: {e}")
+                self._remember_error(provider_file, e)
                 errors.append(e)
                 # Continue loading other providers
 
@@ -308,12 +482,22 @@ class ProviderLoader:
         return existing_dirs
 
     def load_all_providers(
-        self, additional_directories: Optional[List[Path]] = None
+        self,
+        additional_directories: Optional[List[Path]] = None,
+        names: Optional[List[str]] = None,
+        action: Optional[str] = None,
+        current_platform_only: bool = False,
     ) -> Dict[str, ProviderData]:
         """Load providers from all default and additional directories.
 
+        When any filter is given, provider files are first matched against the
+        manifest index and only the providers passing the filters are loaded.
+
         Args:
             additional_directories: Additional directories to search for providers
+            names: Only load providers with these names
+            action: Only load providers defining this action
+            current_platform_only: Only load providers supporting the current platform
 
         Returns:
             Dictionary mapping provider names to ProviderData instances
@@ -323,6 +507,20 @@ class ProviderLoader:
         if additional_directories:
             directories.extend(additional_directories)
 
+        if names is not None or action is not None or current_platform_only:
+            manifest = self._get_manifest()
+            if manifest is not None:
+                return self._load_filtered_providers(
+                    directories, manifest, names, action, current_platform_only
+                )
+
+            providers = self.load_all_providers(additional_directories)
+            return {
+                name: provider_data
+                for name, provider_data in providers.items()
+                if self._matches_filters(provider_data, names, action, current_platform_only)
+            }
+
         all_providers = {}
 
         for directory in directories:
@@ -341,7 +539,127 @@ class ProviderLoader:
                 logger.debug(f"Provider directory not found: {directory}")
                 continue
 
+        # Persist newly validated providers so the next start can skip validation
+        self._save_bundle()
+
         logger.info(
             f"Loaded {len(all_providers)} total providers from {len(directories)} directories"
         )
         return all_providers
+
+    def _load_filtered_providers(
+        self,
+        directories: List[Path],
+        manifest: ProviderManifest,
+        names: Optional[List[str]],
+        action: Optional[str],
+        current_platform_only: bool,
+    ) -> Dict[str, ProviderData]:
+        """Load only the providers whose manifest entries pass the filters.
+
+        Files without a current manifest entry are loaded once to index them.
+
+        Args:
+            directories: Provider directories in precedence order
+            manifest: Manifest index of provider files
+            names: Only load providers with these names
+            action: Only load providers defining this action
+            current_platform_only: Only load providers supporting the current platform
+
+        Returns:
+            Dictionary mapping provider names to ProviderData instances
+        """
+        # Resolve which file defines each provider, with later files taking precedence
+        candidates = {}
+        for directory in directories:
+            try:
+                provider_files = self.scan_provider_directory(directory)
+            except FileNotFoundError:
+                logger.debug(f"Provider directory not found: {directory}")
+                continue
+
+            for provider_file in provider_files:
+                entry = manifest.get(provider_file)
+                if entry is None:
+                    try:
+                        self.load_provider_file(provider_file)
+                    except (ProviderLoadError, ProviderValidationError) as e:
+                        logger.error(f"Failed to load provider from {provider_file}: {e}")
+                        self._remember_error(provider_file, e)
+                        continue
+                    entry = manifest.get(provider_file)
+
+                if entry is None or entry.error:
+                    continue
+                candidates[entry.name] = (provider_file, entry)
+
+        providers = {}
+        for name, (provider_file, entry) in candidates.items():
+            if not entry.matches(names, action, current_platform_only):
+                continue
+            try:
+                providers[name] = self.load_provider_file(provider_file)
+            except (ProviderLoadError, ProviderValidationError) as e:
+                logger.error(f"Failed to load provider from {provider_file}: {e}")
+
+        self._save_bundle()
+
+        logger.info(f"Loaded {len(providers)} of {len(candidates)} providers matching filters")
+        return providers
+
+    @staticmethod
+    def _matches_filters(
+        provider_data: ProviderData,
+        names: Optional[List[str]],
+        action: Optional[str],
+        current_platform_only: bool,
+    ) -> bool:
+        """Check loaded provider data against provider filters.
+
+        Args:
+            provider_data: Validated provider data
+            names: Provider names to keep, None for all
+            action: Action the provider must define, None for any
+            current_platform_only: Keep only providers supporting the current platform
+
+        Returns:
+            True if the provider passes the filters
+        """
+        from ..utils.system import is_platform_supported
+
+        if names is not None and provider_data.provider.name not in names:
+            return False
+        if action is not None and action not in provider_data.actions:
+            return False
+        if current_platform_only and not is_platform_supported(
+            provider_data.provider.platforms or []
+        ):
+            return False
+        return True
+
+    def compile_bundle(
+        self, additional_directories: Optional[List[Path]] = None
+    ) -> Tuple[int, Path]:
+        """Rebuild the precompiled provider bundle from scratch.
+
+        Args:
+            additional_directories: Additional directories to search for providers
+
+        Returns:
+            Tuple of the number of provider files stored in the bundle and the bundle path
+
+        Raises:
+            ValueError: If provider bundles are disabled
+        """
+        bundle = self._get_bundle()
+        if bundle is None:
+            raise ValueError("Provider bundle is disabled (caching is turned off)")
+
+        bundle.clear()
+        self._provider_cache.clear()
+        self.load_all_providers(additional_directories)
+
+        if not bundle.save() and bundle.is_dirty:
+            raise OSError(f"Failed to write provider bundle to {bundle.bundle_path}")
+
+        return len(bundle), bundle.bundle_path
@@ -0,0 +1,257 @@
+"""Lightweight manifest index of provider files."""
+
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..models.provider_data import ProviderData
+from ..utils.system import is_platform_supported
+from ..version import get_version
+from .bundle import file_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the manifest layout changes incompatibly
+MANIFEST_FORMAT_VERSION = 1
+
+
+@dataclass
+class ProviderManifestEntry:
+    """Summary of one provider file, enough to decide whether to load it."""
+
+    name: Optional[str]
+    fingerprint: List[int]
+    type: Optional[str] = None
+    platforms: List[str] = field(default_factory=list)
+    executable: Optional[str] = None
+    priority: Optional[int] = None
+    actions: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @classmethod
+    def from_provider_data(
+        cls, provider_data: ProviderData, fingerprint: List[int]
+    ) -> "ProviderManifestEntry":
+        """Build an entry from validated provider data.
+
+        Args:
+            provider_data: Validated provider data
+            fingerprint: Fingerprint of the provider file
+
+        Returns:
+            ProviderManifestEntry for the provider
+        """
+        from .base import BaseProvider
+
+        provider = provider_data.provider
+        return cls(
+            name=provider.name,
+            fingerprint=fingerprint,
+            type=provider.type.value if hasattr(provider.type, "value") else str(provider.type),
+            platforms=list(provider.platforms or []),
+            executable=BaseProvider(provider_data)._get_main_executable(),
+            priority=provider.priority,
+            actions=list(provider_data.actions.keys()),
+        )
+
+    def matches(
+        self,
+        names: Optional[List[str]] = None,
+        action: Optional[str] = None,
+        current_platform_only: bool = False,
+    ) -> bool:
+        """Check whether the provider passes the given filters.
+
+        Args:
+            names: Provider names to keep, None for all
+            action: Action the provider must define, None for any
+            current_platform_only: Keep only providers supporting the current platform
+
+        Returns:
+            True if the provider should be loaded
+        """
+        if self.error or self.name is None:
+            return False
+        if names is not None and self.name not in names:
+            return False
+        if action is not None and action not in self.actions:
+            return False
+        if current_platform_only and not is_platform_supported(self.platforms):
+            return False
+        return True
+
+
+class ProviderManifest:
+    """Persisted index of provider files keyed by path and file fingerprint.
+
+    The manifest is plain JSON so it can be read without unpickling or
+    validating any provider data. Entries for files that failed validation
+    are recorded too, so they can be skipped without parsing them again.
+    """
+
+    def __init__(self, manifest_path: Path):
+        """Initialize the manifest.
+
+        Args:
+            manifest_path: Path of the manifest file
+        """
+        self.manifest_path = manifest_path
+        self._entries: Dict[str, ProviderManifestEntry] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def _header(self) -> Dict[str, Any]:
+        """Build the header identifying what the manifest entries depend on."""
+        return {"format_version": MANIFEST_FORMAT_VERSION, "sai_version": get_version()}
+
+    def load(self) -> None:
+        """Load the manifest from disk, discarding it if stale or unreadable."""
+        self._loaded = True
+        self._entries = {}
+
+        if not self.manifest_path.exists():
+            return
+
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            if not isinstance(data, dict) or data.get("header") != self._header():
+                logger.debug(f"Provider manifest {self.manifest_path} is outdated")
+                self._dirty = True
+                return
+
+            self._entries = {
+                path: ProviderManifestEntry(**entry)
+                for path, entry in data.get("entries", {}).items()
+            }
+            logger.debug(f"Loaded provider manifest with {len(self._entries)} entries")
+
+        except (json.JSONDecodeError, OSError, TypeError, AttributeError) as e:
+            logger.warning(f"Failed to load provider manifest {self.manifest_path}: {e}")
+            self._entries = {}
+            self._dirty = True
+
+    def _ensure_loaded(self) -> None:
+        """Load the manifest on first use."""
+        if not self._loaded:
+            self.load()
+
+    def get(self, provider_file: Path) -> Optional[ProviderManifestEntry]:
+        """Get the entry for a provider file if the file is unchanged.
+
+        Args:
+            provider_file: Path to the provider YAML file
+
+        Returns:
+            ProviderManifestEntry if the manifest holds a current entry
+        """
+        self._ensure_loaded()
+
+        entry = self._entries.get(str(provider_file))
+        if entry is None:
+            return None
+
+        fingerprint = file_fingerprint(provider_file)
+        if fingerprint is None or list(fingerprint) != entry.fingerprint:
+            return None
+
+        return entry
+
+    def put(self, provider_file: Path, provider_data: ProviderData) -> None:
+        """Record a successfully loaded provider file.
+
+        Args:
+            provider_file: Path to the provider YAML file
+            provider_data: Validated provider data loaded from the file
+        """
+        fingerprint = file_fingerprint(provider_file)
+        if fingerprint is None:
+            return
+
+        self._set(
+            provider_file,
+            ProviderManifestEntry.from_provider_data(provider_data, list(fingerprint)),
+        )
+
+    def put_error(self, provider_file: Path, error: str) -> None:
+        """Record a provider file that failed to load.
+
+        Args:
+            provider_file: Path to the provider YAML file
+            error: Error message
+        """
+        fingerprint = file_fingerprint(provider_file)
+        if fingerprint is None:
+            return
+
+        self._set(
+            provider_file,
+            ProviderManifestEntry(name=None, fingerprint=list(fingerprint), error=error),
+        )
+
+    def _set(self, provider_file: Path, entry: ProviderManifestEntry) -> None:
+        """Store an entry and mark the manifest as changed."""
+        self._ensure_loaded()
+        key = str(provider_file)
+        if self._entries.get(key) != entry:
+            self._entries[key] = entry
+            self._dirty = True
+
+    def prune(self) -> int:
+        """Remove entries for provider files that no longer exist.
+
+        Returns:
+            Number of entries removed
+        """
+        self._ensure_loaded()
+
+        missing = [path for path in self._entries if not Path(path).exists()]
+        for path in missing:
+            del self._entries[path]
+
+        if missing:
+            self._dirty = True
+        return len(missing)
+
+    def save(self) -> bool:
+        """Write the manifest atomically if it changed.
+
+        Returns:
+            True if the manifest was written
+        """
+        if not self._dirty:
+            return False
+
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write atomically by writing to temp file first
+            temp_file = self.manifest_path.with_name(
+                f".{self.manifest_path.name}.{os.getpid()}.tmp"
+            )
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "header": self._header(),
+                        "created_at": time.time(),
+                        "entries": {path: asdict(entry) for path, entry in self._entries.items()},
+                    },
+                    f,
+                    separators=(",", ":"),
+                )
+
+            # Atomic move
+            temp_file.replace(self.manifest_path)
+            self._dirty = False
+
+            logger.debug(f"Saved provider manifest with {len(self._entries)} entries")
+            return True
+
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to save provider manifest {self.manifest_path}: {e}")
+            return False
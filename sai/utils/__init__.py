@@ -1,7 +1,11 @@
 """Utility functions for sai CLI tool."""
 
+from .path_index import PathIndex, get_path_index
 from .system import (
     check_executable_functionality,
+    clear_executable_version_cache,
+    get_cached_executable_version,
+    get_executable_fingerprint,
     get_executable_path,
     get_executable_version,
     get_platform,
@@ -14,8 +18,13 @@ __all__ = [
     "get_platform",
     "is_executable_available",
     "get_executable_path",
+    "get_executable_fingerprint",
     "get_executable_version",
+    "get_cached_executable_version",
+    "clear_executable_version_cache",
     "check_executable_functionality",
     "get_system_info",
     "is_platform_supported",
+    "PathIndex",
+    "get_path_index",
 ]
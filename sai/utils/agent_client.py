@@ -0,0 +1,266 @@
+"""Client side of the sai agent protocol.
+
+The agent keeps providers and caches warm in a long-running process. This
+module only imports the standard library and :mod:`sai.version`, so the
+``sai`` entry point can hand a command to a running agent without importing
+the rest of sai.
+Messages are newline-delimited JSON objects sent over a Unix domain socket.
+"""
+
+import json
+import logging
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO
+
+from ..version import get_version
+
+logger = logging.getLogger(__name__)
+
+AGENT_PROTOCOL_VERSION = 1
+
+# Environment variables controlling the CLI side of the agent
+AGENT_SOCKET_ENV = "SAI_AGENT_SOCKET"
+AGENT_DISABLE_ENV = "SAI_NO_AGENT"
+
+# Seconds the CLI waits for the agent to accept a connection before running in-process
+CONNECT_TIMEOUT = 0.5
+
+# Largest message accepted on the socket
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+
+def get_agent_socket_path() -> Path:
+    """Get the path of the agent socket.
+
+    Returns:
+        Socket path from SAI_AGENT_SOCKET, or ~/.sai/agent.sock
+    """
+    socket_path = os.environ.get(AGENT_SOCKET_ENV)
+    if socket_path:
+        return Path(socket_path).expanduser()
+    return Path.home() / ".sai" / "agent.sock"
+
+
+def send_message(stream, message: Dict[str, Any]) -> None:
+    """Write one newline-delimited JSON message.
+
+    Args:
+        stream: Binary socket file
+        message: Message to send
+    """
+    stream.write(json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def receive_message(stream) -> Optional[Dict[str, Any]]:
+    """Read one newline-delimited JSON message.
+
+    Args:
+        stream: Binary socket file
+
+    Returns:
+        Decoded message, or None when the connection was closed
+    """
+    line = stream.readline(MAX_MESSAGE_SIZE)
+    if not line:
+        return None
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Agent message is not an object")
+    return message
+
+
+def _connect(socket_path: Path, timeout: Optional[float] = CONNECT_TIMEOUT) -> socket.socket:
+    """Connect to the agent socket.
+
+    Args:
+        socket_path: Path of the agent socket
+        timeout: Connection timeout in seconds
+
+    Returns:
+        Connected socket, blocking once connected
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.settimeout(None)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _request(socket_path: Path, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send a control message to the agent and return its reply.
+
+    Args:
+        socket_path: Path of the agent socket
+        message: Control message
+
+    Returns:
+        Reply from the agent, or None if no agent is listening
+    """
+    try:
+        with _connect(socket_path) as sock, sock.makefile("rwb") as stream:
+            send_message(stream, message)
+            return receive_message(stream)
+    except (OSError, ValueError):
+        return None
+
+
+def ping_agent(socket_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Check whether an agent is running.
+
+    Args:
+        socket_path: Path of the agent socket, defaults to get_agent_socket_path()
+
+    Returns:
+        Agent status information, or None if no agent is running
+    """
+    reply = _request(socket_path or get_agent_socket_path(), {"type": "ping"})
+    if reply is None or reply.get("type") != "pong":
+        return None
+    return reply
+
+
+def stop_agent(socket_path: Optional[Path] = None) -> bool:
+    """Ask a running agent to exit.
+
+    Args:
+        socket_path: Path of the agent socket, defaults to get_agent_socket_path()
+
+    Returns:
+        True if an agent acknowledged the request
+    """
+    reply = _request(socket_path or get_agent_socket_path(), {"type": "shutdown"})
+    return reply is not None and reply.get("type") == "bye"
+
+
+def interrupt_agent(socket_path: Path, request_id: int) -> bool:
+    """Ask the agent to interrupt a command it runs for this client.
+
+    Args:
+        socket_path: Path of the agent socket
+        request_id: Request ID the agent sent when the command started
+
+    Returns:
+        True if the agent interrupted the command
+    """
+    reply = _request(socket_path, {"type": "interrupt", "request": request_id})
+    return reply is not None and reply.get("type") == "interrupted"
+
+
+def _isatty(stream: Optional[TextIO]) -> bool:
+    """Check whether a stream is a terminal without failing on odd streams."""
+    try:
+        return bool(stream is not None and stream.isatty())
+    except (AttributeError, ValueError):
+        return False
+
+
+def forward_to_agent(
+    argv: List[str],
+    socket_path: Optional[Path] = None,
+    stdin: Optional[TextIO] = None,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> Optional[int]:
+    """Run a CLI invocation in the agent if one is running.
+
+    Args:
+        argv: Command line arguments, without the program name
+        socket_path: Path of the agent socket, defaults to get_agent_socket_path()
+        stdin: Stream answering prompts, defaults to sys.stdin
+        stdout: Stream receiving standard output, defaults to sys.stdout
+        stderr: Stream receiving standard error, defaults to sys.stderr
+
+    Returns:
+        Exit code of the command, or None if it must run in-process, e.g.
+        because the agent is busy with another command
+
+    Ctrl+C interrupts the command in the agent; a second one raises
+    KeyboardInterrupt without waiting for the command to finish.
+    """
+    if os.environ.get(AGENT_DISABLE_ENV) or (argv and argv[0] == "agent"):
+        return None
+
+    # Shell completion runs through the entry point with these variables set
+    if any(name.startswith("_SAI_COMPLETE") for name in os.environ):
+        return None
+
+    socket_path = socket_path or get_agent_socket_path()
+    if not socket_path.exists():
+        return None
+
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+
+    try:
+        sock = _connect(socket_path)
+    except OSError as e:
+        logger.debug(f"Agent not reachable at {socket_path}: {e}")
+        return None
+
+    started = False
+    request_id = None
+    with sock, sock.makefile("rwb") as stream:
+        try:
+            send_message(
+                stream,
+                {
+                    "type": "run",
+                    "protocol": AGENT_PROTOCOL_VERSION,
+                    "version": get_version(),
+                    "argv": list(argv),
+                    "cwd": os.getcwd(),
+                    "env": dict(os.environ),
+                    "stdin_tty": _isatty(stdin),
+                    "stdout_tty": _isatty(stdout),
+                    "stderr_tty": _isatty(stderr),
+                },
+            )
+
+            while True:
+                try:
+                    message = receive_message(stream)
+                    if message is None:
+                        break
+
+                    message_type = message.get("type")
+                    if message_type == "rejected" and not started:
+                        logger.debug(f"Agent rejected request: {message.get('reason')}")
+                        return None
+
+                    started = True
+                    if message_type == "started":
+                        request_id = message.get("request")
+                    elif message_type in ("stdout", "stderr"):
+                        target = stdout if message_type == "stdout" else stderr
+                        target.write(message.get("data", ""))
+                        target.flush()
+                    elif message_type == "input":
+                        line = stdin.readline() if stdin is not None else ""
+                        send_message(stream, {"type": "input", "data": line or None})
+                    elif message_type == "exit":
+                        return int(message.get("code", 1))
+
+                except KeyboardInterrupt:
+                    if request_id is None:
+                        raise
+                    # Let the command clean up and report its exit code
+                    interrupt_agent(socket_path, request_id)
+                    request_id = None
+
+        except (OSError, ValueError) as e:
+            logger.debug(f"Lost connection to agent: {e}")
+
+    if not started:
+        return None
+
+    stderr.write("Error: connection to sai agent lost\n")
+    return 1
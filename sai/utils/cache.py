@@ -1,20 +1,127 @@
 """Cache management utilities for providers and saidata."""
 
+import atexit
 import hashlib
 import json
 import logging
+import os
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from ..models.config import SaiConfig
 
 logger = logging.getLogger(__name__)
 
 
+class _ProviderCacheStore:
+    """Process-wide in-memory view of one provider cache file.
+
+    The file is read once; lookups are served from memory and updates are
+    buffered until :meth:`flush` writes them in a single atomic replace.
+    """
+
+    def __init__(self, cache_file: Path):
+        """Initialize the store.
+
+        Args:
+            cache_file: Path of the provider cache file
+        """
+        self.cache_file = cache_file
+        self.lock = threading.RLock()
+        self.data: Optional[Dict[str, Any]] = None
+        self.dirty: Dict[str, Dict[str, Any]] = {}
+        self.removed: set = set()
+        self.cleared = False
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """Whether there are changes not yet written to disk."""
+        return bool(self.dirty or self.removed or self.cleared)
+
+
+_provider_cache_stores: Dict[Path, _ProviderCacheStore] = {}
+_provider_caches: Dict[tuple, "ProviderCache"] = {}
+_provider_cache_registry_lock = threading.Lock()
+
+
+def _get_provider_cache_store(cache_file: Path) -> _ProviderCacheStore:
+    """Get the process-wide store for a provider cache file."""
+    with _provider_cache_registry_lock:
+        store = _provider_cache_stores.get(cache_file)
+        if store is None:
+            store = _ProviderCacheStore(cache_file)
+            _provider_cache_stores[cache_file] = store
+        return store
+
+
+def get_provider_cache(config: Optional[SaiConfig] = None) -> "ProviderCache":
+    """Get a shared ProviderCache for the given configuration.
+
+    Args:
+        config: SAI configuration object, loaded from disk if None
+
+    Returns:
+        ProviderCache instance shared by all callers using the same cache settings
+    """
+    if config is None:
+        from .config import get_config
+
+        config = get_config()
+
+    key = (
+        Path(config.cache_directory),
+        config.cache_enabled,
+        getattr(config, "cache_ttl", 3600),
+    )
+    with _provider_cache_registry_lock:
+        cache = _provider_caches.get(key)
+    if cache is None:
+        cache = ProviderCache(config)
+        with _provider_cache_registry_lock:
+            cache = _provider_caches.setdefault(key, cache)
+    return cache
+
+
+def flush_provider_caches() -> None:
+    """Write all pending provider cache changes to disk."""
+    with _provider_cache_registry_lock:
+        stores = list(_provider_cache_stores.values())
+
+    for store in stores:
+        if store.has_pending_changes:
+            ProviderCache._flush_store(store)
+
+
+atexit.register(flush_provider_caches)
+
+
+def get_file_fingerprint(file_path: Path) -> Optional[List[int]]:
+    """Get a fingerprint of a file that changes whenever the file is modified.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        ``[size, mtime_ns, inode]`` of the file, None if it cannot be stat'ed
+    """
+    try:
+        stat_info = os.stat(file_path)
+    except OSError:
+        return None
+    return [stat_info.st_size, stat_info.st_mtime_ns, stat_info.st_ino]
+
+
 class ProviderCache:
-    """Manages provider detection cache for performance optimization."""
+    """Manages provider detection cache for performance optimization.
+
+    All instances using the same cache file share one in-memory copy of it, so
+    the file is read at most once per process. Updates are written back in
+    batches by :meth:`flush`, which runs at the end of provider detection and
+    at interpreter exit.
+    """
 
     def __init__(self, config: SaiConfig):
         """Initialize provider cache.
@@ -26,7 +133,12 @@ class ProviderCache:
         self.cache_dir = config.cache_directory
         self.cache_enabled = config.cache_enabled
         self.cache_ttl = getattr(config, "cache_ttl", 3600)  # Default 1 hour
+        # Fingerprinted entries are revalidated on use, so they can live much longer
+        self.availability_ttl = max(
+            getattr(config, "provider_availability_ttl", 604800), self.cache_ttl
+        )
         self.provider_cache_file = self.cache_dir / "providers.json"
+        self._store = _get_provider_cache_store(self.provider_cache_file)
 
         # Ensure cache directory exists
         if self.cache_enabled:
@@ -46,21 +158,25 @@ class ProviderCache:
             logger.warning(f"Cannot create or write to cache directory {self.cache_dir}: {e}")
             self.cache_enabled = False
 
-    def _load_cache_data(self) -> Dict[str, Any]:
-        """Load cache data from disk.
+    @staticmethod
+    def _read_cache_file(cache_file: Path) -> Dict[str, Any]:
+        """Read and decode a provider cache file.
+
+        Args:
+            cache_file: Path of the provider cache file
 
         Returns:
             Dictionary containing cache data, empty if not found or invalid
         """
-        if not self.cache_enabled or not self.provider_cache_file.exists():
+        if not cache_file.exists():
             return {}
 
         try:
-            with open(self.provider_cache_file, "r", encoding="utf-8") as f:
+            with open(cache_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
 
             # Validate cache structure
-            if not isinstance(data, dict) or "providers" not in data:
+            if not isinstance(data, dict) or not isinstance(data.get("providers"), dict):
                 logger.warning("Invalid cache file structure, ignoring cache")
                 return {}
 
@@ -70,84 +186,221 @@ class ProviderCache:
             logger.warning(f"Failed to load provider cache: {e}")
             return {}
 
-    def _save_cache_data(self, data: Dict[str, Any]) -> None:
-        """Save cache data to disk.
+    def _load_cache_data(self) -> Dict[str, Any]:
+        """Load cache data from disk.
+
+        Returns:
+            Dictionary containing cache data, empty if not found or invalid
+        """
+        if not self.cache_enabled:
+            return {}
+        return self._read_cache_file(self.provider_cache_file)
+
+    def _entries(self) -> Dict[str, Dict[str, Any]]:
+        """Get the in-memory provider entries, loading the cache file on first use.
+
+        Must be called with the store lock held.
+
+        Returns:
+            Dictionary mapping provider names to cached entries
+        """
+        store = self._store
+        if store.data is None:
+            store.data = self._load_cache_data()
+            store.data.setdefault("providers", {})
+        return store.data["providers"]
+
+    @staticmethod
+    def _flush_store(store: _ProviderCacheStore) -> bool:
+        """Merge pending changes of a store into its cache file.
+
+        The file is re-read right before writing so entries written by other
+        processes in the meantime are kept.
 
         Args:
-            data: Cache data to save
+            store: Store whose pending changes should be written
+
+        Returns:
+            True if the cache file was written
         """
-        if not self.cache_enabled:
-            return
+        with store.lock:
+            if not store.has_pending_changes:
+                return False
 
-        try:
-            # Add metadata
-            data["cache_version"] = "1.0"
-            data["last_updated"] = time.time()
+            if not store.cache_file.parent.is_dir():
+                logger.debug(f"Cache directory for {store.cache_file} no longer exists")
+                store.dirty = {}
+                store.removed = set()
+                store.cleared = False
+                return False
 
-            # Write atomically by writing to temp file first
-            temp_file = self.provider_cache_file.with_suffix(".tmp")
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            data = {} if store.cleared else ProviderCache._read_cache_file(store.cache_file)
+            providers = data.setdefault("providers", {})
+            for provider_name in store.removed:
+                providers.pop(provider_name, None)
+            providers.update(store.dirty)
 
-            # Atomic move
-            temp_file.replace(self.provider_cache_file)
+            try:
+                # Add metadata
+                data["cache_version"] = "1.0"
+                data["last_updated"] = time.time()
 
-            logger.debug(f"Saved provider cache to {self.provider_cache_file}")
+                # Write atomically by writing to temp file first
+                temp_file = store.cache_file.with_suffix(".tmp")
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
 
-        except (OSError, json.JSONEncodeError) as e:
-            logger.error(f"Failed to save provider cache: {e}")
+                # Atomic move
+                temp_file.replace(store.cache_file)
 
-    def is_cache_valid(self, provider_name: str) -> bool:
-        """Check if cached data for a provider is still valid.
+            except (OSError, TypeError, ValueError) as e:
+                logger.error(f"Failed to save provider cache: {e}")
+                return False
 
-        Args:
-            provider_name: Name of the provider to check
+            logger.debug(
+                f"Saved {len(store.dirty)} provider cache update(s) to {store.cache_file}"
+            )
+            store.data = data
+            store.dirty = {}
+            store.removed = set()
+            store.cleared = False
+            return True
+
+    def flush(self) -> bool:
+        """Write pending cache updates to disk in one atomic write.
 
         Returns:
-            True if cache is valid and not expired
+            True if the cache file was written
         """
         if not self.cache_enabled:
             return False
+        return self._flush_store(self._store)
 
-        cache_data = self._load_cache_data()
+    def _entry_ttl(self, provider_cache: Dict[str, Any]) -> int:
+        """Get the time-to-live of a cache entry.
 
-        if "providers" not in cache_data or provider_name not in cache_data["providers"]:
-            return False
+        Args:
+            provider_cache: Cached entry for a provider
 
-        provider_cache = cache_data["providers"][provider_name]
+        Returns:
+            TTL in seconds, longer for entries carrying a fingerprint
+        """
+        return self.availability_ttl if "fingerprint" in provider_cache else self.cache_ttl
 
+    def _is_entry_valid(
+        self,
+        provider_name: str,
+        provider_cache: Optional[Dict[str, Any]],
+        fingerprint: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Check whether a cache entry exists, has not expired and is still current.
+
+        Args:
+            provider_name: Name of the provider
+            provider_cache: Cached entry for the provider, if any
+            fingerprint: Current provider fingerprint to compare against, if known
+
+        Returns:
+            True if the entry is valid
+        """
         # Check if cache entry has timestamp
-        if "cached_at" not in provider_cache:
+        if provider_cache is None or "cached_at" not in provider_cache:
             return False
 
-        # Check if cache is expired
-        cached_at = provider_cache["cached_at"]
-        current_time = time.time()
+        # Entries without a fingerprint cannot be revalidated and use the short TTL
+        if fingerprint is None or "fingerprint" not in provider_cache:
+            ttl = self.cache_ttl
+        elif provider_cache["fingerprint"] != fingerprint:
+            logger.debug(f"Provider '{provider_name}' changed since it was cached")
+            return False
+        else:
+            ttl = self.availability_ttl
 
-        if current_time - cached_at > self.cache_ttl:
+        # Check if cache is expired
+        if time.time() - provider_cache["cached_at"] > ttl:
             logger.debug(f"Cache for provider '{provider_name}' has expired")
             return False
 
         return True
 
-    def get_cached_provider_info(self, provider_name: str) -> Optional[Dict[str, Any]]:
+    def is_cache_valid(
+        self, provider_name: str, fingerprint: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Check if cached data for a provider is still valid.
+
+        Args:
+            provider_name: Name of the provider to check
+            fingerprint: Current provider fingerprint; when given, an entry with a
+                matching fingerprint stays valid for ``provider_availability_ttl``
+
+        Returns:
+            True if cache is valid and not expired
+        """
+        if not self.cache_enabled:
+            return False
+
+        with self._store.lock:
+            provider_cache = self._entries().get(provider_name)
+            return self._is_entry_valid(provider_name, provider_cache, fingerprint)
+
+    def get_cached_provider_info(
+        self, provider_name: str, fingerprint: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """Get cached information for a provider.
 
         Args:
             provider_name: Name of the provider
+            fingerprint: Current provider fingerprint; when given, an entry with a
+                matching fingerprint stays valid for ``provider_availability_ttl``
 
         Returns:
             Cached provider information if valid, None otherwise
         """
-        if not self.is_cache_valid(provider_name):
+        if not self.cache_enabled:
             return None
 
-        cache_data = self._load_cache_data()
-        return cache_data["providers"][provider_name].copy()
+        with self._store.lock:
+            provider_cache = self._entries().get(provider_name)
+            if not self._is_entry_valid(provider_name, provider_cache, fingerprint):
+                return None
+            return provider_cache.copy()
+
+    def get_cached_version(
+        self, provider_name: str, executable_fingerprint: List[Any]
+    ) -> Optional[str]:
+        """Get the cached version of a provider's executable.
+
+        Unlike availability, the version only depends on the executable, so an
+        entry stays usable after the provider file changes as long as the
+        executable fingerprint matches.
+
+        Args:
+            provider_name: Name of the provider
+            executable_fingerprint: Current fingerprint of the provider's main executable
+
+        Returns:
+            Cached version string, None if unknown or the executable changed
+        """
+        if not self.cache_enabled or executable_fingerprint[0] is None:
+            return None
+
+        with self._store.lock:
+            provider_cache = self._entries().get(provider_name)
+            if provider_cache is None or "cached_at" not in provider_cache:
+                return None
+            fingerprint = provider_cache.get("fingerprint") or {}
+            if fingerprint.get("executable") != executable_fingerprint:
+                return None
+            if time.time() - provider_cache["cached_at"] > self.availability_ttl:
+                return None
+            return provider_cache.get("version")
 
     def update_provider_cache(self, provider_name: str, provider_info: Dict[str, Any]) -> None:
         """Update cache for a specific provider.
 
+        The update is visible immediately to every ProviderCache in this process
+        and is written to disk by the next :meth:`flush`.
+
         Args:
             provider_name: Name of the provider
             provider_info: Provider information to cache
@@ -155,16 +408,13 @@ class ProviderCache:
         if not self.cache_enabled:
             return
 
-        cache_data = self._load_cache_data()
-
-        if "providers" not in cache_data:
-            cache_data["providers"] = {}
-
         # Add timestamp
         provider_info["cached_at"] = time.time()
-        cache_data["providers"][provider_name] = provider_info
 
-        self._save_cache_data(cache_data)
+        with self._store.lock:
+            self._entries()[provider_name] = provider_info
+            self._store.dirty[provider_name] = provider_info
+            self._store.removed.discard(provider_name)
         logger.debug(f"Updated cache for provider '{provider_name}'")
 
     def clear_provider_cache(self, provider_name: str) -> bool:
@@ -179,13 +429,15 @@ class ProviderCache:
         if not self.cache_enabled:
             return False
 
-        cache_data = self._load_cache_data()
-
-        if "providers" not in cache_data or provider_name not in cache_data["providers"]:
-            return False
+        with self._store.lock:
+            entries = self._entries()
+            if provider_name not in entries:
+                return False
 
-        del cache_data["providers"][provider_name]
-        self._save_cache_data(cache_data)
+            del entries[provider_name]
+            self._store.dirty.pop(provider_name, None)
+            self._store.removed.add(provider_name)
+            self.flush()
 
         logger.debug(f"Cleared cache for provider '{provider_name}'")
         return True
@@ -199,14 +451,17 @@ class ProviderCache:
         if not self.cache_enabled:
             return 0
 
-        cache_data = self._load_cache_data()
-
-        if "providers" not in cache_data:
-            return 0
+        with self._store.lock:
+            entries = self._entries()
+            if not entries:
+                return 0
 
-        cleared_count = len(cache_data["providers"])
-        cache_data["providers"] = {}
-        self._save_cache_data(cache_data)
+            cleared_count = len(entries)
+            entries.clear()
+            self._store.dirty = {}
+            self._store.removed = set()
+            self._store.cleared = True
+            self.flush()
 
         logger.debug(f"Cleared cache for {cleared_count} providers")
         return cleared_count
@@ -217,7 +472,13 @@ class ProviderCache:
         Returns:
             Dictionary with cache status information
         """
-        cache_data = self._load_cache_data()
+        if self.cache_enabled:
+            with self._store.lock:
+                self._entries()
+                cache_data = dict(self._store.data)
+                cache_data["providers"] = dict(cache_data["providers"])
+        else:
+            cache_data = {}
 
         # Calculate cache size
         cache_size_bytes = 0
@@ -250,7 +511,7 @@ class ProviderCache:
                         "age_seconds": age_seconds,
                         "age_hours": age_hours,
                         "age_days": age_days,
-                        "expired": age_seconds > self.cache_ttl,
+                        "expired": age_seconds > self._entry_ttl(provider_info),
                     }
                 )
 
@@ -263,6 +524,7 @@ class ProviderCache:
             "cache_file": str(self.provider_cache_file),
             "cache_ttl_seconds": self.cache_ttl,
             "cache_ttl_hours": self.cache_ttl / 3600,
+            "availability_ttl_seconds": self.availability_ttl,
             "cache_size_bytes": cache_size_bytes,
             "cache_size_mb": cache_size_mb,
             "total_cached_providers": len(cached_providers),
@@ -280,26 +542,25 @@ class ProviderCache:
         if not self.cache_enabled:
             return 0
 
-        cache_data = self._load_cache_data()
-
-        if "providers" not in cache_data:
-            return 0
-
-        current_time = time.time()
-        expired_providers = []
-
-        for provider_name, provider_info in cache_data["providers"].items():
-            cached_at = provider_info.get("cached_at", 0)
-            if current_time - cached_at > self.cache_ttl:
-                expired_providers.append(provider_name)
-
-        # Remove expired entries
-        for provider_name in expired_providers:
-            del cache_data["providers"][provider_name]
-
-        if expired_providers:
-            self._save_cache_data(cache_data)
-            logger.debug(f"Cleaned up {len(expired_providers)} expired cache entries")
+        with self._store.lock:
+            entries = self._entries()
+            current_time = time.time()
+            expired_providers = [
+                provider_name
+                for provider_name, provider_info in entries.items()
+                if current_time - provider_info.get("cached_at", 0)
+                > self._entry_ttl(provider_info)
+            ]
+
+            # Remove expired entries
+            for provider_name in expired_providers:
+                del entries[provider_name]
+                self._store.dirty.pop(provider_name, None)
+                self._store.removed.add(provider_name)
+
+            if expired_providers:
+                self.flush()
+                logger.debug(f"Cleaned up {len(expired_providers)} expired cache entries")
 
         return len(expired_providers)
 
@@ -309,12 +570,29 @@ class ProviderCache:
         Returns:
             Dictionary mapping provider names to their cached information
         """
-        cache_data = self._load_cache_data()
-        return cache_data.get("providers", {}).copy()
+        if not self.cache_enabled:
+            return {}
+
+        with self._store.lock:
+            return self._entries().copy()
 
 
 class SaidataCache:
-    """Manages saidata file parsing cache for performance optimization."""
+    """Manages saidata file parsing cache for performance optimization.
+
+    Every entry lives in its own small JSON file under ``saidata/`` in the
+    cache directory, in a shard directory derived from the software name.
+    Lookups and updates touch a single entry file, and entries are replaced
+    atomically, so concurrent processes never rewrite each other's entries.
+    Entries of the former single-file cache are migrated on first use.
+
+    Entries are validated against a ``(size, mtime_ns, inode)`` fingerprint of
+    each source file, so a warm lookup costs one ``stat`` per file and reads
+    nothing but the entry itself. With ``saidata_cache_verify_content`` the
+    file contents are hashed and compared as well.
+    """
+
+    CACHE_VERSION = "2.0"
 
     def __init__(self, config: SaiConfig):
         """Initialize saidata cache.
@@ -326,19 +604,23 @@ class SaidataCache:
         self.cache_dir = config.cache_directory
         self.cache_enabled = config.cache_enabled
         self.cache_ttl = getattr(config, "cache_ttl", 3600)  # Default 1 hour
-        self.saidata_cache_file = self.cache_dir / "saidata.json"
+        self.verify_content = getattr(config, "saidata_cache_verify_content", False)
+        self.saidata_cache_dir = self.cache_dir / "saidata"
+        self.legacy_cache_file = self.cache_dir / "saidata.json"
 
         # Ensure cache directory exists
         if self.cache_enabled:
             self._ensure_cache_directory()
+        if self.cache_enabled:
+            self._migrate_legacy_cache()
 
     def _ensure_cache_directory(self) -> None:
         """Ensure cache directory exists and is writable."""
         try:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.saidata_cache_dir.mkdir(parents=True, exist_ok=True)
 
             # Test write permissions
-            test_file = self.cache_dir / ".write_test"
+            test_file = self.saidata_cache_dir / ".write_test"
             test_file.touch()
             test_file.unlink()
 
@@ -346,6 +628,38 @@ class SaidataCache:
             logger.warning(f"Cannot create or write to cache directory {self.cache_dir}: {e}")
             self.cache_enabled = False
 
+    def _migrate_legacy_cache(self) -> None:
+        """Move entries of the former single-file cache into entry files."""
+        if not self.legacy_cache_file.exists():
+            return
+
+        try:
+            with open(self.legacy_cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            entries = data.get("saidata", {}) if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Discarding unreadable saidata cache {self.legacy_cache_file}: {e}")
+            entries = {}
+
+        migrated = 0
+        for cache_key, cached_entry in entries.items():
+            if not isinstance(cached_entry, dict) or "software_name" not in cached_entry:
+                continue
+            entry_path = self._entry_path(cached_entry["software_name"], cache_key)
+            # Another process may have migrated or refreshed the entry already
+            if not entry_path.exists() and self._write_entry(entry_path, cached_entry):
+                migrated += 1
+
+        try:
+            self.legacy_cache_file.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove migrated saidata cache: {e}")
+            return
+
+        logger.debug(f"Migrated {migrated} saidata cache entries from {self.legacy_cache_file}")
+
     def _get_file_hash(self, file_path: Path) -> str:
         """Get hash of file content for cache invalidation.
 
@@ -377,105 +691,184 @@ class SaidataCache:
         key_content = f"{software_name}:{path_str}"
         return hashlib.sha256(key_content.encode()).hexdigest()
 
-    def _load_cache_data(self) -> Dict[str, Any]:
-        """Load saidata cache data from disk.
+    def _shard_dir(self, software_name: str) -> Path:
+        """Get the directory holding the entries of a software.
+
+        Args:
+            software_name: Name of the software
 
         Returns:
-            Dictionary containing cache data, empty if not found or invalid
+            Shard directory path
         """
-        if not self.cache_enabled or not self.saidata_cache_file.exists():
-            return {}
+        shard = hashlib.sha256(software_name.encode()).hexdigest()[:2]
+        return self.saidata_cache_dir / shard
 
-        try:
-            with open(self.saidata_cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+    def _entry_path(self, software_name: str, cache_key: str) -> Path:
+        """Get the file storing one cache entry.
 
-            # Validate cache structure
-            if not isinstance(data, dict) or "saidata" not in data:
-                logger.warning("Invalid saidata cache file structure, ignoring cache")
-                return {}
+        Args:
+            software_name: Name of the software
+            cache_key: Cache key of the entry
 
-            return data
+        Returns:
+            Entry file path
+        """
+        return self._shard_dir(software_name) / f"{cache_key}.json"
 
+    @staticmethod
+    def _read_entry(entry_path: Path) -> Optional[Dict[str, Any]]:
+        """Read one cache entry.
+
+        Args:
+            entry_path: Entry file path
+
+        Returns:
+            Cache entry, None if missing or unreadable
+        """
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
         except (json.JSONDecodeError, OSError) as e:
-            logger.warning(f"Failed to load saidata cache: {e}")
-            return {}
+            logger.debug(f"Ignoring unreadable saidata cache entry {entry_path}: {e}")
+            return None
+
+        return entry if isinstance(entry, dict) else None
 
-    def _save_cache_data(self, data: Dict[str, Any]) -> None:
-        """Save saidata cache data to disk.
+    @staticmethod
+    def _write_entry(entry_path: Path, entry: Dict[str, Any]) -> bool:
+        """Write one cache entry atomically.
 
         Args:
-            data: Cache data to save
-        """
-        if not self.cache_enabled:
-            return
+            entry_path: Entry file path
+            entry: Cache entry to store
 
+        Returns:
+            True if the entry was written
+        """
+        # Temp names are unique per writer so concurrent updates cannot interleave
+        temp_file = entry_path.with_name(
+            f".{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
         try:
-            # Add metadata
-            data["cache_version"] = "1.0"
-            data["last_updated"] = time.time()
-
-            # Write atomically by writing to temp file first
-            temp_file = self.saidata_cache_file.with_suffix(".tmp")
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
             with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+                json.dump(entry, f, separators=(",", ":"))
 
             # Atomic move
-            temp_file.replace(self.saidata_cache_file)
+            temp_file.replace(entry_path)
+            return True
 
-            logger.debug(f"Saved saidata cache to {self.saidata_cache_file}")
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Failed to save saidata cache entry {entry_path}: {e}")
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+            return False
 
-        except (OSError, json.JSONEncodeError) as e:
-            logger.error(f"Failed to save saidata cache: {e}")
+    def _iter_entries(self) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        """Iterate over all stored cache entries.
 
-    def is_cache_valid(self, software_name: str, file_paths: List[Path]) -> bool:
-        """Check if cached saidata is still valid.
+        Yields:
+            Tuples of entry file path and cache entry
+        """
+        if not self.saidata_cache_dir.is_dir():
+            return
+
+        for entry_path in self.saidata_cache_dir.glob("*/*.json"):
+            entry = self._read_entry(entry_path)
+            if entry is not None:
+                yield entry_path, entry
+
+    def _is_entry_valid(
+        self, software_name: str, cached_entry: Optional[Dict[str, Any]], file_paths: List[Path]
+    ) -> bool:
+        """Check whether a cache entry has not expired and its files are unchanged.
 
         Args:
             software_name: Name of the software
+            cached_entry: Cached entry, if any
             file_paths: List of saidata file paths
 
         Returns:
-            True if cache is valid and not expired
+            True if the entry is valid
         """
-        if not self.cache_enabled:
-            return False
-
-        cache_key = self._get_cache_key(software_name, file_paths)
-        cache_data = self._load_cache_data()
-
-        if "saidata" not in cache_data or cache_key not in cache_data["saidata"]:
-            return False
-
-        cached_entry = cache_data["saidata"][cache_key]
-
         # Check if cache entry has timestamp
-        if "cached_at" not in cached_entry:
+        if cached_entry is None or "cached_at" not in cached_entry:
             return False
 
         # Check if cache is expired
-        cached_at = cached_entry["cached_at"]
-        current_time = time.time()
-
-        if current_time - cached_at > self.cache_ttl:
+        if time.time() - cached_entry["cached_at"] > self.cache_ttl:
             logger.debug(f"Cache for saidata '{software_name}' has expired")
             return False
 
         # Check if any source files have been modified
-        cached_file_hashes = cached_entry.get("file_hashes", {})
+        cached_fingerprints = cached_entry.get("file_fingerprints", {})
         for file_path in file_paths:
-            file_path_str = str(file_path)
-            current_hash = self._get_file_hash(file_path)
-            cached_hash = cached_file_hashes.get(file_path_str, "")
-
-            if current_hash != cached_hash:
+            current_fingerprint = get_file_fingerprint(file_path)
+            if (
+                current_fingerprint is None
+                or current_fingerprint != cached_fingerprints.get(str(file_path))
+            ):
                 logger.debug(
-                    f"Cache for saidata '{software_name}' invalidated due to file change: {file_path}"
+                    f"Cache for saidata '{software_name}' invalidated due to file change: "
+                    f"{file_path}"
                 )
                 return False
 
+        if self.verify_content:
+            cached_file_hashes = cached_entry.get("file_hashes", {})
+            for file_path in file_paths:
+                if self._get_file_hash(file_path) != cached_file_hashes.get(str(file_path)):
+                    logger.debug(
+                        f"Cache for saidata '{software_name}' invalidated due to content "
+                        f"change: {file_path}"
+                    )
+                    return False
+
         return True
 
+    def is_cache_valid(self, software_name: str, file_paths: List[Path]) -> bool:
+        """Check if cached saidata is still valid.
+
+        Args:
+            software_name: Name of the software
+            file_paths: List of saidata file paths
+
+        Returns:
+            True if cache is valid and not expired
+        """
+        if not self.cache_enabled:
+            return False
+
+        cache_key = self._get_cache_key(software_name, file_paths)
+        cached_entry = self._read_entry(self._entry_path(software_name, cache_key))
+        return self._is_entry_valid(software_name, cached_entry, file_paths)
+
+    def get_cached_entry(
+        self, software_name: str, file_paths: List[Path]
+    ) -> Optional[Dict[str, Any]]:
+        """Get the full cache entry for saidata if valid.
+
+        Args:
+            software_name: Name of the software
+            file_paths: List of saidata file paths
+
+        Returns:
+            Cache entry with the saidata under ``data`` if valid, None otherwise
+        """
+        if not self.cache_enabled:
+            return None
+
+        cache_key = self._get_cache_key(software_name, file_paths)
+        cached_entry = self._read_entry(self._entry_path(software_name, cache_key))
+        if not self._is_entry_valid(software_name, cached_entry, file_paths):
+            return None
+
+        return cached_entry
+
     def get_cached_saidata(
         self, software_name: str, file_paths: List[Path]
     ) -> Optional[Dict[str, Any]]:
@@ -488,17 +881,18 @@ class SaidataCache:
         Returns:
             Cached saidata dictionary if valid, None otherwise
         """
-        if not self.is_cache_valid(software_name, file_paths):
+        cached_entry = self.get_cached_entry(software_name, file_paths)
+        if cached_entry is None:
             return None
 
-        cache_key = self._get_cache_key(software_name, file_paths)
-        cache_data = self._load_cache_data()
-
-        cached_entry = cache_data["saidata"][cache_key]
         return cached_entry.get("data", {}).copy()
 
     def update_saidata_cache(
-        self, software_name: str, file_paths: List[Path], saidata: Dict[str, Any]
+        self,
+        software_name: str,
+        file_paths: List[Path],
+        saidata: Dict[str, Any],
+        validated_with: Optional[List[Any]] = None,
     ) -> None:
         """Update cache for saidata.
 
@@ -506,32 +900,37 @@ class SaidataCache:
             software_name: Name of the software
             file_paths: List of saidata file paths used
             saidata: Parsed and validated saidata dictionary
+            validated_with: Identifies the validation rules the data passed, so
+                loaders using the same rules can skip validating it again
         """
         if not self.cache_enabled:
             return
 
         cache_key = self._get_cache_key(software_name, file_paths)
-        cache_data = self._load_cache_data()
-
-        if "saidata" not in cache_data:
-            cache_data["saidata"] = {}
 
-        # Calculate file hashes for invalidation
-        file_hashes = {}
+        # Fingerprint the source files for invalidation
+        file_fingerprints = {}
         for file_path in file_paths:
-            file_hashes[str(file_path)] = self._get_file_hash(file_path)
+            file_fingerprints[str(file_path)] = get_file_fingerprint(file_path)
 
         # Store cache entry
-        cache_data["saidata"][cache_key] = {
+        cached_entry = {
+            "cache_version": self.CACHE_VERSION,
             "software_name": software_name,
             "file_paths": [str(p) for p in file_paths],
-            "file_hashes": file_hashes,
+            "file_fingerprints": file_fingerprints,
             "data": saidata,
             "cached_at": time.time(),
         }
+        if validated_with is not None:
+            cached_entry["validated_with"] = validated_with
+        if self.verify_content:
+            cached_entry["file_hashes"] = {
+                str(file_path): self._get_file_hash(file_path) for file_path in file_paths
+            }
 
-        self._save_cache_data(cache_data)
-        logger.debug(f"Updated saidata cache for '{software_name}'")
+        if self._write_entry(self._entry_path(software_name, cache_key), cached_entry):
+            logger.debug(f"Updated saidata cache for '{software_name}'")
 
     def clear_saidata_cache(self, software_name: Optional[str] = None) -> int:
         """Clear saidata cache.
@@ -545,30 +944,28 @@ class SaidataCache:
         if not self.cache_enabled:
             return 0
 
-        cache_data = self._load_cache_data()
-
-        if "saidata" not in cache_data:
-            return 0
-
         if software_name is None:
             # Clear all saidata cache
-            cleared_count = len(cache_data["saidata"])
-            cache_data["saidata"] = {}
+            entry_paths = list(self.saidata_cache_dir.glob("*/*.json"))
         else:
-            # Clear cache for specific software
-            cleared_count = 0
-            keys_to_remove = []
-
-            for cache_key, cached_entry in cache_data["saidata"].items():
-                if cached_entry.get("software_name") == software_name:
-                    keys_to_remove.append(cache_key)
-                    cleared_count += 1
-
-            for key in keys_to_remove:
-                del cache_data["saidata"][key]
+            # Clear cache for specific software, whose entries share one shard
+            entry_paths = [
+                entry_path
+                for entry_path in self._shard_dir(software_name).glob("*.json")
+                if (self._read_entry(entry_path) or {}).get("software_name") == software_name
+            ]
+
+        cleared_count = 0
+        for entry_path in entry_paths:
+            try:
+                entry_path.unlink()
+                cleared_count += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove saidata cache entry {entry_path}: {e}")
 
         if cleared_count > 0:
-            self._save_cache_data(cache_data)
             logger.debug(f"Cleared {cleared_count} saidata cache entries")
 
         return cleared_count
@@ -579,43 +976,42 @@ class SaidataCache:
         Returns:
             Dictionary with cache status information
         """
-        cache_data = self._load_cache_data()
-
-        # Calculate cache size
         cache_size_bytes = 0
-        if self.saidata_cache_file.exists():
+        last_updated = None
+        cached_saidata = []
+        current_time = time.time()
+
+        for entry_path, cached_entry in self._iter_entries():
+            # Calculate cache size
             try:
-                cache_size_bytes = self.saidata_cache_file.stat().st_size
+                cache_size_bytes += entry_path.stat().st_size
             except OSError:
                 pass
 
-        cache_size_mb = cache_size_bytes / (1024 * 1024)
-
-        # Get saidata information
-        cached_saidata = []
-        if "saidata" in cache_data:
-            current_time = time.time()
-
-            for cache_key, cached_entry in cache_data["saidata"].items():
-                cached_at = cached_entry.get("cached_at", 0)
-                age_seconds = current_time - cached_at
-                age_hours = age_seconds / 3600
-                age_days = age_hours / 24
+            cached_at = cached_entry.get("cached_at", 0)
+            if cached_at and (last_updated is None or cached_at > last_updated):
+                last_updated = cached_at
+
+            age_seconds = current_time - cached_at
+            age_hours = age_seconds / 3600
+            age_days = age_hours / 24
+
+            cached_saidata.append(
+                {
+                    "software_name": cached_entry.get("software_name", "unknown"),
+                    "file_paths": cached_entry.get("file_paths", []),
+                    "cached_at": datetime.fromtimestamp(cached_at).isoformat()
+                    if cached_at
+                    else None,
+                    "age_seconds": age_seconds,
+                    "age_hours": age_hours,
+                    "age_days": age_days,
+                    "expired": age_seconds > self.cache_ttl,
+                    "cache_key": entry_path.stem,
+                }
+            )
 
-                cached_saidata.append(
-                    {
-                        "software_name": cached_entry.get("software_name", "unknown"),
-                        "file_paths": cached_entry.get("file_paths", []),
-                        "cached_at": datetime.fromtimestamp(cached_at).isoformat()
-                        if cached_at
-                        else None,
-                        "age_seconds": age_seconds,
-                        "age_hours": age_hours,
-                        "age_days": age_days,
-                        "expired": age_seconds > self.cache_ttl,
-                        "cache_key": cache_key,
-                    }
-                )
+        cache_size_mb = cache_size_bytes / (1024 * 1024)
 
         # Sort by software name
         cached_saidata.sort(key=lambda x: x["software_name"])
@@ -623,15 +1019,15 @@ class SaidataCache:
         return {
             "cache_enabled": self.cache_enabled,
             "cache_directory": str(self.cache_dir),
-            "cache_file": str(self.saidata_cache_file),
+            "cache_file": str(self.saidata_cache_dir),
             "cache_ttl_seconds": self.cache_ttl,
             "cache_ttl_hours": self.cache_ttl / 3600,
             "cache_size_bytes": cache_size_bytes,
             "cache_size_mb": cache_size_mb,
             "total_cached_saidata": len(cached_saidata),
             "cached_saidata": cached_saidata,
-            "last_updated": cache_data.get("last_updated"),
-            "cache_version": cache_data.get("cache_version", "unknown"),
+            "last_updated": last_updated,
+            "cache_version": self.CACHE_VERSION,
         }
 
     def cleanup_expired_cache(self) -> int:
@@ -643,28 +1039,22 @@ class SaidataCache:
         if not self.cache_enabled:
             return 0
 
-        cache_data = self._load_cache_data()
-
-        if "saidata" not in cache_data:
-            return 0
-
         current_time = time.time()
-        expired_keys = []
-
-        for cache_key, cached_entry in cache_data["saidata"].items():
-            cached_at = cached_entry.get("cached_at", 0)
-            if current_time - cached_at > self.cache_ttl:
-                expired_keys.append(cache_key)
+        removed = 0
 
-        # Remove expired entries
-        for cache_key in expired_keys:
-            del cache_data["saidata"][cache_key]
+        for entry_path, cached_entry in self._iter_entries():
+            if current_time - cached_entry.get("cached_at", 0) <= self.cache_ttl:
+                continue
+            try:
+                entry_path.unlink()
+                removed += 1
+            except OSError:
+                pass
 
-        if expired_keys:
-            self._save_cache_data(cache_data)
-            logger.debug(f"Cleaned up {len(expired_keys)} expired saidata cache entries")
+        if removed:
+            logger.debug(f"Cleaned up {removed} expired saidata cache entries")
 
-        return len(expired_keys)
+        return removed
 
 
 class CacheManager:
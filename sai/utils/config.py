@@ -23,11 +23,25 @@ class ConfigManager:
         Path.cwd() / "sai.json",
     ]
 
-    def __init__(self, config_path: Optional[Path] = None):
-        """Initialize configuration manager."""
+    def __init__(
+        self, config_path: Optional[Path] = None, working_directory: Optional[Path] = None
+    ):
+        """Initialize configuration manager.
+
+        Args:
+            config_path: Explicit configuration file to use
+            working_directory: Directory to look for project configuration files in,
+                defaults to the current directory at import time
+        """
         self.config_path = config_path
         self._config: Optional[SaiConfig] = None
 
+        if working_directory is not None:
+            self.DEFAULT_CONFIG_PATHS = self.DEFAULT_CONFIG_PATHS[:2] + [
+                working_directory / name
+                for name in (".sai.yaml", ".sai.json", "sai.yaml", "sai.json")
+            ]
+
     def load_config(self) -> SaiConfig:
         """Load configuration from file or create default."""
         if self._config is not None:
@@ -260,6 +274,20 @@ def get_config_manager(config_path: Optional[Path] = None) -> ConfigManager:
     return _config_manager
 
 
+def reset_config_manager(working_directory: Optional[Path] = None) -> ConfigManager:
+    """Replace the global configuration manager so configuration is read again.
+
+    Args:
+        working_directory: Directory to look for project configuration files in
+
+    Returns:
+        The new global ConfigManager instance
+    """
+    global _config_manager
+    _config_manager = ConfigManager(working_directory=working_directory)
+    return _config_manager
+
+
 def get_config() -> SaiConfig:
     """Get current configuration."""
     return get_config_manager().get_config()
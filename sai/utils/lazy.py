@@ -0,0 +1,90 @@
+"""Deferred imports for modules on the CLI startup path."""
+
+import importlib
+from typing import Any, Callable, Dict
+
+
+class LazyImport:
+    """Stand-in for a class or function that is imported on first use.
+
+    Calling the stand-in or reading one of its attributes imports the target
+    and forwards to it. Module attributes bound to a ``LazyImport`` can still
+    be replaced with ``unittest.mock.patch`` like regular imports.
+
+    The stand-in cannot be used where Python needs the real object, such as
+    in ``except`` clauses, ``isinstance`` checks or as a base class; import
+    the target directly in those places.
+    """
+
+    __slots__ = ("_module", "_name", "_target")
+
+    def __init__(self, module: str, name: str):
+        """Initialize the stand-in.
+
+        Args:
+            module: Absolute name of the module defining the target
+            name: Name of the target in that module
+        """
+        self._module = module
+        self._name = name
+        self._target = None
+
+    def resolve(self) -> Any:
+        """Import and return the target.
+
+        Returns:
+            The class or function this stand-in represents
+        """
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module), self._name)
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        return f"<LazyImport {self._module}.{self._name}>"
+
+
+def lazy_import(module: str, name: str) -> LazyImport:
+    """Create a stand-in for ``from module import name``.
+
+    Args:
+        module: Absolute name of the module defining the target
+        name: Name of the target in that module
+
+    Returns:
+        LazyImport importing the target on first use
+    """
+    return LazyImport(module, name)
+
+
+def make_lazy_getattr(
+    package: str, exports: Dict[str, str], namespace: Dict[str, Any]
+) -> Callable[[str], Any]:
+    """Create a package ``__getattr__`` importing its public names on first use.
+
+    Imported names are stored in the package namespace, so each one goes
+    through ``__getattr__`` only once.
+
+    Args:
+        package: Name of the package, ``__name__`` in its ``__init__``
+        exports: Module defining each public name, relative to the package
+        namespace: Namespace of the package, ``globals()`` in its ``__init__``
+
+    Returns:
+        Function to bind to ``__getattr__`` in the package's ``__init__``
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    return __getattr__
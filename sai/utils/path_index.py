@@ -0,0 +1,231 @@
+"""Shared index of executables found on the system PATH."""
+
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DirectoryInfo:
+    """Cached state of one directory on the PATH."""
+
+    path: str
+    exists: bool
+    mtime_ns: int = 0
+    mode: int = 0
+    candidates: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def world_writable(self) -> bool:
+        """Whether the directory is writable by any user."""
+        return bool(self.mode & 0o002)
+
+
+class PathIndex:
+    """Maps executable names to absolute paths by listing each PATH directory once.
+
+    Each directory is listed with ``os.scandir`` and the result is kept until
+    the directory's mtime changes, so resolving many executables costs a few
+    directory listings instead of one ``stat`` per PATH entry per name.
+    Directories are re-stat'ed at most once per ``revalidate_interval``
+    seconds; :meth:`invalidate` forces a check on the next lookup.
+    """
+
+    def __init__(self, revalidate_interval: float = 1.0):
+        """Initialize the index.
+
+        Args:
+            revalidate_interval: Minimum seconds between directory mtime checks
+        """
+        self.revalidate_interval = revalidate_interval
+        self._lock = threading.RLock()
+        self._directories: Dict[str, DirectoryInfo] = {}
+        self._resolved: Dict[Tuple[str, str], Optional[str]] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._generation = 0
+        self._case_insensitive = os.name == "nt"
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented every time an indexed directory changes."""
+        return self._generation
+
+    def invalidate(self) -> None:
+        """Force directory mtimes to be checked again on the next lookup."""
+        with self._lock:
+            self._checked_at.clear()
+
+    def clear(self) -> None:
+        """Drop all indexed directories."""
+        with self._lock:
+            self._directories.clear()
+            self._resolved.clear()
+            self._checked_at.clear()
+            self._generation += 1
+
+    def _normalize(self, name: str) -> str:
+        """Normalize an executable name for lookups."""
+        return name.lower() if self._case_insensitive else name
+
+    def _scan(self, directory: str) -> DirectoryInfo:
+        """Stat a directory and list its candidate executables.
+
+        Args:
+            directory: Directory to scan
+
+        Returns:
+            DirectoryInfo for the directory
+        """
+        try:
+            stat_info = os.stat(directory)
+        except OSError:
+            return DirectoryInfo(path=directory, exists=False)
+
+        if not os.path.isdir(directory):
+            return DirectoryInfo(path=directory, exists=False)
+
+        info = DirectoryInfo(
+            path=directory,
+            exists=True,
+            mtime_ns=stat_info.st_mtime_ns,
+            mode=stat_info.st_mode,
+        )
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        # Directories can never be executables; symlinks are checked on lookup
+                        if entry.is_dir(follow_symlinks=False):
+                            continue
+                    except OSError:
+                        continue
+                    info.candidates.setdefault(self._normalize(entry.name), entry.path)
+        except OSError as e:
+            logger.debug(f"Failed to list PATH directory {directory}: {e}")
+
+        return info
+
+    def get_directory(self, directory: str) -> DirectoryInfo:
+        """Get cached information about a directory, rescanning it if it changed.
+
+        Args:
+            directory: Directory path
+
+        Returns:
+            DirectoryInfo for the directory
+        """
+        with self._lock:
+            info = self._directories.get(directory)
+            now = time.monotonic()
+
+            if info is not None:
+                checked_at = self._checked_at.get(directory)
+                if checked_at is not None and now - checked_at < self.revalidate_interval:
+                    return info
+
+                try:
+                    current_mtime = os.stat(directory).st_mtime_ns
+                    unchanged = info.exists and current_mtime == info.mtime_ns
+                except OSError:
+                    unchanged = not info.exists
+
+                if unchanged:
+                    self._checked_at[directory] = now
+                    return info
+
+            new_info = self._scan(directory)
+            self._directories[directory] = new_info
+            self._checked_at[directory] = now
+            if info is not None:
+                logger.debug(f"PATH directory changed, rescanned {directory}")
+                self._resolved.clear()
+                self._generation += 1
+            return new_info
+
+    def _candidate_names(self, name: str) -> List[str]:
+        """Get the file names that may provide an executable.
+
+        Args:
+            name: Executable name
+
+        Returns:
+            Candidate file names in lookup order
+        """
+        if os.name != "nt":
+            return [name]
+
+        extensions = [
+            ext.lower()
+            for ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(";")
+            if ext
+        ]
+        lowered = name.lower()
+        if any(lowered.endswith(ext) for ext in extensions):
+            return [lowered]
+        return [lowered + ext for ext in extensions]
+
+    def which(self, executable: str, path: Optional[str] = None) -> Optional[str]:
+        """Resolve an executable the same way ``shutil.which`` does.
+
+        Args:
+            executable: Executable name, or a path to an executable
+            path: PATH value to search, defaults to the PATH environment variable
+
+        Returns:
+            Absolute path to the executable, or None if not found
+        """
+        if not executable:
+            return None
+
+        # Explicit paths are not looked up in PATH directories
+        if os.sep in executable or (os.altsep and os.altsep in executable):
+            return shutil.which(executable, path=path)
+
+        search_path = os.environ.get("PATH", os.defpath) if path is None else path
+        directories = [d for d in search_path.split(os.pathsep) if d]
+
+        with self._lock:
+            infos = [self.get_directory(d) for d in directories]
+
+            key = (search_path, executable)
+            if key in self._resolved:
+                return self._resolved[key]
+
+            result = None
+            names = self._candidate_names(executable)
+            for info in infos:
+                for name in names:
+                    candidate = info.candidates.get(name)
+                    if candidate and os.access(candidate, os.X_OK) and not os.path.isdir(candidate):
+                        result = candidate
+                        break
+                if result:
+                    break
+
+            self._resolved[key] = result
+            return result
+
+
+_path_index: Optional[PathIndex] = None
+_path_index_lock = threading.Lock()
+
+
+def get_path_index() -> PathIndex:
+    """Get the process-wide PATH index.
+
+    Returns:
+        Shared PathIndex instance
+    """
+    global _path_index
+    if _path_index is None:
+        with _path_index_lock:
+            if _path_index is None:
+                _path_index = PathIndex()
+    return _path_index
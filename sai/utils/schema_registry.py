@@ -0,0 +1,138 @@
+"""Process-wide registry of compiled JSON schema validators.
+
+``jsonschema.validate`` checks the schema against its metaschema and builds
+a new validator on every call, which costs more than validating a typical
+saidata document. The registry loads each schema file once per process,
+checks it once and hands out the same compiled validator to every caller.
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import ValidationError, best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_DIRECTORY = Path(__file__).parent.parent.parent / "schemas"
+
+# Schema files shipped with sai, by schema name
+SCHEMA_FILES = {
+    "saidata-0.2": "saidata-0.2-schema.json",
+    "saidata-0.3": "saidata-0.3-schema.json",
+    "providerdata-0.1": "providerdata-0.1-schema.json",
+    "applydata-0.1": "applydata-0.1-schema.json",
+}
+
+# Compiled validators by resolved schema file path
+_validators: Dict[Path, Validator] = {}
+_validators_lock = threading.Lock()
+
+
+def get_schema_path(schema_name: str) -> Path:
+    """Get the file of a schema shipped with sai.
+
+    Args:
+        schema_name: Schema name such as ``saidata-0.3``
+
+    Returns:
+        Path of the schema file
+
+    Raises:
+        ValueError: If the schema name is unknown
+    """
+    try:
+        return SCHEMA_DIRECTORY / SCHEMA_FILES[schema_name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown schema '{schema_name}', available: {', '.join(SCHEMA_FILES)}"
+        ) from None
+
+
+def compile_schema(schema: Dict[str, Any]) -> Validator:
+    """Check a schema and build a validator for it.
+
+    The validator class follows the schema's ``$schema`` keyword like
+    ``jsonschema.validate`` does, defaulting to Draft 7.
+
+    Args:
+        schema: JSON schema
+
+    Returns:
+        Validator for the schema
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    validator_class = validator_for(schema, default=Draft7Validator)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def get_validator(schema_path: Path) -> Validator:
+    """Get the compiled validator of a schema file.
+
+    The file is read and compiled on first use and shared afterwards.
+
+    Args:
+        schema_path: Path of the JSON schema file
+
+    Returns:
+        Validator for the schema
+
+    Raises:
+        OSError: If the schema file cannot be read
+        ValueError: If the schema file is not valid JSON
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    key = schema_path.resolve()
+    with _validators_lock:
+        validator = _validators.get(key)
+    if validator is not None:
+        return validator
+
+    with open(key, "r", encoding="utf-8") as f:
+        schema = json.load(f)
+    validator = compile_schema(schema)
+    logger.debug(f"Compiled JSON schema {schema_path}")
+
+    with _validators_lock:
+        return _validators.setdefault(key, validator)
+
+
+def get_schema_validator(schema_name: str) -> Validator:
+    """Get the compiled validator of a schema shipped with sai.
+
+    Args:
+        schema_name: Schema name such as ``saidata-0.3``
+
+    Returns:
+        Validator for the schema
+    """
+    return get_validator(get_schema_path(schema_name))
+
+
+def validate(validator: Validator, instance: Any) -> None:
+    """Validate an instance, raising the most relevant error like ``jsonschema.validate``.
+
+    Args:
+        validator: Compiled validator
+        instance: Data to validate
+
+    Raises:
+        jsonschema.ValidationError: If the instance is invalid
+    """
+    error: ValidationError = best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+def clear_validators() -> None:
+    """Forget all compiled validators."""
+    with _validators_lock:
+        _validators.clear()
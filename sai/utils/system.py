@@ -3,15 +3,20 @@
 import logging
 import os
 import platform
-import shutil
 import socket
 import subprocess
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
+from .path_index import get_path_index
+
 logger = logging.getLogger(__name__)
 
+# Files identifying the Linux distribution, in order of precedence
+OS_RELEASE_FILES = ("/etc/os-release", "/usr/lib/os-release")
+
 
 def get_platform() -> str:
     """Get the current platform identifier.
@@ -22,6 +27,34 @@ def get_platform() -> str:
     return platform.system().lower()
 
 
+def get_os_id() -> str:
+    """Get the identifier of the host operating system as used by saidata OS overrides.
+
+    Linux distributions are identified by the ``ID`` field of os-release
+    (e.g. 'ubuntu', 'debian'), other systems by name ('macos', 'windows').
+
+    Returns:
+        Operating system identifier
+    """
+    system = get_platform()
+    if system == "darwin":
+        return "macos"
+    if system != "linux":
+        return system
+
+    for os_release in OS_RELEASE_FILES:
+        try:
+            with open(os_release, "r", encoding="utf-8") as f:
+                for line in f:
+                    key, _, value = line.strip().partition("=")
+                    if key == "ID" and value:
+                        return value.strip("\"'").lower()
+        except OSError:
+            continue
+
+    return system
+
+
 def is_executable_available(executable: str) -> bool:
     """Check if an executable is available in the system PATH.
 
@@ -32,8 +65,8 @@ def is_executable_available(executable: str) -> bool:
         True if executable is available, False otherwise
     """
     try:
-        # Use shutil.which to check if executable exists in PATH
-        result = shutil.which(executable)
+        # Use the shared PATH index to check if executable exists in PATH
+        result = get_path_index().which(executable)
         available = result is not None
 
         if available:
@@ -58,7 +91,7 @@ def get_executable_path(executable: str) -> Optional[str]:
         Full path to executable if found, None otherwise
     """
     try:
-        path = shutil.which(executable)
+        path = get_path_index().which(executable)
         if path:
             logger.debug(f"Located executable '{executable}' at: {path}")
         return path
@@ -67,6 +100,33 @@ def get_executable_path(executable: str) -> Optional[str]:
         return None
 
 
+def get_executable_fingerprint(executable: str) -> List[Any]:
+    """Get a cheap fingerprint identifying the installed version of an executable.
+
+    The fingerprint changes when the executable is installed, removed, moved
+    or replaced, without running it.
+
+    Args:
+        executable: Name or path of the executable
+
+    Returns:
+        ``[path, inode, mtime_ns, size]`` of the resolved executable, or
+        ``[None]`` if it is not found
+    """
+    path = get_executable_path(executable)
+    if not path:
+        return [None]
+
+    try:
+        stat_info = os.stat(path)
+    except OSError:
+        # The executable went away since the PATH index last looked; refresh it
+        get_path_index().invalidate()
+        return [None]
+
+    return [path, stat_info.st_ino, stat_info.st_mtime_ns, stat_info.st_size]
+
+
 def get_executable_version(executable: str, version_args: List[str] = None) -> Optional[str]:
     """Get version information for an executable.
 
@@ -114,6 +174,59 @@ def get_executable_version(executable: str, version_args: List[str] = None) -> O
         return None
 
 
+# Version strings by executable fingerprint and version arguments
+_version_memo: Dict[Tuple[Any, ...], Optional[str]] = {}
+_version_probe_locks: Dict[Tuple[Any, ...], threading.Lock] = {}
+_version_memo_lock = threading.Lock()
+
+
+def get_cached_executable_version(
+    executable: str, version_args: List[str] = None
+) -> Optional[str]:
+    """Get version information for an executable, probing each binary only once.
+
+    Results are memoized for the lifetime of the process under the
+    executable's fingerprint, so an executable that is upgraded or replaced is
+    probed again. Concurrent callers asking for the same executable wait for a
+    single probe instead of each running the version command.
+
+    Args:
+        executable: Name or path of the executable
+        version_args: Arguments to pass to get version (defaults to ['--version'])
+
+    Returns:
+        Version string if available, None otherwise
+    """
+    fingerprint = get_executable_fingerprint(executable)
+    if fingerprint[0] is None:
+        return None
+
+    key = (*fingerprint, *(version_args or ["--version"]))
+    with _version_memo_lock:
+        if key in _version_memo:
+            return _version_memo[key]
+        probe_lock = _version_probe_locks.setdefault(key, threading.Lock())
+
+    with probe_lock:
+        with _version_memo_lock:
+            if key in _version_memo:
+                return _version_memo[key]
+
+        # Run the resolved path so the probed binary is the fingerprinted one
+        version = get_executable_version(fingerprint[0], version_args)
+
+        with _version_memo_lock:
+            _version_memo[key] = version
+            _version_probe_locks.pop(key, None)
+        return version
+
+
+def clear_executable_version_cache() -> None:
+    """Forget all memoized executable versions."""
+    with _version_memo_lock:
+        _version_memo.clear()
+
+
 def check_executable_functionality(
     executable: str, test_command: List[str], expected_exit_code: int = 0, timeout: int = 30
 ) -> bool:
@@ -0,0 +1,29 @@
+"""YAML parsing with LibYAML when it is available."""
+
+from typing import IO, Any, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader
+
+# Whether YAML is parsed by the LibYAML C extension
+HAS_LIBYAML = SafeLoader is not yaml.SafeLoader
+
+
+def safe_load(stream: Union[str, bytes, IO[Any]]) -> Any:
+    """Parse a YAML document like ``yaml.safe_load``.
+
+    Uses LibYAML's ``CSafeLoader``, which is several times faster than the
+    pure-Python loader, and falls back to ``yaml.SafeLoader`` when PyYAML was
+    built without LibYAML.
+
+    Args:
+        stream: YAML text or file object
+
+    Returns:
+        The parsed document
+    """
+    return yaml.load(stream, Loader=SafeLoader)
@@ -2,6 +2,7 @@
 
 import json
 import re
+import threading
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -15,6 +16,10 @@ from ..models.saidata import SaiData
 from ..utils.checksum_validator import ChecksumValidator
 from ..utils.url_templating import URLTemplateProcessor
 
+# Compiled schema validators shared by all SaidataValidator instances, by schema path
+_schema_validators: Dict[Path, Draft7Validator] = {}
+_schema_validators_lock = threading.Lock()
+
 
 class ValidationSeverity(str, Enum):
     """Validation error severity levels."""
@@ -104,10 +109,19 @@ class SaidataValidator:
         return self._schema
 
     def _get_validator(self) -> Draft7Validator:
-        """Get cached JSON schema validator."""
+        """Get the JSON schema validator, compiled once per process and schema file."""
         if self._validator is None:
-            schema = self._load_schema()
-            self._validator = Draft7Validator(schema)
+            key = self.schema_path.resolve()
+            with _schema_validators_lock:
+                validator = _schema_validators.get(key)
+
+            if validator is None:
+                schema = self._load_schema()
+                with _schema_validators_lock:
+                    validator = _schema_validators.setdefault(key, Draft7Validator(schema))
+
+            self._validator = validator
+            self._schema = validator.schema
 
         return self._validator
 
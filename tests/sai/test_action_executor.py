@@ -0,0 +1,65 @@
+"""Tests for the action executor."""
+
+from unittest.mock import Mock
+
+from sai.core.action_executor import ActionExecutor
+from sai.core.execution_engine import ExecutionResult, ExecutionStatus
+from sai.core.saidata_loader import BulkLoadResult, SaidataNotFoundError, ValidationError
+from sai.models.actions import ActionFile
+from sai.models.saidata import Metadata, SaiData
+
+
+class TestActionExecutorSaidataLoading:
+    """Test how the action executor loads saidata."""
+
+    def _executor(self, bulk_result):
+        engine = Mock()
+        engine.execute_action.return_value = ExecutionResult(
+            success=True,
+            status=ExecutionStatus.SUCCESS,
+            message="ok",
+            provider_used="apt",
+            action_name="install",
+            commands_executed=[],
+            execution_time=0.0,
+        )
+        loader = Mock()
+        loader.load_many.return_value = bulk_result
+        return ActionExecutor(engine, loader), engine, loader
+
+    def test_saidata_is_loaded_in_bulk(self):
+        """All saidata of an action file is loaded with one bulk load."""
+        nginx = SaiData(version="0.3", metadata=Metadata(name="nginx"))
+        executor, engine, loader = self._executor(BulkLoadResult(saidata={"nginx": nginx}))
+        action_file = ActionFile(
+            actions={"install": ["nginx", {"name": "nginx"}], "start": ["nginx"]}
+        )
+
+        result = executor.execute_action_file(action_file)
+
+        assert result.successful_actions == 3
+        loader.load_many.assert_called_once_with(["nginx", "nginx", "nginx"])
+        loader.load_saidata.assert_not_called()
+        assert all(call.args[0].saidata is nginx for call in engine.execute_action.call_args_list)
+
+    def test_bulk_load_errors_are_reported_per_action(self):
+        """Missing saidata falls back to minimal saidata, other errors fail the action."""
+        executor, engine, loader = self._executor(
+            BulkLoadResult(
+                errors={
+                    "custom": SaidataNotFoundError("not found", "custom"),
+                    "broken": ValidationError("invalid saidata"),
+                }
+            )
+        )
+        action_file = ActionFile(
+            config={"continue_on_error": True}, actions={"install": ["custom", "broken"]}
+        )
+
+        result = executor.execute_action_file(action_file)
+
+        results = {r.software: r for r in result.results}
+        assert results["custom"].success is True
+        assert results["broken"].success is False
+        assert "invalid saidata" in results["broken"].error
+        loader.load_saidata.assert_not_called()
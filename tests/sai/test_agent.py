@@ -0,0 +1,240 @@
+"""Tests for the sai agent and its client."""
+
+import io
+import os
+import socket
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import click
+import pytest
+
+from sai.core.agent import AgentError, AgentServer
+from sai.utils.agent_client import forward_to_agent, ping_agent, stop_agent
+
+# Set to let the block command finish
+release_block = threading.Event()
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets only")
+
+
+@click.group()
+def fake_cli():
+    """Minimal CLI standing in for the sai command group."""
+
+
+@fake_cli.command()
+@click.argument("text")
+def say(text):
+    """Write to both output streams."""
+    click.echo(text)
+    click.echo(f"warning: {text}", err=True)
+
+
+@fake_cli.command()
+def fail():
+    """Exit with a custom code."""
+    sys.exit(3)
+
+
+@fake_cli.command()
+def ask():
+    """Prompt for confirmation."""
+    click.echo("confirmed" if click.confirm("Continue?") else "declined")
+
+
+@fake_cli.command()
+def where():
+    """Report the working directory and an environment variable."""
+    click.echo(os.getcwd())
+    click.echo(os.environ.get("SAI_AGENT_TEST_VALUE", "unset"))
+
+
+@fake_cli.command()
+def block():
+    """Run until released."""
+    click.echo("waiting")
+    deadline = time.monotonic() + 10
+    while not release_block.is_set() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    click.echo("released")
+
+
+class _InterruptedOutput(io.StringIO):
+    """Output stream standing in for a user pressing Ctrl+C once output arrives."""
+
+    def __init__(self):
+        super().__init__()
+        self.interrupted = False
+
+    def write(self, data):
+        if not self.interrupted:
+            self.interrupted = True
+            raise KeyboardInterrupt
+        return super().write(data)
+
+
+@pytest.fixture
+def agent(tmp_path):
+    """Run an agent serving the fake CLI in a background thread."""
+    socket_path = tmp_path / "agent.sock"
+    server = AgentServer(socket_path, fake_cli)
+    server.bind()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    release_block.set()
+    stop_agent(socket_path)
+    thread.join(timeout=5)
+    release_block.clear()
+
+
+def _forward(server, argv, stdin=""):
+    """Forward a command to the agent and capture its output."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = forward_to_agent(
+        argv,
+        socket_path=server.socket_path,
+        stdin=io.StringIO(stdin),
+        stdout=stdout,
+        stderr=stderr,
+    )
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+class TestAgentForwarding:
+    """Test running commands through the agent."""
+
+    def test_output_and_exit_code(self, agent):
+        """Both output streams and the exit code reach the client."""
+        assert _forward(agent, ["say", "hello"]) == (0, "hello\n", "warning: hello\n")
+        assert _forward(agent, ["fail"])[0] == 3
+
+    def test_usage_errors(self, agent):
+        """Click usage errors are reported like in-process runs."""
+        exit_code, _, stderr = _forward(agent, ["missing-command"])
+
+        assert exit_code == 2
+        assert "No such command" in stderr
+
+    def test_prompt_is_answered_by_client(self, agent):
+        """Prompts read their answer from the client's stdin."""
+        assert _forward(agent, ["ask"], stdin="y\n")[1].endswith("confirmed\n")
+        assert _forward(agent, ["ask"], stdin="n\n")[1].endswith("declined\n")
+
+    def test_client_environment_and_directory(self, agent, tmp_path):
+        """Commands run with the client's environment and working directory."""
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        agent_cwd = os.getcwd()
+
+        with patch.dict(os.environ, {"SAI_AGENT_TEST_VALUE": "from-client"}):
+            cwd = os.getcwd()
+            os.chdir(work_dir)
+            try:
+                _, stdout, _ = _forward(agent, ["where"])
+            finally:
+                os.chdir(cwd)
+
+        assert stdout == f"{work_dir}\nfrom-client\n"
+        assert os.getcwd() == agent_cwd
+        assert "SAI_AGENT_TEST_VALUE" not in os.environ
+
+    def test_version_mismatch_runs_in_process(self, agent):
+        """Clients of another sai version are turned away before anything runs."""
+        with patch("sai.utils.agent_client.get_version", return_value="0.0.0"):
+            assert _forward(agent, ["say", "hello"]) == (None, "", "")
+
+    def test_state_change_invalidates_cache(self, agent):
+        """Cached state is dropped when the watched files change."""
+        with patch.object(
+            AgentServer, "_compute_state_token", side_effect=[("a",), ("a",), ("b",)]
+        ), patch.object(AgentServer, "invalidate") as mock_invalidate:
+            for _ in range(3):
+                _forward(agent, ["say", "hello"])
+
+        mock_invalidate.assert_called_once()
+
+    def test_busy_agent_runs_in_process(self, agent):
+        """Commands arriving while another one runs do not wait for it."""
+        results = []
+        running = threading.Thread(target=lambda: results.append(_forward(agent, ["block"])))
+        running.start()
+        for _ in range(100):
+            if ping_agent(agent.socket_path).get("busy"):
+                break
+            time.sleep(0.05)
+
+        assert _forward(agent, ["say", "hello"]) == (None, "", "")
+
+        release_block.set()
+        running.join(timeout=10)
+        assert results == [(0, "waiting\nreleased\n", "")]
+
+    def test_interrupt_is_forwarded(self, agent):
+        """Ctrl+C in the client aborts the command running in the agent."""
+        stdout, stderr = _InterruptedOutput(), io.StringIO()
+
+        start = time.monotonic()
+        exit_code = forward_to_agent(
+            ["block"], socket_path=agent.socket_path, stdout=stdout, stderr=stderr
+        )
+
+        assert exit_code == 1
+        assert "Aborted!" in stderr.getvalue()
+        assert "released" not in stdout.getvalue()
+        assert time.monotonic() - start < 5
+        assert _forward(agent, ["say", "hello"])[0] == 0
+
+
+class TestAgentClient:
+    """Test the client side without a running agent."""
+
+    def test_no_agent(self, tmp_path):
+        """Without an agent socket the command runs in-process."""
+        assert forward_to_agent(["say", "hello"], socket_path=tmp_path / "agent.sock") is None
+
+    def test_stale_socket(self, tmp_path):
+        """A socket file nobody listens on is ignored."""
+        socket_path = tmp_path / "agent.sock"
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(str(socket_path))
+        sock.close()
+
+        assert forward_to_agent(["say", "hello"], socket_path=socket_path) is None
+        assert ping_agent(socket_path) is None
+
+    def test_opt_out(self, agent):
+        """SAI_NO_AGENT and agent commands always run in-process."""
+        with patch.dict(os.environ, {"SAI_NO_AGENT": "1"}):
+            assert forward_to_agent(["say", "hi"], socket_path=agent.socket_path) is None
+        assert forward_to_agent(["agent", "status"], socket_path=agent.socket_path) is None
+
+
+class TestAgentServer:
+    """Test agent lifecycle."""
+
+    def test_ping_and_stop(self, agent):
+        """A running agent answers pings and stops on request."""
+        status = ping_agent(agent.socket_path)
+        assert status["pid"] == os.getpid()
+
+        assert stop_agent(agent.socket_path)
+        for _ in range(50):
+            if not agent.socket_path.exists():
+                break
+            threading.Event().wait(0.1)
+        assert not agent.socket_path.exists()
+
+    def test_second_agent_is_refused(self, agent):
+        """Only one agent can listen on a socket."""
+        with pytest.raises(AgentError):
+            AgentServer(agent.socket_path, fake_cli).bind()
+
+    def test_socket_is_private(self, agent):
+        """The socket is only accessible to its owner."""
+        assert agent.socket_path.stat().st_mode & 0o077 == 0
@@ -0,0 +1,84 @@
+"""Import-time budget for the sai CLI.
+
+``sai --help``, ``sai --version`` and shell completion import the CLI module
+on every invocation, so heavy dependencies must only be imported by the
+commands that use them.
+"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+# Total import time allowed for ``python -m sai.cli.main --help``, in
+# microseconds. Loading everything eagerly takes well over twice as long.
+IMPORT_TIME_BUDGET_US = 300_000
+
+# Modules that only specific commands need
+HEAVY_MODULES = [
+    "jinja2",
+    "jsonschema",
+    "pydantic",
+    "yaml",
+    "sai.core.execution_engine",
+    "sai.core.saidata_loader",
+    "sai.core.saidata_repository_manager",
+    "sai.core.git_repository_handler",
+    "sai.core.tarball_repository_handler",
+    "sai.providers.loader",
+    "sai.providers.base",
+    "sai.utils.config",
+]
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+
+
+def _run_importtime(*args: str) -> Dict[str, int]:
+    """Run the CLI with -X importtime and collect top-level import times.
+
+    Returns:
+        Dictionary mapping every imported module to its cumulative time in
+        microseconds, with nested imports included in their importer's time
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "sai.cli.main", *args],
+        cwd=Path(__file__).resolve().parents[2],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+    modules = {}
+    top_level_total = 0
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if not match:
+            continue
+        modules[match.group(4)] = int(match.group(2))
+        if len(match.group(3)) == 1:
+            top_level_total += int(match.group(2))
+
+    modules["<total>"] = top_level_total
+    return modules
+
+
+@pytest.mark.parametrize("args", [("--help",), ("--version",)])
+def test_heavy_modules_are_not_imported(args):
+    """Help and version output do not load providers, models or repositories."""
+    modules = _run_importtime(*args)
+
+    assert not [module for module in HEAVY_MODULES if module in modules]
+
+
+def test_help_import_time_budget():
+    """Importing the CLI for --help stays within the import-time budget."""
+    total = _run_importtime("--help")["<total>"]
+
+    assert total <= IMPORT_TIME_BUDGET_US, (
+        f"python -m sai.cli.main --help spent {total / 1000:.0f}ms importing modules, "
+        f"budget is {IMPORT_TIME_BUDGET_US / 1000:.0f}ms"
+    )
@@ -414,6 +414,27 @@ class TestCLICommands:
         kwargs = mock_execute.call_args[1]
         assert kwargs.get("use_cache") is False
 
+    @patch("sai.providers.base.BaseProvider.is_available", return_value=False)
+    @patch("sai.cli.main.ProviderLoader")
+    def test_providers_list_command(self, mock_provider_loader, mock_is_available):
+        """Test listing providers with concurrent availability detection."""
+        from sai.models.provider_data import Action, Provider, ProviderData, ProviderType
+
+        provider_data = ProviderData(
+            version="0.1",
+            provider=Provider(name="test-provider", type=ProviderType.PACKAGE_MANAGER),
+            actions={"install": Action(command="test-cmd install")},
+        )
+        mock_provider_loader.return_value.load_all_providers.return_value = {
+            "test-provider": provider_data
+        }
+
+        result = self.runner.invoke(cli, ["providers", "list"])
+
+        assert result.exit_code == 0
+        assert "test-provider" in result.output
+        assert "Not available" in result.output
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
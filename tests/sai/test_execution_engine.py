@@ -184,6 +184,57 @@ class TestExecutionEngine:
         assert "install" in actions["test-provider"]
         assert "uninstall" in actions["test-provider"]
 
+    def test_routing_table_orders_by_priority(self, sample_saidata):
+        """Test that providers are routed by priority, resolved once at construction."""
+        providers = []
+        for name, priority, actions in [
+            ("low", 10, ["install"]),
+            ("high", 90, ["install", "start"]),
+            ("mid", 50, ["install"]),
+        ]:
+            provider = BaseProvider(
+                ProviderData(
+                    version="0.1",
+                    provider=Provider(
+                        name=name, type=ProviderType.PACKAGE_MANAGER, priority=priority
+                    ),
+                    actions={action: Action(command=f"{name} {action}") for action in actions},
+                )
+            )
+            provider.is_available = Mock(return_value=True)
+            providers.append(provider)
+
+        with patch("sai.core.execution_engine.get_platform", return_value="linux") as mock_platform:
+            engine = ExecutionEngine(providers)
+        assert mock_platform.call_count == 1
+
+        assert engine.get_supported_actions(by_action=True) == {
+            "install": ["high", "mid", "low"],
+            "start": ["high"],
+        }
+
+        context = ExecutionContext(action="install", software="test", saidata=sample_saidata)
+        with patch.object(BaseProvider, "get_priority") as mock_priority:
+            assert engine._select_provider(context).name == "high"
+        mock_priority.assert_not_called()
+
+    def test_routing_table_is_read_only(self, execution_engine):
+        """Test that the routing table cannot be modified after construction."""
+        with pytest.raises(TypeError):
+            execution_engine._routing_table["install"] = ()
+
+    def test_requested_provider_without_action(self, execution_engine, sample_saidata):
+        """Test selecting a requested provider that lacks the action."""
+        context = ExecutionContext(
+            action="start",
+            software="test-software",
+            saidata=sample_saidata,
+            provider="test-provider",
+        )
+
+        with pytest.raises(ProviderSelectionError, match="does not support action 'start'"):
+            execution_engine._select_provider(context)
+
     @patch("sai.core.execution_engine.subprocess.Popen")
     def test_actual_execution_success(self, mock_popen, execution_engine, sample_saidata):
         """Test actual command execution (success case)."""
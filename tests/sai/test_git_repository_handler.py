@@ -8,8 +8,15 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from sai.core.git_repository_handler import GitOperationResult, GitRepositoryHandler, RepositoryInfo
-from sai.models.config import RepositoryAuthType
+from sai.core.git_repository_handler import (
+    GitOperationResult,
+    GitRepositoryHandler,
+    RepositoryInfo,
+    SparseCheckoutProfile,
+)
+from sai.core.saidata_repository_manager import SaidataRepositoryManager
+from sai.models.config import RepositoryAuthType, SaiConfig
+from sai.utils.security import SecurityLevel
 
 
 class TestGitRepositoryHandler:
@@ -400,3 +407,195 @@ def temp_repo_dir():
     yield temp_dir
     if temp_dir.exists():
         shutil.rmtree(temp_dir)
+
+
+def _git(*args, cwd=None):
+    """Run a git command for test setup."""
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def saidata_remote(tmp_path):
+    """Create a bare saidata repository serving partial clones over file://."""
+    source = tmp_path / "source"
+    for directory in ("ng/nginx", "re/redis"):
+        software_dir = source / "software" / directory
+        (software_dir / "ubuntu").mkdir(parents=True)
+        (software_dir / "debian").mkdir()
+        (software_dir / "default.yaml").write_text(
+            f"version: '0.3'\nmetadata:\n  name: {software_dir.name}\n"
+        )
+        (software_dir / "ubuntu" / "22.04.yaml").write_text(f"# {directory} on ubuntu\n")
+        (software_dir / "debian" / "12.yaml").write_text(f"# {directory} on debian\n")
+    (source / "schemas").mkdir()
+    (source / "schemas" / "saidata.json").write_text("{}")
+    (source / "README.md").write_text("saidata\n")
+
+    _git("init", "-q", "-b", "main", str(source))
+    _git("add", ".", cwd=source)
+    _git("commit", "-q", "-m", "Initial saidata", cwd=source)
+
+    bare = tmp_path / "saidata.git"
+    _git("clone", "-q", "--bare", str(source), str(bare))
+    _git("config", "uploadpack.allowFilter", "true", cwd=bare)
+    return f"file://localhost{bare}"
+
+
+def _checked_out_files(repo_dir):
+    """List the files of a working tree relative to its root."""
+    return sorted(
+        path.relative_to(repo_dir).as_posix()
+        for path in repo_dir.rglob("*")
+        if path.is_file() and ".git" not in path.relative_to(repo_dir).parts
+    )
+
+
+class TestSparseCheckoutProfile:
+    """Test cases for sparse-checkout pattern generation."""
+
+    def test_default_profile_checks_out_all_software(self):
+        """Without limits every software directory is checked out."""
+        assert SparseCheckoutProfile().get_patterns() == ["/*", "!/*/", "/software/*/*/"]
+
+    def test_profile_limits_prefixes_and_os_overrides(self):
+        """Prefixes select software directories, OS ids select override directories."""
+        profile = SparseCheckoutProfile(prefixes=["ng"], os_ids=["ubuntu"])
+
+        assert profile.get_patterns() == [
+            "/*",
+            "!/*/",
+            "/software/ng/*/",
+            "!/software/ng/*/*/",
+            "/software/ng/*/ubuntu/",
+        ]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+class TestPartialClone:
+    """Test cases for partial clones and sparse checkouts of a local bare repository."""
+
+    @pytest.fixture
+    def handler(self):
+        """Handler accepting file:// URLs."""
+        return GitRepositoryHandler(
+            timeout=30, max_retries=1, security_level=SecurityLevel.PERMISSIVE
+        )
+
+    def test_partial_clone_fetches_no_unneeded_blobs(self, handler, saidata_remote, tmp_path):
+        """A blobless sparse clone only fetches the contents of checked out files."""
+        repo_dir = tmp_path / "clone"
+        result = handler.clone_repository(
+            saidata_remote,
+            repo_dir,
+            verify_signatures=False,
+            partial_clone=True,
+            sparse_profile=SparseCheckoutProfile(os_ids=["ubuntu"]),
+        )
+
+        assert result.success, result.stderr
+        assert _checked_out_files(repo_dir) == [
+            "README.md",
+            "software/ng/nginx/default.yaml",
+            "software/ng/nginx/ubuntu/22.04.yaml",
+            "software/re/redis/default.yaml",
+            "software/re/redis/ubuntu/22.04.yaml",
+        ]
+        missing = subprocess.run(
+            ["git", "-C", str(repo_dir), "rev-list", "--objects", "--missing=print", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        # The debian overrides and the schema were never downloaded
+        assert sum(line.startswith("?") for line in missing.splitlines()) == 3
+
+    def test_hydrate_paths_adds_software(self, handler, saidata_remote, tmp_path):
+        """Software outside the sparse profile is checked out on demand."""
+        repo_dir = tmp_path / "clone"
+        profile = SparseCheckoutProfile(prefixes=["ng"], os_ids=["ubuntu"])
+        handler.clone_repository(
+            saidata_remote,
+            repo_dir,
+            verify_signatures=False,
+            partial_clone=True,
+            sparse_profile=profile,
+        )
+        assert handler.is_sparse_checkout(repo_dir)
+        assert not (repo_dir / "software/re/redis").exists()
+
+        result = handler.hydrate_paths(repo_dir, ["software/re/redis"], profile)
+
+        assert result.success
+        assert (repo_dir / "software/re/redis/default.yaml").exists()
+        assert (repo_dir / "software/re/redis/ubuntu/22.04.yaml").exists()
+        assert not (repo_dir / "software/re/redis/debian").exists()
+
+    def test_hydrate_unknown_paths_is_skipped(self, handler, saidata_remote, tmp_path):
+        """Directories missing from the repository are not added."""
+        repo_dir = tmp_path / "clone"
+        handler.clone_repository(
+            saidata_remote,
+            repo_dir,
+            verify_signatures=False,
+            sparse_profile=SparseCheckoutProfile(prefixes=["ng"]),
+        )
+
+        with patch.object(handler, "_execute_git_command_with_retry") as execute:
+            result = handler.hydrate_paths(repo_dir, ["software/my/mysql"])
+
+        assert not result.success
+        execute.assert_not_called()
+
+    def test_update_keeps_sparse_checkout(self, handler, saidata_remote, tmp_path):
+        """Updates of a sparse checkout only materialize files in the profile."""
+        repo_dir = tmp_path / "clone"
+        handler.clone_repository(
+            saidata_remote,
+            repo_dir,
+            verify_signatures=False,
+            partial_clone=True,
+            sparse_profile=SparseCheckoutProfile(os_ids=["ubuntu"]),
+        )
+        source = tmp_path / "source"
+        (source / "software/my/mysql/debian").mkdir(parents=True)
+        (source / "software/my/mysql/default.yaml").write_text("metadata:\n  name: mysql\n")
+        (source / "software/my/mysql/debian/12.yaml").write_text("packages: []\n")
+        _git("add", ".", cwd=source)
+        _git("commit", "-q", "-m", "Add mysql", cwd=source)
+        _git("push", "-q", str(tmp_path / "saidata.git"), "main", cwd=source)
+
+        result = handler.update_repository(repo_dir)
+
+        assert result.success
+        assert (repo_dir / "software/my/mysql/default.yaml").exists()
+        assert not (repo_dir / "software/my/mysql/debian").exists()
+
+    def test_manager_hydrates_missing_software(self, handler, saidata_remote, tmp_path):
+        """The repository manager checks out software missing from a sparse clone."""
+        config = SaiConfig(
+            cache_directory=tmp_path / "cache",
+            saidata_sparse_checkout=True,
+            saidata_sparse_prefixes=["ng"],
+        )
+        manager = SaidataRepositoryManager(config)
+        manager.git_handler = handler
+        manager.is_offline_mode = Mock(return_value=False)
+        manager._should_update_repository = Mock(return_value=False)
+        handler.clone_repository(
+            saidata_remote,
+            manager.repository_path,
+            verify_signatures=False,
+            partial_clone=True,
+            sparse_profile=manager._get_sparse_profile(),
+        )
+        assert not (manager.repository_path / "software/re/redis").exists()
+
+        saidata = manager.get_saidata("redis")
+
+        assert saidata.metadata.name == "redis"
+        assert (manager.repository_path / "software/re/redis/default.yaml").exists()
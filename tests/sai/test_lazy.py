@@ -0,0 +1,28 @@
+"""Tests for deferred imports."""
+
+import importlib
+
+import pytest
+
+from sai.utils.lazy import make_lazy_getattr
+
+
+@pytest.mark.parametrize("package", ["sai", "sai.core", "sai.models", "sai.providers"])
+def test_package_exports_resolve(package):
+    """Every public name of a package is imported on first use."""
+    module = importlib.import_module(package)
+
+    for name in module.__all__:
+        assert getattr(module, name).__name__ == name
+
+
+def test_lazy_getattr_caches_in_namespace():
+    """Imported names are stored in the namespace and unknown names are rejected."""
+    namespace = {}
+    lazy_getattr = make_lazy_getattr("sai.utils", {"SaiError": ".errors"}, namespace)
+
+    error_class = lazy_getattr("SaiError")
+
+    assert namespace == {"SaiError": error_class}
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        lazy_getattr("missing")
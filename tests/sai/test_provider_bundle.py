@@ -0,0 +1,196 @@
+"""Tests for the precompiled provider bundle."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from sai.providers.bundle import ProviderBundle
+from sai.providers.loader import ProviderLoader
+from sai.utils.yaml_loader import safe_load
+
+
+def _write_provider(directory, name, template="install {{saidata.metadata.name}}"):
+    """Write a minimal valid provider YAML file and return its path."""
+    provider_file = directory / f"{name}.yaml"
+    provider_file.write_text(
+        yaml.dump(
+            {
+                "version": "1.0",
+                "provider": {"name": name, "type": "package_manager"},
+                "actions": {"install": {"template": template}},
+            }
+        )
+    )
+    return provider_file
+
+
+@pytest.fixture
+def provider_dir(tmp_path):
+    """Directory with two provider files."""
+    directory = tmp_path / "providers"
+    directory.mkdir()
+    _write_provider(directory, "apt")
+    _write_provider(directory, "brew")
+    return directory
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    """Path of the bundle file."""
+    return tmp_path / "cache" / "providers.bundle"
+
+
+def _make_loader(bundle_path):
+    """Create a loader that only reads from the test directories."""
+    loader = ProviderLoader(bundle_path=bundle_path)
+    loader.get_default_provider_directories = lambda: []
+    return loader
+
+
+class TestProviderBundle:
+    """Test cases for ProviderBundle."""
+
+    def test_round_trip(self, provider_dir, bundle_path):
+        """Saved entries are returned by a fresh bundle."""
+        provider_file = provider_dir / "apt.yaml"
+        data = ProviderLoader(enable_caching=False).load_provider_file(provider_file)
+
+        bundle = ProviderBundle(bundle_path)
+        bundle.put(provider_file, data)
+        assert bundle.save() is True
+        assert bundle.save() is False
+
+        reloaded = ProviderBundle(bundle_path).get(provider_file)
+        assert reloaded is not None
+        assert reloaded.provider.name == "apt"
+
+    def test_bundle_file_is_private(self, provider_dir, bundle_path):
+        """The bundle is written with owner-only permissions."""
+        provider_file = provider_dir / "apt.yaml"
+        bundle = ProviderBundle(bundle_path)
+        bundle.put(
+            provider_file, ProviderLoader(enable_caching=False).load_provider_file(provider_file)
+        )
+        bundle.save()
+
+        assert bundle_path.stat().st_mode & 0o077 == 0
+
+    def test_stale_entry_is_ignored(self, provider_dir, bundle_path):
+        """Entries whose file changed are not returned."""
+        provider_file = provider_dir / "apt.yaml"
+        bundle = ProviderBundle(bundle_path)
+        bundle.put(
+            provider_file, ProviderLoader(enable_caching=False).load_provider_file(provider_file)
+        )
+        bundle.save()
+
+        _write_provider(
+            provider_dir, "apt", template="apt-get install -y {{saidata.metadata.name}}"
+        )
+
+        assert ProviderBundle(bundle_path).get(provider_file) is None
+
+    def test_header_mismatch_discards_bundle(self, provider_dir, bundle_path):
+        """A bundle written for a different schema is discarded."""
+        provider_file = provider_dir / "apt.yaml"
+        bundle = ProviderBundle(bundle_path)
+        bundle.put(
+            provider_file, ProviderLoader(enable_caching=False).load_provider_file(provider_file)
+        )
+        bundle.save()
+
+        other_schema = provider_dir / "schema.json"
+        other_schema.write_text("{}")
+
+        assert ProviderBundle(bundle_path, other_schema).get(provider_file) is None
+
+    def test_corrupt_bundle_is_ignored(self, provider_dir, bundle_path):
+        """An unreadable bundle behaves like an empty one."""
+        bundle_path.parent.mkdir(parents=True)
+        bundle_path.write_bytes(b"not a pickle")
+        os.chmod(bundle_path, 0o600)
+
+        bundle = ProviderBundle(bundle_path)
+
+        assert bundle.get(provider_dir / "apt.yaml") is None
+        assert bundle.is_dirty
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions only")
+    def test_writable_bundle_is_not_trusted(self, provider_dir, bundle_path):
+        """A group/world-writable bundle is never unpickled."""
+        provider_file = provider_dir / "apt.yaml"
+        bundle = ProviderBundle(bundle_path)
+        bundle.put(
+            provider_file, ProviderLoader(enable_caching=False).load_provider_file(provider_file)
+        )
+        bundle.save()
+        os.chmod(bundle_path, 0o666)
+
+        with patch("sai.providers.bundle.pickle.load") as mock_load:
+            assert ProviderBundle(bundle_path).get(provider_file) is None
+            mock_load.assert_not_called()
+
+    def test_prune_removes_deleted_files(self, provider_dir, bundle_path):
+        """Entries for deleted provider files are pruned."""
+        loader = ProviderLoader(enable_caching=False)
+        bundle = ProviderBundle(bundle_path)
+        for name in ("apt", "brew"):
+            provider_file = provider_dir / f"{name}.yaml"
+            bundle.put(provider_file, loader.load_provider_file(provider_file))
+
+        (provider_dir / "brew.yaml").unlink()
+
+        assert bundle.prune() == 1
+        assert len(bundle) == 1
+
+
+class TestProviderLoaderBundle:
+    """Test ProviderLoader integration with ProviderBundle."""
+
+    def test_warm_start_skips_parsing(self, provider_dir, bundle_path):
+        """A second loader reuses the bundle without parsing YAML."""
+        cold = _make_loader(bundle_path).load_all_providers([provider_dir])
+        assert bundle_path.exists()
+
+        with patch("sai.providers.loader.safe_load") as mock_safe_load:
+            warm = _make_loader(bundle_path).load_all_providers([provider_dir])
+
+        mock_safe_load.assert_not_called()
+        assert sorted(warm) == sorted(cold) == ["apt", "brew"]
+
+    def test_changed_file_is_revalidated(self, provider_dir, bundle_path):
+        """Only providers whose file changed are parsed again."""
+        _make_loader(bundle_path).load_all_providers([provider_dir])
+        _write_provider(provider_dir, "brew", template="brew install {{saidata.metadata.name}}")
+
+        with patch("sai.providers.loader.safe_load", wraps=safe_load) as mock_safe_load:
+            providers = _make_loader(bundle_path).load_all_providers([provider_dir])
+
+        assert mock_safe_load.call_count == 1
+        template = providers["brew"].actions["install"].template
+        assert template == "brew install {{saidata.metadata.name}}"
+
+    def test_caching_disabled_uses_no_bundle(self, provider_dir, bundle_path):
+        """No bundle is written when caching is disabled."""
+        loader = ProviderLoader(enable_caching=False, bundle_path=bundle_path)
+        loader.get_default_provider_directories = lambda: []
+        loader.load_all_providers([provider_dir])
+
+        assert not bundle_path.exists()
+
+    def test_compile_bundle(self, provider_dir, bundle_path):
+        """compile_bundle rebuilds the bundle from all provider files."""
+        count, path = _make_loader(bundle_path).compile_bundle([provider_dir])
+
+        assert count == 2
+        assert path == bundle_path
+        assert len(ProviderBundle(bundle_path, ProviderLoader().schema_path)) == 2
+
+    def test_compile_bundle_disabled(self, bundle_path):
+        """compile_bundle fails when caching is disabled."""
+        loader = ProviderLoader(enable_caching=False, bundle_path=bundle_path)
+
+        with pytest.raises(ValueError):
+            loader.compile_bundle()
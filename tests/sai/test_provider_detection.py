@@ -0,0 +1,270 @@
+"""Tests for concurrent provider availability detection."""
+
+import logging
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from pydantic import ValidationError
+
+from sai.models.config import SaiConfig
+from sai.providers.base import ProviderFactory
+from sai.providers.detection import ProviderDetector
+
+
+def _make_provider(name, available=True, delay=0.0, error=None):
+    """Create a provider stand-in whose availability probe takes ``delay`` seconds."""
+    provider = Mock()
+    provider.name = name
+    provider.display_name = name.upper()
+    provider.description = f"{name} provider"
+    provider.type = "package_manager"
+    provider.platforms = ["linux"]
+    provider.capabilities = ["install"]
+    provider.get_supported_actions.return_value = ["install"]
+    provider.get_priority.return_value = 50
+    provider.get_executable_path.return_value = f"/usr/bin/{name}"
+    provider.get_version.return_value = f"{name} 1.0"
+
+    def is_available(use_cache=True):
+        if delay:
+            time.sleep(delay)
+        if error:
+            raise error
+        return available
+
+    provider.is_available.side_effect = is_available
+    return provider
+
+
+class TestProviderDetector:
+    """Test cases for ProviderDetector."""
+
+    def test_detect_availability_preserves_order(self):
+        """Results are keyed by provider name in input order."""
+        providers = [
+            _make_provider("zypper", available=False, delay=0.05),
+            _make_provider("apt", delay=0.01),
+            _make_provider("brew", available=False),
+        ]
+
+        result = ProviderDetector(max_workers=4).detect_availability(providers)
+
+        assert list(result) == ["zypper", "apt", "brew"]
+        assert result == {"zypper": False, "apt": True, "brew": False}
+
+    def test_probes_run_concurrently(self):
+        """Total detection time is bounded by the slowest probe, not the sum."""
+        providers = [_make_provider(f"p{i}", delay=0.2) for i in range(8)]
+
+        start = time.monotonic()
+        result = ProviderDetector(max_workers=8).detect_availability(providers)
+        elapsed = time.monotonic() - start
+
+        assert all(result.values())
+        assert elapsed < 0.2 * 4
+
+    def test_worker_pool_is_bounded(self):
+        """No more than max_workers probes run at the same time."""
+        lock = threading.Lock()
+        running = {"current": 0, "peak": 0}
+
+        def probe(use_cache=True):
+            with lock:
+                running["current"] += 1
+                running["peak"] = max(running["peak"], running["current"])
+            time.sleep(0.05)
+            with lock:
+                running["current"] -= 1
+            return True
+
+        providers = []
+        for i in range(6):
+            provider = _make_provider(f"p{i}")
+            provider.is_available.side_effect = probe
+            providers.append(provider)
+
+        ProviderDetector(max_workers=2).detect_availability(providers)
+
+        assert running["peak"] <= 2
+
+    def test_use_cache_is_forwarded(self):
+        """The use_cache flag reaches every provider probe."""
+        providers = [_make_provider("apt"), _make_provider("brew")]
+
+        ProviderDetector(max_workers=2).detect_availability(providers, use_cache=False)
+
+        for provider in providers:
+            provider.is_available.assert_called_once_with(use_cache=False)
+
+    def test_probe_timeout_marks_provider_unavailable(self):
+        """A probe exceeding the per-probe timeout is reported as unavailable."""
+        providers = [_make_provider("slow", delay=1.0), _make_provider("fast")]
+
+        start = time.monotonic()
+        result = ProviderDetector(max_workers=2, probe_timeout=0.1).detect(providers)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.8
+        assert result["fast"]["available"] is True
+        assert result["slow"]["available"] is False
+        assert "timed out" in result["slow"]["error"]
+
+    def test_global_deadline(self):
+        """Probes still pending at the deadline are reported as unavailable."""
+        providers = [_make_provider(f"slow{i}", delay=1.0) for i in range(3)]
+
+        start = time.monotonic()
+        result = ProviderDetector(max_workers=3, probe_timeout=None, deadline=0.1).detect(providers)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.8
+        assert all(not info["available"] for info in result.values())
+        assert all("deadline" in info["error"] for info in result.values())
+
+    def test_hung_probe_does_not_block_exit(self):
+        """A probe abandoned after its timeout does not keep the process alive."""
+        script = (
+            "import time\n"
+            "from unittest.mock import Mock\n"
+            "from sai.providers.detection import ProviderDetector\n"
+            "hung = Mock()\n"
+            "hung.name = 'hung'\n"
+            "hung.is_available.side_effect = lambda use_cache=True: time.sleep(60)\n"
+            "print(ProviderDetector(probe_timeout=0.1).detect_availability([hung]))\n"
+        )
+
+        start = time.monotonic()
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, timeout=30
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "'hung': False" in result.stdout
+        assert time.monotonic() - start < 20
+
+    def test_probe_error_is_reported(self):
+        """Exceptions raised by a probe are captured per provider."""
+        providers = [
+            _make_provider("broken", error=RuntimeError("boom")),
+            _make_provider("apt"),
+        ]
+
+        result = ProviderDetector(max_workers=2).detect(providers)
+
+        assert result["broken"] == {"name": "broken", "available": False, "error": "boom"}
+        assert result["apt"]["available"] is True
+
+    def test_detect_returns_provider_info(self):
+        """Detailed detection returns the same fields as ProviderFactory.detect_providers."""
+        providers = [_make_provider("apt"), _make_provider("brew", available=False)]
+
+        result = ProviderDetector(max_workers=2).detect(providers)
+
+        assert result["apt"]["executable_path"] == "/usr/bin/apt"
+        assert result["apt"]["version"] == "apt 1.0"
+        assert result["brew"]["executable_path"] is None
+        assert result["brew"]["version"] is None
+        assert set(result["apt"]) == {
+            "name",
+            "display_name",
+            "description",
+            "type",
+            "platforms",
+            "capabilities",
+            "supported_actions",
+            "priority",
+            "available",
+            "executable_path",
+            "version",
+        }
+
+    def test_single_worker_runs_serially(self):
+        """max_workers=1 probes providers in order on the calling thread."""
+        calling_threads = set()
+
+        def probe(use_cache=True):
+            calling_threads.add(threading.get_ident())
+            return True
+
+        providers = [_make_provider("apt"), _make_provider("brew")]
+        for provider in providers:
+            provider.is_available.side_effect = probe
+
+        ProviderDetector(max_workers=1).detect_availability(providers)
+
+        assert calling_threads == {threading.get_ident()}
+
+    def test_from_config(self, tmp_path):
+        """Detection settings are read from the configuration."""
+        config = SaiConfig(
+            cache_directory=tmp_path,
+            provider_detection_workers=3,
+            provider_detection_timeout=5,
+            provider_detection_deadline=20,
+        )
+
+        detector = ProviderDetector.from_config(config)
+
+        assert detector.max_workers == 3
+        assert detector.probe_timeout == 5
+        assert detector.deadline == 20
+
+    @pytest.mark.parametrize(
+        "setting", ["provider_detection_timeout", "provider_detection_deadline"]
+    )
+    def test_detection_limits_must_be_positive(self, setting):
+        """Zero or negative detection time limits are rejected."""
+        with pytest.raises(ValidationError, match="must be positive"):
+            SaiConfig(**{setting: 0})
+
+    def test_from_config_ignores_non_numeric_settings(self):
+        """Non-numeric settings fall back to defaults."""
+        detector = ProviderDetector.from_config(Mock())
+
+        assert detector.max_workers == 8
+
+
+class TestProviderFactoryDetection:
+    """Test ProviderFactory integration with ProviderDetector."""
+
+    def test_detect_providers_uses_detector(self):
+        """detect_providers returns detector results for all created providers."""
+        providers = [_make_provider("apt"), _make_provider("brew", available=False)]
+        factory = ProviderFactory(Mock(), detector=ProviderDetector(max_workers=2))
+        factory.create_providers = Mock(return_value=providers)
+
+        result = factory.detect_providers()
+
+        assert result["apt"]["available"] is True
+        assert result["brew"]["available"] is False
+
+    def test_failed_probe_is_logged_once(self, caplog):
+        """Probe failures are logged by the detector only."""
+        providers = [_make_provider("broken", error=RuntimeError("boom"))]
+        factory = ProviderFactory(Mock(), detector=ProviderDetector(max_workers=2))
+        factory.create_providers = Mock(return_value=providers)
+
+        with caplog.at_level(logging.DEBUG):
+            factory.detect_providers()
+
+        assert [record.levelname for record in caplog.records if "broken" in record.message] == [
+            "ERROR"
+        ]
+
+    def test_create_available_providers(self):
+        """create_available_providers keeps only available providers in order."""
+        providers = [
+            _make_provider("apt"),
+            _make_provider("brew", available=False),
+            _make_provider("snap"),
+        ]
+        factory = ProviderFactory(Mock(), detector=ProviderDetector(max_workers=3))
+        factory.create_providers = Mock(return_value=providers)
+
+        result = factory.create_available_providers()
+
+        assert [p.name for p in result] == ["apt", "snap"]
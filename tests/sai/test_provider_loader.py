@@ -6,7 +6,7 @@ from unittest.mock import patch
 import pytest
 import yaml
 
-from sai.providers.base import BaseProvider, ProviderFactory
+from sai.providers.base import BaseProvider, ProviderFactory, create_provider
 from sai.providers.loader import ProviderLoader, ProviderLoadError, ProviderValidationError
 
 
@@ -197,6 +197,59 @@ class TestProviderLoader:
             assert "string_var" in result.mappings.variables
             assert "object_var" in result.mappings.variables
 
+    def test_shared_state(self, tmp_path):
+        """Test that loaders share loaded providers once sharing is enabled."""
+        provider_file = tmp_path / "test.yaml"
+        provider_file.write_text(
+            yaml.dump(
+                {
+                    "version": "1.0",
+                    "provider": {"name": "test", "type": "package_manager"},
+                    "actions": {"install": {"template": "test install"}},
+                }
+            )
+        )
+        bundle_path = tmp_path / "cache" / "providers.bundle"
+
+        ProviderLoader.enable_shared_state()
+        try:
+            first = ProviderLoader(bundle_path=bundle_path).load_provider_file(provider_file)
+            second = ProviderLoader(bundle_path=bundle_path).load_provider_file(provider_file)
+            assert second is first
+
+            ProviderLoader.clear_shared_state()
+            third = ProviderLoader(bundle_path=bundle_path).load_provider_file(provider_file)
+            assert third is not first
+        finally:
+            ProviderLoader.disable_shared_state()
+
+        assert ProviderLoader(bundle_path=bundle_path)._provider_cache == {}
+
+    def test_shared_provider_instances(self, tmp_path):
+        """Test that provider instances are reused for the same data while sharing."""
+        provider_file = tmp_path / "test.yaml"
+        provider_file.write_text(
+            yaml.dump(
+                {
+                    "version": "1.0",
+                    "provider": {"name": "test", "type": "package_manager"},
+                    "actions": {"install": {"template": "test install"}},
+                }
+            )
+        )
+        provider_data = ProviderLoader().load_provider_file(provider_file)
+        assert create_provider(provider_data) is not create_provider(provider_data)
+
+        ProviderLoader.enable_shared_state()
+        try:
+            first = create_provider(provider_data)
+            assert create_provider(provider_data) is first
+
+            ProviderLoader.clear_shared_state()
+            assert create_provider(provider_data) is not first
+        finally:
+            ProviderLoader.disable_shared_state()
+
 
 class TestBaseProvider:
     """Test cases for BaseProvider."""
@@ -0,0 +1,167 @@
+"""Tests for the provider manifest index and filtered provider loading."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from sai.providers.loader import ProviderLoader
+from sai.providers.manifest import ProviderManifest, ProviderManifestEntry
+
+
+def _write_provider(directory, name, actions=("install",), platforms=None, executable=None):
+    """Write a minimal valid provider YAML file and return its path."""
+    provider = {"name": name, "type": "package_manager"}
+    if platforms:
+        provider["platforms"] = platforms
+    if executable:
+        provider["executable"] = executable
+
+    provider_file = directory / f"{name}.yaml"
+    provider_file.write_text(
+        yaml.dump(
+            {
+                "version": "1.0",
+                "provider": provider,
+                "actions": {
+                    action: {"template": f"{name} {action} {{{{saidata.metadata.name}}}}"}
+                    for action in actions
+                },
+            }
+        )
+    )
+    return provider_file
+
+
+@pytest.fixture
+def provider_dir(tmp_path):
+    """Directory with providers for different actions and platforms."""
+    directory = tmp_path / "providers"
+    directory.mkdir()
+    _write_provider(directory, "apt", actions=("install", "uninstall"), executable="apt-get")
+    _write_provider(directory, "brew", actions=("install",), platforms=["darwin"])
+    _write_provider(directory, "systemd", actions=("start", "stop"))
+    (directory / "broken.yaml").write_text("provider: [not, valid")
+    return directory
+
+
+def _make_loader(tmp_path):
+    """Create a loader that only reads from the test directories."""
+    loader = ProviderLoader(bundle_path=tmp_path / "cache" / "providers.bundle")
+    loader.get_default_provider_directories = lambda: []
+    return loader
+
+
+class TestProviderManifest:
+    """Test cases for ProviderManifest."""
+
+    def test_entries_are_recorded_on_load(self, tmp_path, provider_dir):
+        """Loading providers indexes every file, including invalid ones."""
+        _make_loader(tmp_path).load_all_providers([provider_dir])
+
+        manifest = ProviderManifest(tmp_path / "cache" / "provider-manifest.json")
+        apt = manifest.get(provider_dir / "apt.yaml")
+        assert apt.name == "apt"
+        assert apt.type == "package_manager"
+        assert apt.executable == "apt-get"
+        assert apt.actions == ["install", "uninstall"]
+
+        broken = manifest.get(provider_dir / "broken.yaml")
+        assert broken.name is None
+        assert broken.error
+
+    def test_changed_file_invalidates_entry(self, tmp_path, provider_dir):
+        """Entries are only returned while the file fingerprint matches."""
+        _make_loader(tmp_path).load_all_providers([provider_dir])
+        _write_provider(provider_dir, "apt", actions=("install", "uninstall", "upgrade"))
+
+        manifest = ProviderManifest(tmp_path / "cache" / "provider-manifest.json")
+        assert manifest.get(provider_dir / "apt.yaml") is None
+
+    def test_manifest_is_plain_json(self, tmp_path, provider_dir):
+        """The manifest can be read without loading provider data."""
+        _make_loader(tmp_path).load_all_providers([provider_dir])
+
+        data = json.loads((tmp_path / "cache" / "provider-manifest.json").read_text())
+        assert str(provider_dir / "systemd.yaml") in data["entries"]
+
+    def test_corrupt_manifest_is_ignored(self, tmp_path, provider_dir):
+        """An unreadable manifest behaves like an empty one."""
+        manifest_path = tmp_path / "provider-manifest.json"
+        manifest_path.write_text("{not json")
+
+        assert ProviderManifest(manifest_path).get(provider_dir / "apt.yaml") is None
+
+    def test_entry_matches(self):
+        """Entries are matched by name, action and platform."""
+        entry = ProviderManifestEntry(
+            name="brew", fingerprint=[0, 0], platforms=["darwin"], actions=["install"]
+        )
+
+        assert entry.matches(names=["brew"], action="install")
+        assert not entry.matches(names=["apt"])
+        assert not entry.matches(action="start")
+        with patch("sai.utils.system.get_platform", return_value="linux"):
+            assert not entry.matches(current_platform_only=True)
+        with patch("sai.utils.system.get_platform", return_value="darwin"):
+            assert entry.matches(current_platform_only=True)
+
+
+class TestFilteredProviderLoading:
+    """Test ProviderLoader filtering driven by the manifest."""
+
+    def test_filter_by_action(self, tmp_path, provider_dir):
+        """Only providers defining the action are returned."""
+        providers = _make_loader(tmp_path).load_all_providers([provider_dir], action="start")
+
+        assert list(providers) == ["systemd"]
+
+    def test_filter_by_name(self, tmp_path, provider_dir):
+        """Only the named providers are returned."""
+        providers = _make_loader(tmp_path).load_all_providers([provider_dir], names=["brew"])
+
+        assert list(providers) == ["brew"]
+
+    def test_filter_by_platform(self, tmp_path, provider_dir):
+        """Providers for other platforms are skipped."""
+        with patch("sai.utils.system.get_platform", return_value="linux"):
+            providers = _make_loader(tmp_path).load_all_providers(
+                [provider_dir], current_platform_only=True
+            )
+
+        assert sorted(providers) == ["apt", "systemd"]
+
+    def test_warm_filtered_load_skips_other_providers(self, tmp_path, provider_dir):
+        """With a warm manifest, only matching provider files are loaded."""
+        _make_loader(tmp_path).load_all_providers([provider_dir])
+
+        loader = _make_loader(tmp_path)
+        with patch.object(
+            ProviderLoader, "load_provider_file", autospec=True, wraps=loader.load_provider_file
+        ) as mock_load:
+            providers = loader.load_all_providers([provider_dir], action="start")
+
+        assert list(providers) == ["systemd"]
+        loaded_files = [call.args[1].name for call in mock_load.call_args_list]
+        assert loaded_files == ["systemd.yaml"]
+
+    def test_later_directory_overrides(self, tmp_path, provider_dir):
+        """An override in a later directory wins even if it no longer matches."""
+        override_dir = tmp_path / "override"
+        override_dir.mkdir()
+        _write_provider(override_dir, "systemd", actions=("restart",))
+
+        loader = _make_loader(tmp_path)
+        providers = loader.load_all_providers([provider_dir, override_dir], action="start")
+
+        assert providers == {}
+
+    def test_filters_without_caching(self, tmp_path, provider_dir):
+        """Filters also apply when caching is disabled."""
+        loader = ProviderLoader(enable_caching=False)
+        loader.get_default_provider_directories = lambda: []
+
+        providers = loader.load_all_providers([provider_dir], action="start")
+
+        assert list(providers) == ["systemd"]
@@ -0,0 +1,233 @@
+"""Tests for layered saidata repositories."""
+
+import os
+import shutil
+import subprocess
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from sai.core.git_repository_handler import GitRepositoryHandler
+from sai.core.saidata_catalog import MergedCatalog, build_catalog, load_merged_catalog
+from sai.core.saidata_path import SaidataPath
+from sai.core.saidata_repository_manager import SaidataRepositoryManager
+from sai.models.config import RepositoryMethod, SaiConfig, SaidataRepositorySource
+from sai.utils.security import SecurityLevel
+
+
+def _write_software(base_path, name, description):
+    """Write the default saidata file of a software."""
+    software_dir = base_path / "software" / name[:2] / name
+    software_dir.mkdir(parents=True)
+    (software_dir / "default.yaml").write_text(
+        f"version: '0.3'\nmetadata:\n  name: {name}\n  description: {description}\n"
+    )
+
+
+def _make_remote(tmp_path, name, software):
+    """Create a bare git repository with saidata for the given software."""
+    source = tmp_path / f"{name}-source"
+    for software_name, description in software.items():
+        _write_software(source, software_name, description)
+
+    git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    subprocess.run([*git, "init", "-q", "-b", "main", str(source)], check=True)
+    subprocess.run([*git, "add", "."], cwd=source, check=True)
+    subprocess.run([*git, "commit", "-qm", "saidata"], cwd=source, check=True)
+
+    bare = tmp_path / f"{name}.git"
+    subprocess.run(["git", "clone", "-q", "--bare", str(source), str(bare)], check=True)
+    return f"file://localhost{bare}"
+
+
+@pytest.fixture
+def layer_dirs(tmp_path):
+    """Two repository directories with catalogs, overlay first."""
+    overlay = tmp_path / "overlay"
+    base = tmp_path / "base"
+    _write_software(overlay, "nginx", "Internal nginx")
+    _write_software(overlay, "internal-tool", "Internal tool")
+    _write_software(base, "nginx", "HTTP server")
+    _write_software(base, "redis", "Key-value store")
+    build_catalog(overlay)
+    build_catalog(base)
+    return overlay, base
+
+
+class TestRepositorySourceConfig:
+    """Test cases for layered repository configuration."""
+
+    def test_local_remotes_are_allowed(self):
+        """Layers may be fetched from local file:// remotes."""
+        source = SaidataRepositorySource(url="file:///srv/saidata.git", method="git")
+
+        assert source.branch == "main"
+        assert source.method == RepositoryMethod.GIT
+
+    def test_invalid_url_is_rejected(self):
+        """Layer URLs are validated like the primary repository URL."""
+        with pytest.raises(ValidationError, match="Invalid repository URL format"):
+            SaiConfig(saidata_repositories=[{"url": "/srv/saidata"}])
+
+
+class TestMergedCatalog:
+    """Test cases for the merged catalog of repository layers."""
+
+    def test_layer_precedence(self, layer_dirs):
+        """The first layer with a software wins, all layers are kept in order."""
+        overlay, base = layer_dirs
+
+        merged = load_merged_catalog([overlay, base])
+
+        assert merged.get_layer("nginx") == overlay
+        assert merged.get_layer("redis") == base
+        assert merged.get_layer("missing") is None
+        assert merged.resolve("nginx") == [
+            overlay / "software/ng/nginx/default.yaml",
+            base / "software/ng/nginx/default.yaml",
+        ]
+        assert merged.names() == ["internal-tool", "nginx", "redis"]
+
+    def test_merged_catalog_is_reused_until_a_layer_changes(self, layer_dirs):
+        """Unchanged layer catalogs are not merged again."""
+        overlay, base = layer_dirs
+
+        first = load_merged_catalog([overlay, base])
+        assert load_merged_catalog([overlay, base]) is first
+
+        _write_software(base, "mysql", "Database")
+        build_catalog(base)
+        second = load_merged_catalog([overlay, base])
+
+        assert second is not first
+        assert "mysql" in second
+
+    def test_outdated_layer_is_not_trusted(self, tmp_path):
+        """Software added to a layer after its catalog was built is not hidden."""
+        overlay, base = tmp_path / "overlay", tmp_path / "base"
+        _write_software(overlay, "nginx", "Internal nginx")
+        _write_software(base, "redis", "Key-value store")
+        past = time.time() - 3600
+        for directory in (overlay / "software", overlay / "software" / "ng"):
+            os.utime(directory, (past, past))
+        build_catalog(overlay)
+        build_catalog(base)
+
+        _write_software(overlay, "ngrok", "Tunnels")
+        merged = load_merged_catalog([overlay, base])
+
+        assert not merged.is_current("ngrok")
+        assert merged.is_current("redis")
+
+    def test_layer_without_catalog(self, layer_dirs, tmp_path):
+        """Missing layers are skipped, layers without a catalog disable the merged catalog."""
+        overlay, base = layer_dirs
+        uncataloged = tmp_path / "uncataloged"
+        _write_software(uncataloged, "nginx", "Local nginx")
+
+        assert load_merged_catalog([tmp_path / "missing", base]).base_paths == [base]
+        assert load_merged_catalog([uncataloged, base]) is None
+
+    def test_empty_merged_catalog(self):
+        """A merged catalog of no layers has no software."""
+        merged = MergedCatalog([])
+
+        assert len(merged) == 0
+        assert merged.resolve("nginx") == []
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+class TestLayeredRepositories:
+    """Test cases for managers of layered repositories."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """Configuration with an internal overlay on top of a base repository."""
+        base_remote = _make_remote(
+            tmp_path, "base", {"nginx": "HTTP server", "redis": "Key-value store"}
+        )
+        overlay_remote = _make_remote(
+            tmp_path, "overlay", {"nginx": "Internal nginx", "internal-tool": "Internal tool"}
+        )
+        config = SaiConfig(
+            cache_directory=tmp_path / "cache",
+            saidata_paths=[],
+            saidata_repository_method="git",
+            saidata_repositories=[SaidataRepositorySource(url=overlay_remote, method="git")],
+        )
+        # Only layers accept file:// remotes, so the primary URL is set without validation
+        return config.model_copy(update={"saidata_repository_url": base_remote})
+
+    @pytest.fixture
+    def manager(self, config):
+        """Manager of the layered repositories accepting local remotes."""
+        manager = SaidataRepositoryManager(config)
+        for repository in (manager, *manager.layers):
+            repository.is_offline_mode = Mock(return_value=False)
+            repository.git_handler = GitRepositoryHandler(
+                timeout=30, max_retries=1, security_level=SecurityLevel.PERMISSIVE
+            )
+        return manager
+
+    def test_layers_come_first_in_search_paths(self, manager):
+        """Layers take precedence over the primary repository."""
+        overlay_path, base_path = manager.get_layer_paths()
+
+        assert len(manager.layers) == 1
+        assert manager.layers[0].layers == []
+        assert manager.config.saidata_paths == [str(overlay_path), str(base_path)]
+
+    def test_layers_are_updated_concurrently(self, manager):
+        """Every repository is updated at the same time."""
+        barrier = threading.Barrier(2, timeout=10)
+
+        def update(force=False):
+            barrier.wait()
+            return True
+
+        manager.layers[0].update_repository = Mock(side_effect=update)
+        manager._update_repository = Mock(side_effect=update)
+
+        assert manager.update_repository(force=True)
+        manager.layers[0].update_repository.assert_called_once_with(True)
+        manager._update_repository.assert_called_once_with(True)
+
+    def test_failed_layer_fails_update(self, manager):
+        """The update only succeeds if every layer is available."""
+        manager.layers[0].update_repository = Mock(side_effect=RuntimeError("unreachable"))
+        manager._update_repository = Mock(return_value=True)
+
+        assert not manager.update_repository(force=True)
+
+    def test_overlay_wins_through_merged_catalog(self, manager):
+        """Saidata is resolved across layers with the merged catalog."""
+        assert manager.update_repository(force=True)
+        overlay_path, base_path = manager.get_layer_paths()
+
+        with patch.object(SaidataPath, "find_existing_file") as find_existing_file:
+            result = manager.load_many(["nginx", "redis", "internal-tool"])
+
+        find_existing_file.assert_not_called()
+        assert result.errors == {}
+        assert result.saidata["nginx"].metadata.description == "Internal nginx"
+        assert result.saidata["redis"].metadata.description == "Key-value store"
+        merged = manager.saidata_loader._get_merged_catalog()
+        assert merged.get_layer("nginx") == overlay_path.resolve()
+        assert merged.get_layer("redis") == base_path.resolve()
+
+    def test_missing_layer_is_fetched_before_serving(self, manager):
+        """Background updates do not serve a layer that was never fetched as missing."""
+        assert manager._update_repository(force=True)
+        manager.config.saidata_background_update = True
+
+        with patch(
+            "sai.core.saidata_repository_manager.start_background_update"
+        ) as start_background_update:
+            result = manager.load_many(["internal-tool"])
+
+        start_background_update.assert_not_called()
+        assert result.errors == {}
+        assert manager.layers[0].repository_path.exists()
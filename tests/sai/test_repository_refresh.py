@@ -0,0 +1,249 @@
+"""Tests for background updates of the saidata repository."""
+
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from sai.core import repository_refresh
+from sai.core.repository_refresh import (
+    get_lock_path,
+    hold_update_lock,
+    is_update_running,
+    start_background_update,
+)
+from sai.core.saidata_repository_manager import SaidataRepositoryManager
+from sai.models.config import SaiConfig
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Configuration with background updates and a cached repository."""
+    config = SaiConfig(
+        cache_directory=tmp_path / "cache",
+        saidata_background_update=True,
+        log_file=None,
+    )
+    return config
+
+
+@pytest.fixture
+def repository_path(config):
+    """Create the cached repository directory."""
+    manager = SaidataRepositoryManager(config)
+    software_dir = manager.repository_path / "software" / "ng" / "nginx"
+    software_dir.mkdir(parents=True)
+    (software_dir / "default.yaml").write_text(
+        "version: '0.3'\nmetadata:\n  name: nginx\n  description: HTTP server\n"
+    )
+    return manager.repository_path
+
+
+class TestUpdateLock:
+    """Test cases for the repository update lock."""
+
+    def test_lock_is_exclusive(self, repository_path):
+        """Only one holder gets the update lock."""
+        lock_path = get_lock_path(repository_path)
+
+        with hold_update_lock(lock_path) as locked:
+            assert locked
+            assert is_update_running(repository_path)
+            with hold_update_lock(lock_path) as second:
+                assert not second
+
+        assert not is_update_running(repository_path)
+        assert lock_path.parent == repository_path.parent
+
+    def test_no_update_started_while_running(self, config, repository_path):
+        """A running update is not started twice."""
+        with hold_update_lock(get_lock_path(repository_path)), patch("subprocess.Popen") as popen:
+            assert not start_background_update(config, repository_path)
+
+        popen.assert_not_called()
+
+    def test_no_update_started_right_after_another(self, config, repository_path):
+        """Repeated lookups start at most one update per interval."""
+        with patch("subprocess.Popen") as popen:
+            assert start_background_update(config, repository_path)
+            assert not start_background_update(config, repository_path)
+
+        assert popen.call_count == 1
+
+        stale = time.time() - repository_refresh.BACKGROUND_UPDATE_INTERVAL - 1
+        os.utime(get_lock_path(repository_path), (stale, stale))
+        with patch("subprocess.Popen") as popen:
+            assert start_background_update(config, repository_path)
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX sessions")
+    def test_update_process_is_detached(self, config, repository_path):
+        """The update runs in its own session with the configuration on stdin."""
+        config.saidata_offline_mode = True
+        processes = []
+        real_popen = subprocess.Popen
+
+        def popen(*args, **kwargs):
+            processes.append(real_popen(*args, **kwargs))
+            return processes[-1]
+
+        with patch("subprocess.Popen", side_effect=popen) as spawn:
+            assert start_background_update(config, repository_path)
+
+        assert spawn.call_args.kwargs["start_new_session"] is True
+        assert b"saidata_repository_auth_data" not in b" ".join(
+            arg.encode() for arg in spawn.call_args.args[0]
+        )
+        # Offline, the update keeps the cached repository and succeeds
+        assert processes[0].wait(timeout=60) == 0
+
+
+class TestUpdateProcess:
+    """Test cases for the detached update process."""
+
+    def test_main_reads_configuration_from_stdin(self, config, repository_path):
+        """The update process is configured from the JSON on stdin."""
+        config.saidata_offline_mode = True
+
+        result = subprocess.run(
+            [sys.executable, "-m", "sai.core.repository_refresh"],
+            input=config.model_dump_json().encode(),
+            capture_output=True,
+            timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr.decode()
+
+    def test_update_skipped_when_locked(self, config, repository_path):
+        """A second update process leaves the update to the lock holder."""
+        with hold_update_lock(get_lock_path(repository_path)), patch.object(
+            SaidataRepositoryManager, "update_repository"
+        ) as update:
+            assert repository_refresh.run_update(config)
+
+        update.assert_not_called()
+
+    def test_update_runs_under_lock(self, config, repository_path):
+        """The update holds the lock while it runs."""
+
+        def update_repository(self, force=False):
+            return is_update_running(repository_path)
+
+        with patch.object(SaidataRepositoryManager, "update_repository", update_repository):
+            assert repository_refresh.run_update(config)
+
+    def test_update_process_fetches_locked_repository(self, config, repository_path):
+        """The update process fetches the repository under the lock it holds."""
+        with patch.object(
+            SaidataRepositoryManager, "is_offline_mode", return_value=False
+        ), patch.object(SaidataRepositoryManager, "_fetch_repository", return_value=True) as fetch:
+            assert repository_refresh.run_update(config)
+
+        fetch.assert_called_once()
+
+
+class TestForegroundUpdates:
+    """Test cases for foreground updates while another process updates."""
+
+    @pytest.fixture
+    def manager(self, config):
+        """Manager whose fetches are recorded instead of run."""
+        manager = SaidataRepositoryManager(config)
+        manager.is_offline_mode = Mock(return_value=False)
+        manager._update_with_git = Mock(return_value=True)
+        manager._update_with_tarball = Mock(return_value=True)
+        return manager
+
+    def test_locked_repository_is_not_touched(self, manager, repository_path):
+        """A foreground update uses the cached copy while another process updates it."""
+        with hold_update_lock(get_lock_path(repository_path)):
+            assert manager.update_repository(force=True)
+
+        manager._update_with_git.assert_not_called()
+        manager._update_with_tarball.assert_not_called()
+        assert (repository_path / "software/ng/nginx/default.yaml").exists()
+
+    def test_missing_repository_waits_for_other_update(self, manager, repository_path):
+        """Without a cached copy the update waits for the process fetching it."""
+        shutil.rmtree(repository_path)
+        locked = threading.Event()
+
+        def fetch_elsewhere():
+            with hold_update_lock(get_lock_path(repository_path)):
+                locked.set()
+                time.sleep(0.2)
+                repository_path.mkdir()
+
+        thread = threading.Thread(target=fetch_elsewhere)
+        thread.start()
+        assert locked.wait(timeout=10)
+
+        assert manager.update_repository(force=True)
+        thread.join()
+        manager._update_with_git.assert_not_called()
+        manager._update_with_tarball.assert_not_called()
+
+
+class TestManagerBackgroundUpdates:
+    """Test cases for lookups with background updates enabled."""
+
+    @pytest.fixture
+    def manager(self, config, repository_path):
+        """Manager with an expired repository cache."""
+        manager = SaidataRepositoryManager(config)
+        manager.is_offline_mode = Mock(return_value=False)
+        manager.update_repository = Mock(return_value=True)
+        return manager
+
+    def test_expired_cache_is_served_immediately(self, manager):
+        """Lookups use the cached repository and leave the update to another process."""
+        with patch("sai.core.saidata_repository_manager.start_background_update") as start_update:
+            saidata = manager.get_saidata("nginx")
+
+        assert saidata.metadata.name == "nginx"
+        manager.update_repository.assert_not_called()
+        start_update.assert_called_once_with(manager.config, manager.repository_path)
+
+    def test_valid_cache_starts_no_update(self, manager, repository_path):
+        """Nothing is started while the cache is valid."""
+        manager.repository_cache.is_repository_valid = Mock(return_value=True)
+        manager.repository_cache.get_repository_path = Mock(return_value=repository_path)
+
+        with patch("sai.core.saidata_repository_manager.start_background_update") as start_update:
+            manager.load_many(["nginx"])
+
+        start_update.assert_not_called()
+        manager.update_repository.assert_not_called()
+
+    def test_missing_software_does_not_update(self, manager):
+        """Missing saidata is not fetched synchronously while a local copy exists."""
+        with patch("sai.core.saidata_repository_manager.start_background_update"):
+            result = manager.load_many(["redis"])
+
+        assert "redis" in result.errors
+        manager.update_repository.assert_not_called()
+
+    def test_offline_mode_starts_no_update(self, manager):
+        """No update process is started while offline."""
+        manager.is_offline_mode.return_value = True
+
+        with patch("sai.core.saidata_repository_manager.start_background_update") as start_update:
+            result = manager.load_many(["nginx"])
+
+        assert "nginx" in result.saidata
+        start_update.assert_not_called()
+        manager.update_repository.assert_not_called()
+
+    def test_missing_repository_is_fetched(self, manager, repository_path):
+        """Without a local copy the repository is fetched before serving."""
+        shutil.rmtree(repository_path)
+
+        with patch("sai.core.saidata_repository_manager.start_background_update") as start_update:
+            manager.load_many(["nginx"])
+
+        start_update.assert_not_called()
+        assert manager.update_repository.called
@@ -0,0 +1,230 @@
+"""Tests for incrementally maintained repository file statistics."""
+
+import subprocess
+from unittest.mock import Mock, patch
+
+import pytest
+
+from sai.core.git_repository_handler import GitRepositoryHandler
+from sai.core.repository_cache import RepositoryCache
+from sai.core.repository_stats import FileManifest, get_manifest_path
+from sai.core.saidata_repository_manager import SaidataRepositoryManager
+from sai.models.config import SaiConfig
+
+REPO_URL = "https://github.com/example/saidata"
+
+
+def _git(*args, cwd=None):
+    """Run a git command, failing the test on errors."""
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+def _commit(repo_dir, message):
+    """Commit all changes of a repository and return the commit hash."""
+    _git("add", "-A", cwd=repo_dir)
+    _git(
+        "-c",
+        "user.name=test",
+        "-c",
+        "user.email=test@example.com",
+        "commit",
+        "-qm",
+        message,
+        cwd=repo_dir,
+    )
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=repo_dir, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Repository cache in a temporary directory."""
+    return RepositoryCache(SaiConfig(cache_directory=tmp_path / "cache"))
+
+
+@pytest.fixture
+def repo_path(cache):
+    """Cached repository directory with a few files."""
+    repo_path = cache._get_repository_path(REPO_URL, "main")
+    (repo_path / "software" / "ng" / "nginx").mkdir(parents=True)
+    (repo_path / "software" / "ng" / "nginx" / "default.yaml").write_text("nginx")
+    (repo_path / "README.md").write_text("readme")
+    return repo_path
+
+
+class TestFileManifest:
+    """Test cases for the file manifest."""
+
+    def test_scan_skips_git_directory(self, repo_path):
+        """Git's own files are not repository content."""
+        (repo_path / ".git" / "objects").mkdir(parents=True)
+        (repo_path / ".git" / "objects" / "pack").write_bytes(b"x" * 100)
+
+        manifest = FileManifest.scan(repo_path)
+
+        assert manifest.sizes == {"README.md": 6, "software/ng/nginx/default.yaml": 5}
+        assert (manifest.size_bytes, manifest.file_count) == (11, 2)
+
+    def test_save_and_load(self, repo_path):
+        """The manifest is stored next to the repository directory."""
+        FileManifest.scan(repo_path, revision="abc").save()
+
+        manifest = FileManifest.load(repo_path)
+
+        assert get_manifest_path(repo_path).parent == repo_path.parent
+        assert manifest.revision == "abc"
+        assert manifest.sizes == FileManifest.scan(repo_path).sizes
+
+    def test_apply_changes(self, repo_path):
+        """Changed files are re-examined, everything else is kept as recorded."""
+        manifest = FileManifest.scan(repo_path)
+        (repo_path / "README.md").write_text("longer readme")
+        (repo_path / "software" / "ng" / "nginx" / "default.yaml").unlink()
+        (repo_path / "software" / "re" / "redis").mkdir(parents=True)
+        (repo_path / "software" / "re" / "redis" / "default.yaml").write_text("redis")
+
+        applied = manifest.apply_changes(
+            [
+                "README.md",
+                "software/ng/nginx/default.yaml",
+                "software/re/redis/default.yaml",
+            ]
+        )
+
+        assert applied == 3
+        assert manifest.sizes == {"README.md": 13, "software/re/redis/default.yaml": 5}
+
+    def test_apply_changed_directory(self, repo_path):
+        """A changed directory is walked and files gone from it are dropped."""
+        manifest = FileManifest.scan(repo_path)
+        manifest.sizes["software/ng/nginx/removed.yaml"] = 42
+        (repo_path / "software" / "ng" / "nginx" / "ubuntu").mkdir()
+        (repo_path / "software" / "ng" / "nginx" / "ubuntu" / "22.04.yaml").write_text("ubuntu")
+
+        manifest.apply_changes(["software/ng/nginx/"])
+
+        assert manifest.sizes == {
+            "README.md": 6,
+            "software/ng/nginx/default.yaml": 5,
+            "software/ng/nginx/ubuntu/22.04.yaml": 6,
+        }
+
+
+class TestRepositoryCacheStats:
+    """Test cases for statistics kept in the repository cache metadata."""
+
+    def test_changed_paths_are_applied_without_walk(self, cache, repo_path):
+        """Updates with known changes only look at the changed paths."""
+        cache.mark_repository_updated(REPO_URL, "main", revision="first")
+        (repo_path / "README.md").write_text("a much longer readme")
+
+        with patch.object(FileManifest, "scan") as scan:
+            cache.mark_repository_updated(
+                REPO_URL, "main", revision="second", changed_paths=["README.md"]
+            )
+
+        scan.assert_not_called()
+        status = cache.get_repository_status(REPO_URL, "main")
+        assert status.file_count == 2
+        assert status.size_mb * 1024 * 1024 == pytest.approx(25)
+        assert cache.get_repository_revision(REPO_URL, "main") == "second"
+
+    def test_manifest_of_other_revision_is_rescanned(self, cache, repo_path):
+        """A manifest that does not match the recorded revision is not trusted."""
+        cache.mark_repository_updated(REPO_URL, "main", revision="first")
+        FileManifest(repo_path, {}, revision="other").save()
+        (repo_path / "NEW.md").write_text("new")
+
+        cache.mark_repository_updated(
+            REPO_URL, "main", revision="third", changed_paths=["README.md"]
+        )
+
+        assert cache.get_repository_status(REPO_URL, "main").file_count == 3
+
+    def test_release_file_sizes_are_recorded(self, cache, repo_path):
+        """File sizes reported by an extraction are used as they are."""
+        with patch.object(FileManifest, "scan") as scan:
+            cache.mark_repository_updated(
+                REPO_URL, "main", is_git_repo=False, files={"software/a.yaml": 2048}
+            )
+
+        scan.assert_not_called()
+        status = cache.get_repository_status(REPO_URL, "main")
+        assert status.file_count == 1
+        assert FileManifest.load(repo_path).sizes == {"software/a.yaml": 2048}
+
+    def test_status_reads_recorded_stats(self, cache, repo_path):
+        """Status checks do not walk the repository."""
+        cache.mark_repository_updated(REPO_URL, "main")
+
+        with patch.object(FileManifest, "scan") as scan:
+            status = cache.get_repository_status(REPO_URL, "main")
+
+        scan.assert_not_called()
+        assert status.file_count == 2
+
+    def test_hydrated_paths_update_stats(self, cache, repo_path):
+        """Directories added to a checkout outside an update are counted."""
+        cache.mark_repository_updated(REPO_URL, "main", revision="first")
+        (repo_path / "software" / "re" / "redis").mkdir(parents=True)
+        (repo_path / "software" / "re" / "redis" / "default.yaml").write_text("redis")
+
+        cache.update_repository_stats(REPO_URL, "main", ["software/re/redis"])
+
+        assert cache.get_repository_status(REPO_URL, "main").file_count == 3
+        assert cache.get_repository_revision(REPO_URL, "main") == "first"
+
+
+class TestGitChanges:
+    """Test cases for the paths changed by git updates."""
+
+    @pytest.fixture
+    def git_repo(self, tmp_path):
+        """Git repository with one commit."""
+        repo_dir = tmp_path / "repo"
+        (repo_dir / "software" / "ng" / "nginx").mkdir(parents=True)
+        (repo_dir / "software" / "ng" / "nginx" / "default.yaml").write_text("nginx")
+        (repo_dir / "README.md").write_text("readme")
+        _git("init", "-q", "-b", "main", str(repo_dir))
+        return repo_dir
+
+    def test_changed_paths_between_commits(self, git_repo):
+        """Added, modified and deleted files are listed."""
+        handler = GitRepositoryHandler()
+        first = _commit(git_repo, "first")
+        (git_repo / "README.md").write_text("changed")
+        (git_repo / "software" / "ng" / "nginx" / "default.yaml").unlink()
+        (git_repo / "new file.yaml").write_text("new")
+        second = _commit(git_repo, "second")
+
+        assert handler.get_head_commit(git_repo) == second
+        assert sorted(handler.get_changed_paths(git_repo, first, second)) == [
+            "README.md",
+            "new file.yaml",
+            "software/ng/nginx/default.yaml",
+        ]
+        assert handler.get_changed_paths(git_repo, second, second) == []
+        assert handler.get_changed_paths(git_repo, "0" * 40, second) is None
+
+    def test_manager_passes_changes_to_cache(self, git_repo, tmp_path):
+        """A git update records the new commit and the paths changed since the last one."""
+        first = _commit(git_repo, "first")
+        config = SaiConfig(cache_directory=tmp_path / "cache", saidata_repository_url=REPO_URL)
+        manager = SaidataRepositoryManager(config)
+        manager.git_handler.get_head_commit = Mock(return_value=first)
+        manager.git_handler.get_changed_paths = Mock(return_value=["README.md"])
+        manager.repository_cache.get_repository_revision = Mock(return_value="previous")
+        manager.repository_cache.mark_repository_updated = Mock()
+
+        manager._record_git_changes("git_update")
+        manager._mark_update_successful(
+            revision=manager._git_revision, changed_paths=manager._git_changed_paths
+        )
+
+        manager.git_handler.get_changed_paths.assert_called_once_with(
+            manager.repository_path, "previous", first
+        )
+        kwargs = manager.repository_cache.mark_repository_updated.call_args.kwargs
+        assert kwargs["revision"] == first
+        assert kwargs["changed_paths"] == ["README.md"]
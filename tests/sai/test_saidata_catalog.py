@@ -0,0 +1,249 @@
+"""Tests for the precomputed saidata repository catalog."""
+
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sai.core.saidata_catalog import (
+    SUGGESTION_CANDIDATES,
+    CatalogEntry,
+    SaidataCatalog,
+    _edit_distance,
+    _get_trigrams,
+    build_catalog,
+    get_catalog_path,
+    load_catalog,
+)
+from sai.core.saidata_path import SaidataPath
+
+APACHE_SAIDATA = """version: "0.3"
+metadata:
+  name: apache
+packages:
+  - name: server
+    package_name: httpd
+commands:
+  - name: apachectl
+    aliases: [apache2ctl]
+"""
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Create a small hierarchical saidata repository."""
+    base_path = tmp_path / "saidata-main"
+    apache_dir = base_path / "software" / "ap" / "apache"
+    (apache_dir / "ubuntu").mkdir(parents=True)
+    (apache_dir / "default.yaml").write_text(APACHE_SAIDATA)
+    (apache_dir / "ubuntu" / "22.04.yaml").write_text("version: '0.3'\n")
+
+    nginx_dir = base_path / "software" / "ng" / "nginx"
+    nginx_dir.mkdir(parents=True)
+    (nginx_dir / "default.yml").write_text("version: '0.3'\nmetadata:\n  name: nginx\n")
+
+    # Directories without saidata are not software
+    (base_path / "software" / "ng" / "ngrok").mkdir()
+    return base_path
+
+
+def _backdate(base_path):
+    """Move directory modification times into the past, so later changes are noticed."""
+    past = time.time() - 3600
+    for directory, _, _ in os.walk(base_path):
+        os.utime(directory, (past, past))
+
+
+class TestSaidataCatalog:
+    """Test cases for building and reading the catalog."""
+
+    def test_build_records_files_aliases_and_fingerprints(self, repository):
+        """Building resolves default and override files and collects aliases."""
+        catalog = build_catalog(repository)
+
+        assert catalog.names() == ["apache", "nginx"]
+        apache = catalog.get("apache")
+        assert apache.default == "software/ap/apache/default.yaml"
+        assert apache.overrides == {"ubuntu/22.04": "software/ap/apache/ubuntu/22.04.yaml"}
+        assert apache.aliases == ["apache2ctl", "apachectl", "httpd"]
+        assert set(apache.fingerprints) == {apache.default, *apache.overrides.values()}
+        assert catalog.resolve_default("nginx") == repository / "software/ng/nginx/default.yml"
+        assert catalog.find_by_alias("HTTPD") == ["apache"]
+
+    def test_catalog_is_stored_outside_repository(self, repository):
+        """The catalog file does not add files to the repository checkout."""
+        build_catalog(repository)
+
+        catalog_path = get_catalog_path(repository)
+        assert catalog_path.parent == repository.parent
+        assert json.loads(catalog_path.read_text())["software"]["apache"]["aliases"]
+
+    def test_load_round_trip(self, repository):
+        """A saved catalog loads with the same entries."""
+        built = build_catalog(repository)
+
+        loaded = load_catalog(repository)
+
+        assert loaded.names() == built.names()
+        assert loaded.get("apache") == built.get("apache")
+
+    def test_load_without_catalog(self, repository):
+        """Repositories without a catalog have none to load."""
+        assert load_catalog(repository) is None
+
+    def test_replaced_repository_invalidates_catalog(self, repository):
+        """A catalog is not used for a repository directory that was replaced."""
+        build_catalog(repository)
+        shutil.rmtree(repository / "software")
+        (repository / "software" / "re" / "redis").mkdir(parents=True)
+        (repository / "software" / "re" / "redis" / "default.yaml").write_text("version: '0.3'\n")
+
+        assert load_catalog(repository) is None
+
+    def test_catalog_with_other_version_is_ignored(self, repository):
+        """Catalogs written by another catalog version are not used."""
+        build_catalog(repository)
+        catalog_path = get_catalog_path(repository)
+        data = json.loads(catalog_path.read_text())
+        data["catalog_version"] = "0.1"
+        catalog_path.write_text(json.dumps(data))
+
+        assert load_catalog(repository) is None
+
+    def test_repository_without_software_tree(self, tmp_path):
+        """Directories without a software tree get no catalog."""
+        assert build_catalog(tmp_path) is None
+        assert not get_catalog_path(tmp_path).exists()
+
+
+class TestCatalogLookups:
+    """Test cases for lookups answered from the catalog."""
+
+    def test_find_existing_file_uses_catalog(self, repository):
+        """Resolving a saidata file does not stat candidate files when cataloged."""
+        build_catalog(repository)
+
+        with patch.object(Path, "is_file", side_effect=AssertionError("stat")), patch.object(
+            Path, "exists", side_effect=AssertionError("stat")
+        ):
+            apache = SaidataPath.from_software_name("apache", repository).find_existing_file()
+            nginx = SaidataPath.from_software_name("nginx", repository).find_existing_file()
+            ngrok = SaidataPath.from_software_name("ngrok", repository).find_existing_file()
+
+        assert apache == repository / "software/ap/apache/default.yaml"
+        assert nginx == repository / "software/ng/nginx/default.yml"
+        assert ngrok is None
+
+    def test_find_existing_file_without_catalog(self, repository):
+        """Without a catalog the filesystem is searched as before."""
+        nginx = SaidataPath.from_software_name("nginx", repository).find_existing_file()
+
+        assert nginx == repository / "software/ng/nginx/default.yml"
+
+    def test_loaded_catalog_is_reused(self, repository):
+        """The catalog file is parsed once while it does not change."""
+        build_catalog(repository)
+        load_catalog(repository)
+
+        with patch.object(SaidataCatalog, "_read") as read:
+            assert load_catalog(repository) is not None
+
+        read.assert_not_called()
+
+    def test_completion_uses_catalog(self, repository):
+        """Software name completion lists cataloged software."""
+        from sai.cli.completion import SaidataLoader, complete_software_names
+        from sai.models.config import SaiConfig
+
+        SaidataLoader.resolve()
+
+        build_catalog(repository)
+        config = SaiConfig(saidata_paths=[str(repository)], cache_enabled=False)
+
+        with patch("sai.cli.completion.get_config", return_value=config), patch.object(
+            Path, "iterdir", side_effect=AssertionError("scan")
+        ):
+            assert complete_software_names(None, None, "ng") == ["nginx"]
+
+    def test_new_software_under_existing_prefix(self, repository):
+        """Software added after the catalog was built is found on the filesystem."""
+        _backdate(repository)
+        build_catalog(repository)
+        (repository / "software/ng/ngrok/default.yaml").write_text("version: '0.3'\n")
+        (repository / "software/ng/ngx").mkdir()
+        (repository / "software/ng/ngx/default.yaml").write_text("version: '0.3'\n")
+
+        ngrok = SaidataPath.from_software_name("ngrok", repository).find_existing_file()
+        ngx = SaidataPath.from_software_name("ngx", repository).find_existing_file()
+
+        assert ngrok == repository / "software/ng/ngrok/default.yaml"
+        assert ngx == repository / "software/ng/ngx/default.yaml"
+        assert load_catalog(repository) is None
+        assert load_catalog(repository, "apache") is not None
+
+    def test_new_os_override_directory(self, repository):
+        """A catalog is not trusted for software whose directory changed."""
+        _backdate(repository)
+        build_catalog(repository)
+        (repository / "software/ng/nginx/debian").mkdir()
+
+        assert load_catalog(repository, "nginx") is None
+        assert load_catalog(repository, "apache") is not None
+
+
+class TestCatalogSuggestions:
+    """Test cases for "did you mean" suggestions."""
+
+    @staticmethod
+    def _catalog(names):
+        entries = {
+            name: CatalogEntry(name=name, default=f"software/{name[:2]}/{name}/default.yaml")
+            for name in names
+        }
+        return SaidataCatalog(Path("/repo"), entries)
+
+    def test_transposition_is_suggested(self):
+        """Swapped adjacent letters count as a single edit."""
+        catalog = self._catalog(["nginx", "ngrok", "nodejs", "apache"])
+
+        assert catalog.suggest("ngnix")[0] == "nginx"
+
+    def test_suggestions_are_ranked_by_edit_distance(self):
+        """Closer names come first, longer names containing the query last."""
+        catalog = self._catalog(["redis", "redis-cli", "reds", "rediss", "mysql"])
+
+        assert catalog.suggest("rediz") == ["redis", "rediss", "reds"]
+        assert catalog.suggest("mysq") == ["mysql"]
+        assert "redis-cli" in catalog.suggest("redis")
+
+    def test_unrelated_names_are_not_suggested(self):
+        """Names without shared trigrams are not suggested."""
+        catalog = self._catalog(["nginx", "apache"])
+
+        assert catalog.suggest("zzz") == []
+
+    def test_trigram_index_is_persisted(self, repository):
+        """The trigram index is saved with the catalog and not rebuilt on load."""
+        build_catalog(repository)
+
+        with patch("sai.core.saidata_catalog._get_trigrams", wraps=_get_trigrams) as trigrams:
+            catalog = load_catalog(repository)
+            assert catalog.suggest("ngnix") == ["nginx"]
+
+        # Only the query is split into trigrams
+        assert trigrams.call_count == 1
+
+    def test_large_catalog(self):
+        """Suggestions look at a bounded number of candidates."""
+        names = [f"pkg{i:05d}" for i in range(20000)] + ["postgresql"]
+        catalog = self._catalog(names)
+        catalog.trigram_index
+
+        with patch("sai.core.saidata_catalog._edit_distance", wraps=_edit_distance) as distance:
+            assert catalog.suggest("postgersql") == ["postgresql"]
+
+        assert distance.call_count <= SUGGESTION_CANDIDATES
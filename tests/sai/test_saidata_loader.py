@@ -3,6 +3,7 @@
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
 import yaml
@@ -12,7 +13,9 @@ from sai.core.saidata_loader import (
     SaidataNotFoundError,
     ValidationError,
     ValidationResult,
+    clear_validated_saidata_cache,
 )
+from sai.core.saidata_path import SaidataPath
 from sai.models.config import SaiConfig
 from sai.models.saidata import SaiData
 
@@ -338,3 +341,183 @@ class TestValidationResult:
         assert not mixed_result.valid
         assert mixed_result.has_errors
         assert mixed_result.has_warnings
+
+
+def _spy_validation():
+    """Count calls to SaidataLoader.validate_saidata while still validating."""
+    return patch.object(
+        SaidataLoader, "validate_saidata", autospec=True, side_effect=SaidataLoader.validate_saidata
+    )
+
+
+class TestValidatedSaidataCache:
+    """Test reuse of validated saidata across loads."""
+
+    @pytest.fixture
+    def saidata_setup(self, tmp_path):
+        """A saidata repository with one software and a loader configuration."""
+        saidata_path = SaidataPath.from_software_name("nginx", tmp_path / "saidata")
+        saidata_path.get_directory().mkdir(parents=True)
+
+        def write_saidata(description):
+            saidata_path.hierarchical_path.write_text(
+                yaml.dump(
+                    {
+                        "version": "0.3",
+                        "metadata": {"name": "nginx", "description": description},
+                        "packages": [{"name": "nginx", "package_name": "nginx"}],
+                    }
+                )
+            )
+
+        write_saidata("Web server")
+        config = SaiConfig(
+            saidata_paths=[str(tmp_path / "saidata")], cache_directory=tmp_path / "cache"
+        )
+
+        clear_validated_saidata_cache()
+        yield config, write_saidata
+        clear_validated_saidata_cache()
+
+    def test_repeated_loads_share_validated_object(self, saidata_setup):
+        """Loading unchanged saidata again skips validation and model construction."""
+        config, _ = saidata_setup
+        loader = SaidataLoader(config)
+
+        with _spy_validation() as mock_validate:
+            first = loader.load_saidata("nginx")
+            second = SaidataLoader(config).load_saidata("nginx")
+
+        assert second is first
+        assert mock_validate.call_count == 1
+
+    def test_persisted_entry_skips_validation(self, saidata_setup):
+        """A new process reuses the validated cache entry without validating again."""
+        config, _ = saidata_setup
+        first = SaidataLoader(config).load_saidata("nginx")
+        clear_validated_saidata_cache()
+
+        with patch.object(SaidataLoader, "validate_saidata") as mock_validate:
+            second = SaidataLoader(config).load_saidata("nginx")
+
+        mock_validate.assert_not_called()
+        assert second == first
+
+    def test_changed_file_is_validated_again(self, saidata_setup):
+        """Editing the saidata file yields a freshly validated object."""
+        config, write_saidata = saidata_setup
+        loader = SaidataLoader(config)
+        loader.load_saidata("nginx")
+
+        write_saidata("High performance web server")
+
+        with _spy_validation() as mock_validate:
+            saidata = loader.load_saidata("nginx")
+
+        assert saidata.metadata.description == "High performance web server"
+        assert mock_validate.call_count == 1
+
+    def test_new_sai_version_validates_again(self, saidata_setup):
+        """Cached entries validated by another SAI version are validated again."""
+        config, _ = saidata_setup
+        SaidataLoader(config).load_saidata("nginx")
+        clear_validated_saidata_cache()
+
+        loader = SaidataLoader(config)
+        with patch(
+            "sai.core.saidata_loader.get_version", return_value="99.0.0"
+        ), _spy_validation() as mock_validate:
+            loader.load_saidata("nginx")
+
+        assert mock_validate.call_count == 1
+
+    def test_invalid_saidata_is_not_cached(self, saidata_setup):
+        """Saidata failing validation is rejected on every load."""
+        config, _ = saidata_setup
+        loader = SaidataLoader(config)
+        invalid = ValidationResult(valid=False, errors=["broken"], warnings=[])
+
+        with patch.object(SaidataLoader, "validate_saidata", return_value=invalid):
+            for _ in range(2):
+                with pytest.raises(ValidationError):
+                    loader.load_saidata("nginx")
+
+
+class TestLoadMany:
+    """Test bulk saidata loading."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """A saidata repository with several software and a loader configuration."""
+        for name in ("nginx", "redis", "mysql"):
+            saidata_path = SaidataPath.from_software_name(name, tmp_path / "saidata")
+            saidata_path.get_directory().mkdir(parents=True)
+            saidata_path.hierarchical_path.write_text(
+                yaml.dump(
+                    {
+                        "version": "0.3",
+                        "metadata": {"name": name},
+                        "packages": [{"name": name, "package_name": name}],
+                    }
+                )
+            )
+
+        clear_validated_saidata_cache()
+        yield SaiConfig(
+            saidata_paths=[str(tmp_path / "saidata")], cache_directory=tmp_path / "cache"
+        )
+        clear_validated_saidata_cache()
+
+    def test_load_many_returns_results_and_errors(self, config):
+        """Every requested name gets either saidata or an error."""
+        result = SaidataLoader(config).load_many(["nginx", "redis", "missing", "bad name!"])
+
+        assert sorted(result.saidata) == ["nginx", "redis"]
+        assert result.saidata["redis"].metadata.name == "redis"
+        assert isinstance(result.errors["missing"], SaidataNotFoundError)
+        assert isinstance(result.errors["bad name!"], ValueError)
+        assert result.has_errors
+
+    def test_duplicates_are_loaded_once(self, config):
+        """Names requested several times are validated once."""
+        names = ["nginx", "redis", "mysql"] * 50
+
+        with _spy_validation() as mock_validate:
+            result = SaidataLoader(config).load_many(names)
+
+        assert sorted(result.saidata) == ["mysql", "nginx", "redis"]
+        assert mock_validate.call_count == 3
+        assert not result.has_errors
+
+    def test_matches_single_loads(self, config):
+        """Bulk loads produce the same saidata as single loads."""
+        loader = SaidataLoader(config)
+        result = loader.load_many(["nginx", "mysql"], use_cache=False, max_workers=1)
+
+        assert result.saidata["nginx"] == loader.load_saidata("nginx", use_cache=False)
+        assert result.saidata["mysql"] == loader.load_saidata("mysql", use_cache=False)
+
+    def test_validation_errors_are_per_name(self, config):
+        """A document failing validation does not affect the others."""
+        original = SaidataLoader.validate_saidata
+
+        def validate(loader, data):
+            if data["metadata"]["name"] == "redis":
+                return ValidationResult(valid=False, errors=["broken"], warnings=[])
+            return original(loader, data)
+
+        with patch.object(SaidataLoader, "validate_saidata", autospec=True, side_effect=validate):
+            result = SaidataLoader(config).load_many(["nginx", "redis"])
+
+        assert sorted(result.saidata) == ["nginx"]
+        assert isinstance(result.errors["redis"], ValidationError)
+
+    def test_repository_checked_once(self, config):
+        """The repository status is checked once for the whole batch."""
+        repository_manager = Mock()
+        repository_manager.get_repository_status.return_value.is_healthy = True
+
+        loader = SaidataLoader(config, repository_manager=repository_manager)
+        loader.load_many(["nginx", "redis", "mysql"])
+
+        repository_manager.get_repository_status.assert_called_once()
@@ -0,0 +1,180 @@
+"""Tests for the compiled saidata mirror."""
+
+import marshal
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from sai.core.saidata_catalog import build_catalog, read_saidata_file
+from sai.core.saidata_loader import SaidataLoader, clear_validated_saidata_cache
+from sai.core.saidata_mirror import (
+    SaidataMirror,
+    compile_mirror,
+    get_mirror_path,
+    get_mirrored_saidata,
+    load_mirror,
+)
+from sai.models.config import SaiConfig
+from sai.utils import yaml_loader
+
+NGINX_SAIDATA = {
+    "version": "0.3",
+    "metadata": {"name": "nginx", "description": "HTTP server"},
+    "packages": [{"name": "server", "package_name": "nginx"}],
+}
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Create a small hierarchical saidata repository."""
+    base_path = tmp_path / "saidata-main"
+    nginx_dir = base_path / "software" / "ng" / "nginx"
+    (nginx_dir / "ubuntu").mkdir(parents=True)
+    (nginx_dir / "default.yaml").write_text(yaml.dump(NGINX_SAIDATA))
+    (nginx_dir / "ubuntu" / "22.04.yaml").write_text(
+        "packages:\n  - name: server\n    package_name: nginx-full\n"
+    )
+
+    redis_dir = base_path / "software" / "re" / "redis"
+    redis_dir.mkdir(parents=True)
+    (redis_dir / "default.json").write_text('{"version": "0.3", "metadata": {"name": "redis"}}')
+    return base_path
+
+
+def _compile(base_path):
+    """Build the catalog and compile the mirror like a repository update does."""
+    documents = {}
+    catalog = build_catalog(base_path, documents)
+    return compile_mirror(base_path, catalog, documents)
+
+
+class TestSaidataMirror:
+    """Test cases for compiling and reading the mirror."""
+
+    def test_compile_mirrors_default_and_override_files(self, repository):
+        """Every cataloged file is stored parsed, grouped by software."""
+        mirror = _compile(repository)
+
+        assert sorted(mirror.software) == ["nginx", "redis"]
+        assert mirror.get(repository / "software/ng/nginx/default.yaml") == NGINX_SAIDATA
+        assert mirror.get(repository / "software/ng/nginx/ubuntu/22.04.yaml") == {
+            "packages": [{"name": "server", "package_name": "nginx-full"}]
+        }
+        assert mirror.get(repository / "software/re/redis/default.json")["metadata"] == {
+            "name": "redis"
+        }
+
+    def test_default_files_parsed_for_the_catalog_are_reused(self, repository):
+        """Compiling after building the catalog parses only the override files."""
+        documents = {}
+        catalog = build_catalog(repository, documents)
+
+        with patch("sai.core.saidata_mirror.read_saidata_file", wraps=read_saidata_file) as read:
+            compile_mirror(repository, catalog, documents)
+
+        assert [call.args[0].name for call in read.call_args_list] == ["22.04.yaml"]
+
+    def test_get_returns_independent_copies(self, repository):
+        """Callers may modify mirrored data without affecting later lookups."""
+        mirror = _compile(repository)
+        default_file = repository / "software/ng/nginx/default.yaml"
+
+        mirror.get(default_file)["metadata"]["name"] = "changed"
+
+        assert mirror.get(default_file)["metadata"]["name"] == "nginx"
+
+    def test_changed_file_is_not_served(self, repository):
+        """Files modified after compiling are parsed again."""
+        _compile(repository)
+        default_file = repository / "software/ng/nginx/default.yaml"
+        default_file.write_text(yaml.dump({**NGINX_SAIDATA, "version": "0.2"}))
+
+        assert get_mirrored_saidata(default_file) is None
+        assert get_mirrored_saidata(repository / "software/re/redis/default.json") is not None
+
+    def test_values_marshal_cannot_store_are_left_out(self, repository):
+        """Files with YAML dates are not mirrored, the rest of the repository is."""
+        (repository / "software/ng/nginx/ubuntu/22.04.yaml").write_text("released: 2024-04-25\n")
+
+        mirror = _compile(repository)
+
+        assert mirror.get(repository / "software/ng/nginx/ubuntu/22.04.yaml") is None
+        assert mirror.get(repository / "software/ng/nginx/default.yaml") == NGINX_SAIDATA
+
+    def test_load_round_trip(self, repository):
+        """A saved mirror is read back and kept in memory."""
+        compiled = _compile(repository)
+
+        loaded = load_mirror(repository)
+        with patch.object(SaidataMirror, "_read") as read:
+            assert load_mirror(repository) is loaded
+        read.assert_not_called()
+
+        assert loaded.software == compiled.software
+        assert get_mirror_path(repository).parent == repository.parent
+
+    def test_mirror_requires_matching_catalog(self, repository):
+        """A mirror is not used once its repository directory was replaced."""
+        _compile(repository)
+        shutil.rmtree(repository / "software")
+        (repository / "software/ng/nginx").mkdir(parents=True)
+        (repository / "software/ng/nginx/default.yaml").write_text(yaml.dump(NGINX_SAIDATA))
+
+        assert load_mirror(repository) is None
+
+    def test_mirror_from_other_python_is_ignored(self, repository):
+        """Mirrors written by another Python or mirror version are not read."""
+        _compile(repository)
+        mirror_path = get_mirror_path(repository)
+        with open(mirror_path, "rb") as f:
+            data = marshal.load(f)
+        data["header"]["python_version"] = [2, 7]
+        with open(mirror_path, "wb") as f:
+            marshal.dump(data, f)
+
+        assert load_mirror(repository) is None
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_writable_mirror_is_ignored(self, repository):
+        """Mirrors others could have written are not read."""
+        _compile(repository)
+        get_mirror_path(repository).chmod(0o666)
+
+        assert load_mirror(repository) is None
+
+
+class TestLoaderUsesMirror:
+    """Test cases for saidata loading from the mirror."""
+
+    @pytest.fixture
+    def loader(self, repository):
+        """A loader reading the repository without the saidata cache."""
+        clear_validated_saidata_cache()
+        yield SaidataLoader(SaiConfig(saidata_paths=[str(repository)], cache_enabled=False))
+        clear_validated_saidata_cache()
+
+    def test_compiled_repository_is_not_parsed(self, repository, loader):
+        """Loading saidata from a compiled repository parses no YAML."""
+        _compile(repository)
+
+        with patch("sai.core.saidata_loader.safe_load", side_effect=AssertionError("parsed")):
+            nginx = loader.load_saidata("nginx")
+
+        assert nginx.metadata.description == "HTTP server"
+        assert loader.load_saidata("redis").metadata.name == "redis"
+
+    def test_uncompiled_repository_is_parsed(self, repository, loader):
+        """Without a mirror files are parsed with the YAML loader."""
+        with patch("sai.core.saidata_loader.safe_load", wraps=yaml_loader.safe_load) as safe_load:
+            assert loader.load_saidata("nginx").metadata.name == "nginx"
+
+        assert safe_load.call_count == 1
+
+    @pytest.mark.skipif(not yaml_loader.HAS_LIBYAML, reason="PyYAML built without LibYAML")
+    def test_libyaml_loader_is_used(self):
+        """YAML is parsed with LibYAML when it is available."""
+        assert yaml_loader.SafeLoader is yaml.CSafeLoader
+        assert yaml_loader.safe_load("a: [1, 2]") == {"a": [1, 2]}
@@ -9,7 +9,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from sai.core.git_repository_handler import GitOperationResult, RepositoryInfo
-from sai.core.saidata_loader import SaidataNotFoundError
+from sai.core.saidata_loader import BulkLoadResult, SaidataNotFoundError
 from sai.core.saidata_repository_manager import (
     RepositoryHealthCheck,
     RepositoryStatus,
@@ -114,6 +114,30 @@ class TestSaidataRepositoryManager:
         # Should be called once with force=True during retry
         manager.update_repository.assert_called_with(force=True)
 
+    def test_load_many_retries_missing_after_update(self, manager):
+        """Only software missing from the cached repository is loaded again after an update."""
+        nginx, apache = Mock(spec=SaiData), Mock(spec=SaiData)
+        manager.saidata_loader.load_many = Mock(
+            side_effect=[
+                BulkLoadResult(
+                    saidata={"nginx": nginx},
+                    errors={"apache": SaidataNotFoundError("Not found", "apache")},
+                ),
+                BulkLoadResult(saidata={"apache": apache}),
+            ]
+        )
+        manager.update_repository = Mock(return_value=True)
+        manager.is_offline_mode = Mock(return_value=False)
+        manager._should_retry_with_update = Mock(return_value=True)
+        manager._should_update_repository = Mock(return_value=False)
+
+        result = manager.load_many(["nginx", "apache", "nginx"])
+
+        assert result.saidata == {"nginx": nginx, "apache": apache}
+        assert not result.has_errors
+        manager.saidata_loader.load_many.assert_called_with(["apache"])
+        manager.update_repository.assert_called_once_with(force=True)
+
     def test_update_repository_offline_mode(self, manager):
         """Test update repository in offline mode."""
         manager.config.saidata_offline_mode = True
@@ -511,3 +535,145 @@ class TestRepositoryHealthCheck:
             status=RepositoryStatus.AVAILABLE, update_available=False
         )
         assert health_check.needs_update is False
+
+    def test_to_dict_round_trip(self):
+        """Health checks survive JSON serialization."""
+        health_check = RepositoryHealthCheck(
+            status=RepositoryStatus.AVAILABLE,
+            last_updated=datetime(2024, 1, 2, 3, 4, 5),
+            repository_info=RepositoryInfo(
+                url="https://github.com/example42/saidata",
+                branch="main",
+                commit_hash="abc123",
+                last_updated=datetime(2024, 1, 2, 3, 4, 5),
+            ),
+            cache_valid=True,
+        )
+
+        assert RepositoryHealthCheck.from_dict(health_check.to_dict()) == health_check
+
+
+class TestRepositoryStatusReuse:
+    """Test cases for reusing repository health checks."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """Create a test configuration."""
+        return SaiConfig(
+            cache_directory=tmp_path / "cache",
+            saidata_repository_url="https://github.com/example42/saidata",
+            saidata_update_interval=3600,
+        )
+
+    @pytest.fixture(autouse=True)
+    def online(self):
+        """Answer network detection without touching the network."""
+        with patch(
+            "sai.core.saidata_repository_manager.detect_offline_mode",
+            return_value=(False, "Network connectivity available"),
+        ) as detect:
+            yield detect
+
+    @pytest.fixture
+    def checked_manager(self, config):
+        """Create a manager for an updated repository and check its status once."""
+        manager = SaidataRepositoryManager(config)
+        manager.repository_path.mkdir(parents=True)
+        manager.repository_cache.mark_repository_updated(
+            config.saidata_repository_url, config.saidata_repository_branch
+        )
+        manager.git_handler.get_repository_info = Mock(
+            return_value=RepositoryInfo(
+                url=config.saidata_repository_url,
+                branch="main",
+                commit_hash="abc123",
+                last_updated=datetime(2024, 1, 2, 3, 4, 5),
+            )
+        )
+        manager.check_repository_accessibility = Mock(return_value=(True, None))
+
+        assert manager.get_repository_status().status == RepositoryStatus.AVAILABLE
+        return manager
+
+    def test_status_is_reused_within_process(self, checked_manager):
+        """Repeated status checks do not run git again."""
+        checked_manager.get_repository_status()
+        checked_manager.get_repository_status()
+
+        assert checked_manager.git_handler.get_repository_info.call_count == 2
+        checked_manager.check_repository_accessibility.assert_called_once()
+
+    def test_warm_status_runs_no_git_or_network(self, checked_manager, config, online):
+        """A new process reuses the recorded status without git or network probes."""
+        online.reset_mock()
+        manager = SaidataRepositoryManager(config)
+
+        with patch("subprocess.run", side_effect=AssertionError("git was run")), patch(
+            "sai.core.saidata_repository_manager.check_url_accessibility",
+            side_effect=AssertionError("network was probed"),
+        ):
+            status = manager.get_repository_status()
+            age = manager.get_cached_repository_age()
+            offline = manager.is_offline_mode()
+
+        assert status.status == RepositoryStatus.AVAILABLE
+        assert status.repository_info.commit_hash == "abc123"
+        assert status.last_updated == datetime(2024, 1, 2, 3, 4, 5)
+        assert age is not None
+        assert offline is False
+        online.assert_not_called()
+
+    def test_cache_age_without_recorded_status(self, config):
+        """Without a recorded status the cache age is read from disk."""
+        config.saidata_repository_status_ttl = 0
+        manager = SaidataRepositoryManager(config)
+        manager.repository_path.mkdir(parents=True)
+        manager.git_handler.get_repository_info = Mock(
+            return_value=RepositoryInfo(
+                url=config.saidata_repository_url,
+                branch="main",
+                commit_hash="abc123",
+                last_updated=datetime.now() - timedelta(hours=2),
+            )
+        )
+        manager.check_repository_accessibility = Mock(side_effect=AssertionError("probed"))
+
+        age = manager.get_cached_repository_age()
+
+        assert timedelta(hours=2) <= age < timedelta(hours=3)
+        manager.check_repository_accessibility.assert_not_called()
+
+    def test_update_discards_recorded_status(self, checked_manager, config):
+        """Updating the repository checks its status again."""
+        checked_manager._mark_update_successful()
+        health = checked_manager.repository_cache.get_repository_health(
+            config.saidata_repository_url, config.saidata_repository_branch
+        )
+
+        assert health is None
+        checked_manager.get_repository_status()
+        assert checked_manager.git_handler.get_repository_info.call_count == 4
+
+    def test_repository_change_discards_recorded_status(self, checked_manager):
+        """Changes to the repository directory check its status again."""
+        (checked_manager.repository_path / ".git").mkdir()
+
+        checked_manager.get_repository_status()
+
+        assert checked_manager.git_handler.get_repository_info.call_count == 4
+
+    def test_expired_status_is_checked_again(self, checked_manager):
+        """Recorded statuses expire after the configured TTL."""
+        checked_manager._status_snapshot["checked_at"] -= 301
+
+        checked_manager.get_repository_status()
+
+        assert checked_manager.git_handler.get_repository_info.call_count == 4
+
+    def test_zero_ttl_disables_reuse(self, checked_manager):
+        """A TTL of 0 checks the repository every time."""
+        checked_manager.config.saidata_repository_status_ttl = 0
+
+        checked_manager.get_repository_status()
+
+        assert checked_manager.git_handler.get_repository_info.call_count == 4
@@ -0,0 +1,117 @@
+"""Tests for the shared JSON schema validator registry."""
+
+import json
+from unittest.mock import patch
+
+import jsonschema
+import pytest
+
+from sai.core.saidata_loader import SAIDATA_SCHEMA_PATH, SaidataLoader
+from sai.providers.loader import ProviderLoader
+from sai.utils import schema_registry
+from sai.utils.schema_registry import (
+    SCHEMA_FILES,
+    get_schema_path,
+    get_schema_validator,
+    get_validator,
+    validate,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    """Start every test with an empty registry."""
+    schema_registry.clear_validators()
+    yield
+    schema_registry.clear_validators()
+
+
+class TestSchemaRegistry:
+    """Test cases for compiling and sharing validators."""
+
+    @pytest.mark.parametrize("schema_name", sorted(SCHEMA_FILES))
+    def test_shipped_schemas_compile(self, schema_name):
+        """Every schema shipped with sai compiles."""
+        validator = get_schema_validator(schema_name)
+
+        assert validator.schema["$schema"].startswith("http://json-schema.org/draft-07")
+
+    def test_unknown_schema_name(self):
+        """Unknown schema names are rejected with the available names."""
+        with pytest.raises(ValueError, match="saidata-0.3"):
+            get_schema_path("saidata-9.9")
+
+    def test_schema_is_loaded_and_checked_once(self):
+        """Repeated lookups reuse the compiled validator."""
+        with patch(
+            "sai.utils.schema_registry.compile_schema", wraps=schema_registry.compile_schema
+        ) as compile_schema:
+            first = get_schema_validator("saidata-0.3")
+            second = get_validator(SAIDATA_SCHEMA_PATH)
+
+        assert first is second
+        assert compile_schema.call_count == 1
+
+    def test_invalid_schema_is_rejected(self, tmp_path):
+        """Schemas that do not match their metaschema are reported once compiled."""
+        schema_path = tmp_path / "broken-schema.json"
+        schema_path.write_text(json.dumps({"type": "no-such-type"}))
+
+        with pytest.raises(jsonschema.SchemaError):
+            get_validator(schema_path)
+
+    def test_validate_reports_same_error_as_jsonschema(self):
+        """Validation raises the error jsonschema.validate would raise."""
+        validator = get_schema_validator("saidata-0.3")
+        data = {"version": "0.3", "metadata": {"name": 42}, "packages": "nginx"}
+
+        with pytest.raises(jsonschema.ValidationError) as expected:
+            jsonschema.validate(data, validator.schema)
+        with pytest.raises(jsonschema.ValidationError) as raised:
+            validate(validator, data)
+
+        assert raised.value.message == expected.value.message
+
+
+class TestRegistryUsers:
+    """Test cases for loaders sharing compiled validators."""
+
+    def test_saidata_loaders_share_validator(self):
+        """Saidata validation does not recompile the schema per loader or document."""
+        data = {"version": "0.3", "metadata": {"name": "nginx", "description": "Web server"}}
+
+        with patch(
+            "sai.utils.schema_registry.compile_schema", wraps=schema_registry.compile_schema
+        ) as compile_schema:
+            results = [SaidataLoader().validate_saidata(data) for _ in range(5)]
+
+        assert all(result.valid for result in results)
+        assert compile_schema.call_count == 1
+        loader = SaidataLoader()
+        loader.validate_saidata(data)
+        assert loader._schema_validator is get_schema_validator("saidata-0.3")
+
+    def test_saidata_schema_errors_are_reported(self):
+        """Schema violations are reported as validation errors."""
+        result = SaidataLoader().validate_saidata({"version": "0.3", "metadata": {}})
+
+        assert not result.valid
+        assert any("Schema validation error" in error for error in result.errors)
+
+    def test_provider_loaders_share_validator(self):
+        """Provider loaders get the same compiled validator."""
+        first = ProviderLoader(enable_caching=False)
+        second = ProviderLoader(enable_caching=False)
+
+        assert first._schema_validator is not None
+        assert first._schema_validator is second._schema_validator
+        assert first._schema_validator is get_schema_validator("providerdata-0.1")
+
+    def test_custom_provider_schema(self, tmp_path):
+        """Provider loaders given a schema file compile that file instead."""
+        schema_path = tmp_path / "provider-schema.json"
+        schema_path.write_text(json.dumps({"type": "object"}))
+
+        loader = ProviderLoader(schema_path=schema_path, enable_caching=False)
+
+        assert loader._schema_validator.schema == {"type": "object"}
@@ -1,22 +1,28 @@
 """Tests for TarballRepositoryHandler."""
 
+import hashlib
+import io
 import json
 import tarfile
 import tempfile
+import threading
 import zipfile
+from collections import Counter
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
+from sai.core.saidata_repository_manager import SaidataRepositoryManager
 from sai.core.tarball_repository_handler import (
     ProgressReporter,
     ReleaseInfo,
     TarballOperationResult,
     TarballRepositoryHandler,
 )
-from sai.models.config import RepositoryAuthType
+from sai.models.config import RepositoryAuthType, SaiConfig
 
 
 class TestProgressReporter:
@@ -581,6 +587,21 @@ class TestReleaseInfo:
         assert release_info.checksum_algorithm == "sha256"
         assert release_info.size is None
 
+    def test_release_info_round_trip(self):
+        """ReleaseInfo survives conversion to and from JSON-compatible dictionaries."""
+        release_info = ReleaseInfo(
+            tag_name="v1.0.0",
+            name="Release 1.0.0",
+            download_url="https://example.com/release.tar.gz",
+            published_at=datetime(2024, 1, 2, 3, 4, 5),
+            etag='"abc"',
+            asset_last_modified="Tue, 02 Jan 2024 03:04:05 GMT",
+        )
+
+        data = json.loads(json.dumps(release_info.to_dict()))
+
+        assert ReleaseInfo.from_dict(data) == release_info
+
 
 class TestTarballOperationResult:
     """Test TarballOperationResult dataclass."""
@@ -604,3 +625,328 @@ class TestTarballOperationResult:
         assert not result.success
         assert result.message == "Operation failed"
         assert result.error_details == "Detailed error information"
+
+
+def _make_release_archive(version: str) -> bytes:
+    """Build a release tarball with one saidata file."""
+    content = f"version: '0.3'\nmetadata:\n  name: nginx\n  version: {version}\n".encode()
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        info = tarfile.TarInfo("saidata-main/software/ng/nginx/default.yaml")
+        info.size = len(content)
+        tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+class ReleaseServer:
+    """Local stand-in for the GitHub releases API and release asset downloads."""
+
+    LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    def __init__(self):
+        self.requests = Counter()
+        self.authorizations = []
+        self.asset_redirect = None
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_HEAD(self):
+                self._respond(send_body=False)
+
+            def do_GET(self):
+                self._respond(send_body=True)
+
+            def _respond(self, send_body):
+                server.requests[(self.command, self.path)] += 1
+                server.authorizations.append((self.command, self.headers.get("Authorization")))
+                if self.path == server.asset_path and server.asset_redirect:
+                    self.send_response(302)
+                    self.send_header("Location", f"{server.asset_redirect}{self.path}")
+                    self.end_headers()
+                    return
+                if self.path == "/repos/example42/saidata/releases/latest":
+                    body = json.dumps(server.release).encode()
+                    etag = server.metadata_etag
+                elif self.path == server.asset_path:
+                    body = server.archive
+                    etag = server.asset_etag
+                else:
+                    self.send_error(404)
+                    return
+
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", server.LAST_MODIFIED)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.publish("v1.0.0", metadata_etag='"release-1"')
+
+    def publish(self, tag, metadata_etag):
+        """Publish a new release asset under a tag."""
+        self.asset_path = f"/download/{tag}/saidata.tar.gz"
+        self.asset_etag = f'"asset-{tag}"'
+        self.archive = _make_release_archive(tag)
+        self.edit_release(tag, metadata_etag)
+
+    def edit_release(self, tag, metadata_etag):
+        """Change the release metadata without touching the asset."""
+        self.metadata_etag = metadata_etag
+        self.release = {
+            "tag_name": tag,
+            "name": f"Release {tag}",
+            "assets": [
+                {
+                    "name": "saidata.tar.gz",
+                    "browser_download_url": f"{self.url}{self.asset_path}",
+                    "size": len(self.archive),
+                }
+            ],
+        }
+
+    def asset_downloads(self):
+        """Number of times the current asset was downloaded."""
+        return self.requests[("GET", self.asset_path)]
+
+
+def _serve_releases():
+    """Serve releases from a local HTTP server until the generator is closed."""
+    server = ReleaseServer()
+    thread = threading.Thread(target=server.httpd.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+@pytest.fixture
+def release_server():
+    """Serve releases from a local HTTP server."""
+    yield from _serve_releases()
+
+
+@pytest.fixture
+def asset_server():
+    """Serve release assets from a second local HTTP server."""
+    yield from _serve_releases()
+
+
+class TestConditionalUpdates:
+    """Test conditional release requests against a local HTTP server."""
+
+    REPO_URL = "https://github.com/example42/saidata"
+
+    @pytest.fixture
+    def handler(self, release_server):
+        """Create a handler talking to the local release server."""
+        return TarballRepositoryHandler(max_retries=1, api_url=release_server.url)
+
+    def test_first_download_records_validators(self, handler, release_server, tmp_path):
+        """A full download records the validators of the metadata and asset."""
+        result = handler.download_latest_release(self.REPO_URL, tmp_path / "repo")
+
+        assert result.success and not result.not_modified
+        assert (tmp_path / "repo/software/ng/nginx/default.yaml").exists()
+        assert result.release_info.etag == '"release-1"'
+        assert result.release_info.last_modified == ReleaseServer.LAST_MODIFIED
+        assert result.release_info.asset_etag == '"asset-v1.0.0"'
+        assert release_server.asset_downloads() == 1
+
+    def test_unchanged_release_is_not_downloaded(self, handler, release_server, tmp_path):
+        """A 304 for the release metadata ends the update."""
+        first = handler.download_latest_release(self.REPO_URL, tmp_path / "repo")
+
+        second = handler.download_latest_release(
+            self.REPO_URL, tmp_path / "repo", previous_release=first.release_info
+        )
+
+        assert second.success and second.not_modified
+        assert second.release_info == first.release_info
+        assert release_server.asset_downloads() == 1
+        assert (tmp_path / "repo/software/ng/nginx/default.yaml").exists()
+
+    def test_edited_release_with_same_asset(self, handler, release_server, tmp_path):
+        """Changed metadata with an unchanged asset only costs a HEAD request."""
+        first = handler.download_latest_release(self.REPO_URL, tmp_path / "repo")
+        release_server.edit_release("v1.0.0", metadata_etag='"release-1-edited"')
+
+        second = handler.download_latest_release(
+            self.REPO_URL, tmp_path / "repo", previous_release=first.release_info
+        )
+
+        assert second.not_modified
+        assert second.release_info.etag == '"release-1-edited"'
+        assert second.release_info.asset_etag == '"asset-v1.0.0"'
+        assert release_server.requests[("HEAD", release_server.asset_path)] == 1
+        assert release_server.asset_downloads() == 1
+
+    def test_new_release_is_downloaded(self, handler, release_server, tmp_path):
+        """A new release is downloaded and extracted."""
+        first = handler.download_latest_release(self.REPO_URL, tmp_path / "repo")
+        release_server.publish("v2.0.0", metadata_etag='"release-2"')
+
+        second = handler.download_latest_release(
+            self.REPO_URL, tmp_path / "repo", previous_release=first.release_info
+        )
+
+        assert second.success and not second.not_modified
+        assert second.release_info.tag_name == "v2.0.0"
+        assert "v2.0.0" in (tmp_path / "repo/software/ng/nginx/default.yaml").read_text()
+
+    def test_missing_local_copy_is_downloaded(self, handler, release_server, tmp_path):
+        """Validators of a release that is no longer on disk are not sent."""
+        first = handler.download_latest_release(self.REPO_URL, tmp_path / "repo")
+
+        second = handler.download_latest_release(
+            self.REPO_URL, tmp_path / "other", previous_release=first.release_info
+        )
+
+        assert not second.not_modified
+        assert release_server.asset_downloads() == 2
+
+    def test_credentials_are_not_sent_to_asset_host(
+        self, handler, release_server, asset_server, tmp_path
+    ):
+        """Authentication is dropped when the asset download is redirected."""
+        release_server.asset_redirect = asset_server.url
+
+        result = handler.download_latest_release(
+            self.REPO_URL, tmp_path / "repo", RepositoryAuthType.TOKEN, {"token": "secret"}
+        )
+
+        assert result.success
+        assert ("GET", "token secret") in release_server.authorizations
+        assert asset_server.asset_downloads() == 1
+        assert asset_server.authorizations == [("GET", None)]
+
+    def test_credentials_are_not_sent_with_redirected_asset_check(
+        self, handler, release_server, asset_server, tmp_path
+    ):
+        """The conditional asset request drops authentication when redirected."""
+        release_server.asset_redirect = asset_server.url
+        auth = (RepositoryAuthType.TOKEN, {"token": "secret"})
+        first = handler.download_latest_release(self.REPO_URL, tmp_path / "repo", *auth)
+        release_server.edit_release("v1.0.0", metadata_etag='"release-1-edited"')
+
+        second = handler.download_latest_release(
+            self.REPO_URL, tmp_path / "repo", *auth, previous_release=first.release_info
+        )
+
+        assert second.not_modified
+        assert ("HEAD", "token secret") in release_server.authorizations
+        assert len(asset_server.authorizations) == 2
+        assert all(authorization is None for _, authorization in asset_server.authorizations)
+
+    def test_repository_manager_keeps_unchanged_repository(self, release_server, tmp_path):
+        """Repeated updates of an unchanged release make one small request."""
+        config = SaiConfig(cache_directory=tmp_path / "cache", saidata_repository_url=self.REPO_URL)
+        manager = SaidataRepositoryManager(config)
+        manager.tarball_handler = TarballRepositoryHandler(
+            max_retries=1, api_url=release_server.url
+        )
+        manager.git_handler.is_git_available = Mock(return_value=False)
+        manager.is_offline_mode = Mock(return_value=False)
+
+        assert manager.update_repository(force=True)
+        saidata_file = manager.repository_path / "software/ng/nginx/default.yaml"
+        inode = saidata_file.stat().st_ino
+
+        release_server.requests.clear()
+        assert manager.update_repository(force=True)
+
+        assert sum(release_server.requests.values()) == 1
+        assert saidata_file.stat().st_ino == inode
+
+
+class TestStreamingExtraction:
+    """Test cases for extracting release tarballs while they download."""
+
+    @pytest.fixture
+    def handler(self):
+        """Create a handler that does not retry."""
+        return TarballRepositoryHandler(max_retries=1)
+
+    def _release(self, server, checksum=None):
+        """Release info pointing at the asset of the local server."""
+        return ReleaseInfo(
+            tag_name="v1.0.0",
+            name="Release 1.0.0",
+            download_url=f"{server.url}{server.asset_path}",
+            published_at=datetime.now(),
+            checksum=checksum,
+        )
+
+    def _leftovers(self, parent, target_dir):
+        """Entries next to the target besides the target itself."""
+        return [path.name for path in parent.iterdir() if path != target_dir]
+
+    def test_archive_is_not_written_to_disk(self, handler, release_server, tmp_path):
+        """The release is hashed and extracted as it arrives."""
+        checksum = hashlib.sha256(release_server.archive).hexdigest()
+        progress = []
+        target_dir = tmp_path / "repos" / "saidata"
+
+        with patch("urllib.request.urlretrieve") as urlretrieve:
+            result = handler.download_and_extract_release(
+                self._release(release_server, checksum),
+                target_dir,
+                progress_callback=lambda downloaded, total: progress.append((downloaded, total)),
+            )
+
+        assert result.success, result.error_details
+        urlretrieve.assert_not_called()
+        assert (target_dir / "software/ng/nginx/default.yaml").exists()
+        assert result.files == {
+            "software/ng/nginx/default.yaml": (
+                target_dir / "software/ng/nginx/default.yaml"
+            ).stat().st_size
+        }
+        assert result.release_info.asset_etag == '"asset-v1.0.0"'
+        assert progress[-1] == (len(release_server.archive), len(release_server.archive))
+        assert self._leftovers(tmp_path / "repos", target_dir) == []
+
+    def test_checksum_mismatch_keeps_previous_release(self, handler, release_server, tmp_path):
+        """Nothing is committed unless the digest of the whole archive matches."""
+        target_dir = tmp_path / "repos" / "saidata"
+        (target_dir / "software").mkdir(parents=True)
+        (target_dir / "software" / "previous.yaml").write_text("previous")
+
+        result = handler.download_and_extract_release(
+            self._release(release_server, "0" * 64), target_dir
+        )
+
+        assert not result.success
+        assert result.message == "Checksum verification failed"
+        assert (target_dir / "software" / "previous.yaml").read_text() == "previous"
+        assert self._leftovers(tmp_path / "repos", target_dir) == []
+
+    def test_unsafe_archive_is_rejected(self, handler, release_server, tmp_path):
+        """Members are checked by the path traversal filters while streaming."""
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+            for name in ("../escape.yaml", "/etc/absolute.yaml", "saidata/ok.yaml"):
+                info = tarfile.TarInfo(name)
+                info.size = 2
+                tar.addfile(info, io.BytesIO(b"x\n"))
+        release_server.archive = buffer.getvalue()
+        target_dir = tmp_path / "repos" / "saidata"
+
+        result = handler.download_and_extract_release(self._release(release_server), target_dir)
+
+        assert not result.success
+        assert "too many unsafe members" in result.error_details
+        assert not target_dir.exists()
+        assert not (tmp_path / "repos" / "escape.yaml").exists()
+        assert self._leftovers(tmp_path / "repos", target_dir) == []
@@ -1,5 +1,7 @@
 """Tests for caching utilities."""
 
+import json
+import os
 import tempfile
 import time
 from pathlib import Path
@@ -8,7 +10,13 @@ from unittest.mock import patch
 import pytest
 
 from sai.models.config import SaiConfig
-from sai.utils.cache import CacheManager, ProviderCache
+from sai.utils.cache import (
+    CacheManager,
+    ProviderCache,
+    SaidataCache,
+    flush_provider_caches,
+    get_provider_cache,
+)
 
 
 class CacheError(Exception):
@@ -300,6 +308,411 @@ class TestProviderCache:
                 assert "worker" in result
                 assert result["available"]
 
+    def test_cache_file_read_once(self):
+        """Lookups after the first are served from memory."""
+        self.provider_cache.update_provider_cache("provider1", {"available": True})
+        self.provider_cache.flush()
+
+        new_cache = ProviderCache(SaiConfig(cache_enabled=True, cache_directory=self.cache_dir))
+        new_cache._store.data = None
+
+        with patch("sai.utils.cache.json.load", wraps=json.load) as mock_load:
+            for _ in range(3):
+                assert new_cache.get_cached_provider_info("provider1") is not None
+                assert new_cache.is_cache_valid("provider1")
+
+        assert mock_load.call_count == 1
+
+    def test_updates_are_written_on_flush(self):
+        """Updates are buffered and written in one batch."""
+        cache_file = self.cache_dir / "providers.json"
+
+        with patch("sai.utils.cache.json.dump", wraps=json.dump) as mock_dump:
+            for i in range(5):
+                self.provider_cache.update_provider_cache(f"provider{i}", {"available": True})
+
+            assert mock_dump.call_count == 0
+            assert self.provider_cache.flush() is True
+            assert self.provider_cache.flush() is False
+
+        assert mock_dump.call_count == 1
+        assert len(json.loads(cache_file.read_text())["providers"]) == 5
+
+    def test_flush_keeps_entries_from_other_processes(self):
+        """Flushing merges pending updates into the current file contents."""
+        cache_file = self.cache_dir / "providers.json"
+        self.provider_cache.update_provider_cache("ours", {"available": True})
+
+        cache_file.write_text(
+            json.dumps({"providers": {"theirs": {"available": False, "cached_at": time.time()}}})
+        )
+        self.provider_cache.flush()
+
+        providers = json.loads(cache_file.read_text())["providers"]
+        assert set(providers) == {"ours", "theirs"}
+
+    def test_clear_is_written_immediately(self):
+        """Clearing entries is persisted without an explicit flush."""
+        cache_file = self.cache_dir / "providers.json"
+        self.provider_cache.update_provider_cache("provider1", {"available": True})
+        self.provider_cache.update_provider_cache("provider2", {"available": True})
+        self.provider_cache.flush()
+
+        self.provider_cache.clear_provider_cache("provider1")
+
+        assert set(json.loads(cache_file.read_text())["providers"]) == {"provider2"}
+
+    def test_get_provider_cache_is_shared(self):
+        """get_provider_cache returns one instance per cache configuration."""
+        other_config = SaiConfig(cache_enabled=True, cache_directory=self.cache_dir)
+
+        assert get_provider_cache(self.config) is get_provider_cache(other_config)
+
+    def test_flush_provider_caches(self):
+        """flush_provider_caches writes pending updates of every cache."""
+        self.provider_cache.update_provider_cache("provider1", {"available": True})
+
+        flush_provider_caches()
+
+        cache_file = self.cache_dir / "providers.json"
+        assert "provider1" in json.loads(cache_file.read_text())["providers"]
+
+    def test_fingerprinted_entry_uses_availability_ttl(self):
+        """Entries with a matching fingerprint outlive the plain cache TTL."""
+        fingerprint = {"executable": ["/usr/bin/tool", 1, 2, 3], "provider_file": None}
+        self.provider_cache.cache_ttl = 1
+        self.provider_cache.availability_ttl = 3600
+        self.provider_cache.update_provider_cache(
+            "tool", {"available": True, "fingerprint": fingerprint}
+        )
+
+        with patch("time.time", return_value=time.time() + 2):
+            assert self.provider_cache.is_cache_valid("tool", fingerprint=fingerprint)
+            assert not self.provider_cache.is_cache_valid("tool")
+
+        with patch("time.time", return_value=time.time() + 3601):
+            assert not self.provider_cache.is_cache_valid("tool", fingerprint=fingerprint)
+
+    def test_changed_fingerprint_invalidates_entry(self):
+        """A different fingerprint makes the entry invalid regardless of age."""
+        fingerprint = {"executable": ["/usr/bin/tool", 1, 2, 3], "provider_file": None}
+        self.provider_cache.update_provider_cache(
+            "tool", {"available": True, "fingerprint": fingerprint}
+        )
+        removed = {"executable": [None], "provider_file": None}
+
+        assert self.provider_cache.get_cached_provider_info("tool", fingerprint=fingerprint)
+        assert self.provider_cache.get_cached_provider_info("tool", fingerprint=removed) is None
+
+    def test_fingerprint_survives_persistence(self):
+        """Fingerprints compare equal after a round trip through the cache file."""
+        fingerprint = {"executable": ["/usr/bin/tool", 1, 2, 3], "provider_file": ["p", 4, 5]}
+        self.provider_cache.update_provider_cache(
+            "tool", {"available": True, "fingerprint": fingerprint}
+        )
+        self.provider_cache.flush()
+
+        cache_file = self.cache_dir / "providers.json"
+        entry = json.loads(cache_file.read_text())["providers"]["tool"]
+        assert entry["fingerprint"] == fingerprint
+
+
+class TestProviderAvailabilityFingerprint:
+    """Test availability revalidation through provider fingerprints."""
+
+    @pytest.fixture
+    def provider_setup(self, tmp_path):
+        """A provider whose executable lives in a temporary PATH directory."""
+        from sai.models.provider_data import Action, Provider, ProviderData, ProviderType
+        from sai.providers.base import BaseProvider
+
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        executable = bin_dir / "fptool"
+        executable.write_text("#!/bin/sh\n")
+        executable.chmod(0o755)
+
+        provider_file = tmp_path / "fptool.yaml"
+        provider_file.write_text("provider: fptool\n")
+        provider_data = ProviderData(
+            version="0.1",
+            provider=Provider(
+                name="fptool", type=ProviderType.PACKAGE_MANAGER, executable="fptool"
+            ),
+            actions={"install": Action(command="fptool install")},
+        )
+        setattr(provider_data, "_source_file", str(provider_file))
+
+        cache = ProviderCache(
+            SaiConfig(cache_enabled=True, cache_directory=tmp_path / "cache", cache_ttl=60)
+        )
+        with patch.dict("os.environ", {"PATH": str(bin_dir)}), patch(
+            "sai.utils.cache.get_provider_cache", return_value=cache
+        ), patch.object(BaseProvider, "_test_functionality", return_value=True) as mock_test:
+            yield BaseProvider(provider_data), executable, provider_file, mock_test
+
+    def test_unchanged_provider_is_not_probed_again(self, provider_setup):
+        """A cached result is reused while the fingerprint matches, even past cache_ttl."""
+        provider, _, _, mock_test = provider_setup
+
+        assert provider.is_available()
+        with patch("time.time", return_value=time.time() + 3600):
+            assert provider.is_available()
+
+        assert mock_test.call_count == 1
+
+    def test_replaced_executable_is_probed_again(self, provider_setup):
+        """Replacing the executable invalidates the cached result."""
+        provider, executable, _, mock_test = provider_setup
+        assert provider.is_available()
+
+        executable.unlink()
+        executable.write_text("#!/bin/sh\n# upgraded\n")
+        executable.chmod(0o755)
+
+        assert provider.is_available()
+        assert mock_test.call_count == 2
+
+    def test_removed_executable_is_detected(self, provider_setup):
+        """Removing the executable invalidates a cached available result."""
+        provider, executable, _, _ = provider_setup
+        assert provider.is_available()
+
+        executable.unlink()
+
+        assert not provider.is_available()
+
+    def test_changed_provider_file_is_detected(self, provider_setup):
+        """Editing the provider file invalidates the cached result."""
+        provider, _, provider_file, mock_test = provider_setup
+        assert provider.is_available()
+
+        provider_file.write_text("provider: fptool\nchanged: true\n")
+
+        assert provider.is_available()
+        assert mock_test.call_count == 2
+
+
+class TestProviderVersionCache:
+    """Test that provider versions are probed once per executable fingerprint."""
+
+    @pytest.fixture
+    def version_setup(self, tmp_path):
+        """A provider whose executable reports a version and counts its runs."""
+        from sai.models.provider_data import Action, Provider, ProviderData, ProviderType
+        from sai.providers.base import BaseProvider
+        from sai.utils.system import clear_executable_version_cache
+
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        executable = bin_dir / "vertool"
+        calls_file = tmp_path / "calls"
+
+        def write_executable(version):
+            executable.write_text(
+                f'#!/bin/sh\necho run >> "{calls_file}"\necho "vertool {version}"\n'
+            )
+            executable.chmod(0o755)
+
+        write_executable("1.0")
+        provider_data = ProviderData(
+            version="0.1",
+            provider=Provider(
+                name="vertool", type=ProviderType.PACKAGE_MANAGER, executable="vertool"
+            ),
+            actions={"install": Action(command="vertool install")},
+        )
+
+        def probe_count():
+            return len(calls_file.read_text().splitlines()) if calls_file.exists() else 0
+
+        cache = ProviderCache(
+            SaiConfig(cache_enabled=True, cache_directory=tmp_path / "cache", cache_ttl=60)
+        )
+        clear_executable_version_cache()
+        with patch.dict("os.environ", {"PATH": str(bin_dir)}), patch(
+            "sai.utils.cache.get_provider_cache", return_value=cache
+        ), patch.object(BaseProvider, "_test_functionality", return_value=True):
+            yield BaseProvider(provider_data), write_executable, probe_count
+        clear_executable_version_cache()
+
+    def test_version_is_probed_once(self, version_setup):
+        """Filling the cache and reading the version run the version command once."""
+        from sai.utils.system import clear_executable_version_cache
+
+        provider, _, probe_count = version_setup
+
+        assert provider.is_available()
+        assert provider.get_version() == "vertool 1.0"
+
+        # A new process has no memoized versions but finds the cached entry
+        clear_executable_version_cache()
+        assert provider.get_version() == "vertool 1.0"
+        assert probe_count() == 1
+
+    def test_changed_executable_is_probed_again(self, version_setup):
+        """Upgrading the executable yields the new version."""
+        provider, write_executable, probe_count = version_setup
+        assert provider.is_available()
+
+        write_executable("2.0.0")
+
+        assert provider.get_version() == "vertool 2.0.0"
+        assert probe_count() == 2
+
+    def test_no_cache_probes_again(self, version_setup):
+        """Fresh detection runs the version command again."""
+        provider, _, probe_count = version_setup
+        assert provider.get_version() == "vertool 1.0"
+
+        assert provider.get_version(use_cache=False) == "vertool 1.0"
+        assert probe_count() == 2
+
+
+class TestSaidataCache:
+    """Test cases for the per-entry saidata cache."""
+
+    @pytest.fixture
+    def cache_setup(self, tmp_path):
+        """A saidata cache and a saidata file to cache."""
+        saidata_file = tmp_path / "nginx.yaml"
+        saidata_file.write_text("metadata:\n  name: nginx\n")
+        config = SaiConfig(cache_enabled=True, cache_directory=tmp_path / "cache", cache_ttl=60)
+        return SaidataCache(config), config, saidata_file
+
+    def test_round_trip(self, cache_setup):
+        """Cached saidata is returned while the files are unchanged."""
+        cache, _, saidata_file = cache_setup
+        data = {"metadata": {"name": "nginx"}}
+
+        assert cache.get_cached_saidata("nginx", [saidata_file]) is None
+        cache.update_saidata_cache("nginx", [saidata_file], data)
+
+        assert cache.is_cache_valid("nginx", [saidata_file])
+        assert cache.get_cached_saidata("nginx", [saidata_file]) == data
+
+    def test_changed_file_invalidates_entry(self, cache_setup):
+        """Editing a saidata file invalidates its entry."""
+        cache, _, saidata_file = cache_setup
+        cache.update_saidata_cache("nginx", [saidata_file], {"metadata": {"name": "nginx"}})
+
+        saidata_file.write_text("metadata:\n  name: nginx\n  description: changed\n")
+
+        assert cache.get_cached_saidata("nginx", [saidata_file]) is None
+
+    def test_entries_are_stored_separately(self, cache_setup, tmp_path):
+        """Each entry lives in its own file and updates leave other entries untouched."""
+        cache, _, saidata_file = cache_setup
+        other_file = tmp_path / "redis.yaml"
+        other_file.write_text("metadata:\n  name: redis\n")
+
+        cache.update_saidata_cache("nginx", [saidata_file], {"name": "nginx"})
+        nginx_entry = next(cache.saidata_cache_dir.glob("*/*.json"))
+        nginx_mtime = nginx_entry.stat().st_mtime_ns
+
+        cache.update_saidata_cache("redis", [other_file], {"name": "redis"})
+
+        assert len(list(cache.saidata_cache_dir.glob("*/*.json"))) == 2
+        assert nginx_entry.stat().st_mtime_ns == nginx_mtime
+        assert cache.get_cached_saidata("redis", [other_file]) == {"name": "redis"}
+
+    def test_clear_single_software(self, cache_setup, tmp_path):
+        """Clearing one software keeps the other entries."""
+        cache, _, saidata_file = cache_setup
+        other_file = tmp_path / "redis.yaml"
+        other_file.write_text("metadata:\n  name: redis\n")
+        cache.update_saidata_cache("nginx", [saidata_file], {"name": "nginx"})
+        cache.update_saidata_cache("redis", [other_file], {"name": "redis"})
+
+        assert cache.clear_saidata_cache("nginx") == 1
+        assert cache.get_cached_saidata("nginx", [saidata_file]) is None
+        assert cache.get_cached_saidata("redis", [other_file]) == {"name": "redis"}
+        assert cache.clear_saidata_cache() == 1
+
+    def test_cleanup_and_status(self, cache_setup):
+        """Expired entries are reported and removed."""
+        cache, _, saidata_file = cache_setup
+        cache.update_saidata_cache("nginx", [saidata_file], {"name": "nginx"})
+
+        status = cache.get_cache_status()
+        assert status["total_cached_saidata"] == 1
+        assert status["cached_saidata"][0]["software_name"] == "nginx"
+        assert status["cache_size_bytes"] > 0
+
+        assert cache.cleanup_expired_cache() == 0
+        with patch("time.time", return_value=time.time() + 120):
+            assert cache.cleanup_expired_cache() == 1
+        assert cache.get_cache_status()["total_cached_saidata"] == 0
+
+    def test_legacy_cache_is_migrated(self, cache_setup):
+        """Entries of the former single-file cache are moved to entry files."""
+        cache, config, saidata_file = cache_setup
+        legacy_entry = {
+            "software_name": "nginx",
+            "file_paths": [str(saidata_file)],
+            "file_hashes": {str(saidata_file): cache._get_file_hash(saidata_file)},
+            "data": {"name": "nginx"},
+            "cached_at": time.time(),
+        }
+        cache_key = cache._get_cache_key("nginx", [saidata_file])
+        cache.legacy_cache_file.write_text(json.dumps({"saidata": {cache_key: legacy_entry}}))
+
+        migrated_cache = SaidataCache(config)
+
+        assert not migrated_cache.legacy_cache_file.exists()
+        assert migrated_cache.get_cache_status()["cached_saidata"][0]["cache_key"] == cache_key
+        # Legacy entries carry no file fingerprints and are refreshed on next use
+        assert migrated_cache.get_cached_saidata("nginx", [saidata_file]) is None
+
+    def test_warm_lookup_reads_no_saidata_file(self, cache_setup):
+        """Freshness is decided from file metadata without reading the files."""
+        cache, _, saidata_file = cache_setup
+        cache.update_saidata_cache("nginx", [saidata_file], {"name": "nginx"})
+
+        with patch.object(SaidataCache, "_get_file_hash") as mock_hash:
+            assert cache.get_cached_saidata("nginx", [saidata_file]) == {"name": "nginx"}
+
+        mock_hash.assert_not_called()
+
+    def test_removed_file_invalidates_entry(self, cache_setup):
+        """An entry whose source file is gone is not used."""
+        cache, _, saidata_file = cache_setup
+        cache.update_saidata_cache("nginx", [saidata_file], {"name": "nginx"})
+
+        saidata_file.unlink()
+
+        assert cache.get_cached_saidata("nginx", [saidata_file]) is None
+
+    def test_verify_content_detects_same_size_edit(self, tmp_path):
+        """Content verification catches edits that keep size and timestamps."""
+        saidata_file = tmp_path / "nginx.yaml"
+        saidata_file.write_text("name: nginx\n")
+        config = SaiConfig(
+            cache_enabled=True,
+            cache_directory=tmp_path / "cache",
+            saidata_cache_verify_content=True,
+        )
+        cache = SaidataCache(config)
+        cache.update_saidata_cache("nginx", [saidata_file], {"name": "nginx"})
+        assert cache.get_cached_saidata("nginx", [saidata_file]) == {"name": "nginx"}
+
+        stat_info = saidata_file.stat()
+        with open(saidata_file, "r+") as f:
+            f.write("name: apache")
+        os.utime(saidata_file, ns=(stat_info.st_atime_ns, stat_info.st_mtime_ns))
+
+        assert cache.get_cached_saidata("nginx", [saidata_file]) is None
+
+    def test_corrupt_entry_is_a_miss(self, cache_setup):
+        """An unreadable entry file is treated as not cached."""
+        cache, _, saidata_file = cache_setup
+        cache.update_saidata_cache("nginx", [saidata_file], {"name": "nginx"})
+        next(cache.saidata_cache_dir.glob("*/*.json")).write_text("{truncated")
+
+        assert cache.get_cached_saidata("nginx", [saidata_file]) is None
+        cache.update_saidata_cache("nginx", [saidata_file], {"name": "nginx"})
+        assert cache.get_cached_saidata("nginx", [saidata_file]) == {"name": "nginx"}
+
 
 class TestCacheErrors:
     """Test cache error handling."""
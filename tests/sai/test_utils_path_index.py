@@ -0,0 +1,134 @@
+"""Tests for the shared PATH executable index."""
+
+import os
+import shutil
+import time
+from unittest.mock import patch
+
+import pytest
+
+from sai.utils.path_index import PathIndex, get_path_index
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="POSIX executable bits only")
+
+
+def _make_executable(directory, name, executable=True):
+    """Create a file in ``directory`` and optionally mark it executable."""
+    path = directory / name
+    path.write_text("#!/bin/sh\n")
+    path.chmod(0o755 if executable else 0o644)
+    return path
+
+
+def _bump_mtime(directory):
+    """Move a directory's mtime forward so the change is always detected."""
+    stat_info = os.stat(directory)
+    os.utime(directory, ns=(stat_info.st_atime_ns, stat_info.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def path_dirs(tmp_path):
+    """Two PATH directories, the first shadowing the second."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    _make_executable(first, "tool")
+    _make_executable(second, "tool")
+    _make_executable(second, "other")
+    _make_executable(first, "plain", executable=False)
+    (first / "subdir").mkdir()
+    return first, second
+
+
+class TestPathIndex:
+    """Test cases for PathIndex."""
+
+    def test_matches_shutil_which(self, path_dirs):
+        """Lookups agree with shutil.which for the same PATH."""
+        search_path = os.pathsep.join(str(d) for d in path_dirs)
+        index = PathIndex()
+
+        for name in ["tool", "other", "plain", "subdir", "missing"]:
+            assert index.which(name, path=search_path) == shutil.which(name, path=search_path)
+
+    def test_directories_are_listed_once(self, path_dirs):
+        """Repeated lookups do not list directories again."""
+        search_path = os.pathsep.join(str(d) for d in path_dirs)
+        index = PathIndex()
+
+        with patch("sai.utils.path_index.os.scandir", wraps=os.scandir) as mock_scandir:
+            for name in ["tool", "other", "missing", "tool", "missing"]:
+                index.which(name, path=search_path)
+
+        assert mock_scandir.call_count == 2
+
+    def test_directory_change_is_detected(self, path_dirs):
+        """Adding an executable is picked up once the directory mtime changes."""
+        first, second = path_dirs
+        search_path = os.pathsep.join(str(d) for d in path_dirs)
+        index = PathIndex(revalidate_interval=0)
+
+        assert index.which("newtool", path=search_path) is None
+        generation = index.generation
+
+        _make_executable(second, "newtool")
+        _bump_mtime(second)
+
+        assert index.which("newtool", path=search_path) == str(second / "newtool")
+        assert index.generation > generation
+
+    def test_revalidation_is_throttled(self, path_dirs):
+        """Directory mtimes are not checked again within the revalidate interval."""
+        first, second = path_dirs
+        search_path = os.pathsep.join(str(d) for d in path_dirs)
+        index = PathIndex(revalidate_interval=3600)
+        index.which("tool", path=search_path)
+
+        _make_executable(second, "newtool")
+        _bump_mtime(second)
+        assert index.which("newtool", path=search_path) is None
+
+        index.invalidate()
+        assert index.which("newtool", path=search_path) == str(second / "newtool")
+
+    def test_explicit_path_bypasses_index(self, path_dirs):
+        """Executables given as paths are resolved directly."""
+        first, _ = path_dirs
+        tool = str(first / "tool")
+
+        assert PathIndex().which(tool) == tool
+
+    def test_get_directory(self, tmp_path, path_dirs):
+        """Directory info reports existence and world-writable directories."""
+        first, _ = path_dirs
+        writable = tmp_path / "writable"
+        writable.mkdir()
+        writable.chmod(0o777)
+        index = PathIndex()
+
+        assert index.get_directory(str(first)).exists
+        assert not index.get_directory(str(first)).world_writable
+        assert index.get_directory(str(writable)).world_writable
+        assert not index.get_directory(str(tmp_path / "missing")).exists
+
+    def test_get_path_index_is_shared(self):
+        """The process-wide index is a singleton."""
+        assert get_path_index() is get_path_index()
+
+    def test_default_path_from_environment(self, path_dirs):
+        """Without an explicit path, the PATH environment variable is used."""
+        first, _ = path_dirs
+        with patch.dict(os.environ, {"PATH": str(first)}):
+            assert PathIndex().which("tool") == str(first / "tool")
+
+    def test_timing_sanity(self, path_dirs):
+        """Warm lookups are served from memory."""
+        search_path = os.pathsep.join(str(d) for d in path_dirs)
+        index = PathIndex()
+        index.which("tool", path=search_path)
+
+        start = time.monotonic()
+        for _ in range(1000):
+            index.which("missing", path=search_path)
+        assert time.monotonic() - start < 1.0
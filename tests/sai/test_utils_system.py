@@ -1,6 +1,8 @@
 """Tests for system utilities."""
 
 import subprocess
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -8,8 +10,11 @@ import pytest
 
 from sai.utils.system import (
     check_executable_functionality,
+    clear_executable_version_cache,
+    get_cached_executable_version,
     get_executable_path,
     get_executable_version,
+    get_os_id,
     get_platform,
     get_system_info,
     is_executable_available,
@@ -20,9 +25,10 @@ from sai.utils.system import (
 class TestExecutableUtils:
     """Test executable-related utilities."""
 
-    @patch("sai.utils.system.shutil.which")
-    def test_is_executable_available_found(self, mock_which):
+    @patch("sai.utils.system.get_path_index")
+    def test_is_executable_available_found(self, mock_get_path_index):
         """Test executable availability check when found."""
+        mock_which = mock_get_path_index.return_value.which
         mock_which.return_value = "/usr/bin/test-cmd"
 
         result = is_executable_available("test-cmd")
@@ -30,9 +36,10 @@ class TestExecutableUtils:
         assert result is True
         mock_which.assert_called_once_with("test-cmd")
 
-    @patch("sai.utils.system.shutil.which")
-    def test_is_executable_available_not_found(self, mock_which):
+    @patch("sai.utils.system.get_path_index")
+    def test_is_executable_available_not_found(self, mock_get_path_index):
         """Test executable availability check when not found."""
+        mock_which = mock_get_path_index.return_value.which
         mock_which.return_value = None
 
         result = is_executable_available("nonexistent-cmd")
@@ -40,9 +47,10 @@ class TestExecutableUtils:
         assert result is False
         mock_which.assert_called_once_with("nonexistent-cmd")
 
-    @patch("sai.utils.system.shutil.which")
-    def test_get_executable_path_found(self, mock_which):
+    @patch("sai.utils.system.get_path_index")
+    def test_get_executable_path_found(self, mock_get_path_index):
         """Test getting executable path when found."""
+        mock_which = mock_get_path_index.return_value.which
         expected_path = "/usr/bin/test-cmd"
         mock_which.return_value = expected_path
 
@@ -51,9 +59,10 @@ class TestExecutableUtils:
         assert result == expected_path
         mock_which.assert_called_once_with("test-cmd")
 
-    @patch("sai.utils.system.shutil.which")
-    def test_get_executable_path_not_found(self, mock_which):
+    @patch("sai.utils.system.get_path_index")
+    def test_get_executable_path_not_found(self, mock_get_path_index):
         """Test getting executable path when not found."""
+        mock_which = mock_get_path_index.return_value.which
         mock_which.return_value = None
 
         result = get_executable_path("nonexistent-cmd")
@@ -144,6 +153,62 @@ class TestExecutableUtils:
         assert result is False
 
 
+class TestCachedExecutableVersion:
+    """Test memoized version probing."""
+
+    @pytest.fixture(autouse=True)
+    def clear_memo(self):
+        """Start and end every test without memoized versions."""
+        clear_executable_version_cache()
+        yield
+        clear_executable_version_cache()
+
+    @patch("sai.utils.system.get_executable_fingerprint")
+    @patch("sai.utils.system.get_executable_version")
+    def test_concurrent_callers_share_one_probe(self, mock_version, mock_fingerprint):
+        """Threads asking for the same executable wait for a single probe."""
+        mock_fingerprint.return_value = ["/usr/bin/tool", 1, 2, 3]
+
+        def slow_probe(executable, version_args):
+            time.sleep(0.1)
+            return "tool 1.0"
+
+        mock_version.side_effect = slow_probe
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_cached_executable_version("tool")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["tool 1.0"] * 8
+        mock_version.assert_called_once_with("/usr/bin/tool", None)
+
+    @patch("sai.utils.system.get_executable_fingerprint")
+    @patch("sai.utils.system.get_executable_version")
+    def test_changed_fingerprint_probes_again(self, mock_version, mock_fingerprint):
+        """A replaced executable is probed again."""
+        mock_version.side_effect = ["tool 1.0", "tool 2.0"]
+
+        mock_fingerprint.return_value = ["/usr/bin/tool", 1, 2, 3]
+        assert get_cached_executable_version("tool") == "tool 1.0"
+        assert get_cached_executable_version("tool") == "tool 1.0"
+
+        mock_fingerprint.return_value = ["/usr/bin/tool", 1, 5, 3]
+        assert get_cached_executable_version("tool") == "tool 2.0"
+        assert mock_version.call_count == 2
+
+    @patch("sai.utils.system.get_executable_fingerprint", return_value=[None])
+    @patch("sai.utils.system.get_executable_version")
+    def test_missing_executable_is_not_probed(self, mock_version, mock_fingerprint):
+        """Executables that are not installed are never run."""
+        assert get_cached_executable_version("missing-tool") is None
+        mock_version.assert_not_called()
+
+
 class TestPlatformUtils:
     """Test platform-related utilities."""
 
@@ -183,6 +248,25 @@ class TestPlatformUtils:
 
         assert result == "unknownos"
 
+    @patch("sai.utils.system.platform.system")
+    def test_get_os_id_macos(self, mock_system):
+        """Test macOS is identified like saidata OS override directories."""
+        mock_system.return_value = "Darwin"
+
+        assert get_os_id() == "macos"
+
+    @patch("sai.utils.system.platform.system")
+    def test_get_os_id_linux_distribution(self, mock_system, tmp_path):
+        """Test Linux hosts are identified by their os-release ID."""
+        mock_system.return_value = "Linux"
+        os_release = tmp_path / "os-release"
+        os_release.write_text('NAME="Ubuntu"\nID=ubuntu\nVERSION_ID="22.04"\n')
+
+        with patch(
+            "sai.utils.system.OS_RELEASE_FILES", (str(tmp_path / "missing"), str(os_release))
+        ):
+            assert get_os_id() == "ubuntu"
+
     @patch("sai.utils.system.get_platform")
     def test_is_platform_supported_single_match(self, mock_get_platform):
         """Test platform support check with single matching platform."""
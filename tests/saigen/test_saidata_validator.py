@@ -4,6 +4,7 @@ import json
 import tempfile
 from pathlib import Path
 from typing import Any, Dict
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -343,6 +344,18 @@ class TestSaidataValidator:
             validator = SaidataValidator(schema_path=Path("/nonexistent/schema.json"))
             validator.validate_data({"test": "data"})
 
+    def test_validators_share_compiled_schema(self):
+        """Validator instances for the same schema reuse one compiled schema."""
+        first = SaidataValidator()
+        first.validate_data({"version": "0.3", "metadata": {"name": "test"}})
+
+        second = SaidataValidator()
+        with patch("saigen.core.validator.json.load") as mock_load:
+            second.validate_data({"version": "0.3", "metadata": {"name": "test"}})
+
+        mock_load.assert_not_called()
+        assert second._get_validator() is first._get_validator()
+
 
 class TestValidationErrorFormatting:
     """Test specific error message formatting."""